@@ -0,0 +1,12 @@
+"""Performance benchmarks for CDD.
+
+Run with `python -m benchmarks` from the repository root:
+
+    python -m benchmarks run --size 1000 --size 10000
+    python -m benchmarks compare results/<old>.json results/<new>.json
+
+Benchmarks run against synthetic projects (see `benchmarks.fixtures`)
+with thousands of tickets and large progress files. Results are stored
+as JSON per commit; `compare` flags statistically significant
+regressions between two result files.
+"""
@@ -0,0 +1,200 @@
+"""Command line for the benchmark suite (`python -m benchmarks`)."""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from .cases import CASES
+from .fixtures import DEFAULT_FIXTURE_DIR, DEFAULT_PROGRESS_STEPS, get_fixture
+from .runner import (
+    DEFAULT_RESULTS_DIR,
+    load_results,
+    run_suite,
+    save_results,
+)
+from .stats import compare_results
+
+console = Console()
+
+DEFAULT_SIZES = (1000,)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.0f}µs"
+
+
+@click.group()
+def main():
+    """CDD performance benchmarks."""
+    pass
+
+
+@main.command()
+@click.option(
+    "--size",
+    "sizes",
+    type=int,
+    multiple=True,
+    help="Active tickets in the fixture (repeatable; e.g. 1000, 10000, "
+    "100000).",
+)
+@click.option(
+    "--progress-steps",
+    type=int,
+    default=DEFAULT_PROGRESS_STEPS,
+    show_default=True,
+    help="Steps in the large progress file.",
+)
+@click.option(
+    "--fixture-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE_DIR,
+    help="Where generated fixtures are kept.",
+)
+def generate(sizes, progress_steps, fixture_dir):
+    """Generate fixtures ahead of a run."""
+    for size in sizes or DEFAULT_SIZES:
+        with console.status(f"Generating {size} tickets..."):
+            root = get_fixture(size, fixture_dir, progress_steps)
+        console.print(f"[green]✅[/green] {root}")
+
+
+@main.command()
+@click.option(
+    "--size",
+    "sizes",
+    type=int,
+    multiple=True,
+    help="Active tickets in the fixture (repeatable; default 1000).",
+)
+@click.option(
+    "--case",
+    "names",
+    type=click.Choice(sorted(CASES)),
+    multiple=True,
+    help="Run only these cases (repeatable).",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=20,
+    show_default=True,
+    help="Timed runs per case.",
+)
+@click.option(
+    "--progress-steps",
+    type=int,
+    default=DEFAULT_PROGRESS_STEPS,
+    show_default=True,
+    help="Steps in the large progress file.",
+)
+@click.option(
+    "--fixture-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE_DIR,
+    help="Where generated fixtures are kept.",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Results file (default: benchmarks/results/<commit>.json).",
+)
+def run(sizes, names, repeat, progress_steps, fixture_dir, output_file):
+    """Run the benchmarks and save the results as JSON."""
+    if repeat < 2:
+        raise click.BadParameter("must be at least 2", param_hint="--repeat")
+
+    def _report(name, summary):
+        console.print(
+            f"{name:<50} median {_format_seconds(summary['median']):>10}"
+            f"  min {_format_seconds(summary['min']):>10}",
+            soft_wrap=True,
+        )
+
+    results = run_suite(
+        list(sizes or DEFAULT_SIZES),
+        list(names) or None,
+        repeat=repeat,
+        fixture_dir=fixture_dir,
+        progress_steps=progress_steps,
+        report=_report,
+    )
+    if output_file is None:
+        output_file = DEFAULT_RESULTS_DIR / (
+            f"{(results['commit'] or 'worktree')[:12]}.json"
+        )
+    save_results(results, output_file)
+    console.print(f"\n[green]✅ Results saved to {output_file}[/green]")
+
+
+@main.command()
+@click.argument("old", type=click.Path(exists=True, dir_okay=False))
+@click.argument("new", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--alpha",
+    type=float,
+    default=0.01,
+    show_default=True,
+    help="Significance level of the Mann-Whitney U test.",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.05,
+    show_default=True,
+    help="Ignore median changes smaller than this fraction.",
+)
+def compare(old, new, alpha, threshold):
+    """Compare two results files; exit 1 on significant regressions."""
+    try:
+        baseline = load_results(old)
+        candidate = load_results(new)
+    except ValueError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    comparisons = compare_results(
+        baseline["results"], candidate["results"], alpha, threshold
+    )
+    table = Table(
+        title=f"{(baseline['commit'] or old)[:12]} → "
+        f"{(candidate['commit'] or new)[:12]}"
+    )
+    table.add_column("Benchmark")
+    table.add_column("Old", justify="right")
+    table.add_column("New", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("p", justify="right")
+    styles = {"regression": "red", "improvement": "green", "unchanged": ""}
+    for item in comparisons:
+        style = styles[item["verdict"]]
+        change = f"{item['change']:+.1%}"
+        table.add_row(
+            item["name"],
+            _format_seconds(item["old_median"]),
+            _format_seconds(item["new_median"]),
+            f"[{style}]{change}[/{style}]" if style else change,
+            f"{item['p_value']:.3f}",
+        )
+    console.print(table)
+
+    regressions = [c for c in comparisons if c["verdict"] == "regression"]
+    if regressions:
+        console.print(
+            f"\n[red]❌ {len(regressions)} significant regression(s)[/red]"
+        )
+        sys.exit(1)
+    console.print("\n[green]✅ No significant regressions[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Benchmark cases.
+
+Each case is a setup function registered with `@case`. Setup receives
+the fixture project root (with the current directory already set to it)
+and returns a `(run, teardown)` pair: `run` is the timed operation and
+`teardown` undoes whatever the runs changed, so fixtures stay reusable.
+
+Cases registered with `scaled=False` do not depend on project size and
+run once per suite instead of once per fixture.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, TypedDict
+
+import cddoc
+from cddoc.handlers.archive_handler import ArchiveHandler
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.handlers.spec_handler import SpecHandler
+from cddoc.new_ticket import create_new_ticket
+from cddoc.path_resolver import PathResolver
+
+from .fixtures import LARGE_TICKET
+
+Operation = Callable[[], None]
+Setup = Callable[[Path], Tuple[Operation, Operation]]
+
+
+class Case(TypedDict):
+    setup: Setup
+    scaled: bool
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, scaled: bool = True) -> Callable[[Setup], Setup]:
+    """Register a benchmark case."""
+
+    def decorator(setup: Setup) -> Setup:
+        CASES[name] = {"setup": setup, "scaled": scaled}
+        return setup
+
+    return decorator
+
+
+def _noop() -> None:
+    pass
+
+
+def _existing_ticket(project: Path) -> str:
+    """Pick an active ticket from the middle of the listing."""
+    names = sorted(
+        entry.name
+        for entry in os.scandir(project / "specs" / "tickets")
+        if entry.name != LARGE_TICKET
+    )
+    return names[len(names) // 2]
+
+
+@case("path_resolver.resolve")
+def resolve_existing(project: Path) -> Tuple[Operation, Operation]:
+    name = _existing_ticket(project)
+    return lambda: PathResolver.resolve(name, "spec.yaml"), _noop
+
+
+@case("path_resolver.find_similar_tickets")
+def find_similar(project: Path) -> Tuple[Operation, Operation]:
+    # A typo of an existing name: scans and scores every ticket
+    name = _existing_ticket(project).replace("-", "_", 1)
+    return lambda: PathResolver.find_similar_tickets(name), _noop
+
+
+@case("new_ticket.create_new_ticket")
+def create_ticket(project: Path) -> Tuple[Operation, Operation]:
+    created = []
+
+    def run():
+        result = create_new_ticket("feature", f"bench-new-{len(created)}")
+        created.append(result["ticket_path"])
+
+    def teardown():
+        for path in created:
+            shutil.rmtree(path, ignore_errors=True)
+
+    return run, teardown
+
+
+@case("spec_handler.update_status")
+def update_status(project: Path) -> Tuple[Operation, Operation]:
+    spec_path = project / "specs" / "tickets" / LARGE_TICKET / "spec.yaml"
+    original = spec_path.read_bytes()
+    statuses = ["in_progress", "completed"]
+    calls = []
+
+    def run():
+        SpecHandler.update_status(spec_path, statuses[len(calls) % 2])
+        calls.append(None)
+
+    return run, lambda: spec_path.write_bytes(original)
+
+
+@case("progress_handler.read_progress")
+def read_progress(project: Path) -> Tuple[Operation, Operation]:
+    path = project / "specs" / "tickets" / LARGE_TICKET / "progress.yaml"
+    return lambda: ProgressHandler.read_progress(path), _noop
+
+
+@case("progress_handler.write_progress")
+def write_progress(project: Path) -> Tuple[Operation, Operation]:
+    path = project / "specs" / "tickets" / LARGE_TICKET / "progress.yaml"
+    original = path.read_bytes()
+    data = ProgressHandler.read_progress(path)
+
+    def run():
+        ProgressHandler.write_progress(path, data)
+
+    return run, lambda: path.write_bytes(original)
+
+
+@case("archive_handler.archive_restore")
+def archive_restore(project: Path) -> Tuple[Operation, Operation]:
+    tickets_dir = project / "specs" / "tickets"
+    archive_dir = project / "specs" / "archive"
+    name = _existing_ticket(project)
+
+    def run():
+        archived = ArchiveHandler.archive_ticket(
+            tickets_dir / name, archive_dir
+        )
+        ArchiveHandler.restore_ticket(archived, tickets_dir)
+
+    return run, _noop
+
+
+def _cli(*args: str, cwd: Optional[Path] = None) -> Operation:
+    """Time a fresh interpreter running the CLI."""
+    env = dict(os.environ)
+    package_dir = str(Path(cddoc.__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [package_dir, env.get("PYTHONPATH")])
+    )
+
+    def run():
+        subprocess.run(
+            [sys.executable, "-m", "cddoc.cli", *args],
+            cwd=cwd,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    return run
+
+
+@case("cli.cold_start.version", scaled=False)
+def cli_version(project: Path) -> Tuple[Operation, Operation]:
+    return _cli("--version"), _noop
+
+
+@case("cli.cold_start.help", scaled=False)
+def cli_help(project: Path) -> Tuple[Operation, Operation]:
+    return _cli("--help"), _noop
+
+
+@case("cli.cold_start.new_feature")
+def cli_new_feature(project: Path) -> Tuple[Operation, Operation]:
+    tickets_dir = project / "specs" / "tickets"
+    created = []
+
+    def run():
+        name = f"bench-cli-{len(created)}"
+        _cli("new", "feature", name, cwd=project)()
+        created.append(tickets_dir / f"feature-{name}")
+
+    def teardown():
+        for path in created:
+            shutil.rmtree(path, ignore_errors=True)
+
+    return run, teardown
@@ -0,0 +1,233 @@
+"""Synthetic large-project fixtures.
+
+A fixture is a CDD project with `tickets` ticket folders spread across
+the ticket types, a realistic spec.yaml in each, plans and progress
+files for a share of them, a few hundred archived tickets and one
+ticket whose progress.yaml has `progress_steps` steps.
+
+Fixtures are deterministic for a given (tickets, progress_steps, seed)
+and are generated once into the fixture directory, then reused.
+"""
+
+import random
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from cddoc.init import install_templates
+from cddoc.validation import TICKET_TYPES
+
+# Bump when the generated layout changes to force regeneration
+FIXTURE_VERSION = 2
+
+DEFAULT_FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+DEFAULT_PROGRESS_STEPS = 1000
+
+# Ticket that carries the large progress file
+LARGE_TICKET = "feature-large-progress"
+
+# Share of active tickets with a plan.md / progress.yaml
+PLANNED_SHARE = 0.4
+STARTED_SHARE = 0.2
+
+WORDS = (
+    "auth billing cache checkout config dashboard email export import "
+    "invoice login metrics notification onboarding payment profile queue "
+    "report search session settings signup storage sync upload user "
+    "webhook"
+).split()
+
+# Statuses of active tickets (see spec_handler.TicketStatus)
+STATUSES = ["draft", "defined", "planned", "in_progress", "completed"]
+
+
+def ticket_names(count: int, seed: int = 0) -> List[str]:
+    """Generate unique ticket folder names.
+
+    Args:
+        count: Number of names
+        seed: Random seed
+
+    Returns:
+        Names like `feature-billing-export-42`
+    """
+    rng = random.Random(seed)
+    return [
+        f"{TICKET_TYPES[i % len(TICKET_TYPES)]}-"
+        f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+        for i in range(count)
+    ]
+
+
+def make_spec(name: str, ticket_type: str, rng: random.Random) -> Dict:
+    """Build a spec.yaml document resembling a filled-in template."""
+    topic = name.split("-", 1)[1].replace("-", " ")
+    return {
+        "title": f"{topic.title()} improvements",
+        "user_story": (
+            f"As a user,\nI want better {topic},\n"
+            "So that my work goes faster.\n"
+        ),
+        "business_value": f"Reduces support load around {topic}.\n",
+        "acceptance_criteria": [
+            f"Criterion {i} for {topic}" for i in range(rng.randint(3, 8))
+        ],
+        "implementation_scope": {
+            "backend": [f"Service change for {topic}"],
+            "frontend": [f"Screen update for {topic}"],
+        },
+        "technical_considerations": "Keep backwards compatibility.\n",
+        "ticket": {
+            "type": ticket_type,
+            "status": rng.choice(STATUSES),
+            "priority": rng.choice(["high", "medium", "low"]),
+            "estimated_effort": f"{rng.randint(1, 10)} days",
+            "created": "2025-01-01",
+            "updated": "2025-01-02",
+        },
+    }
+
+
+def make_progress(ticket_dir: str, steps: int) -> Dict:
+    """Build a progress.yaml document with the given number of steps."""
+    timestamp = "2025-01-01T00:00:00Z"
+    return {
+        "plan_path": f"{ticket_dir}/plan.md",
+        "spec_path": f"{ticket_dir}/spec.yaml",
+        "started_at": timestamp,
+        "updated_at": timestamp,
+        "status": "in_progress",
+        "steps": [
+            {
+                "step_id": i + 1,
+                "description": f"Implement part {i + 1} of the change",
+                "status": "completed" if i < steps // 2 else "pending",
+                "started_at": timestamp if i < steps // 2 else None,
+                "completed_at": timestamp if i < steps // 2 else None,
+                "files_touched": [
+                    {
+                        "path": f"src/module_{i % 50}.py",
+                        "operation": "modified",
+                    }
+                ],
+            }
+            for i in range(steps)
+        ],
+        "acceptance_criteria": [
+            {
+                "criterion": f"Criterion {i}",
+                "status": "pending",
+                "validated_at": None,
+            }
+            for i in range(max(steps // 20, 1))
+        ],
+        "files_modified": [f"src/module_{i}.py" for i in range(50)],
+        "files_created": [],
+        "issues": [],
+    }
+
+
+def _dump(data: Dict) -> str:
+    return yaml.dump(
+        data,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
+def generate_project(
+    root: Path,
+    tickets: int,
+    progress_steps: int = DEFAULT_PROGRESS_STEPS,
+    seed: int = 0,
+) -> Path:
+    """Generate a synthetic CDD project.
+
+    Args:
+        root: Directory to create the project in (must not exist)
+        tickets: Number of active tickets
+        progress_steps: Steps in the large progress file
+        seed: Random seed
+
+    Returns:
+        Project root
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True)
+    (root / ".cdd").mkdir()
+    install_templates(root, "en")
+
+    tickets_dir = root / "specs" / "tickets"
+    archive_dir = root / "specs" / "archive"
+    tickets_dir.mkdir(parents=True)
+    archive_dir.mkdir(parents=True)
+
+    archived = max(tickets // 10, 1)
+    names = ticket_names(tickets + archived, seed)
+    plan = "# Plan\n\n" + "".join(
+        f"## Step {i}\n\nDo part {i}.\n\n" for i in range(1, 11)
+    )
+
+    for index, name in enumerate(names):
+        base = tickets_dir if index < tickets else archive_dir
+        ticket_dir = base / name
+        ticket_dir.mkdir()
+        ticket_type = name.split("-", 1)[0]
+        (ticket_dir / "spec.yaml").write_text(
+            _dump(make_spec(name, ticket_type, rng)), encoding="utf-8"
+        )
+        roll = rng.random()
+        if roll < PLANNED_SHARE:
+            (ticket_dir / "plan.md").write_text(plan, encoding="utf-8")
+        if roll < STARTED_SHARE:
+            (ticket_dir / "progress.yaml").write_text(
+                _dump(make_progress(f"specs/tickets/{name}", 10)),
+                encoding="utf-8",
+            )
+
+    large_dir = tickets_dir / LARGE_TICKET
+    large_dir.mkdir()
+    (large_dir / "spec.yaml").write_text(
+        _dump(make_spec(LARGE_TICKET, "feature", rng)), encoding="utf-8"
+    )
+    (large_dir / "plan.md").write_text(plan, encoding="utf-8")
+    (large_dir / "progress.yaml").write_text(
+        _dump(make_progress(f"specs/tickets/{LARGE_TICKET}", progress_steps)),
+        encoding="utf-8",
+    )
+    return root
+
+
+def get_fixture(
+    tickets: int,
+    fixture_dir: Path = DEFAULT_FIXTURE_DIR,
+    progress_steps: int = DEFAULT_PROGRESS_STEPS,
+    seed: int = 0,
+) -> Path:
+    """Get a generated fixture, generating it on first use.
+
+    Args:
+        tickets: Number of active tickets
+        fixture_dir: Directory holding generated fixtures
+        progress_steps: Steps in the large progress file
+        seed: Random seed
+
+    Returns:
+        Project root of the fixture
+    """
+    root = fixture_dir / (
+        f"v{FIXTURE_VERSION}-{tickets}-{progress_steps}-{seed}"
+    )
+    marker = root / ".cdd" / "fixture-complete"
+    if marker.exists():
+        return root
+    if root.exists():
+        # Interrupted generation
+        shutil.rmtree(root)
+    generate_project(root, tickets, progress_steps, seed)
+    marker.touch()
+    return root
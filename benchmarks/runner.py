@@ -0,0 +1,175 @@
+"""Benchmark runner and result files."""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, TypedDict
+
+from cddoc.project import forget_project_roots
+
+from .cases import CASES, Case
+from .fixtures import DEFAULT_FIXTURE_DIR, DEFAULT_PROGRESS_STEPS, get_fixture
+from .stats import Summary, summarize
+
+# Bump when the result file layout changes
+RESULTS_VERSION = 1
+
+DEFAULT_RESULTS_DIR = Path(__file__).parent / "results"
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Fast operations are looped so each sample lasts at least this long;
+# single microsecond-scale calls are dominated by timer and scheduler
+# noise
+MIN_SAMPLE_SECONDS = 0.05
+
+
+class Results(TypedDict):
+    version: int
+    commit: Optional[str]
+    python: str
+    platform: str
+    timestamp: str
+    results: Dict[str, Summary]
+
+
+def current_commit() -> Optional[str]:
+    """Commit the benchmarked code is at (None outside git)."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return None
+    return result.stdout.strip() or None
+
+
+def _time(run, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        run()
+    return time.perf_counter() - start
+
+
+def run_case(
+    benchmark: Case,
+    project: Path,
+    repeat: int,
+    warmup: int = 1,
+    min_sample: float = MIN_SAMPLE_SECONDS,
+) -> List[float]:
+    """Time one case against a project.
+
+    The first warmup run also calibrates how many calls each sample
+    makes (at least min_sample seconds per sample).
+
+    Args:
+        benchmark: Registered case
+        project: Fixture project root
+        repeat: Number of samples
+        warmup: Untimed runs before timing
+        min_sample: Minimum duration of a sample in seconds
+
+    Returns:
+        Wall-clock seconds per call, one value per sample
+    """
+    previous = os.getcwd()
+    os.chdir(project)
+    forget_project_roots()
+    try:
+        run, teardown = benchmark["setup"](project)
+        try:
+            single = _time(run, 1)
+            number = max(1, int(min_sample / max(single, 1e-9)))
+            for _ in range(warmup - 1):
+                run()
+            samples = [_time(run, number) / number for _ in range(repeat)]
+        finally:
+            teardown()
+    finally:
+        os.chdir(previous)
+        forget_project_roots()
+    return samples
+
+
+def run_suite(
+    sizes: List[int],
+    names: Optional[List[str]] = None,
+    repeat: int = 20,
+    warmup: int = 1,
+    fixture_dir: Path = DEFAULT_FIXTURE_DIR,
+    progress_steps: int = DEFAULT_PROGRESS_STEPS,
+    report=None,
+) -> Results:
+    """Run benchmark cases against fixtures of each size.
+
+    Scaled cases are named `<case>[<size>]`; unscaled cases run once,
+    against the smallest fixture.
+
+    Args:
+        sizes: Ticket counts of the fixtures
+        names: Cases to run (None runs all)
+        repeat: Timed runs per case
+        warmup: Untimed runs per case
+        fixture_dir: Directory holding generated fixtures
+        progress_steps: Steps in the large progress file
+        report: Optional callback receiving (name, summary) per case
+
+    Returns:
+        Results with run metadata
+    """
+    selected = {
+        name: CASES[name] for name in (names or CASES) if name in CASES
+    }
+    results: Dict[str, Summary] = {}
+
+    for index, size in enumerate(sorted(sizes)):
+        project = get_fixture(size, fixture_dir, progress_steps)
+        for name, benchmark in selected.items():
+            if benchmark["scaled"]:
+                key = f"{name}[{size}]"
+            elif index == 0:
+                key = name
+            else:
+                continue
+            summary = summarize(run_case(benchmark, project, repeat, warmup))
+            results[key] = summary
+            if report:
+                report(key, summary)
+
+    return {
+        "version": RESULTS_VERSION,
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "timestamp": datetime.now(UTC).isoformat(),
+        "results": results,
+    }
+
+
+def save_results(results: Results, path: Path) -> None:
+    """Write results as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> Results:
+    """Read a results file.
+
+    Raises:
+        ValueError: If the file is not a results file of this version
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"{path}: not a version {RESULTS_VERSION} results file"
+        )
+    return data
@@ -0,0 +1,148 @@
+"""Statistics for benchmark samples.
+
+Regressions are detected with a two-sided Mann-Whitney U test: timing
+samples are skewed and noisy, so a rank test is more robust than
+comparing means. The p-value uses the normal approximation with tie
+correction, which is accurate for the sample sizes the runner collects
+(10 or more per side).
+"""
+
+import math
+import statistics
+from typing import Dict, List, Tuple, TypedDict
+
+
+class Summary(TypedDict):
+    samples: List[float]
+    median: float
+    mean: float
+    stdev: float
+    min: float
+
+
+def summarize(samples: List[float]) -> Summary:
+    """Summarize timing samples.
+
+    Args:
+        samples: Timings in seconds
+
+    Returns:
+        The samples with their median, mean, stdev and min
+    """
+    return {
+        "samples": samples,
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+    }
+
+
+def _ranks(values: List[float]) -> Tuple[List[float], List[int]]:
+    """Rank values (ties get their average rank).
+
+    Returns:
+        Tuple of (ranks in input order, sizes of tied groups)
+    """
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = []
+    start = 0
+    while start < len(order):
+        end = start
+        while (
+            end + 1 < len(order)
+            and values[order[end + 1]] == values[order[start]]
+        ):
+            end += 1
+        rank = (start + end) / 2 + 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = rank
+        if end > start:
+            ties.append(end - start + 1)
+        start = end + 1
+    return ranks, ties
+
+
+def mann_whitney_u(a: List[float], b: List[float]) -> Tuple[float, float]:
+    """Two-sided Mann-Whitney U test.
+
+    Args:
+        a: First sample
+        b: Second sample
+
+    Returns:
+        Tuple of (U statistic for a, p-value)
+    """
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    ranks, ties = _ranks(list(a) + list(b))
+    u1 = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    tie_term = sum(t**3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        # Every value is identical
+        return u1, 1.0
+    mean = n1 * n2 / 2
+    # Continuity correction
+    z = (abs(u1 - mean) - 0.5) / math.sqrt(variance)
+    p_value = math.erfc(max(z, 0) / math.sqrt(2))
+    return u1, min(p_value, 1.0)
+
+
+class Comparison(TypedDict):
+    name: str
+    old_median: float
+    new_median: float
+    change: float
+    p_value: float
+    verdict: str
+
+
+def compare_results(
+    old: Dict[str, Summary],
+    new: Dict[str, Summary],
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+) -> List[Comparison]:
+    """Compare two sets of benchmark results.
+
+    A benchmark regressed (or improved) when its samples differ
+    significantly (p < alpha) and its median moved by more than
+    threshold; other differences are reported as unchanged.
+
+    Args:
+        old: Baseline results by benchmark name
+        new: Candidate results by benchmark name
+        alpha: Significance level
+        threshold: Minimum relative median change worth reporting
+
+    Returns:
+        Comparisons for benchmarks present in both, sorted by name
+    """
+    comparisons: List[Comparison] = []
+    for name in sorted(set(old) & set(new)):
+        old_median = old[name]["median"]
+        new_median = new[name]["median"]
+        change = (new_median - old_median) / old_median if old_median else 0
+        _, p_value = mann_whitney_u(old[name]["samples"], new[name]["samples"])
+        if p_value < alpha and change > threshold:
+            verdict = "regression"
+        elif p_value < alpha and change < -threshold:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        comparisons.append(
+            {
+                "name": name,
+                "old_median": old_median,
+                "new_median": new_median,
+                "change": change,
+                "p_value": p_value,
+                "verdict": verdict,
+            }
+        )
+    return comparisons
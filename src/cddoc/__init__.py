@@ -1,3 +1,8 @@
 """Context-Driven Documentation for AI-assisted development."""
 
+import time
+
+# Start of the package import, reported by `cdd --timings`
+IMPORT_STARTED = time.perf_counter()
+
 __version__ = "0.1.0"
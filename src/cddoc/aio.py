@@ -0,0 +1,311 @@
+"""Asyncio API for CDD handlers.
+
+Coroutine equivalents of SpecHandler, ProgressHandler, ArchiveHandler
+and ticket creation, for services that process many tickets from one
+event loop. Blocking work (file I/O, YAML parsing, locks) runs in a
+bounded thread pool shared by all coroutines of this module, so the
+event loop never blocks and at most `max_workers` operations touch the
+filesystem at once:
+
+    from cddoc import aio
+
+    aio.configure(max_workers=8)
+    specs = await aio.SpecHandler.read_specs(paths)
+    await aio.SpecHandler.update_status(path, "planned")
+
+Cancellation: cancelling a coroutine whose operation hasn't started
+yet (it is queued behind other work) removes it from the queue, so it
+never runs. An operation already running in a worker thread cannot be
+interrupted; it finishes, and its result is discarded. Writes are
+atomic (see cddoc.concurrency), so a cancelled write is either fully
+applied or not at all.
+
+The tracing span and context variables of the calling task carry over
+into the worker thread.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+from .handlers import archive_handler, progress_handler, spec_handler
+from .handlers.progress_handler import ProgressData
+from .handlers.spec_handler import TicketStatus
+from .new_ticket import create_ticket as _create_ticket
+
+# Worker threads used when configure() isn't called
+DEFAULT_MAX_WORKERS = 8
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers = DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+
+
+def configure(max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+    """Set how many blocking operations may run at once.
+
+    Operations already running finish on the previous pool.
+
+    Args:
+        max_workers: Number of worker threads
+
+    Raises:
+        ValueError: If max_workers is not positive
+    """
+    global _executor, _max_workers
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    with _executor_lock:
+        previous, _executor = _executor, None
+        _max_workers = max_workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="cddoc-aio"
+            )
+        return _executor
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the worker pool (a new one is created on next use).
+
+    Args:
+        wait: Wait for running operations to finish
+    """
+    global _executor
+    with _executor_lock:
+        previous, _executor = _executor, None
+    if previous is not None:
+        previous.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the worker pool.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        The function's result
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+async def gather_blocking(
+    func: Callable[..., T],
+    items: Iterable[Any],
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Call a blocking function once per item, concurrently.
+
+    Args:
+        func: Function taking one item
+        items: Items to process
+        return_exceptions: Return exceptions in place of results instead
+            of raising the first one
+
+    Returns:
+        Results in item order
+    """
+    return await asyncio.gather(
+        *(run_blocking(func, item) for item in items),
+        return_exceptions=return_exceptions,
+    )
+
+
+class SpecHandler:
+    """Coroutine versions of SpecHandler operations."""
+
+    @staticmethod
+    async def read_spec(spec_path: Path) -> dict:
+        """Read and parse a spec.yaml (see SpecHandler.read_spec)."""
+        return await run_blocking(
+            spec_handler.SpecHandler.read_spec, spec_path
+        )
+
+    @staticmethod
+    async def write_spec(spec_path: Path, data: dict) -> None:
+        """Write a spec.yaml (see SpecHandler.write_spec)."""
+        await run_blocking(
+            spec_handler.SpecHandler.write_spec, spec_path, data
+        )
+
+    @staticmethod
+    async def update_status(
+        spec_path: Path, new_status: TicketStatus, add_timestamp: bool = True
+    ) -> None:
+        """Update a ticket's status (see SpecHandler.update_status)."""
+        await run_blocking(
+            spec_handler.SpecHandler.update_status,
+            spec_path,
+            new_status,
+            add_timestamp,
+        )
+
+    @staticmethod
+    async def get_status(spec_path: Path) -> Optional[TicketStatus]:
+        """Get a ticket's status (see SpecHandler.get_status)."""
+        return await run_blocking(
+            spec_handler.SpecHandler.get_status, spec_path
+        )
+
+    @staticmethod
+    async def read_specs(
+        spec_paths: Iterable[Path], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Read many spec.yaml files concurrently.
+
+        Args:
+            spec_paths: Spec files
+            return_exceptions: Return SpecHandlerError instances for
+                unreadable specs instead of raising the first one
+
+        Returns:
+            Parsed specs in path order
+        """
+        return await gather_blocking(
+            spec_handler.SpecHandler.read_spec, spec_paths, return_exceptions
+        )
+
+
+class ProgressHandler:
+    """Coroutine versions of ProgressHandler operations."""
+
+    @staticmethod
+    async def read_progress(progress_path: Path) -> ProgressData:
+        """Read a progress.yaml (see ProgressHandler.read_progress)."""
+        return await run_blocking(
+            progress_handler.ProgressHandler.read_progress, progress_path
+        )
+
+    @staticmethod
+    async def write_progress(progress_path: Path, data: ProgressData) -> None:
+        """Write a progress.yaml (see ProgressHandler.write_progress)."""
+        await run_blocking(
+            progress_handler.ProgressHandler.write_progress,
+            progress_path,
+            data,
+        )
+
+    @staticmethod
+    async def update_progress(
+        progress_path: Path, update: Callable[[ProgressData], None]
+    ) -> ProgressData:
+        """Read, modify and write a progress.yaml under its lock.
+
+        `update` runs in a worker thread while the lock is held, so it
+        must not await or block for long.
+        """
+        return await run_blocking(
+            progress_handler.ProgressHandler.update_progress,
+            progress_path,
+            update,
+        )
+
+    @staticmethod
+    async def initialize_progress(
+        plan_path: Path, spec_path: Path
+    ) -> ProgressData:
+        """Build initial progress data from a ticket's plan and spec."""
+        return await run_blocking(
+            progress_handler.ProgressHandler.initialize_progress,
+            plan_path,
+            spec_path,
+        )
+
+    @staticmethod
+    async def seed_progress(ticket_dir: Path) -> Optional[ProgressData]:
+        """Create a missing progress.yaml from the ticket's plan."""
+        return await run_blocking(
+            progress_handler.ProgressHandler.seed_progress, ticket_dir
+        )
+
+    @staticmethod
+    async def read_progresses(
+        progress_paths: Iterable[Path], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Read many progress.yaml files concurrently.
+
+        Args:
+            progress_paths: Progress files
+            return_exceptions: Return ProgressHandlerError instances for
+                unreadable files instead of raising the first one
+
+        Returns:
+            Progress data in path order
+        """
+        return await gather_blocking(
+            progress_handler.ProgressHandler.read_progress,
+            progress_paths,
+            return_exceptions,
+        )
+
+
+class ArchiveHandler:
+    """Coroutine versions of ArchiveHandler operations."""
+
+    @staticmethod
+    async def archive_ticket(ticket_path: Path, archive_base: Path) -> Path:
+        """Move a ticket to the archive (see ArchiveHandler)."""
+        return await run_blocking(
+            archive_handler.ArchiveHandler.archive_ticket,
+            ticket_path,
+            archive_base,
+        )
+
+    @staticmethod
+    async def restore_ticket(archive_path: Path, tickets_base: Path) -> Path:
+        """Move an archived ticket back (see ArchiveHandler)."""
+        return await run_blocking(
+            archive_handler.ArchiveHandler.restore_ticket,
+            archive_path,
+            tickets_base,
+        )
+
+    @staticmethod
+    async def list_archived_tickets(archive_base: Path) -> List[Path]:
+        """List archived tickets (see ArchiveHandler)."""
+        return await run_blocking(
+            archive_handler.ArchiveHandler.list_archived_tickets,
+            archive_base,
+        )
+
+
+async def create_ticket(
+    project_root: Path, ticket_type: str, name: str, overwrite: bool = False
+) -> dict:
+    """Create a ticket without prompting (see new_ticket.create_ticket).
+
+    Args:
+        project_root: Project root directory
+        ticket_type: Type of ticket (feature/bug/spike/enhancement)
+        name: Ticket name (will be normalized)
+        overwrite: Replace the spec of an existing ticket
+
+    Returns:
+        Creation results
+
+    Raises:
+        TicketCreationError: If the ticket cannot be created
+    """
+    return await run_blocking(
+        _create_ticket, project_root, ticket_type, name, overwrite
+    )
@@ -0,0 +1,473 @@
+"""Library API for working with a CDD project.
+
+The CLI resolves the project from the current directory on every call
+and reads configuration through the process-wide Config singleton. A
+Repository instead is bound to one project root and keeps what it
+learns about that project: the parsed config, ticket templates, ticket
+listings, parsed specs and (optionally) the project index. Each cached
+value carries the stat signature of the file or directory it came from
+and is re-read once that changes, so edits made by other processes are
+still picked up.
+
+Repositories share no state, so one process can hold many of them:
+
+    from cddoc.api import Repository
+
+    repo = Repository("/srv/projects/billing")
+    repo.create_ticket("feature", "CSV export")
+    repo.update_status("feature-csv-export", "planned")
+    for entry in repo.list_tickets():
+        print(entry["name"], entry["status"])
+    repo.save()
+"""
+
+import copy
+import difflib
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from .handlers.archive_handler import ArchiveHandler
+from .handlers.progress_handler import ProgressData, ProgressHandler
+from .handlers.spec_handler import SpecHandler, TicketStatus
+from .index import (
+    TICKET_LOCATIONS,
+    ProjectIndex,
+    TicketEntry,
+    read_ticket_entry,
+)
+from .new_ticket import (
+    TicketCreationError,
+    get_template_path,
+    populate_template_dates,
+    require_ticket_name,
+)
+from .path_resolver import PathResolutionError, PathResolver
+from .project import PROJECT_MARKER
+
+# (inode, mtime_ns, size); None when the path doesn't exist
+Signature = Optional[Tuple[int, int, int]]
+
+
+class RepositoryError(Exception):
+    """Raised when a repository cannot be opened or used."""
+
+    pass
+
+
+def _is_folder_name(name: str) -> bool:
+    """Whether a name denotes a folder directly inside its parent."""
+    return (
+        bool(name)
+        and name not in (".", "..")
+        and "/" not in name
+        and "\\" not in name
+    )
+
+
+def _signature(path: Path) -> Signature:
+    """Get the stat signature of a file or directory."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class Repository:
+    """A CDD project opened for library use."""
+
+    def __init__(self, root: Path, use_index: bool = True):
+        """Open a project.
+
+        Args:
+            root: Project root (the directory containing `.cdd`)
+            use_index: Serve list_tickets() from the persistent project
+                index instead of parsing every ticket on each call
+
+        Raises:
+            RepositoryError: If root is not a CDD project
+        """
+        self.root = Path(os.path.abspath(root))
+        if not (self.root / PROJECT_MARKER).is_dir():
+            raise RepositoryError(
+                f"Not a CDD project (no {PROJECT_MARKER} directory): "
+                f"{self.root}"
+            )
+        self.use_index = use_index
+        self._index: Optional[ProjectIndex] = None
+        self._index_lock = threading.Lock()
+        self._config: Optional[Tuple[Signature, dict]] = None
+        self._templates: Dict[str, Tuple[Signature, str]] = {}
+        self._listings: Dict[str, Tuple[Signature, List[str]]] = {}
+        self._specs: Dict[Path, Tuple[Signature, dict]] = {}
+
+    def __repr__(self) -> str:
+        return f"Repository({str(self.root)!r})"
+
+    def __enter__(self) -> "Repository":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.save()
+
+    # Configuration and templates
+
+    @property
+    def config_path(self) -> Path:
+        return self.root / PROJECT_MARKER / "config.yaml"
+
+    @property
+    def config(self) -> dict:
+        """Parsed `.cdd/config.yaml` ({} if missing or malformed)."""
+        signature = _signature(self.config_path)
+        if self._config is not None and self._config[0] == signature:
+            return self._config[1]
+
+        config: Any = {}
+        if signature is not None:
+            try:
+                config = yaml.safe_load(
+                    self.config_path.read_text(encoding="utf-8")
+                )
+            except (OSError, yaml.YAMLError):
+                config = {}
+        if not isinstance(config, dict):
+            config = {}
+        self._config = (signature, config)
+        return config
+
+    @property
+    def language(self) -> str:
+        """Configured language ('en' when not set)."""
+        return self.config.get("language") or "en"
+
+    def template(self, ticket_type: str) -> str:
+        """Get the raw ticket template for a type.
+
+        Args:
+            ticket_type: Type of ticket (feature/bug/spike/enhancement)
+
+        Returns:
+            Template content
+
+        Raises:
+            TicketCreationError: If the template doesn't exist
+        """
+        path = (
+            self.root
+            / PROJECT_MARKER
+            / "templates"
+            / f"{ticket_type}-ticket-template.yaml"
+        )
+        signature = _signature(path)
+        cached = self._templates.get(ticket_type)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        if signature is None:
+            # Raises with the same guidance as `cdd new`
+            get_template_path(self.root, ticket_type)
+
+        content = path.read_text()
+        self._templates[ticket_type] = (signature, content)
+        return content
+
+    # Listings and lookup
+
+    @property
+    def index(self) -> Optional[ProjectIndex]:
+        """Project index, loaded on first use (None if disabled)."""
+        if not self.use_index:
+            return None
+        with self._index_lock:
+            if self._index is None:
+                self._index = ProjectIndex.load(self.root)
+            return self._index
+
+    def ticket_names(self, location: str = "tickets") -> List[str]:
+        """Names of the ticket folders in a location, sorted.
+
+        Args:
+            location: "tickets" or "archive"
+
+        Returns:
+            Ticket names
+        """
+        base = self._location_dir(location)
+        signature = _signature(base)
+        cached = self._listings.get(location)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+
+        names: List[str] = []
+        if signature is not None:
+            names = sorted(
+                entry.name
+                for entry in os.scandir(base)
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+        self._listings[location] = (signature, names)
+        return list(names)
+
+    def list_tickets(
+        self, location: Optional[str] = None
+    ) -> List[TicketEntry]:
+        """List tickets with their status and progress summary.
+
+        Args:
+            location: "tickets" or "archive" (None for both)
+
+        Returns:
+            Ticket entries sorted by path
+        """
+        index = self.index
+        if index is not None:
+            index.refresh()
+            return index.list_tickets(location)
+
+        entries = []
+        for name in TICKET_LOCATIONS:
+            if location is not None and name != location:
+                continue
+            base = self._location_dir(name)
+            for ticket in self.ticket_names(name):
+                if (base / ticket / "spec.yaml").exists():
+                    entries.append(
+                        read_ticket_entry(base / ticket, name, self.root)
+                    )
+        return entries
+
+    def ticket_dir(self, name: str, location: str = "tickets") -> Path:
+        """Resolve a ticket name to its folder.
+
+        Args:
+            name: Ticket folder name (e.g. feature-user-auth)
+            location: "tickets" or "archive"
+
+        Returns:
+            Absolute ticket folder path
+
+        Raises:
+            PathResolutionError: If the name isn't a plain folder name or
+                the ticket doesn't exist (the message suggests similar
+                names)
+        """
+        base = self._location_dir(location)
+        if not _is_folder_name(name):
+            raise PathResolutionError(f"Invalid ticket name: {name!r}")
+        ticket_dir = base / name
+        if not ticket_dir.is_dir():
+            similar = difflib.get_close_matches(
+                name,
+                self.ticket_names(location),
+                n=PathResolver.MAX_SUGGESTIONS,
+                cutoff=PathResolver.SIMILARITY_THRESHOLD,
+            )
+            raise PathResolutionError(
+                PathResolver.format_not_found_error(name, similar)
+            )
+        return ticket_dir
+
+    def resolve(
+        self,
+        name: str,
+        target_file: str = "spec.yaml",
+        location: str = "tickets",
+    ) -> Path:
+        """Resolve a ticket name to one of its files.
+
+        Args:
+            name: Ticket folder name
+            target_file: File inside the ticket folder
+            location: "tickets" or "archive"
+
+        Returns:
+            Absolute file path (which may not exist yet)
+
+        Raises:
+            PathResolutionError: If the ticket doesn't exist or the file
+                would be outside the ticket folder
+        """
+        ticket_dir = self.ticket_dir(name, location)
+        path = Path(os.path.normpath(ticket_dir / target_file))
+        if not path.is_relative_to(ticket_dir) or path == ticket_dir:
+            raise PathResolutionError(f"Invalid ticket file: {target_file!r}")
+        return path
+
+    # Tickets
+
+    def create_ticket(
+        self, ticket_type: str, name: str, overwrite: bool = False
+    ) -> dict:
+        """Create a ticket from the project's template.
+
+        Args:
+            ticket_type: Type of ticket (feature/bug/spike/enhancement)
+            name: Ticket name (will be normalized)
+            overwrite: Replace the spec of an existing ticket
+
+        Returns:
+            Creation results (same keys as new_ticket.create_ticket())
+
+        Raises:
+            TicketCreationError: If the name is invalid, the template is
+                missing or the ticket exists
+        """
+        normalized_name = require_ticket_name(name)
+        content = populate_template_dates(self.template(ticket_type))
+        ticket_path = (
+            self._location_dir("tickets") / f"{ticket_type}-{normalized_name}"
+        )
+
+        exists = ticket_path.exists()
+        if exists and not overwrite:
+            raise TicketCreationError(f"Ticket already exists: {ticket_path}")
+
+        try:
+            ticket_path.mkdir(parents=True, exist_ok=True)
+            (ticket_path / "spec.yaml").write_text(content)
+        except OSError as e:
+            raise TicketCreationError(f"Failed to create ticket: {e}")
+        self._ticket_changed(ticket_path)
+
+        return {
+            "ticket_path": ticket_path,
+            "normalized_name": normalized_name,
+            "ticket_type": ticket_type,
+            "overwritten": exists,
+        }
+
+    def archive_ticket(self, name: str) -> Path:
+        """Move a ticket to `specs/archive/`.
+
+        Returns:
+            Archived ticket folder
+
+        Raises:
+            PathResolutionError: If the ticket doesn't exist
+            ArchiveHandlerError: If the move fails
+        """
+        ticket_dir = self.ticket_dir(name)
+        archived = ArchiveHandler.archive_ticket(
+            ticket_dir, self._location_dir("archive")
+        )
+        self._ticket_changed(ticket_dir)
+        self._ticket_changed(archived)
+        return archived
+
+    def restore_ticket(self, name: str) -> Path:
+        """Move an archived ticket back to `specs/tickets/`.
+
+        Returns:
+            Restored ticket folder
+
+        Raises:
+            PathResolutionError: If the archived ticket doesn't exist
+            ArchiveHandlerError: If the move fails
+        """
+        archived = self.ticket_dir(name, "archive")
+        restored = ArchiveHandler.restore_ticket(
+            archived, self._location_dir("tickets")
+        )
+        self._ticket_changed(archived)
+        self._ticket_changed(restored)
+        return restored
+
+    # Specs
+
+    def read_spec(self, name: str, location: str = "tickets") -> dict:
+        """Read a ticket's spec.yaml.
+
+        Parsed specs are cached until the file changes; each call
+        returns a copy the caller may modify and pass to write_spec().
+
+        Raises:
+            PathResolutionError: If the ticket doesn't exist
+            SpecHandlerError: If the spec is missing or malformed
+        """
+        spec_path = self.resolve(name, "spec.yaml", location)
+        signature = _signature(spec_path)
+        cached = self._specs.get(spec_path)
+        if cached is None or cached[0] != signature or signature is None:
+            cached = (signature, SpecHandler.read_spec(spec_path))
+            self._specs[spec_path] = cached
+        return copy.deepcopy(cached[1])
+
+    def write_spec(
+        self, name: str, data: dict, location: str = "tickets"
+    ) -> None:
+        """Write a ticket's spec.yaml (see SpecHandler.write_spec)."""
+        spec_path = self.resolve(name, "spec.yaml", location)
+        SpecHandler.write_spec(spec_path, data)
+        self._ticket_changed(spec_path.parent)
+
+    def update_status(
+        self, name: str, new_status: TicketStatus, add_timestamp: bool = True
+    ) -> None:
+        """Update a ticket's status (see SpecHandler.update_status)."""
+        spec_path = self.resolve(name)
+        SpecHandler.update_status(spec_path, new_status, add_timestamp)
+        self._ticket_changed(spec_path.parent)
+
+    def get_status(
+        self, name: str, location: str = "tickets"
+    ) -> Optional[TicketStatus]:
+        """Get a ticket's status (None if not set)."""
+        ticket = self.read_spec(name, location).get("ticket")
+        if not isinstance(ticket, dict):
+            return None
+        return ticket.get("status")
+
+    # Progress
+
+    def read_progress(
+        self, name: str, location: str = "tickets"
+    ) -> ProgressData:
+        """Read a ticket's progress.yaml (see ProgressHandler)."""
+        return ProgressHandler.read_progress(
+            self.resolve(name, "progress.yaml", location)
+        )
+
+    def write_progress(self, name: str, data: ProgressData) -> None:
+        """Write a ticket's progress.yaml (see ProgressHandler)."""
+        progress_path = self.resolve(name, "progress.yaml")
+        ProgressHandler.write_progress(progress_path, data)
+        self._ticket_changed(progress_path.parent)
+
+    def update_progress(
+        self, name: str, update: Callable[[ProgressData], None]
+    ) -> ProgressData:
+        """Read, modify and write a ticket's progress.yaml under its lock."""
+        progress_path = self.resolve(name, "progress.yaml")
+        data = ProgressHandler.update_progress(progress_path, update)
+        self._ticket_changed(progress_path.parent)
+        return data
+
+    def seed_progress(self, name: str) -> Optional[ProgressData]:
+        """Create a ticket's progress.yaml from its plan if missing."""
+        ticket_dir = self.ticket_dir(name)
+        data = ProgressHandler.seed_progress(ticket_dir)
+        if data is not None:
+            self._ticket_changed(ticket_dir)
+        return data
+
+    # Persistence
+
+    def save(self) -> None:
+        """Persist the project index if it was loaded and changed."""
+        if self._index is not None:
+            self._index.save()
+
+    def _location_dir(self, location: str) -> Path:
+        try:
+            return self.root / TICKET_LOCATIONS[location]
+        except KeyError:
+            raise RepositoryError(f"Unknown ticket location: {location}")
+
+    def _ticket_changed(self, ticket_dir: Path) -> None:
+        """Bring the loaded index up to date with a ticket we changed."""
+        if self._index is not None:
+            self._index.update_ticket(ticket_dir)
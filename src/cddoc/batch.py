@@ -0,0 +1,453 @@
+"""JSON-lines batch protocol.
+
+`cdd batch` runs many operations in one process, so a sequence like
+resolve, read status, update status and archive costs one interpreter
+start instead of four. Each input line is a request:
+
+    {"id": 1, "op": "update_status",
+     "args": {"ticket": "feature-auth", "status": "planned"}}
+
+and produces exactly one response line, in input order:
+
+    {"id": 1, "ok": true, "result": {"ticket": "feature-auth", ...}}
+    {"id": 2, "ok": false,
+     "error": {"type": "PathResolutionError", "message": "..."}}
+
+`id` is echoed back unchanged (null when missing). A failed operation
+only fails its own response; later lines still run.
+
+With more than one job, operations run concurrently in a thread pool.
+Operations on the same ticket (or ticket being created) still run one
+after the other in input order, and `list_tickets` waits for every
+earlier operation and holds back every later one, so a batch gives the
+same results with any number of jobs. Responses are always written in
+input order.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    get_args,
+)
+
+from .api import Repository
+from .handlers.spec_handler import TicketStatus
+from .new_ticket import create_documentation, normalize_ticket_name
+from .output import to_json
+
+TICKET_TYPES = ["feature", "bug", "spike", "enhancement"]
+
+DOC_TYPES = ["guide", "feature"]
+
+_MISSING = object()
+
+
+class BatchError(Exception):
+    """Invalid batch request."""
+
+    pass
+
+
+def _arg(
+    args: dict, name: str, kind: type = str, default: Any = _MISSING
+) -> Any:
+    """Get a request argument, checking its JSON type."""
+    if name not in args or args[name] is None:
+        if default is _MISSING:
+            raise BatchError(f"Missing argument '{name}'")
+        return default
+    value = args[name]
+    if not isinstance(value, kind) or (
+        kind is not bool and isinstance(value, bool)
+    ):
+        raise BatchError(f"Argument '{name}' must be a {kind.__name__}")
+    return value
+
+
+def _choice(
+    args: dict, name: str, choices: List[str], default: Any = _MISSING
+) -> Any:
+    value = _arg(args, name, default=default)
+    if value != default and value not in choices:
+        raise BatchError(
+            f"Argument '{name}' must be one of {', '.join(choices)} "
+            f"(got '{value}')"
+        )
+    return value
+
+
+def _location(args: dict, default: Optional[str] = "tickets") -> Any:
+    return _choice(args, "location", ["tickets", "archive"], default)
+
+
+def _resolve(repo: Repository, args: dict) -> Any:
+    return repo.resolve(
+        _arg(args, "ticket"),
+        _arg(args, "file", default="spec.yaml"),
+        _location(args),
+    )
+
+
+def _list_tickets(repo: Repository, args: dict) -> Any:
+    return repo.list_tickets(_location(args, default=None))
+
+
+def _read_spec(repo: Repository, args: dict) -> Any:
+    return repo.read_spec(_arg(args, "ticket"), _location(args))
+
+
+def _write_spec(repo: Repository, args: dict) -> Any:
+    ticket = _arg(args, "ticket")
+    repo.write_spec(ticket, _arg(args, "data", dict))
+    return {"ticket": ticket}
+
+
+def _get_status(repo: Repository, args: dict) -> Any:
+    return repo.get_status(_arg(args, "ticket"), _location(args))
+
+
+def _update_status(repo: Repository, args: dict) -> Any:
+    ticket = _arg(args, "ticket")
+    status = _choice(args, "status", list(get_args(TicketStatus)))
+    repo.update_status(
+        ticket, status, _arg(args, "timestamp", bool, default=True)
+    )
+    return {"ticket": ticket, "status": status}
+
+
+def _read_progress(repo: Repository, args: dict) -> Any:
+    return repo.read_progress(_arg(args, "ticket"), _location(args))
+
+
+def _write_progress(repo: Repository, args: dict) -> Any:
+    ticket = _arg(args, "ticket")
+    repo.write_progress(ticket, _arg(args, "data", dict))
+    return {"ticket": ticket}
+
+
+def _update_progress(repo: Repository, args: dict) -> Any:
+    fields = _arg(args, "set", dict, default={})
+    steps = _arg(args, "steps", dict, default={})
+    for step_id, changes in steps.items():
+        if not isinstance(changes, dict):
+            raise BatchError(f"Changes of step {step_id} must be a dict")
+
+    def update(data):
+        data.update(fields)
+        for step in data.get("steps", []):
+            changes = steps.get(str(step.get("step_id")))
+            if changes:
+                step.update(changes)
+
+    return repo.update_progress(_arg(args, "ticket"), update)
+
+
+def _seed_progress(repo: Repository, args: dict) -> Any:
+    return repo.seed_progress(_arg(args, "ticket"))
+
+
+def _archive(repo: Repository, args: dict) -> Any:
+    return repo.archive_ticket(_arg(args, "ticket"))
+
+
+def _restore(repo: Repository, args: dict) -> Any:
+    return repo.restore_ticket(_arg(args, "ticket"))
+
+
+def _create_ticket(repo: Repository, args: dict) -> Any:
+    return repo.create_ticket(
+        _choice(args, "type", TICKET_TYPES),
+        _arg(args, "name"),
+        _arg(args, "overwrite", bool, default=False),
+    )
+
+
+def _create_documentation(repo: Repository, args: dict) -> Any:
+    return create_documentation(
+        repo.root,
+        _choice(args, "type", DOC_TYPES),
+        _arg(args, "name"),
+        _arg(args, "overwrite", bool, default=False),
+    )
+
+
+# Operation name -> function(repository, args) returning the result
+OPERATIONS: Dict[str, Callable[[Repository, dict], Any]] = {
+    "resolve": _resolve,
+    "list_tickets": _list_tickets,
+    "read_spec": _read_spec,
+    "write_spec": _write_spec,
+    "get_status": _get_status,
+    "update_status": _update_status,
+    "read_progress": _read_progress,
+    "write_progress": _write_progress,
+    "update_progress": _update_progress,
+    "seed_progress": _seed_progress,
+    "archive": _archive,
+    "restore": _restore,
+    "create_ticket": _create_ticket,
+    "create_documentation": _create_documentation,
+}
+
+
+def parse_request(line: str) -> dict:
+    """Parse and check one request line.
+
+    Args:
+        line: JSON object with `op`, and optionally `id` and `args`
+
+    Returns:
+        The request, with `args` defaulting to {}
+
+    Raises:
+        BatchError: If the line isn't a valid request
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        raise BatchError(f"Invalid JSON: {e}")
+    if not isinstance(request, dict):
+        raise BatchError("Request must be a JSON object")
+    op = request.get("op")
+    if op not in OPERATIONS:
+        raise BatchError(
+            f"Unknown operation: {op!r} "
+            f"(expected one of {', '.join(OPERATIONS)})"
+        )
+    request.setdefault("args", {})
+    if not isinstance(request["args"], dict):
+        raise BatchError("'args' must be a JSON object")
+    return request
+
+
+def request_keys(request: dict) -> Optional[Set[str]]:
+    """Get the names of the tickets or documents a request touches.
+
+    Requests sharing a key run in input order.
+
+    Returns:
+        Keys, or None when the request depends on the whole project
+    """
+    op = request["op"]
+    args = request["args"]
+    if op == "list_tickets":
+        return None
+    if op in ("create_ticket", "create_documentation"):
+        name = normalize_ticket_name(str(args.get("name", "")))
+        prefix = "doc:" if op == "create_documentation" else ""
+        return {f"{prefix}{args.get('type')}-{name}"}
+    return {str(args.get("ticket", ""))}
+
+
+def execute(repo: Repository, request: dict) -> dict:
+    """Run one request and build its response.
+
+    Args:
+        repo: Repository the operation works on
+        request: Parsed request
+
+    Returns:
+        Response with `ok` and either `result` or `error`
+    """
+    response: Dict[str, Any] = {"id": request.get("id")}
+    try:
+        result = OPERATIONS[request["op"]](repo, request["args"])
+    except Exception as e:
+        response["ok"] = False
+        response["error"] = error_record(e)
+    else:
+        response["ok"] = True
+        response["result"] = result
+    return response
+
+
+def error_record(error: Exception) -> dict:
+    """Describe an exception in a response."""
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+def _request_id(line: str) -> Any:
+    """Get the id of an invalid request line, if it has one."""
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    return request.get("id") if isinstance(request, dict) else None
+
+
+class _Task:
+    def __init__(self, seq: int, request: dict):
+        self.seq = seq
+        self.request = request
+        self.waiting = 0
+        self.finished = False
+        self.dependents: List["_Task"] = []
+
+
+class BatchRunner:
+    """Runs batch requests and writes their responses in order."""
+
+    def __init__(
+        self, repo: Repository, write: Callable[[str], None], jobs: int = 1
+    ):
+        """Create a runner.
+
+        Args:
+            repo: Repository operations work on
+            write: Called with each response line (without newline)
+            jobs: Operations run at once (1 runs each request as soon as
+                it is submitted, in the calling thread)
+
+        Raises:
+            ValueError: If jobs is not positive
+        """
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        self.repo = repo
+        self.write = write
+        self.failed = 0
+        self._executor = (
+            ThreadPoolExecutor(jobs, thread_name_prefix="cddoc-batch")
+            if jobs > 1
+            else None
+        )
+        self._lock = threading.Condition()
+        self._count = 0
+        self._next = 0
+        self._responses: Dict[int, dict] = {}
+        self._last: Dict[str, _Task] = {}
+        self._barrier: Optional[_Task] = None
+        self._since_barrier: List[_Task] = []
+        self._write_error: Optional[BaseException] = None
+
+    def submit(self, line: str) -> None:
+        """Schedule one request line (blank lines are ignored)."""
+        if not line.strip():
+            return
+        try:
+            request = parse_request(line)
+        except BatchError as e:
+            response = {
+                "id": _request_id(line),
+                "ok": False,
+                "error": error_record(e),
+            }
+            with self._lock:
+                task = _Task(self._count, {})
+                self._count += 1
+            self._finish(task, response)
+            return
+
+        with self._lock:
+            task = _Task(self._count, request)
+            self._count += 1
+            deps = self._dependencies(task)
+            pending = [dep for dep in deps if not dep.finished]
+            task.waiting = len(pending)
+            for dep in pending:
+                dep.dependents.append(task)
+        if not task.waiting:
+            self._start(task)
+
+    def close(self) -> int:
+        """Wait for every submitted request.
+
+        Returns:
+            Number of failed requests
+
+        Raises:
+            Exception: The first error raised by `write` (responses after
+                it were dropped)
+        """
+        with self._lock:
+            self._lock.wait_for(lambda: self._next == self._count)
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._write_error is not None:
+            raise self._write_error
+        return self.failed
+
+    def _dependencies(self, task: _Task) -> Set[_Task]:
+        keys = request_keys(task.request)
+        deps: Set[_Task] = set()
+        if self._barrier is not None:
+            deps.add(self._barrier)
+        if keys is None:
+            deps.update(self._since_barrier)
+            self._barrier = task
+            self._since_barrier = []
+            self._last = {}
+            return deps
+        for key in keys:
+            if key in self._last:
+                deps.add(self._last[key])
+            self._last[key] = task
+        self._since_barrier.append(task)
+        return deps
+
+    def _start(self, task: _Task) -> None:
+        if self._executor is None:
+            self._run(task)
+        else:
+            self._executor.submit(self._run, task)
+
+    def _run(self, task: _Task) -> None:
+        self._finish(task, execute(self.repo, task.request))
+
+    def _finish(self, task: _Task, response: dict) -> None:
+        ready = []
+        with self._lock:
+            task.finished = True
+            if not response["ok"]:
+                self.failed += 1
+            self._responses[task.seq] = response
+            while self._next in self._responses:
+                line = to_json(self._responses.pop(self._next))
+                self._next += 1
+                if self._write_error is None:
+                    try:
+                        self.write(line)
+                    except Exception as e:
+                        self._write_error = e
+            for dependent in task.dependents:
+                dependent.waiting -= 1
+                if not dependent.waiting:
+                    ready.append(dependent)
+            self._lock.notify_all()
+        for dependent in ready:
+            self._start(dependent)
+
+
+def run_batch(
+    repo: Repository,
+    lines: Iterable[str],
+    write: Callable[[str], None],
+    jobs: int = 1,
+) -> int:
+    """Run request lines and write one response line per request.
+
+    Args:
+        repo: Repository operations work on
+        lines: Request lines (read lazily, so responses to earlier
+            requests are written before later lines arrive)
+        write: Called with each response line (without newline)
+        jobs: Operations run at once
+
+    Returns:
+        Number of failed requests
+    """
+    runner = BatchRunner(repo, write, jobs)
+    try:
+        for line in lines:
+            runner.submit(line)
+    finally:
+        failed = runner.close()
+    return failed
@@ -1,18 +1,48 @@
 """CLI entry point for cddoc."""
 
 import sys
+from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from .config import Config
-from .init import InitializationError, initialize_project
+from .init import (
+    SUPPORTED_LANGUAGES,
+    InitializationError,
+    expand_project_patterns,
+    initialize_project,
+    initialize_projects,
+    prompt_language_selection,
+    read_repo_list,
+)
 from .new_ticket import TicketCreationError, create_new_ticket
+from .output import (
+    OUTPUT_MODES,
+    LazyConsole,
+    emit,
+    emit_records,
+    escape,
+    is_machine,
+    set_mode,
+)
+from .path_resolver import PathResolutionError, PathResolver
+from .store import LINK_MODES
 from .translations import get_translations
+from .validation import TICKET_TYPES
 
-console = Console()
+console = LazyConsole()
+
+# Commands that can emit results with --mode json/ndjson/plain
+MACHINE_OUTPUT_COMMANDS = {
+    "dashboard",
+    "docs",
+    "history",
+    "init",
+    "new",
+    "run-queue",
+    "search",
+    "validate",
+}
 
 
 def get_version():
@@ -35,9 +65,104 @@ def get_version():
 
 @click.group()
 @click.version_option(version=get_version())
-def main():
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Print a per-phase time breakdown (import, root discovery, "
+    "config, handler I/O, render) to stderr.",
+)
+@click.option(
+    "--profile",
+    "profile_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write cProfile statistics of the command to this file.",
+)
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    help="With --profile, also write a tracemalloc snapshot "
+    "(<file>.tracemalloc).",
+)
+@click.option(
+    "--trace",
+    "trace_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="CDD_TRACE_FILE",
+    help="Append tracing spans (JSONL, OpenTelemetry field names) to "
+    "this file. Also read from CDD_TRACE_FILE.",
+)
+@click.option(
+    "--mode",
+    "output_mode",
+    type=click.Choice(OUTPUT_MODES),
+    default="rich",
+    show_default=True,
+    help="Result format: rich terminal rendering, one JSON document, "
+    "NDJSON records or plain tab-separated lines.",
+)
+@click.pass_context
+def main(ctx, timings, profile_file, profile_memory, trace_file, output_mode):
     """Context-Driven Documentation CLI."""
-    pass
+    if profile_memory and not profile_file:
+        raise click.UsageError("--profile-memory requires --profile")
+    if (
+        output_mode != "rich"
+        and ctx.invoked_subcommand not in MACHINE_OUTPUT_COMMANDS
+    ):
+        raise click.UsageError(
+            f"--mode {output_mode} is not supported by "
+            f"'cdd {ctx.invoked_subcommand}'"
+        )
+    set_mode(output_mode)
+    if timings or profile_file:
+        _start_profiling(ctx, timings, profile_file, profile_memory)
+    if trace_file:
+        _start_tracing(ctx, trace_file)
+
+
+def _start_tracing(ctx, trace_file):
+    """Record the command as a root span with the operations inside it."""
+    from . import tracing
+
+    tracing.enable(trace_file)
+    command = tracing.start_span(
+        f"cdd {ctx.invoked_subcommand}",
+        **{"process.command_args": sys.argv[1:]},
+    )
+
+    def _finish():
+        tracing.end_span(command)
+        tracing.disable()
+
+    ctx.call_on_close(_finish)
+
+
+def _start_profiling(ctx, timings, profile_file, profile_memory):
+    """Collect timings and/or a profile until the command finishes."""
+    from rich.console import Console
+
+    from .profiling import (
+        Profiler,
+        print_timings,
+        start_timings,
+        stop_timings,
+    )
+
+    stderr = Console(stderr=True)
+    profiler = Profiler(profile_file, profile_memory) if profile_file else None
+
+    def _finish():
+        result = stop_timings()
+        if profiler:
+            profiler.stop(stderr)
+        if result:
+            print_timings(*result, stderr)
+
+    if timings:
+        start_timings()
+    if profiler:
+        profiler.start()
+    ctx.call_on_close(_finish)
 
 
 @main.command()
@@ -52,23 +177,108 @@ def main():
     is_flag=True,
     help="Create only essential structure, skip templates",
 )
-def init(path, force, minimal):
+@click.option(
+    "--shared-store",
+    is_flag=True,
+    help="Link framework files from the user-level shared store "
+    "instead of copying them",
+)
+@click.option(
+    "--link-mode",
+    type=click.Choice(LINK_MODES),
+    default="auto",
+    show_default=True,
+    help="How files are linked from the shared store",
+)
+@click.option(
+    "--language",
+    type=click.Choice(SUPPORTED_LANGUAGES),
+    default=None,
+    help="Language for commands and templates (skips the prompt)",
+)
+@click.option(
+    "--projects",
+    "project_patterns",
+    multiple=True,
+    metavar="PATTERN",
+    help="Initialize every directory matching PATTERN in place "
+    "(repeatable, quote globs: --projects 'packages/*')",
+)
+@click.option(
+    "--repo-list",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="File listing project paths to initialize, one per line",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of projects initialized concurrently",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Install compact builds of the AI commands (fewer tokens)",
+)
+def init(
+    path,
+    force,
+    minimal,
+    shared_store,
+    link_mode,
+    language,
+    project_patterns,
+    repo_list,
+    jobs,
+    compact,
+):
     """Initialize CDD structure in a project.
 
     PATH: Target directory for initialization (defaults to current directory)
+
+    With --projects or --repo-list, many projects are initialized
+    concurrently and PATH is ignored.
     """
     # Note: Language selection happens during initialize_project()
     # We don't load config/translations here because config doesn't exist yet
-    console.print(
-        Panel.fit(
-            "🚀 [bold]Initializing Context-Driven Documentation[/bold]",
-            border_style="blue",
+    if not is_machine():
+        from rich.panel import Panel
+
+        console.print(
+            Panel.fit(
+                "🚀 [bold]Initializing Context-Driven Documentation[/bold]",
+                border_style="blue",
+            )
+        )
+
+    if project_patterns or repo_list:
+        _init_many(
+            project_patterns,
+            repo_list,
+            language,
+            force,
+            shared_store,
+            link_mode,
+            jobs,
+            compact,
         )
-    )
 
     try:
         # Initialize the project (includes language selection)
-        result = initialize_project(path, force=force, minimal=minimal)
+        result = initialize_project(
+            path,
+            force=force,
+            minimal=minimal,
+            shared_store=shared_store,
+            link_mode=link_mode,
+            language=language,
+            compact=compact,
+        )
+
+        if is_machine():
+            emit(result)
+            sys.exit(0)
 
         # Load translations based on selected language
         language = result.get("language", "en")
@@ -92,6 +302,106 @@ def init(path, force, minimal):
         sys.exit(1)
 
 
+def _init_many(
+    project_patterns,
+    repo_list,
+    language,
+    force,
+    shared_store,
+    link_mode,
+    jobs,
+    compact,
+):
+    """Initialize several projects and exit with a combined summary."""
+    try:
+        patterns = list(project_patterns)
+        if repo_list:
+            patterns.extend(read_repo_list(repo_list))
+
+        targets = expand_project_patterns(patterns)
+        if not targets:
+            raise InitializationError("No projects matched")
+
+        # One prompt for the whole batch when --language is omitted
+        if language is None:
+            language = prompt_language_selection()
+
+        results = initialize_projects(
+            targets,
+            language,
+            force=force,
+            shared_store=shared_store,
+            link_mode=link_mode,
+            max_workers=jobs,
+            compact=compact,
+        )
+    except InitializationError as e:
+        console.print(f"\n[red]❌ Error:[/red] {e}")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"\n[red]❌ Unexpected error:[/red] {e}")
+        sys.exit(1)
+
+    if is_machine():
+        emit_records(results, fields=["path", "language", "error"])
+    else:
+        console.print()
+        _display_multi_results(results, get_translations(language))
+
+    failed = sum(1 for result in results if "error" in result)
+    sys.exit(1 if failed else 0)
+
+
+def _display_multi_results(results: list, t):
+    """Display a combined summary table for multi-project init.
+
+    Args:
+        results: Result dictionaries from initialize_projects()
+        t: Translation messages object
+    """
+    from rich.table import Table
+
+    table = Table(title=t.init_multi_summary_title, show_header=True)
+    table.add_column(t.init_multi_table_project, style="cyan")
+    table.add_column(t.init_multi_table_created, justify="right")
+    table.add_column(t.init_multi_table_installed, justify="right")
+    table.add_column(t.init_table_status)
+
+    for result in results:
+        if "error" in result:
+            table.add_row(
+                str(result["path"]),
+                "-",
+                "-",
+                f"[red]❌ {result['error']}[/red]",
+            )
+            continue
+
+        installed = len(result["installed_commands"]) + len(
+            result["installed_templates"]
+        )
+        status = (
+            t.init_status_exists
+            if result["existing_structure"]
+            else t.init_status_created
+        )
+        table.add_row(
+            str(result["path"]),
+            str(len(result["created_dirs"])),
+            str(installed),
+            f"[green]{status}[/green]",
+        )
+
+    console.print(table)
+
+    failed = sum(1 for result in results if "error" in result)
+    console.print(
+        t.init_multi_totals.format(
+            succeeded=len(results) - failed, failed=failed
+        )
+    )
+
+
 def _display_results(result: dict, t):
     """Display initialization results in a formatted table.
 
@@ -103,6 +413,9 @@ def _display_results(result: dict, t):
     installed_commands = result.get("installed_commands", [])
     installed_templates = result.get("installed_templates", [])
     claude_md_created = result.get("claude_md_created", False)
+    store_path = result.get("store_path")
+
+    from rich.table import Table
 
     # Create summary table
     table = Table(title=t.init_summary_title, show_header=True)
@@ -127,6 +440,10 @@ def _display_results(result: dict, t):
     for template_path in installed_templates:
         table.add_row(f"📋 {template_path}", t.init_status_installed)
 
+    # Add shared store location
+    if store_path:
+        table.add_row(f"🗄️  {store_path}", t.init_status_linked)
+
     if table.row_count > 0:
         console.print(table)
     else:
@@ -140,6 +457,8 @@ def _display_next_steps(project_path, t):
         project_path: Path where project was initialized
         t: Translation messages object
     """
+    from rich.panel import Panel
+
     console.print(
         Panel(
             t.next_steps_content,
@@ -163,6 +482,11 @@ def feature(name):
     Examples:
         cdd new feature user-authentication
     """
+    if is_machine():
+        _emit_new_ticket("feature", name)
+
+    from rich.panel import Panel
+
     # Load config and translations
     language = Config.get_language()
     t = get_translations(language)
@@ -172,7 +496,7 @@ def feature(name):
     try:
         result = create_new_ticket("feature", name)
         console.print()
-        _display_ticket_success(result, t)
+        _display_ticket_success(result)
         sys.exit(0)
     except TicketCreationError as e:
         console.print(f"\n[red]❌ {t.error_title}:[/red] {e}")
@@ -190,6 +514,11 @@ def bug(name):
     Examples:
         cdd new bug "Payment Processing Error"
     """
+    if is_machine():
+        _emit_new_ticket("bug", name)
+
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "🎫 [bold]Creating Bug Ticket[/bold]",
@@ -218,6 +547,11 @@ def spike(name):
     Examples:
         cdd new spike api_performance_investigation
     """
+    if is_machine():
+        _emit_new_ticket("spike", name)
+
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "🎫 [bold]Creating Spike Ticket[/bold]",
@@ -246,6 +580,11 @@ def enhancement(name):
     Examples:
         cdd new enhancement improve-error-messages
     """
+    if is_machine():
+        _emit_new_ticket("enhancement", name)
+
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "🎫 [bold]Creating Enhancement Ticket[/bold]",
@@ -266,6 +605,19 @@ def enhancement(name):
         sys.exit(1)
 
 
+def _emit_new_ticket(ticket_type: str, name: str):
+    """Create a ticket without prompting, emit its result and exit."""
+    from .new_ticket import create_ticket, get_project_root
+
+    try:
+        result = create_ticket(get_project_root(), ticket_type, name)
+    except TicketCreationError as e:
+        console.print(f"\n[red]❌ Error:[/red] {e}")
+        sys.exit(1)
+    emit(result)
+    sys.exit(0)
+
+
 def _display_ticket_success(result: dict):
     """Display ticket creation success message.
 
@@ -277,6 +629,9 @@ def _display_ticket_success(result: dict):
     ticket_type = result["ticket_type"]
     overwritten = result["overwritten"]
 
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Create status message
     status = "Overwritten" if overwritten else "Created"
 
@@ -338,6 +693,11 @@ def doc_guide(name):
     Examples:
         cdd new documentation guide getting-started
     """
+    if is_machine():
+        _emit_new_documentation("guide", name)
+
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "📚 [bold]Creating Guide Documentation[/bold]",
@@ -371,6 +731,11 @@ def doc_feature(name):
     Examples:
         cdd new documentation feature authentication
     """
+    if is_machine():
+        _emit_new_documentation("feature", name)
+
+    from rich.panel import Panel
+
     console.print(
         Panel.fit(
             "📚 [bold]Creating Feature Documentation[/bold]",
@@ -396,6 +761,19 @@ def doc_feature(name):
         sys.exit(1)
 
 
+def _emit_new_documentation(doc_type: str, name: str):
+    """Create a documentation file without prompting, emit and exit."""
+    from .new_ticket import create_documentation, get_project_root
+
+    try:
+        result = create_documentation(get_project_root(), doc_type, name)
+    except TicketCreationError as e:
+        console.print(f"\n[red]❌ Error:[/red] {e}")
+        sys.exit(1)
+    emit(result)
+    sys.exit(0)
+
+
 def _display_documentation_success(result: dict):
     """Display documentation creation success message.
 
@@ -407,6 +785,9 @@ def _display_documentation_success(result: dict):
     doc_type = result["doc_type"]
     overwritten = result["overwritten"]
 
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Create status message
     status = "Overwritten" if overwritten else "Created"
 
@@ -457,5 +838,1133 @@ sure what to write - Socrates will ask the right questions.
     )
 
 
+@main.command()
+@click.argument("targets", nargs=-1)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of validation worker processes",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore and don't update the validation results cache",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop at the first invalid file",
+)
+def validate(targets, jobs, no_cache, fail_fast):
+    """Validate ticket specs and progress files against their schemas.
+
+    TARGETS: Files, ticket directories or ticket names (defaults to every
+    spec, progress file and docs/examples/*.yaml in the project)
+
+    Examples:
+        cdd validate
+        cdd validate feature-user-auth
+    """
+    from .project import find_project_root
+    from .validation import discover_validation_targets, validate_files
+
+    project_root = find_project_root() or Path.cwd()
+
+    try:
+        if targets:
+            paths = _expand_validation_targets(targets)
+        else:
+            paths = discover_validation_targets(project_root)
+
+        results = validate_files(
+            paths,
+            project_root=project_root,
+            max_workers=jobs,
+            use_cache=not no_cache,
+            fail_fast=fail_fast,
+        )
+    except PathResolutionError as e:
+        console.print(f"\n[red]{e}[/red]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"\n[red]❌ Unexpected error:[/red] {e}")
+        sys.exit(1)
+
+    invalid = [result for result in results if result["errors"]]
+    if is_machine():
+        emit_records(results, fields=["path", "kind", "cached", "errors"])
+        sys.exit(1 if invalid else 0)
+
+    for result in invalid:
+        console.print(f"\n[red]❌ {result['path']}[/red]")
+        for error in result["errors"]:
+            console.print(f"   • {escape(error)}")
+
+    cached = sum(1 for result in results if result["cached"])
+    console.print(
+        f"\n✅ {len(results) - len(invalid)} valid, "
+        f"❌ {len(invalid)} invalid "
+        f"[dim]({cached} from cache)[/dim]"
+    )
+    sys.exit(1 if invalid else 0)
+
+
+def _expand_validation_targets(targets) -> list:
+    """Turn files, ticket directories and ticket names into files."""
+    paths = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir() and (path / "spec.yaml").exists():
+            candidates = [path / "spec.yaml", path / "progress.yaml"]
+            paths.extend(c for c in candidates if c.exists())
+        elif path.is_dir():
+            paths.extend(sorted(path.glob("*.yaml")))
+        elif path.exists():
+            paths.append(path)
+        else:
+            spec_path = PathResolver.resolve(target, "spec.yaml")
+            progress_path = spec_path.parent / "progress.yaml"
+            paths.append(spec_path)
+            if progress_path.exists():
+                paths.append(progress_path)
+    return paths
+
+
+@main.command()
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.1),
+    default=1.0,
+    show_default=True,
+    help="Polling interval in seconds (polling backend only)",
+)
+@click.option(
+    "--polling",
+    is_flag=True,
+    help="Poll with directory snapshots instead of inotify",
+)
+@click.option(
+    "--once",
+    is_flag=True,
+    help="Bring indexes up to date and exit without watching",
+)
+def watch(interval, polling, once):
+    """Keep the project index and validation results up to date.
+
+    Watches ticket files (spec.yaml, progress.yaml, plan.md) and docs/
+    pages, re-processing only the files that change.
+
+    Examples:
+        cdd watch
+        cdd watch --polling --interval 2
+    """
+    from .project import find_project_root
+    from .watch import Watcher, WatchError, WatchSession, create_backend
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    try:
+        session = WatchSession(project_root)
+    except Exception as e:
+        console.print(f"\n[red]❌ Unexpected error:[/red] {e}")
+        sys.exit(1)
+
+    tickets = len(session.index.tickets)
+    docs = len(session.index.docs)
+    if once:
+        console.print(f"✅ Indexed {tickets} tickets and {docs} docs")
+        return
+
+    try:
+        backend = create_backend(project_root, polling, interval)
+        watcher = Watcher(project_root, backend)
+    except WatchError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    console.print(
+        f"👀 Watching {escape(str(project_root))} "
+        f"[dim]({backend.name}, {tickets} tickets, {docs} docs)[/dim]"
+    )
+    try:
+        while True:
+            changes = watcher.poll()
+            if changes:
+                for line in session.apply(changes):
+                    console.print(f"   • {escape(line)}")
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching[/dim]")
+    finally:
+        watcher.close()
+
+
+@main.command()
+@click.option(
+    "--output",
+    "output_dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Output directory (default: .cdd/cache/dashboard)",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["html", "markdown"]),
+    default="html",
+    show_default=True,
+    help="Output format",
+)
+def dashboard(output_dir, fmt):
+    """Render a static board of every ticket's status and progress.
+
+    Only tickets whose spec, plan or progress changed since the last
+    build are re-rendered.
+
+    Examples:
+        cdd dashboard
+        cdd dashboard --format markdown --output docs/board
+    """
+    from .dashboard import DashboardError, build_dashboard
+    from .project import find_project_root, relative_to_cwd
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    if output_dir is not None:
+        output_dir = output_dir.absolute()
+
+    try:
+        result = build_dashboard(project_root, output_dir, fmt)
+    except DashboardError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    if is_machine():
+        emit(result)
+        return
+
+    board_path = relative_to_cwd(result["board_path"])
+    console.print(
+        f"✅ Dashboard written to [cyan]{escape(str(board_path))}[/cyan] "
+        f"[dim]({result['tickets']} tickets, {result['rendered']} "
+        f"re-rendered, {result['removed']} removed)[/dim]"
+    )
+
+
+@main.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Maximum number of results",
+)
+@click.option(
+    "--kind",
+    type=click.Choice(["spec", "plan", "doc"]),
+    default=None,
+    help="Only search specs, plans or docs",
+)
+@click.option(
+    "--no-refresh",
+    is_flag=True,
+    help="Search the index as is (e.g. while cdd watch keeps it current)",
+)
+def search(query, limit, kind, no_refresh):
+    """Search ticket specs, plans and docs for prior art.
+
+    QUERY: Words to search for
+
+    Examples:
+        cdd search rate limiting
+        cdd search --kind doc authentication
+    """
+    from .project import find_project_root
+    from .search import SearchError, SearchIndex, tokenize
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    text = " ".join(query)
+    try:
+        index = SearchIndex(project_root)
+        try:
+            if not no_refresh:
+                index.refresh()
+            hits = index.search(text, limit=limit, kind=kind)
+        finally:
+            index.close()
+    except SearchError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    if is_machine():
+        emit_records(
+            hits, fields=["path", "kind", "score", "title", "snippet"]
+        )
+        sys.exit(0 if hits else 1)
+
+    if not hits:
+        console.print(f"No results for [bold]{escape(text)}[/bold]")
+        sys.exit(1)
+
+    terms = set(tokenize(text))
+    for hit in hits:
+        title = f" — {escape(hit['title'])}" if hit["title"] else ""
+        console.print(
+            f"\n[cyan]{escape(hit['path'])}[/cyan]{title} "
+            f"[dim]({hit['kind']}, {hit['score']:.2f})[/dim]"
+        )
+        snippet = " ".join(
+            f"[bold]{escape(word)}[/bold]"
+            if word.lower().strip(".,:;()`*\"'") in terms
+            else escape(word)
+            for word in hit["snippet"].split(" ")
+        )
+        console.print(f"   {snippet}")
+
+
+@main.command()
+@click.argument("ticket")
+@click.option(
+    "--for",
+    "purpose",
+    type=click.Choice(["plan", "exec"]),
+    default="plan",
+    show_default=True,
+    help="Command the context is for",
+)
+@click.option(
+    "--budget",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Token budget for the pack (default: 24000)",
+)
+@click.option(
+    "--output",
+    "output_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the pack to a file instead of stdout",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Rebuild the pack even if its inputs are unchanged",
+)
+def context(ticket, purpose, budget, output_file, no_cache):
+    """Print a token-budgeted context pack for a ticket.
+
+    TICKET: Ticket name, ticket directory or path to its spec.yaml
+
+    Examples:
+        cdd context feature-user-auth
+        cdd context feature-user-auth --for exec --budget 16000
+    """
+    from rich.console import Console
+
+    from .context import DEFAULT_BUDGET, ContextError, build_context
+
+    err_console = Console(stderr=True)
+    try:
+        pack = build_context(
+            _resolve_ticket_dir(ticket),
+            purpose=purpose,
+            budget=budget or DEFAULT_BUDGET,
+            use_cache=not no_cache,
+        )
+    except (PathResolutionError, ContextError) as e:
+        err_console.print(f"\n[red]{e}[/red]")
+        sys.exit(1)
+
+    if output_file:
+        output_file.write_text(pack["text"], encoding="utf-8")
+    else:
+        click.echo(pack["text"], nl=False)
+
+    truncated = [s["path"] for s in pack["sections"] if s["truncated"]]
+    summary = (
+        f"📦 {len(pack['sections'])} files, ~{pack['tokens']} of "
+        f"{pack['budget']} tokens"
+        + (" [dim](cached)[/dim]" if pack["cached"] else "")
+    )
+    if truncated:
+        summary += f"; truncated: {escape(', '.join(truncated))}"
+    err_console.print(summary)
+
+
+@main.command()
+@click.argument(
+    "paths", nargs=-1, type=click.Path(exists=True, path_type=Path)
+)
+@click.option(
+    "--estimator",
+    default=None,
+    help="Token estimator: chars (default), words, tiktoken or "
+    "module:function",
+)
+@click.option(
+    "--sections",
+    is_flag=True,
+    help="Show a per-heading breakdown for each file",
+)
+@click.option(
+    "--against",
+    metavar="REF",
+    default=None,
+    help="Git revision to compare with (default: latest release tag)",
+)
+@click.option(
+    "--budget",
+    "budget_overrides",
+    multiple=True,
+    metavar="GROUP=TOKENS",
+    help="Override a per-file budget, e.g. --budget commands=15000",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Exit with status 1 if any file is over budget",
+)
+def tokens(paths, estimator, sections, against, budget_overrides, check):
+    """Estimate the prompt size of command files, templates and tickets.
+
+    PATHS: Files or directories to profile (defaults to installed
+    commands, templates and active ticket artifacts)
+
+    Examples:
+        cdd tokens
+        cdd tokens --sections .claude/commands/socrates.md
+        cdd tokens --against v0.1.4 --check
+    """
+    from .project import find_project_root, relative_to_cwd
+    from .tokens import (
+        TokenEstimatorError,
+        discover_token_targets,
+        expand_token_targets,
+        latest_release,
+        load_budgets,
+        over_budget,
+        profile_tokens,
+    )
+
+    project_root = find_project_root()
+    budgets = load_budgets(project_root)
+    for override in budget_overrides:
+        group, _, value = override.partition("=")
+        if not value.isdigit():
+            console.print(
+                f"[red]❌ Invalid budget (expected GROUP=TOKENS):[/red] "
+                f"{escape(override)}"
+            )
+            sys.exit(1)
+        budgets[group] = int(value)
+
+    root = project_root or Path.cwd()
+    if paths:
+        targets = expand_token_targets(list(paths))
+    else:
+        targets = discover_token_targets(root, Config.get_language())
+    against = against or latest_release(root)
+
+    try:
+        report = profile_tokens(
+            targets,
+            estimator=estimator,
+            budgets=budgets,
+            against=against,
+            repo_dir=project_root,
+            project_root=root,
+        )
+    except TokenEstimatorError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    from rich.table import Table
+
+    table = Table(title=f"Estimated tokens ({report['estimator']})")
+    table.add_column("File", style="cyan")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Budget", justify="right")
+    if against:
+        table.add_column(f"Δ vs {against}", justify="right")
+
+    for entry in report["files"]:
+        path = escape(str(relative_to_cwd(Path(entry["path"]).absolute())))
+        over = (
+            entry["budget"] is not None and entry["tokens"] > entry["budget"]
+        )
+        row = [
+            path,
+            f"[red]{entry['tokens']:,}[/red]"
+            if over
+            else f"{entry['tokens']:,}",
+            f"{entry['budget']:,}" if entry["budget"] else "-",
+        ]
+        if against:
+            row.append(_format_token_delta(entry["tokens"], entry["previous"]))
+        table.add_row(*row)
+
+        if sections:
+            for section in entry["sections"]:
+                indent = "  " * max(section["level"], 1)
+                table.add_row(
+                    f"[dim]{indent}{escape(section['heading'])} "
+                    f"(line {section['line']})[/dim]",
+                    f"[dim]{section['tokens']:,}[/dim]",
+                    "",
+                    *([""] if against else []),
+                )
+
+    console.print(table)
+    total = f"Total: {report['total']:,} tokens"
+    if against and report["previous_total"] is not None:
+        total += (
+            f" ({_format_token_delta(report['total'], report['previous_total'])}"
+            f" vs {escape(against)})"
+        )
+    console.print(total)
+
+    exceeded = over_budget(report)
+    if exceeded:
+        console.print(f"[red]❌ {len(exceeded)} file(s) over budget[/red]")
+        if check:
+            sys.exit(1)
+
+
+@main.command()
+@click.argument(
+    "command",
+    type=click.Choice(["socrates", "plan", "exec", "exec-auto"]),
+)
+@click.argument("ticket", required=False)
+@click.option(
+    "--type",
+    "ticket_type",
+    type=click.Choice(TICKET_TYPES),
+    default=None,
+    help="Ticket type to assemble for (default: read from TICKET)",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Print the compact build of the prompt",
+)
+def prompt(command, ticket, ticket_type, compact):
+    """Print a command prompt assembled for one ticket type.
+
+    Guidance for other ticket types is left out, so the prompt is
+    smaller than the installed command. The type is read from the
+    ticket's spec.yaml unless --type is given.
+
+    COMMAND: Framework command (socrates, plan, exec, exec-auto)
+
+    TICKET: Ticket name, ticket directory or path to its spec.yaml
+
+    Examples:
+        cdd prompt plan bug-login-crash
+        cdd prompt socrates --type spike --compact
+    """
+    from rich.console import Console
+
+    from .compact import CompactError, compact_packaged_commands
+    from .context import ticket_type as read_ticket_type
+    from .fragments import FragmentError, assemble_packaged_commands
+    from .tokens import estimate_tokens
+
+    err_console = Console(stderr=True)
+    try:
+        if ticket_type is None and ticket:
+            ticket_dir = _resolve_ticket_dir(ticket)
+            try:
+                spec_text = (ticket_dir / "spec.yaml").read_text(
+                    encoding="utf-8"
+                )
+            except OSError:
+                spec_text = ""
+            ticket_type = read_ticket_type(ticket_dir, spec_text)
+            if ticket_type not in TICKET_TYPES:
+                ticket_type = None
+
+        language = Config.get_language()
+        if compact:
+            files = compact_packaged_commands(language, ticket_type)
+        else:
+            files = assemble_packaged_commands(language, ticket_type)
+    except (PathResolutionError, FragmentError, CompactError) as e:
+        err_console.print(f"\n[red]{e}[/red]")
+        sys.exit(1)
+
+    text = dict(files)[f"{command}.md"].decode("utf-8")
+    click.echo(text, nl=False)
+    err_console.print(
+        f"🧩 {command} for {ticket_type or 'all ticket types'}: "
+        f"~{estimate_tokens(text)} tokens"
+    )
+
+
+def _resolve_ticket_dir(ticket: str) -> Path:
+    """Resolve a ticket name, directory or spec path to its folder."""
+    path = Path(ticket)
+    if path.is_dir():
+        return path
+    if path.is_file():
+        return path.parent
+    return PathResolver.resolve(ticket, "spec.yaml").parent
+
+
+def _format_token_delta(current: int, previous) -> str:
+    """Format a token count change for display."""
+    if previous is None:
+        return "[dim]new[/dim]"
+    delta = current - previous
+    if delta > 0:
+        return f"[yellow]+{delta:,}[/yellow]"
+    if delta < 0:
+        return f"[green]{delta:,}[/green]"
+    return "0"
+
+
+@main.group()
+def docs():
+    """Check the project documentation."""
+    pass
+
+
+@docs.command(name="graph")
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Number of most-referenced pages to show",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Exit with status 1 if any link is broken (for commit hooks)",
+)
+def docs_graph(top, check):
+    """Report broken links, orphaned pages and the most-referenced pages.
+
+    Links are parsed from docs/, ticket specs and plans, README.md and
+    CLAUDE.md. Only files changed since the last run are re-parsed.
+
+    Examples:
+        cdd docs graph
+        cdd docs graph --check --top 0
+    """
+    from .docgraph import DocGraph
+    from .project import find_project_root
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    graph = DocGraph.load(project_root)
+    graph.save()
+    broken = graph.broken_links()
+    orphans = graph.orphans()
+
+    if is_machine():
+        records = [{"kind": "broken_link", **link} for link in broken]
+        records += [{"kind": "orphan", "path": path} for path in orphans]
+        records += [
+            {"kind": "most_referenced", "path": path, "count": count}
+            for path, count in (graph.most_referenced(top) if top else [])
+        ]
+        emit_records(records)
+        sys.exit(1 if check and broken else 0)
+
+    if broken:
+        console.print(f"\n[red]❌ {len(broken)} broken links[/red]")
+        for link in broken:
+            console.print(
+                f"   {escape(link['source'])}:{link['line']} → "
+                f"[red]{escape(link['target'])}[/red] "
+                f"[dim]({link['reason']})[/dim]"
+            )
+
+    if orphans:
+        console.print(
+            f"\n[yellow]⚠️  {len(orphans)} orphaned pages "
+            "(nothing links to them)[/yellow]"
+        )
+        for path in orphans:
+            console.print(f"   {escape(path)}")
+
+    ranked = graph.most_referenced(top) if top else []
+    if ranked:
+        from rich.table import Table
+
+        table = Table(title="Most referenced", title_justify="left")
+        table.add_column("Page")
+        table.add_column("Linked from", justify="right")
+        for path, count in ranked:
+            table.add_row(escape(path), str(count))
+        console.print()
+        console.print(table)
+
+    console.print(
+        f"\n📚 {len(graph.files)} files, {len(broken)} broken links, "
+        f"{len(orphans)} orphans"
+    )
+    if check and broken:
+        sys.exit(1)
+
+
+@docs.command(name="stale")
+@click.option(
+    "--dir",
+    "docs_dir",
+    default="docs/features",
+    show_default=True,
+    help="Directory of the pages to check",
+)
+@click.option(
+    "--all",
+    "show_all",
+    is_flag=True,
+    help="Also list pages whose sources have not changed",
+)
+def docs_stale(docs_dir, show_all):
+    """List documentation pages whose sources changed since their last edit.
+
+    Each page is mapped to the source paths it mentions; pages are ranked
+    by the lines changed in those sources by commits made after the
+    page's own last commit.
+
+    Examples:
+        cdd docs stale
+        cdd docs stale --dir docs/guides --all
+    """
+    from datetime import datetime
+
+    from .project import find_project_root
+    from .staleness import StalenessError, find_stale_docs
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    try:
+        results = find_stale_docs(project_root, docs_dir, show_all)
+    except StalenessError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    if is_machine():
+        emit_records(
+            results,
+            fields=["path", "last_updated", "commits", "lines_changed"],
+        )
+        return
+
+    if not results:
+        console.print("✅ No stale documentation")
+        return
+
+    from rich.table import Table
+
+    table = Table()
+    table.add_column("Page", no_wrap=True)
+    table.add_column("Updated")
+    table.add_column("Commits", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Lines", justify="right")
+    for doc in results:
+        updated = (
+            datetime.fromtimestamp(doc["last_updated"]).strftime("%Y-%m-%d")
+            if doc["last_updated"]
+            else "uncommitted"
+        )
+        table.add_row(
+            escape(doc["path"]),
+            updated,
+            str(doc["commits"]),
+            str(len(doc["changed_files"])),
+            str(doc["lines_changed"]),
+        )
+    console.print(table)
+    console.print(
+        "[dim]Commits, files and lines changed in each page's sources "
+        "since the page was last committed[/dim]"
+    )
+
+
+@main.command()
+@click.argument("ticket", required=False)
+def history(ticket):
+    """Show when tickets were created, planned, implemented and archived.
+
+    Timelines are rebuilt from git history; only commits made since the
+    last run are read.
+
+    TICKET: Ticket name to show the full timeline for (default: summary
+    of every ticket)
+
+    Examples:
+        cdd history
+        cdd history feature-user-auth
+    """
+    from datetime import datetime
+
+    from .history import MILESTONES, HistoryError, TicketHistory
+    from .project import find_project_root
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    try:
+        timelines = TicketHistory.load(project_root)
+    except HistoryError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    if is_machine():
+        if ticket:
+            name = Path(ticket.rstrip("/")).name
+            emit_records(
+                timelines.timeline(name),
+                fields=["time", "event", "detail", "commit"],
+            )
+            return
+        emit_records(
+            {
+                "ticket": name,
+                **{
+                    milestone: event["time"] if event else None
+                    for milestone, event in timelines.milestones(name).items()
+                },
+            }
+            for name in sorted(timelines.tickets)
+        )
+        return
+
+    from rich.table import Table
+
+    def _date(event) -> str:
+        if event is None:
+            return "[dim]-[/dim]"
+        return datetime.fromtimestamp(event["time"]).strftime("%Y-%m-%d")
+
+    if ticket:
+        ticket = Path(ticket.rstrip("/")).name
+        events = timelines.timeline(ticket)
+        if not events:
+            console.print(
+                f"\n[red]❌ No history for ticket: {escape(ticket)}[/red]"
+            )
+            sys.exit(1)
+        table = Table(title=escape(ticket), title_justify="left")
+        table.add_column("Date")
+        table.add_column("Event")
+        table.add_column("Commit")
+        for event in events:
+            label = event["event"]
+            if event["detail"]:
+                label += f" → {event['detail']}"
+            table.add_row(_date(event), escape(label), event["commit"][:10])
+        console.print(table)
+        return
+
+    if not timelines.tickets:
+        console.print("No ticket history found")
+        return
+
+    table = Table()
+    table.add_column("Ticket", overflow="fold")
+    for milestone in MILESTONES:
+        table.add_column(milestone.title(), no_wrap=True)
+    for name in sorted(timelines.tickets):
+        found = timelines.milestones(name)
+        table.add_row(
+            escape(name),
+            *(_date(found[milestone]) for milestone in MILESTONES),
+        )
+    console.print(table)
+
+
+@main.command("run-queue")
+@click.argument("tickets", nargs=-1)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum tickets executed at once (default: CPU count)",
+)
+@click.option(
+    "--executor",
+    default=None,
+    help="Command run per ticket; {ticket}, {ticket_dir}, {spec} and "
+    "{plan} are replaced",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Seconds before a ticket's executor is stopped",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show the execution order without running anything",
+)
+def run_queue(tickets, jobs, executor, timeout, dry_run):
+    """Execute planned tickets in parallel, in priority order.
+
+    Tickets with spec status `planned` and a plan.md are run through the
+    executor command, respecting `ticket.depends_on`. Tickets whose plans
+    touch the same files never run at the same time. Each ticket's
+    result is read from its progress.yaml status; executor output goes
+    to .cdd/cache/run-queue/<ticket>.log.
+
+    TICKETS: Ticket names to run (default: every planned ticket)
+
+    Examples:
+        cdd run-queue --dry-run
+        cdd run-queue -j 4
+        cdd run-queue feature-user-auth --executor "my-agent {plan}"
+    """
+    from .project import find_project_root, relative_to_cwd
+    from .scheduler import (
+        RunQueue,
+        SchedulerError,
+        load_settings,
+        select_tickets,
+    )
+
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    settings = load_settings(project_root)
+    try:
+        queue = RunQueue(
+            project_root,
+            select_tickets(project_root, list(tickets)),
+            executor=executor or settings["executor"],
+            workers=jobs or settings["workers"],
+            timeout=timeout or settings["timeout"],
+        )
+    except SchedulerError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    if is_machine():
+        _run_queue_records(queue, dry_run)
+
+    if not queue.queue:
+        console.print("No planned tickets to run")
+        return
+
+    if dry_run:
+        from rich.table import Table
+
+        table = Table(title=f"Run queue ({queue.workers} workers)")
+        table.add_column("#", justify="right")
+        table.add_column("Ticket", overflow="fold")
+        table.add_column("Priority")
+        table.add_column("Depends on", overflow="fold")
+        table.add_column("Files", justify="right")
+        for position, ticket in enumerate(queue.queue, 1):
+            table.add_row(
+                str(position),
+                escape(ticket["name"]),
+                ticket["priority"] or "-",
+                escape(", ".join(ticket["depends_on"])) or "-",
+                str(len(ticket["files"])),
+            )
+        console.print(table)
+        return
+
+    icons = {
+        "completed": "✅",
+        "incomplete": "⚠️ ",
+        "failed": "❌",
+        "blocked": "⏸️ ",
+    }
+
+    def _report(event, name, result):
+        if result is None:
+            console.print(f"▶️  {escape(name)} [dim]started[/dim]")
+            return
+        line = f"{icons[result['status']]} {escape(name)} {result['status']}"
+        if result["duration"]:
+            line += f" [dim]({result['duration']:.1f}s)[/dim]"
+        if result["reason"]:
+            line += f" [dim]- {escape(result['reason'])}[/dim]"
+        console.print(line)
+
+    queue.on_event = _report
+    console.print(
+        f"Running {len(queue.queue)} tickets with up to "
+        f"{queue.workers} workers\n"
+    )
+    try:
+        results = queue.run()
+    except SchedulerError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped; running executors were killed[/dim]")
+        sys.exit(130)
+
+    counts = {status: 0 for status in icons}
+    for result in results:
+        counts[result["status"]] += 1
+    console.print(
+        "\n"
+        + ", ".join(f"{count} {status}" for status, count in counts.items())
+    )
+    console.print(
+        f"[dim]Logs: {escape(str(relative_to_cwd(queue.logs_dir)))}[/dim]"
+    )
+    sys.exit(0 if counts["completed"] == len(results) else 1)
+
+
+def _run_queue_records(queue, dry_run):
+    """Emit the queue (dry run) or each ticket's result, then exit."""
+    from .output import get_mode
+    from .scheduler import SchedulerError
+
+    if dry_run:
+        emit_records(
+            queue.queue, fields=["name", "priority", "depends_on", "files"]
+        )
+        sys.exit(0)
+
+    fields = ["name", "status", "returncode", "duration", "reason"]
+    if get_mode() != "json":
+        # Stream each result as its ticket finishes
+        queue.on_event = lambda event, name, result: (
+            result is not None and emit(result, fields)
+        )
+    try:
+        results = queue.run()
+    except SchedulerError as e:
+        console.print(f"\n[red]❌ {e}[/red]")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    if get_mode() == "json":
+        emit_records(results, fields)
+    completed = sum(1 for result in results if result["status"] == "completed")
+    sys.exit(0 if completed == len(results) else 1)
+
+
+@main.command()
+@click.option(
+    "--stdio",
+    is_flag=True,
+    help="Communicate over stdin/stdout (the default; accepted for "
+    "editor clients that always pass it)",
+)
+def lsp(stdio):
+    """Run the language server for spec.yaml, progress.yaml and plan.md.
+
+    Speaks the Language Server Protocol over stdin/stdout: diagnostics
+    against the ticket-type schema, completions for enum values such
+    as ticket.status and priority, and go-to-definition for ticket
+    references. Configure your editor to start `cdd lsp` for YAML and
+    Markdown files under specs/.
+
+    Examples:
+        cdd lsp
+    """
+    from .lsp import LanguageServer
+
+    server = LanguageServer(send=lambda message: None)
+    sys.exit(server.serve(sys.stdin.buffer, sys.stdout.buffer))
+
+
+@main.command()
+@click.argument("requests_file", type=click.File("r"), required=False)
+@click.option(
+    "--stdin",
+    "from_stdin",
+    is_flag=True,
+    help="Read requests from stdin",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Operations run at once; operations on the same ticket still "
+    "run in order (default: 1)",
+)
+def batch(requests_file, from_stdin, jobs):
+    """Run many operations in one process from JSON lines.
+
+    Each input line is a request such as
+    {"id": 1, "op": "get_status", "args": {"ticket": "feature-auth"}}.
+    Each request gets one JSON response line on stdout, in input order,
+    with either a result or an error. Exits with 1 if any request
+    failed.
+
+    REQUESTS_FILE: File of requests (use --stdin to read from stdin)
+
+    Examples:
+        cdd batch --stdin < requests.jsonl
+        cdd batch requests.jsonl -j 8
+    """
+    from .api import Repository
+    from .batch import run_batch
+    from .project import find_project_root
+
+    if requests_file is not None and from_stdin:
+        raise click.UsageError("Pass either REQUESTS_FILE or --stdin")
+    if requests_file is None and not from_stdin:
+        raise click.UsageError("Pass REQUESTS_FILE or --stdin")
+
+    # Keep stdout for responses; notices go to stderr
+    set_mode("ndjson")
+    project_root = find_project_root()
+    if project_root is None:
+        console.print(
+            "\n[red]❌ Not a CDD project (no .cdd directory found)[/red]"
+        )
+        sys.exit(1)
+
+    def write(line):
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+    lines = sys.stdin if from_stdin else requests_file
+    with Repository(project_root) as repo:
+        failed = run_batch(repo, lines, write, jobs)
+    sys.exit(1 if failed else 0)
+
+
 if __name__ == "__main__":
     main()
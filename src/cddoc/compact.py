@@ -0,0 +1,225 @@
+"""Compact builds of the framework command prompts.
+
+`cdd init --compact` installs minified variants of the packaged command
+files: the long "DO NOT MODIFY" banner becomes a one-line marker,
+decorative rules and redundant whitespace are removed, and blocks that
+repeat earlier in the same file (repeated examples and reminders) are
+dropped. Fenced code blocks are kept verbatim.
+
+Each build is checked against its source: every heading must survive in
+order and every distinct block of the source must still be present, so
+no instruction is lost.
+
+Run `python -m cddoc.compact` to see the savings and run the check for
+every packaged language.
+"""
+
+import re
+import sys
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
+
+from .fragments import assemble_packaged_commands
+from .init import SUPPORTED_LANGUAGES
+from .tokens import estimate_tokens
+
+# Marker identifying framework-managed command files
+BANNER_MARKER = "CDD FRAMEWORK COMMAND"
+
+COMPACT_BANNER = f"<!-- {BANNER_MARKER} (compact build) - DO NOT MODIFY -->"
+
+# Shorter repeated blocks (e.g. "Read CLAUDE.md") are kept: they are
+# cheap and usually carry local meaning
+DEDUPE_MIN_CHARS = 80
+
+BANNER_PATTERN = re.compile(r"\A\s*<!--(.*?)-->\s*", re.DOTALL)
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+HEADING_PATTERN = re.compile(r"^#{1,6}\s")
+RULE_PATTERN = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+
+
+class CompactError(Exception):
+    """Raised when a compact build would lose content."""
+
+    pass
+
+
+def strip_banner(text: str) -> str:
+    """Remove the framework banner comment from the top of a file."""
+    match = BANNER_PATTERN.match(text)
+    if match and BANNER_MARKER in match.group(1):
+        return text[match.end() :]
+    return text
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split Markdown into blank-line separated blocks.
+
+    Fenced code blocks are never split, even if they contain blank
+    lines.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        Blocks without surrounding blank lines
+    """
+    blocks: List[str] = []
+    current: List[str] = []
+    in_fence = False
+
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        if not in_fence and not line.strip():
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _normalize(block: str) -> str:
+    return " ".join(block.split())
+
+
+def _is_rule(block: str) -> bool:
+    return bool(RULE_PATTERN.match(block))
+
+
+def _headings(blocks: List[str]) -> List[str]:
+    headings = []
+    for block in blocks:
+        in_fence = False
+        for line in block.splitlines():
+            if FENCE_PATTERN.match(line):
+                in_fence = not in_fence
+            elif not in_fence and HEADING_PATTERN.match(line):
+                headings.append(line.strip())
+    return headings
+
+
+def compact_command(text: str) -> str:
+    """Build the compact variant of a command file.
+
+    Args:
+        text: Command file content
+
+    Returns:
+        Compact content, starting with COMPACT_BANNER
+    """
+    seen: Set[str] = set()
+    kept = []
+
+    for block in split_blocks(strip_banner(text)):
+        if _is_rule(block):
+            continue
+        if not FENCE_PATTERN.match(block):
+            block = "\n".join(line.rstrip() for line in block.splitlines())
+
+        key = _normalize(block)
+        is_heading = bool(HEADING_PATTERN.match(block))
+        if len(key) >= DEDUPE_MIN_CHARS and not is_heading:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(block)
+
+    return COMPACT_BANNER + "\n\n" + "\n\n".join(kept) + "\n"
+
+
+def verify_compact(original: str, compact: str) -> List[str]:
+    """Check that a compact build preserves its source's content.
+
+    Args:
+        original: Source command file
+        compact: Output of compact_command()
+
+    Returns:
+        Problems found (empty when the build is faithful)
+    """
+    problems = []
+    source_blocks = [
+        block
+        for block in split_blocks(strip_banner(original))
+        if not _is_rule(block)
+    ]
+    compact_blocks = split_blocks(compact)
+
+    if BANNER_MARKER not in compact:
+        problems.append("framework marker missing")
+
+    if _headings(source_blocks) != _headings(compact_blocks):
+        problems.append("headings differ from the source")
+
+    present = {_normalize(block) for block in compact_blocks}
+    for block in source_blocks:
+        if _normalize(block) not in present:
+            first_line = block.splitlines()[0][:60]
+            problems.append(f"missing block: {first_line}")
+
+    return problems
+
+
+@lru_cache(maxsize=None)
+def compact_packaged_commands(
+    language: str, ticket_type: Optional[str] = None
+) -> Tuple[Tuple[str, bytes], ...]:
+    """Build and verify compact variants of the packaged commands.
+
+    Args:
+        language: Language code ('en' or 'pt-br')
+        ticket_type: Ticket type to assemble for (None keeps all
+            fragments, see cddoc.fragments)
+
+    Returns:
+        Tuple of (file name, compact contents) pairs
+
+    Raises:
+        CompactError: If a build fails verification
+    """
+    built = []
+    for name, data in assemble_packaged_commands(language, ticket_type):
+        original = data.decode("utf-8")
+        compact = compact_command(original)
+        problems = verify_compact(original, compact)
+        if problems:
+            raise CompactError(
+                f"Compact build of {language}/{name} is lossy: "
+                + "; ".join(problems)
+            )
+        built.append((name, compact.encode("utf-8")))
+    return tuple(built)
+
+
+def main() -> int:
+    """Report compact build savings and verify every language.
+
+    Returns:
+        Process exit status
+    """
+    status = 0
+    for language in SUPPORTED_LANGUAGES:
+        for name, data in assemble_packaged_commands(language):
+            original = data.decode("utf-8")
+            compact = compact_command(original)
+            problems = verify_compact(original, compact)
+            before = estimate_tokens(original)
+            after = estimate_tokens(compact)
+            saved = 100 * (before - after) // max(before, 1)
+            print(
+                f"{language}/{name}: {before} -> {after} tokens "
+                f"(-{saved}%)" + (" LOSSY" if problems else "")
+            )
+            for problem in problems:
+                print(f"  {problem}")
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""Cross-process locking and revision checks for ticket files.
+
+Several agent sessions may update the same spec.yaml or progress.yaml.
+Two mechanisms keep their writes from silently overwriting each other:
+
+- Locks: `locked(path)` serializes read-modify-write cycles across
+  processes with `fcntl.flock` on a lock file in `.cdd/cache/locks/`
+  (next to the file, hidden, outside a project). Locks are re-entrant
+  within a process, time out instead of waiting forever, and name the
+  holder in the timeout error. flock locks are released by the kernel
+  when their holder dies, so they cannot go stale; where fcntl is not
+  available an exclusive lock file is used instead, and it is broken
+  when its holder process is gone or it is older than STALE_AFTER.
+- Revisions: every handler write increments a revision counter kept
+  next to the file's lock (`<lock>.rev`), so ticket files themselves
+  carry no bookkeeping. Data read earlier carries the revision it was
+  read at in its `revision` key (never written to the file); writing
+  it back fails with RevisionConflictError if the file was written in
+  between, instead of discarding that write.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, TypedDict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from .project import find_project_root, get_cache_dir
+
+# Seconds to wait for a lock before giving up
+DEFAULT_TIMEOUT = 10.0
+
+# Seconds between attempts to take a busy lock
+POLL_INTERVAL = 0.02
+
+# Age after which a lock file (without fcntl) is considered abandoned
+STALE_AFTER = 300.0
+
+LOCKS_DIR = "locks"
+
+# Key carrying the revision data was read at (in memory only). It is
+# namespaced so a document's own "revision" field is left alone.
+REVISION_FIELD = "_cdd_revision"
+
+
+class ConcurrencyError(Exception):
+    """Raised when a lock cannot be taken in time."""
+
+    pass
+
+
+class RevisionConflictError(ConcurrencyError):
+    """Raised when a file changed since the data being written was read."""
+
+    pass
+
+
+class LockHolder(TypedDict):
+    pid: int
+    host: str
+    acquired_at: float
+
+
+class _Entry:
+    """In-process state of one lock file."""
+
+    def __init__(self):
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.fd: Optional[int] = None
+
+
+_entries: Dict[str, _Entry] = {}
+_entries_lock = threading.Lock()
+
+
+def lock_path_for(path: Path) -> Path:
+    """Get the lock file guarding a file.
+
+    Args:
+        path: File to lock (its directory must exist)
+
+    Returns:
+        Lock file in the project's lock directory, or a hidden sibling
+        when the file is not inside a CDD project
+    """
+    path = Path(path).resolve()
+    root = find_project_root(path.parent)
+    if root is None:
+        return path.with_name(f".{path.name}.lock")
+    locks_dir = get_cache_dir(root) / LOCKS_DIR
+    locks_dir.mkdir(exist_ok=True)
+    digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:16]
+    return locks_dir / f"{path.name}-{digest}.lock"
+
+
+def read_holder(lock_path: Path) -> Optional[LockHolder]:
+    """Read who holds (or last held) a lock, if recorded."""
+    try:
+        holder = json.loads(Path(lock_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return holder if isinstance(holder, dict) and "pid" in holder else None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def is_stale(lock_path: Path, stale_after: float = STALE_AFTER) -> bool:
+    """Check whether a lock's holder is gone or has held it too long.
+
+    Args:
+        lock_path: Lock file
+        stale_after: Maximum age in seconds
+
+    Returns:
+        True if the lock can be broken
+    """
+    holder = read_holder(lock_path)
+    if holder is None:
+        try:
+            age = time.time() - os.stat(lock_path).st_mtime
+        except OSError:
+            return False
+        return age > stale_after
+    if holder.get("host") == socket.gethostname() and not _pid_alive(
+        holder["pid"]
+    ):
+        return True
+    return time.time() - holder.get("acquired_at", 0) > stale_after
+
+
+def _describe_holder(lock_path: Path) -> str:
+    holder = read_holder(lock_path)
+    if holder is None:
+        return ""
+    age = time.time() - holder.get("acquired_at", time.time())
+    return (
+        f" (held by pid {holder['pid']} on {holder.get('host', '?')} "
+        f"for {age:.0f}s)"
+    )
+
+
+def _holder_record() -> bytes:
+    holder: LockHolder = {
+        "pid": os.getpid(),
+        "host": socket.gethostname(),
+        "acquired_at": time.time(),
+    }
+    return json.dumps(holder).encode("utf-8")
+
+
+def _acquire_file(lock_path: Path, deadline: float, stale_after: float) -> int:
+    """Take the cross-process lock, polling until the deadline."""
+    while True:
+        if fcntl is not None:
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+            else:
+                os.ftruncate(fd, 0)
+                os.write(fd, _holder_record())
+                return fd
+        else:
+            try:
+                fd = os.open(
+                    lock_path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644
+                )
+            except FileExistsError:
+                if is_stale(lock_path, stale_after):
+                    try:
+                        os.remove(lock_path)
+                    except OSError:
+                        pass
+                    continue
+            else:
+                os.write(fd, _holder_record())
+                return fd
+
+        if time.monotonic() >= deadline:
+            raise ConcurrencyError(
+                f"Timed out waiting for lock {lock_path}"
+                + _describe_holder(lock_path)
+            )
+        time.sleep(POLL_INTERVAL)
+
+
+def _release_file(lock_path: Path, fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+    else:
+        os.close(fd)
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def locked(
+    path: Path,
+    timeout: float = DEFAULT_TIMEOUT,
+    stale_after: float = STALE_AFTER,
+) -> Iterator[Path]:
+    """Hold the lock guarding a file.
+
+    Re-entrant within a process: nested `locked()` calls for the same
+    file from the same thread do not block.
+
+    Args:
+        path: File to lock (its directory must exist)
+        timeout: Seconds to wait before raising ConcurrencyError
+        stale_after: Age after which a lock file is broken (only
+            without fcntl)
+
+    Yields:
+        Path of the lock file
+
+    Raises:
+        ConcurrencyError: If the lock is not available in time
+    """
+    lock_path = lock_path_for(path)
+    key = str(lock_path)
+    with _entries_lock:
+        entry = _entries.setdefault(key, _Entry())
+
+    deadline = time.monotonic() + timeout
+    if not entry.thread_lock.acquire(timeout=max(timeout, 0)):
+        raise ConcurrencyError(
+            f"Timed out waiting for lock {lock_path} (held by another "
+            f"thread of this process)"
+        )
+    try:
+        if entry.depth == 0:
+            entry.fd = _acquire_file(lock_path, deadline, stale_after)
+        entry.depth += 1
+    except BaseException:
+        entry.thread_lock.release()
+        raise
+
+    try:
+        yield lock_path
+    finally:
+        entry.depth -= 1
+        if entry.depth == 0:
+            _release_file(lock_path, entry.fd)
+            entry.fd = None
+        entry.thread_lock.release()
+
+
+def revision_path_for(path: Path) -> Path:
+    """Get the file holding a file's revision counter (beside its lock)."""
+    return lock_path_for(path).with_suffix(".rev")
+
+
+def current_revision(path: Path) -> int:
+    """Get the revision of a file (0 if it was never written by cddoc).
+
+    Readers must call this before reading the file: writers store the
+    new revision after replacing the file, so a write in between makes
+    the data look stale rather than current.
+    """
+    try:
+        return int(revision_path_for(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+
+
+def store_revision(path: Path, revision: int) -> None:
+    """Record a file's new revision after it was written.
+
+    Must be called while holding the file's lock.
+    """
+    atomic_write(revision_path_for(path), f"{revision}\n")
+
+
+def without_revision(data: dict) -> dict:
+    """Get a document without its in-memory revision, ready to dump."""
+    return {key: value for key, value in data.items() if key != REVISION_FIELD}
+
+
+def claim_revision(path: Path, data: dict) -> int:
+    """Check and advance the revision of data about to replace a file.
+
+    Must be called while holding the file's lock. Data without a
+    revision (created from scratch) is not checked. Once the file is
+    written, pass the result to store_revision().
+
+    Args:
+        path: File being written
+        data: Document to write; its revision is set to the new one
+
+    Returns:
+        The new revision
+
+    Raises:
+        RevisionConflictError: If the file was written after data was
+            read
+    """
+    current = current_revision(path)
+    expected = data.get(REVISION_FIELD)
+    if expected is not None and expected != current:
+        raise RevisionConflictError(
+            f"{path} changed since it was read (revision {expected}, now "
+            f"{current}); re-read it and apply the change again"
+        )
+    data[REVISION_FIELD] = current + 1
+    return current + 1
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Replace a file's content so readers never see a partial write.
+
+    The temporary file is unique per call, so threads and processes may
+    write the same file at once; the last replace wins.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:12]}.tmp"
+    )
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -5,6 +5,9 @@ from typing import Optional
 
 import yaml
 
+from .profiling import phase
+from .project import find_project_root
+
 
 class Config:
     """Singleton configuration manager.
@@ -36,13 +39,19 @@ class Config:
         return cls._language or "en"
 
     @classmethod
+    @phase("config")
     def _load_language(cls) -> Optional[str]:
-        """Load language from .cdd/config.yaml.
+        """Load language from the project's .cdd/config.yaml.
 
         Returns:
             Language code, None if config not found, 'en' if malformed.
         """
-        config_path = Path(".cdd/config.yaml")
+        project_root = find_project_root()
+        config_path = (
+            project_root / ".cdd" / "config.yaml"
+            if project_root
+            else Path(".cdd/config.yaml")
+        )
 
         if not config_path.exists():
             return None  # Signals config not found (show warning)
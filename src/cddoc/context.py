@@ -0,0 +1,400 @@
+"""Token-budgeted context packs for tickets.
+
+`cdd context <ticket>` assembles everything `/plan` or `/exec` needs to
+read for a ticket into one deterministic bundle:
+
+- CLAUDE.md (project constitution)
+- the plan template for the ticket's type (`/plan` only)
+- the documentation pages most related to the ticket
+- spec.yaml, and for `/exec` plan.md and progress.yaml (created from
+  the parsed plan when the ticket has none, so execution can start
+  without re-deriving the steps)
+
+Sections are emitted from the most stable to the most volatile, so
+bundles for different tickets share a long common prefix that prompt
+caching can reuse. When the bundle exceeds its token budget, the least
+important sections are trimmed at Markdown heading boundaries.
+
+Packs are cached in `.cdd/cache/context/` keyed by the content hashes
+of their inputs.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, TypedDict
+
+import yaml
+
+from .concurrency import atomic_write
+from .handlers.progress_handler import ProgressHandler, ProgressHandlerError
+from .project import find_project_root, get_cache_dir
+from .search import SearchError, SearchIndex
+from .tokens import estimate_tokens
+
+# Bump when the pack layout changes to invalidate cached packs
+CONTEXT_VERSION = 1
+
+CACHE_DIR = "context"
+
+DEFAULT_BUDGET = 24000
+
+# Documentation pages included as related context
+RELATED_DOCS = 3
+
+# Smallest useful remainder when trimming a section to fit
+MIN_SECTION_TOKENS = 200
+
+CONSTITUTION_FILE = "CLAUDE.md"
+
+Purpose = Literal["plan", "exec"]
+
+# Sections each command needs
+PURPOSE_SECTIONS: Dict[str, List[str]] = {
+    "plan": ["constitution", "template", "docs", "spec"],
+    "exec": ["constitution", "docs", "spec", "plan", "progress"],
+}
+
+# Output order: most stable first, for prompt-cache reuse
+SECTION_ORDER = [
+    "constitution",
+    "template",
+    "docs",
+    "spec",
+    "plan",
+    "progress",
+]
+
+# Budget order: earlier sections keep their tokens when trimming
+SECTION_PRIORITY = [
+    "spec",
+    "plan",
+    "progress",
+    "template",
+    "constitution",
+    "docs",
+]
+
+# Sections included whole even when they exceed the budget
+REQUIRED_SECTIONS = {"spec"}
+
+
+class ContextError(Exception):
+    """Raised when a context pack cannot be built."""
+
+    pass
+
+
+class ContextSection(TypedDict):
+    name: str
+    path: str
+    tokens: int
+    truncated: bool
+
+
+class ContextPack(TypedDict):
+    ticket: str
+    purpose: str
+    budget: int
+    tokens: int
+    key: str
+    sections: List[ContextSection]
+    text: str
+    cached: bool
+
+
+class _Input(TypedDict):
+    name: str
+    path: str
+    text: str
+
+
+def ticket_type(ticket_dir: Path, spec_text: str) -> str:
+    """Get a ticket's type from its spec, or its folder prefix."""
+    try:
+        spec = yaml.safe_load(spec_text)
+    except yaml.YAMLError:
+        spec = None
+    if isinstance(spec, dict) and isinstance(spec.get("ticket"), dict):
+        declared = spec["ticket"].get("type")
+        if isinstance(declared, str) and declared:
+            return declared
+    return ticket_dir.name.split("-", 1)[0]
+
+
+def related_docs(
+    project_root: Path, ticket_dir: Path, spec_text: str, limit: int
+) -> List[str]:
+    """Find the documentation pages most related to a ticket.
+
+    Queries the search index with the ticket's title and name.
+
+    Args:
+        project_root: Project root directory
+        ticket_dir: Ticket folder
+        spec_text: Content of the ticket's spec.yaml
+        limit: Maximum number of pages
+
+    Returns:
+        Project-relative paths, sorted for a stable order
+    """
+    if limit <= 0:
+        return []
+    try:
+        spec = yaml.safe_load(spec_text)
+    except yaml.YAMLError:
+        spec = None
+    title = spec.get("title") if isinstance(spec, dict) else None
+    query = f"{title or ''} {ticket_dir.name.replace('-', ' ')}"
+
+    try:
+        index = SearchIndex(project_root)
+        try:
+            index.refresh()
+            hits = index.search(query, limit=limit, kind="doc")
+        finally:
+            index.close()
+    except SearchError:
+        return []
+    return sorted(hit["path"] for hit in hits)
+
+
+def collect_inputs(
+    ticket_dir: Path,
+    purpose: Purpose,
+    project_root: Path,
+    docs_limit: int = RELATED_DOCS,
+) -> List[_Input]:
+    """Read the files that make up a ticket's pack.
+
+    Args:
+        ticket_dir: Ticket folder
+        purpose: "plan" or "exec"
+        project_root: Project root directory
+        docs_limit: Maximum number of related documentation pages
+
+    Returns:
+        Inputs in output order (missing optional files are skipped)
+
+    Raises:
+        ContextError: If the ticket has no spec.yaml
+    """
+    spec_path = ticket_dir / "spec.yaml"
+    try:
+        spec_text = spec_path.read_text(encoding="utf-8")
+    except OSError:
+        raise ContextError(f"Spec not found: {spec_path}")
+
+    wanted = PURPOSE_SECTIONS[purpose]
+    candidates: Dict[str, List[Path]] = {
+        "constitution": [project_root / CONSTITUTION_FILE],
+        "template": [
+            project_root
+            / ".cdd"
+            / "templates"
+            / f"{ticket_type(ticket_dir, spec_text)}-plan-template.md"
+        ],
+        "docs": [
+            project_root / path
+            for path in related_docs(
+                project_root, ticket_dir, spec_text, docs_limit
+            )
+        ]
+        if "docs" in wanted
+        else [],
+        "spec": [spec_path],
+        "plan": [ticket_dir / "plan.md"],
+        "progress": [ticket_dir / "progress.yaml"],
+    }
+
+    inputs: List[_Input] = []
+    for name in SECTION_ORDER:
+        if name not in wanted:
+            continue
+        for path in candidates[name]:
+            try:
+                text = path.read_text(encoding="utf-8")
+            except OSError:
+                continue
+            inputs.append(
+                {
+                    "name": name,
+                    "path": Path(
+                        os.path.relpath(path, project_root)
+                    ).as_posix(),
+                    "text": text,
+                }
+            )
+    return inputs
+
+
+def pack_key(inputs: List[_Input], purpose: str, budget: int) -> str:
+    """Hash everything a pack's content depends on."""
+    digest = hashlib.sha256(f"{CONTEXT_VERSION}\0{purpose}\0{budget}".encode())
+    for item in inputs:
+        digest.update(f"\0{item['name']}\0{item['path']}\0".encode())
+        digest.update(hashlib.sha256(item["text"].encode()).digest())
+    return digest.hexdigest()
+
+
+def truncate_markdown(text: str, max_tokens: int) -> str:
+    """Trim text to a token budget, cutting at heading boundaries.
+
+    Whole sections (starting at a line beginning with '#') are kept
+    while they fit; if not even the first section fits, whole lines
+    are kept instead.
+
+    Args:
+        text: Markdown or YAML text
+        max_tokens: Token budget
+
+    Returns:
+        Trimmed text ending with a truncation marker
+    """
+    marker = "\n[... truncated to fit the context budget ...]\n"
+    limit = max_tokens - estimate_tokens(marker)
+
+    sections: List[List[str]] = [[]]
+    for line in text.splitlines(keepends=True):
+        if line.startswith("#") and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+
+    kept = ""
+    for section in sections:
+        candidate = kept + "".join(section)
+        if estimate_tokens(candidate) > limit:
+            break
+        kept = candidate
+
+    if not kept:
+        for line in text.splitlines(keepends=True):
+            if estimate_tokens(kept + line) > limit:
+                break
+            kept += line
+
+    return kept.rstrip("\n") + marker
+
+
+def fit_to_budget(inputs: List[_Input], budget: int) -> List[Dict]:
+    """Decide how much of each input goes into the pack.
+
+    Args:
+        inputs: Inputs in output order
+        budget: Token budget for the whole pack
+
+    Returns:
+        Inputs (same order) with "text", "tokens" and "truncated";
+        inputs that don't fit at all are dropped
+    """
+    sized = [
+        {**item, "tokens": estimate_tokens(_render_section(item))}
+        for item in inputs
+    ]
+    order = sorted(
+        range(len(sized)),
+        key=lambda i: (SECTION_PRIORITY.index(sized[i]["name"]), i),
+    )
+
+    remaining = budget
+    fitted: Dict[int, Dict] = {}
+    for i in order:
+        item = sized[i]
+        if item["tokens"] <= remaining or item["name"] in REQUIRED_SECTIONS:
+            fitted[i] = {**item, "truncated": False}
+            remaining -= item["tokens"]
+        elif remaining >= MIN_SECTION_TOKENS:
+            overhead = item["tokens"] - estimate_tokens(item["text"])
+            text = truncate_markdown(item["text"], remaining - overhead)
+            trimmed = {**item, "text": text, "truncated": True}
+            trimmed["tokens"] = estimate_tokens(_render_section(trimmed))
+            fitted[i] = trimmed
+            remaining -= trimmed["tokens"]
+
+    return [fitted[i] for i in sorted(fitted)]
+
+
+def _render_section(item) -> str:
+    return (
+        f'<file section="{item["name"]}" path="{item["path"]}">\n'
+        f"{item['text'].rstrip()}\n</file>\n\n"
+    )
+
+
+def build_context(
+    ticket_dir: Path,
+    purpose: Purpose = "plan",
+    budget: int = DEFAULT_BUDGET,
+    project_root: Optional[Path] = None,
+    use_cache: bool = True,
+) -> ContextPack:
+    """Build (or load from cache) a ticket's context pack.
+
+    Args:
+        ticket_dir: Ticket folder
+        purpose: "plan" or "exec"
+        budget: Token budget
+        project_root: Project root (defaults to the ticket's project)
+        use_cache: Reuse a cached pack when its inputs are unchanged
+
+    Returns:
+        Context pack
+
+    Raises:
+        ContextError: If the ticket has no spec.yaml, or progress.yaml
+            can't be created from its plan
+    """
+    ticket_dir = Path(os.path.abspath(ticket_dir))
+    if project_root is None:
+        project_root = find_project_root(ticket_dir) or Path.cwd()
+    project_root = Path(os.path.abspath(project_root))
+
+    if purpose == "exec":
+        try:
+            ProgressHandler.seed_progress(ticket_dir)
+        except ProgressHandlerError as e:
+            raise ContextError(str(e))
+
+    inputs = collect_inputs(ticket_dir, purpose, project_root)
+    key = pack_key(inputs, purpose, budget)
+
+    cache_path = (
+        get_cache_dir(project_root)
+        / CACHE_DIR
+        / f"{ticket_dir.name}-{purpose}.json"
+    )
+    if use_cache:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("key") == key:
+                return {**cached, "cached": True}
+        except (OSError, ValueError):
+            pass
+
+    fitted = fit_to_budget(inputs, budget)
+    text = "".join(_render_section(item) for item in fitted).rstrip() + "\n"
+    pack: ContextPack = {
+        "ticket": ticket_dir.name,
+        "purpose": purpose,
+        "budget": budget,
+        "tokens": estimate_tokens(text),
+        "key": key,
+        "sections": [
+            {
+                "name": item["name"],
+                "path": item["path"],
+                "tokens": item["tokens"],
+                "truncated": item["truncated"],
+            }
+            for item in fitted
+        ],
+        "text": text,
+        "cached": False,
+    }
+
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(cache_path, json.dumps(pack))
+
+    return pack
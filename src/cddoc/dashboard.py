@@ -0,0 +1,381 @@
+"""Static ticket dashboard generation.
+
+`cdd dashboard` renders a board of every ticket (grouped by status, with
+the current step from `progress.yaml` and open issues) plus one page per
+ticket, as HTML or Markdown.
+
+Ticket data comes from the incremental ProjectIndex, and each ticket's
+rendered output is cached in `.cdd/cache/dashboard.json` under a
+fingerprint of its index entry, so after a change only the affected
+tickets are re-rendered and only their pages are rewritten.
+"""
+
+import html
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, TypedDict, get_args
+
+from .concurrency import atomic_write
+from .handlers.spec_handler import TicketStatus
+from .index import INDEX_VERSION, ProjectIndex, TicketEntry
+from .project import get_cache_dir
+
+# Bump when the rendered output changes to force a full re-render
+DASHBOARD_VERSION = 1
+
+CACHE_FILE = "dashboard.json"
+
+# Default output location, relative to the project root
+DEFAULT_OUTPUT_DIR = ".cdd/cache/dashboard"
+
+DashboardFormat = Literal["html", "markdown"]
+
+# Board columns, in workflow order
+BOARD_COLUMNS: List[str] = list(get_args(TicketStatus))
+
+EXTENSIONS = {"html": ".html", "markdown": ".md"}
+
+PAGE_STYLE = """
+body { font-family: system-ui, sans-serif; margin: 2rem; color: #222; }
+.board { display: flex; gap: 1rem; align-items: flex-start; }
+.column { flex: 1; background: #f4f5f7; border-radius: 6px; padding: .5rem; }
+.column h2 { font-size: 1rem; text-transform: capitalize; }
+.card { background: #fff; border-radius: 4px; padding: .5rem;
+        margin-bottom: .5rem; box-shadow: 0 1px 2px rgba(0,0,0,.15); }
+.card a { font-weight: 600; text-decoration: none; }
+.meta { color: #666; font-size: .85rem; }
+.issues { color: #b00020; font-size: .85rem; }
+"""
+
+
+class DashboardError(Exception):
+    """Raised when the dashboard cannot be generated."""
+
+    pass
+
+
+class DashboardResult(TypedDict):
+    output_dir: Path
+    board_path: Path
+    tickets: int
+    rendered: int
+    removed: int
+
+
+def board_status(entry: TicketEntry) -> str:
+    """Pick the board column for a ticket.
+
+    Uses the spec's `ticket.status` when set, otherwise infers it from
+    the ticket's location and files.
+
+    Args:
+        entry: Index entry
+
+    Returns:
+        One of BOARD_COLUMNS
+    """
+    if entry["location"] == "archive":
+        return "archived"
+    if entry["status"] in BOARD_COLUMNS:
+        return entry["status"]
+    if entry["progress_status"] == "completed":
+        return "completed"
+    if entry["progress_status"]:
+        return "in_progress"
+    return "planned" if entry["has_plan"] else "draft"
+
+
+def ticket_page_path(entry: TicketEntry, fmt: DashboardFormat) -> str:
+    """Get a ticket page's path relative to the output directory."""
+    return f"{entry['location']}/{entry['name']}{EXTENSIONS[fmt]}"
+
+
+def entry_fingerprint(entry: TicketEntry, source_prefix: str) -> str:
+    """Identify the inputs of a ticket's rendered output.
+
+    Index entries are derived entirely from the ticket's files, so their
+    stat signature (plus the index and dashboard versions) stands in for
+    the entry's content.
+    """
+    return (
+        f"{INDEX_VERSION}:{DASHBOARD_VERSION}:{source_prefix}:"
+        f"{entry['signature']}"
+    )
+
+
+def _progress_label(entry: TicketEntry) -> str:
+    if not entry["steps_total"]:
+        return "no progress yet"
+    return f"{entry['steps_completed']}/{entry['steps_total']} steps"
+
+
+def render_ticket_html(entry: TicketEntry, source_prefix: str) -> Dict:
+    """Render a ticket's board card and page as HTML.
+
+    Args:
+        entry: Index entry
+        source_prefix: Relative path from a ticket page to the project
+            root (used to link the ticket's files)
+
+    Returns:
+        Dictionary with "card" and "page" HTML
+    """
+    e = html.escape
+    title = entry["title"] or entry["name"]
+    page = ticket_page_path(entry, "html")
+
+    card = [
+        '<div class="card">',
+        f'<a href="{e(page)}">{e(entry["name"])}</a>',
+        f"<div>{e(title)}</div>",
+        f'<div class="meta">{e(entry["type"] or "")} · '
+        f'{e(entry["priority"] or "no priority")} · '
+        f"{e(_progress_label(entry))}</div>",
+    ]
+    if entry["current_step"]:
+        card.append(f'<div class="meta">▶ {e(entry["current_step"])}</div>')
+    if entry["open_issues"]:
+        card.append(
+            f'<div class="issues">⚠ {len(entry["open_issues"])} '
+            "open issue(s)</div>"
+        )
+    card.append("</div>")
+
+    files = "".join(
+        f'<li><a href="{e(source_prefix + entry["path"] + "/" + name)}">'
+        f"{e(name)}</a></li>"
+        for name in ("spec.yaml", "plan.md", "progress.yaml")
+        if name != "plan.md" or entry["has_plan"]
+    )
+    issues = "".join(f"<li>{e(issue)}</li>" for issue in entry["open_issues"])
+    body = [
+        f"<h1>{e(title)}</h1>",
+        '<p><a href="../index.html">← Board</a></p>',
+        "<table>",
+        f"<tr><th>Ticket</th><td>{e(entry['name'])}</td></tr>",
+        f"<tr><th>Type</th><td>{e(entry['type'] or '')}</td></tr>",
+        f"<tr><th>Status</th><td>{e(board_status(entry))}</td></tr>",
+        f"<tr><th>Priority</th><td>{e(entry['priority'] or '')}</td></tr>",
+        f"<tr><th>Progress</th><td>{e(_progress_label(entry))}</td></tr>",
+        f"<tr><th>Current step</th><td>{e(entry['current_step'] or '')}"
+        "</td></tr>",
+        "</table>",
+    ]
+    if issues:
+        body.append(f"<h2>Open issues</h2><ul>{issues}</ul>")
+    if entry["error"]:
+        body.append(f'<p class="issues">{e(entry["error"])}</p>')
+    body.append(f"<h2>Files</h2><ul>{files}</ul>")
+
+    return {
+        "card": "\n".join(card),
+        "page": _html_document(title, "\n".join(body)),
+    }
+
+
+def render_ticket_markdown(entry: TicketEntry, source_prefix: str) -> Dict:
+    """Render a ticket's board row and page as Markdown.
+
+    Args:
+        entry: Index entry
+        source_prefix: Relative path from a ticket page to the project
+            root (used to link the ticket's files)
+
+    Returns:
+        Dictionary with "card" (a table row) and "page" Markdown
+    """
+    title = entry["title"] or entry["name"]
+    page = ticket_page_path(entry, "markdown")
+
+    def cell(value: Optional[str]) -> str:
+        return (value or "").replace("|", "\\|").replace("\n", " ")
+
+    card = (
+        f"| [{cell(entry['name'])}]({page}) | {cell(title)} "
+        f"| {cell(entry['priority'])} | {_progress_label(entry)} "
+        f"| {cell(entry['current_step'])} | {len(entry['open_issues'])} |"
+    )
+
+    lines = [
+        f"# {title}",
+        "",
+        "[← Board](../index.md)",
+        "",
+        f"- **Ticket:** {entry['name']}",
+        f"- **Type:** {entry['type'] or ''}",
+        f"- **Status:** {board_status(entry)}",
+        f"- **Priority:** {entry['priority'] or ''}",
+        f"- **Progress:** {_progress_label(entry)}",
+        f"- **Current step:** {entry['current_step'] or ''}",
+    ]
+    if entry["open_issues"]:
+        lines += ["", "## Open issues", ""]
+        lines += [f"- {issue}" for issue in entry["open_issues"]]
+    if entry["error"]:
+        lines += ["", f"> ⚠ {entry['error']}"]
+    lines += ["", "## Files", ""]
+    lines += [
+        f"- [{name}]({source_prefix}{entry['path']}/{name})"
+        for name in ("spec.yaml", "plan.md", "progress.yaml")
+        if name != "plan.md" or entry["has_plan"]
+    ]
+
+    return {"card": card, "page": "\n".join(lines) + "\n"}
+
+
+def _html_document(title: str, body: str) -> str:
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{html.escape(title)}</title>\n"
+        f"<style>{PAGE_STYLE}</style>\n</head>\n<body>\n{body}\n"
+        "</body>\n</html>\n"
+    )
+
+
+def render_board(
+    columns: Dict[str, List[str]], fmt: DashboardFormat, total: int
+) -> str:
+    """Assemble the board page from cached ticket cards.
+
+    Args:
+        columns: Rendered cards per board column
+        fmt: Output format
+        total: Number of tickets
+
+    Returns:
+        Board page content
+    """
+    if fmt == "markdown":
+        lines = ["# Ticket Dashboard", "", f"{total} tickets", ""]
+        for column in BOARD_COLUMNS:
+            cards = columns.get(column, [])
+            if not cards:
+                continue
+            title = column.replace("_", " ").title()
+            lines += [
+                f"## {title} ({len(cards)})",
+                "",
+                "| Ticket | Title | Priority | Progress | Current step "
+                "| Issues |",
+                "|---|---|---|---|---|---|",
+                *cards,
+                "",
+            ]
+        return "\n".join(lines)
+
+    parts = [
+        "<h1>Ticket Dashboard</h1>",
+        f'<p class="meta">{total} tickets</p>',
+        '<div class="board">',
+    ]
+    for column in BOARD_COLUMNS:
+        cards = columns.get(column, [])
+        label = html.escape(column.replace("_", " "))
+        parts.append(f'<div class="column"><h2>{label} ({len(cards)})</h2>')
+        parts.extend(cards)
+        parts.append("</div>")
+    parts.append("</div>")
+    return _html_document("Ticket Dashboard", "\n".join(parts))
+
+
+def build_dashboard(
+    project_root: Path,
+    output_dir: Optional[Path] = None,
+    fmt: DashboardFormat = "html",
+    index: Optional[ProjectIndex] = None,
+) -> DashboardResult:
+    """Render the dashboard, re-rendering only changed tickets.
+
+    Args:
+        project_root: Project root directory
+        output_dir: Output directory (defaults to DEFAULT_OUTPUT_DIR)
+        fmt: "html" or "markdown"
+        index: Already refreshed project index (loaded if omitted)
+
+    Returns:
+        Build summary
+
+    Raises:
+        DashboardError: If the output directory cannot be written
+    """
+    project_root = Path(os.path.abspath(project_root))
+    output_dir = Path(
+        os.path.abspath(project_root / (output_dir or DEFAULT_OUTPUT_DIR))
+    )
+    if index is None:
+        index = ProjectIndex.load(project_root)
+        index.save()
+
+    cache_path = get_cache_dir(project_root) / CACHE_FILE
+    cache_key = f"{fmt}:{output_dir}"
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    previous: Dict[str, Dict] = cache.get(cache_key, {})
+    current: Dict[str, Dict] = {}
+
+    render = render_ticket_html if fmt == "html" else render_ticket_markdown
+    board_path = output_dir / f"index{EXTENSIONS[fmt]}"
+    # Cached pages are trusted unless the output was deleted
+    if not board_path.exists():
+        previous = {}
+    columns: Dict[str, List[str]] = {}
+    source_prefixes: Dict[str, str] = {}
+    rendered = 0
+    removed = 0
+
+    try:
+        for entry in index.list_tickets():
+            key = entry["path"]
+            location = entry["location"]
+            if location not in source_prefixes:
+                source_prefixes[location] = (
+                    os.path.relpath(project_root, output_dir / location) + "/"
+                )
+            source_prefix = source_prefixes[location]
+            fingerprint = entry_fingerprint(entry, source_prefix)
+            cached = previous.get(key)
+
+            if cached is None or cached["fingerprint"] != fingerprint:
+                output = render(entry, source_prefix)
+                page = ticket_page_path(entry, fmt)
+                page_path = output_dir / page
+                page_path.parent.mkdir(parents=True, exist_ok=True)
+                page_path.write_text(output["page"], encoding="utf-8")
+                cached = {
+                    "fingerprint": fingerprint,
+                    "card": output["card"],
+                    "page": page,
+                    "column": board_status(entry),
+                }
+                rendered += 1
+
+            current[key] = cached
+            columns.setdefault(cached["column"], []).append(cached["card"])
+
+        for key, stale in previous.items():
+            if key not in current:
+                (output_dir / stale["page"]).unlink(missing_ok=True)
+                removed += 1
+
+        if rendered or removed or not board_path.exists():
+            board_path.parent.mkdir(parents=True, exist_ok=True)
+            board_path.write_text(
+                render_board(columns, fmt, len(current)), encoding="utf-8"
+            )
+    except OSError as e:
+        raise DashboardError(f"Cannot write dashboard: {e}")
+
+    if rendered or removed:
+        cache[cache_key] = current
+        atomic_write(cache_path, json.dumps(cache))
+
+    return {
+        "output_dir": output_dir,
+        "board_path": board_path,
+        "tickets": len(current),
+        "rendered": rendered,
+        "removed": removed,
+    }
@@ -0,0 +1,387 @@
+"""Link graph of the project's documentation.
+
+`cdd docs graph` parses every documentation page, ticket spec and plan
+(and the root README.md / CLAUDE.md) for:
+
+- Markdown links (`[text](path#anchor)` and `[id]: path` definitions);
+  external URLs and links inside code are ignored
+- ticket references: plain mentions of `specs/tickets/<name>` or
+  `specs/archive/<name>`; they count as links only while the ticket
+  exists (most other mentions are examples) and are never reported as
+  broken
+
+From the resulting graph it reports broken links (missing files or
+heading anchors), orphaned documentation pages (no inbound links) and
+the most-referenced pages.
+
+The parsed links are persisted in `.cdd/cache/docgraph.json` with a stat
+signature per file, so refreshing re-parses only files that changed.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TypedDict
+from urllib.parse import unquote
+
+from .concurrency import atomic_write
+from .index import DOCS_DIR, TICKET_LOCATIONS
+from .project import get_cache_dir
+from .search import discover_documents
+
+# Bump when link extraction changes to force a rebuild
+GRAPH_VERSION = 1
+
+CACHE_FILE = "docgraph.json"
+
+# Project-root files that link into the documentation
+ROOT_DOCUMENTS = ["README.md", "CLAUDE.md"]
+
+INLINE_LINK = re.compile(r"\[(?:[^\]\\]|\\.)*\]\(\s*<?([^)\s>]*)>?[^)]*\)")
+REFERENCE_DEFINITION = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*<?([^\s>]+)>?")
+TICKET_REFERENCE = re.compile(
+    r"(?<![\w/.-])(specs/(?:tickets|archive)/[a-z0-9][a-z0-9._-]*)"
+)
+EXTERNAL = re.compile(r"^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)")
+FENCE = re.compile(r"^\s*(```|~~~)")
+INLINE_CODE = re.compile(r"(`+).*?\1")
+HEADING = re.compile(r"^#{1,6}\s+(.*?)\s*#*\s*$")
+
+
+class Link(TypedDict):
+    target: str
+    anchor: Optional[str]
+    line: int
+    kind: str
+
+
+class FileNode(TypedDict):
+    signature: List[int]
+    links: List[Link]
+    anchors: List[str]
+
+
+class BrokenLink(TypedDict):
+    source: str
+    line: int
+    target: str
+    reason: str
+
+
+def slugify(heading: str) -> str:
+    """Turn a heading into its GitHub-style anchor."""
+    text = INLINE_CODE.sub(lambda m: m.group(0).strip("`"), heading)
+    text = re.sub(r"[^\w\- ]", "", text.lower())
+    return text.replace(" ", "-")
+
+
+def parse_links(text: str, rel_path: str) -> Tuple[List[Link], List[str]]:
+    """Extract links and heading anchors from a file.
+
+    Args:
+        text: File content
+        rel_path: Project-relative path of the file
+
+    Returns:
+        Tuple of (links, anchors)
+    """
+    links: List[Link] = []
+    anchors: List[str] = []
+    slug_counts: Dict[str, int] = {}
+    base = os.path.dirname(rel_path)
+    in_fence = False
+
+    for number, line in enumerate(text.splitlines(), 1):
+        if FENCE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            slug = slugify(heading.group(1))
+            count = slug_counts.get(slug, 0)
+            slug_counts[slug] = count + 1
+            anchors.append(f"{slug}-{count}" if count else slug)
+
+        for match in TICKET_REFERENCE.finditer(line):
+            links.append(
+                {
+                    "target": match.group(1).rstrip("."),
+                    "anchor": None,
+                    "line": number,
+                    "kind": "ticket",
+                }
+            )
+
+        prose = INLINE_CODE.sub("", line)
+        urls = INLINE_LINK.findall(prose)
+        definition = REFERENCE_DEFINITION.match(prose)
+        if definition:
+            urls.append(definition.group(1))
+
+        for url in urls:
+            if not url or EXTERNAL.match(url):
+                continue
+            path, _, anchor = url.partition("#")
+            path = unquote(path.split("?", 1)[0])
+            if not path:
+                target = rel_path
+            elif path.startswith("/"):
+                target = os.path.normpath(path.lstrip("/"))
+            else:
+                target = os.path.normpath(os.path.join(base, path))
+            links.append(
+                {
+                    "target": Path(target).as_posix(),
+                    "anchor": unquote(anchor) or None,
+                    "line": number,
+                    "kind": "link",
+                }
+            )
+
+    return links, anchors
+
+
+def discover_ticket_dirs(project_root: Path) -> Set[str]:
+    """List ticket folders as project-relative paths."""
+    tickets = set()
+    for rel_dir in TICKET_LOCATIONS.values():
+        try:
+            entries = os.scandir(os.path.join(project_root, rel_dir))
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith("."):
+                    tickets.add(f"{rel_dir}/{entry.name}")
+    return tickets
+
+
+def discover_sources(project_root: Path) -> Dict[str, os.stat_result]:
+    """List files whose links are part of the graph.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Mapping of project-relative path to stat result
+    """
+    found = discover_documents(project_root)
+    for name in ROOT_DOCUMENTS:
+        try:
+            found[name] = os.stat(os.path.join(project_root, name))
+        except OSError:
+            continue
+    return found
+
+
+class DocGraph:
+    """Persistent, incrementally refreshed documentation link graph."""
+
+    def __init__(self, project_root: Path):
+        """Create an empty graph.
+
+        Args:
+            project_root: Project root directory
+        """
+        self.project_root = Path(project_root)
+        self.files: Dict[str, FileNode] = {}
+        self._dirty = False
+
+    @property
+    def cache_path(self) -> Path:
+        return get_cache_dir(self.project_root) / CACHE_FILE
+
+    @classmethod
+    def load(cls, project_root: Path, refresh: bool = True) -> "DocGraph":
+        """Load the graph from the cache, refreshing it by default.
+
+        Args:
+            project_root: Project root directory
+            refresh: Re-parse files that changed since the last save
+
+        Returns:
+            Graph instance
+        """
+        graph = cls(project_root)
+        try:
+            data = json.loads(graph.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") == GRAPH_VERSION:
+                graph.files = data.get("files", {})
+        except (OSError, ValueError):
+            graph._dirty = True
+
+        if refresh:
+            graph.refresh()
+        return graph
+
+    def save(self) -> None:
+        """Write the graph to the cache if it changed."""
+        if not self._dirty:
+            return
+        cache_path = self.cache_path
+        atomic_write(
+            cache_path,
+            json.dumps({"version": GRAPH_VERSION, "files": self.files}),
+        )
+        self._dirty = False
+
+    def refresh(self) -> List[str]:
+        """Re-parse files that changed on disk.
+
+        Returns:
+            Project-relative paths that were (re)parsed or removed
+        """
+        found = discover_sources(self.project_root)
+        changed = []
+
+        for rel_path, stat in found.items():
+            signature = [stat.st_mtime_ns, stat.st_size]
+            cached = self.files.get(rel_path)
+            if cached and cached["signature"] == signature:
+                continue
+            if self._parse(rel_path, signature):
+                changed.append(rel_path)
+
+        for rel_path in [p for p in self.files if p not in found]:
+            del self.files[rel_path]
+            changed.append(rel_path)
+
+        if changed:
+            self._dirty = True
+        return changed
+
+    def update_paths(self, rel_paths: Iterable[str]) -> None:
+        """Re-parse specific files (e.g. from `cdd watch`).
+
+        Args:
+            rel_paths: Project-relative paths; missing files are removed
+        """
+        for rel_path in rel_paths:
+            absolute = os.path.join(self.project_root, rel_path)
+            try:
+                stat = os.stat(absolute)
+            except OSError:
+                if self.files.pop(rel_path, None) is not None:
+                    self._dirty = True
+                continue
+            if rel_path in self.files or self._is_source(rel_path):
+                if self._parse(rel_path, [stat.st_mtime_ns, stat.st_size]):
+                    self._dirty = True
+
+    @staticmethod
+    def _is_source(rel_path: str) -> bool:
+        parts = rel_path.split("/")
+        if parts[0] == DOCS_DIR:
+            return rel_path.endswith(".md")
+        if rel_path in ROOT_DOCUMENTS:
+            return True
+        return (
+            len(parts) == 4
+            and "/".join(parts[:2]) in TICKET_LOCATIONS.values()
+            and parts[3] in ("spec.yaml", "plan.md")
+        )
+
+    def _parse(self, rel_path: str, signature: List[int]) -> bool:
+        try:
+            with open(
+                os.path.join(self.project_root, rel_path),
+                encoding="utf-8",
+                errors="replace",
+            ) as f:
+                text = f.read()
+        except OSError:
+            return False
+        links, anchors = parse_links(text, rel_path)
+        self.files[rel_path] = {
+            "signature": signature,
+            "links": links,
+            "anchors": anchors,
+        }
+        return True
+
+    def inbound(self) -> Dict[str, Set[str]]:
+        """Map each link target to the files linking to it."""
+        tickets = discover_ticket_dirs(self.project_root)
+        sources: Dict[str, Set[str]] = {}
+        for rel_path, node in self.files.items():
+            for link in node["links"]:
+                target = link["target"]
+                if target == rel_path:
+                    continue
+                if link["kind"] == "ticket" and target not in tickets:
+                    continue
+                sources.setdefault(target, set()).add(rel_path)
+        return sources
+
+    def broken_links(self) -> List[BrokenLink]:
+        """Find links whose file or heading anchor does not exist.
+
+        Returns:
+            Broken links sorted by source file and line
+        """
+        exists: Dict[str, bool] = {}
+        broken: List[BrokenLink] = []
+
+        for rel_path in sorted(self.files):
+            for link in self.files[rel_path]["links"]:
+                if link["kind"] == "ticket":
+                    continue
+                target = link["target"]
+                if target not in exists:
+                    # Targets outside the project ("../") are checked
+                    # on disk like any other file
+                    exists[target] = target in self.files or os.path.exists(
+                        os.path.join(self.project_root, target)
+                    )
+                shown = target + (
+                    f"#{link['anchor']}" if link["anchor"] else ""
+                )
+                if not exists[target]:
+                    reason = "missing file"
+                elif (
+                    link["anchor"]
+                    and target in self.files
+                    and target.endswith(".md")
+                    and link["anchor"] not in self.files[target]["anchors"]
+                ):
+                    reason = "missing anchor"
+                else:
+                    continue
+                broken.append(
+                    {
+                        "source": rel_path,
+                        "line": link["line"],
+                        "target": shown,
+                        "reason": reason,
+                    }
+                )
+        return broken
+
+    def orphans(self) -> List[str]:
+        """List documentation pages no other file links to."""
+        linked = self.inbound()
+        return sorted(
+            rel_path
+            for rel_path in self.files
+            if rel_path.startswith(f"{DOCS_DIR}/") and rel_path not in linked
+        )
+
+    def most_referenced(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Rank pages and tickets by the number of files linking to them.
+
+        Args:
+            limit: Maximum number of entries
+
+        Returns:
+            (target, referencing file count) pairs, most referenced first
+        """
+        counts = [
+            (target, len(sources))
+            for target, sources in self.inbound().items()
+        ]
+        counts.sort(key=lambda item: (-item[1], item[0]))
+        return counts[:limit]
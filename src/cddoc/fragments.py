@@ -0,0 +1,133 @@
+"""Ticket-type-specific assembly of the framework command prompts.
+
+Command files mix shared guidance with guidance for one ticket type.
+Type-specific parts are delimited by fragment markers on their own
+lines:
+
+    <!-- cdd:types bug -->
+    ...bug-only guidance...
+    <!-- cdd:end -->
+
+A marker may list several types (`<!-- cdd:types feature enhancement
+-->`). Assembling for a type keeps the shared text and that type's
+fragments; assembling without a type keeps everything. Markers are
+always removed, so installed commands never contain them.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple, TypedDict
+
+FRAGMENT_START = re.compile(r"^<!-- cdd:types ([\w\s-]+?) -->$")
+FRAGMENT_END = "<!-- cdd:end -->"
+
+
+class FragmentError(Exception):
+    """Raised when fragment markers are malformed."""
+
+    pass
+
+
+class Fragment(TypedDict):
+    types: List[str]
+    text: str
+
+
+def parse_fragments(text: str) -> List[Fragment]:
+    """Split a command file into shared and type-specific fragments.
+
+    Args:
+        text: Command file content
+
+    Returns:
+        Fragments in file order; shared fragments have no types
+
+    Raises:
+        FragmentError: If markers are nested or unbalanced
+    """
+    fragments: List[Fragment] = []
+    types: List[str] = []
+    lines: List[str] = []
+
+    def _flush():
+        if lines:
+            fragments.append({"types": types, "text": "".join(lines)})
+
+    for number, line in enumerate(text.splitlines(keepends=True), 1):
+        stripped = line.strip()
+        match = FRAGMENT_START.match(stripped)
+        if match:
+            if types:
+                raise FragmentError(f"Nested fragment at line {number}")
+            _flush()
+            types, lines = match.group(1).split(), []
+        elif stripped == FRAGMENT_END:
+            if not types:
+                raise FragmentError(f"Unmatched fragment end at line {number}")
+            _flush()
+            types, lines = [], []
+        else:
+            lines.append(line)
+
+    if types:
+        raise FragmentError(f"Unclosed fragment for: {' '.join(types)}")
+    _flush()
+    return fragments
+
+
+def fragment_types(text: str) -> List[str]:
+    """List the ticket types a command file has fragments for."""
+    found = {
+        t for fragment in parse_fragments(text) for t in fragment["types"]
+    }
+    return sorted(found)
+
+
+def assemble_command(text: str, ticket_type: Optional[str] = None) -> str:
+    """Assemble a command prompt for one ticket type.
+
+    Args:
+        text: Command file content
+        ticket_type: Ticket type to keep fragments for (None keeps all)
+
+    Returns:
+        Prompt without fragment markers
+
+    Raises:
+        FragmentError: If markers are malformed
+    """
+    fragments = parse_fragments(text)
+    if ticket_type is None and all(not f["types"] for f in fragments):
+        return text
+
+    kept = "".join(
+        fragment["text"]
+        for fragment in fragments
+        if ticket_type is None
+        or not fragment["types"]
+        or ticket_type in fragment["types"]
+    )
+    # Dropped fragments leave blank runs and back-to-back rules behind
+    kept = re.sub(r"\n{3,}", "\n\n", kept)
+    return re.sub(r"(?m)^---\n\n(?:---\n\n)+", "---\n\n", kept)
+
+
+@lru_cache(maxsize=None)
+def assemble_packaged_commands(
+    language: str, ticket_type: Optional[str] = None
+) -> Tuple[Tuple[str, bytes], ...]:
+    """Assemble every packaged command for a ticket type.
+
+    Args:
+        language: Language code ('en' or 'pt-br')
+        ticket_type: Ticket type (None keeps all fragments)
+
+    Returns:
+        Tuple of (file name, assembled contents) pairs
+    """
+    from .init import read_packaged_files
+
+    return tuple(
+        (name, assemble_command(data.decode("utf-8"), ticket_type).encode())
+        for name, data in read_packaged_files("commands", language)
+    )
@@ -3,6 +3,9 @@
 import shutil
 from pathlib import Path
 
+from ..profiling import phase
+from ..tracing import traced
+
 
 class ArchiveHandlerError(Exception):
     """Base exception for archive handler errors."""
@@ -14,6 +17,8 @@ class ArchiveHandler:
     """Handler for archiving completed tickets."""
 
     @staticmethod
+    @traced()
+    @phase("handler I/O")
     def archive_ticket(ticket_path: Path, archive_base: Path) -> Path:
         """Move a ticket folder to the archive directory.
 
@@ -57,6 +62,8 @@ class ArchiveHandler:
             raise ArchiveHandlerError(f"Failed to archive ticket: {e}")
 
     @staticmethod
+    @traced()
+    @phase("handler I/O")
     def restore_ticket(archive_path: Path, tickets_base: Path) -> Path:
         """Restore an archived ticket back to active tickets.
 
@@ -100,6 +107,7 @@ class ArchiveHandler:
             raise ArchiveHandlerError(f"Failed to restore ticket: {e}")
 
     @staticmethod
+    @traced()
     def list_archived_tickets(archive_base: Path) -> list[Path]:
         """List all archived tickets.
 
@@ -2,10 +2,30 @@
 
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import List, Literal, Optional, TypedDict
+from typing import Callable, List, Literal, NotRequired, Optional, TypedDict
 
 import yaml
 
+from ..concurrency import (
+    REVISION_FIELD,
+    atomic_write,
+    claim_revision,
+    current_revision,
+    locked,
+    store_revision,
+    without_revision,
+)
+from ..plan import PlanError, load_plan
+from ..profiling import phase
+from ..tracing import (
+    YAML_DUMP,
+    YAML_PARSE,
+    add_read,
+    add_write,
+    measure,
+    traced,
+)
+
 
 class FileTouched(TypedDict):
     path: str
@@ -19,6 +39,7 @@ class Step(TypedDict):
     started_at: Optional[str]
     completed_at: Optional[str]
     files_touched: List[FileTouched]
+    planned_files: NotRequired[List[str]]
 
 
 class AcceptanceCriterion(TypedDict):
@@ -48,6 +69,8 @@ class ProgressData(TypedDict):
     files_modified: List[str]
     files_created: List[str]
     issues: List[Issue]
+    plan_hash: NotRequired[str]
+    _cdd_revision: NotRequired[int]
 
 
 class ProgressHandlerError(Exception):
@@ -60,6 +83,8 @@ class ProgressHandler:
     """Handler for reading and writing progress.yaml files."""
 
     @staticmethod
+    @traced()
+    @phase("handler I/O")
     def read_progress(progress_path: Path) -> ProgressData:
         """Read and parse progress.yaml file.
 
@@ -67,7 +92,7 @@ class ProgressHandler:
             progress_path: Path to progress.yaml file
 
         Returns:
-            Parsed progress data
+            Parsed progress data, including the `_cdd_revision` it was read at
 
         Raises:
             ProgressHandlerError: If file doesn't exist or is malformed
@@ -78,8 +103,13 @@ class ProgressHandler:
             )
 
         try:
+            # Read before the file (see current_revision)
+            revision = current_revision(progress_path)
             with open(progress_path, "r") as f:
-                data = yaml.safe_load(f)
+                text = f.read()
+            add_read(text)
+            with measure(YAML_PARSE):
+                data = yaml.safe_load(text)
 
             # Validate required fields
             required_fields = [
@@ -97,17 +127,29 @@ class ProgressHandler:
                         f"Missing required field: {field}"
                     )
 
+            data[REVISION_FIELD] = revision
             return data
         except yaml.YAMLError as e:
             raise ProgressHandlerError(f"Invalid YAML format: {e}")
 
     @staticmethod
+    @traced()
+    @phase("handler I/O")
     def write_progress(progress_path: Path, data: ProgressData) -> None:
         """Write progress data to progress.yaml file.
 
+        The write holds the file's lock and bumps its `_cdd_revision`; data
+        read before another process wrote the file is rejected rather
+        than overwriting that write. Use update_progress() for a
+        read-modify-write that cannot conflict.
+
         Args:
             progress_path: Path where progress.yaml will be written
-            data: Progress data to write
+            data: Progress data to write (its revision is updated)
+
+        Raises:
+            ConcurrencyError: If the lock cannot be taken in time
+            RevisionConflictError: If the file changed since data was read
         """
         # Update timestamp
         data["updated_at"] = (
@@ -117,23 +159,65 @@ class ProgressHandler:
         # Ensure parent directory exists
         progress_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(progress_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        with locked(progress_path):
+            revision = claim_revision(progress_path, data)
+            with measure(YAML_DUMP):
+                text = yaml.safe_dump(
+                    without_revision(data),
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            atomic_write(progress_path, text)
+            store_revision(progress_path, revision)
+        add_write(text)
+
+    @staticmethod
+    @traced()
+    def update_progress(
+        progress_path: Path, update: Callable[[ProgressData], None]
+    ) -> ProgressData:
+        """Read, modify and write progress.yaml under its lock.
+
+        Args:
+            progress_path: Path to progress.yaml file
+            update: Function modifying the progress data in place
+
+        Returns:
+            The written progress data
+
+        Raises:
+            ProgressHandlerError: If file doesn't exist or is malformed
+            ConcurrencyError: If the lock cannot be taken in time
+        """
+        with locked(progress_path):
+            data = ProgressHandler.read_progress(progress_path)
+            update(data)
+            ProgressHandler.write_progress(progress_path, data)
+        return data
 
     @staticmethod
     def initialize_progress(plan_path: Path, spec_path: Path) -> ProgressData:
         """Create initial progress structure from plan and spec paths.
 
+        When the plan exists, its steps (with the files each one names)
+        are added as pending steps, and `plan_hash` records the plan
+        revision they came from. Acceptance criteria come from the
+        spec, or from the plan's Definition of Done when the spec has
+        none.
+
         Args:
             plan_path: Path to plan.md file
             spec_path: Path to spec.yaml file
 
         Returns:
             Initial progress data structure
+
+        Raises:
+            ProgressHandlerError: If the plan exists but can't be read
         """
         now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
 
-        return {
+        data: ProgressData = {
             "plan_path": str(plan_path),
             "spec_path": str(spec_path),
             "started_at": now,
@@ -145,3 +229,75 @@ class ProgressHandler:
             "files_created": [],
             "issues": [],
         }
+
+        criteria: List[str] = []
+        if Path(plan_path).exists():
+            try:
+                plan = load_plan(Path(plan_path))
+            except PlanError as e:
+                raise ProgressHandlerError(str(e))
+            data["plan_hash"] = plan["content_hash"]
+            data["steps"] = [
+                {
+                    "step_id": step["step_id"],
+                    "description": step["title"],
+                    "status": "pending",
+                    "started_at": None,
+                    "completed_at": None,
+                    "files_touched": [],
+                    "planned_files": step["files"],
+                }
+                for step in plan["steps"]
+            ]
+            criteria = plan["acceptance_criteria"]
+
+        spec_criteria = _spec_criteria(Path(spec_path))
+        data["acceptance_criteria"] = [
+            {"criterion": criterion, "status": "pending", "validated_at": None}
+            for criterion in spec_criteria or criteria
+        ]
+        return data
+
+    @staticmethod
+    @traced()
+    def seed_progress(ticket_dir: Path) -> Optional[ProgressData]:
+        """Create a ticket's progress.yaml from its plan if it has none.
+
+        Args:
+            ticket_dir: Ticket folder
+
+        Returns:
+            The new progress data, or None if progress.yaml already
+            exists or the ticket has no plan.md
+
+        Raises:
+            ProgressHandlerError: If the plan can't be read
+        """
+        progress_path = ticket_dir / "progress.yaml"
+        plan_path = ticket_dir / "plan.md"
+        if progress_path.exists() or not plan_path.exists():
+            return None
+        with locked(progress_path):
+            # Another session may have created it while we waited
+            if progress_path.exists():
+                return None
+            data = ProgressHandler.initialize_progress(
+                plan_path, ticket_dir / "spec.yaml"
+            )
+            ProgressHandler.write_progress(progress_path, data)
+        return data
+
+
+def _spec_criteria(spec_path: Path) -> List[str]:
+    """Get the acceptance criteria listed in a spec, if readable."""
+    try:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            spec = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError):
+        return []
+    if not isinstance(spec, dict):
+        return []
+    criteria = spec.get("acceptance_criteria")
+    if not isinstance(criteria, list):
+        return []
+    return [str(item) for item in criteria if item is not None]
@@ -6,6 +6,25 @@ from typing import Literal
 
 import yaml
 
+from ..concurrency import (
+    REVISION_FIELD,
+    atomic_write,
+    claim_revision,
+    current_revision,
+    locked,
+    store_revision,
+    without_revision,
+)
+from ..profiling import phase
+from ..tracing import (
+    YAML_DUMP,
+    YAML_PARSE,
+    add_read,
+    add_write,
+    measure,
+    traced,
+)
+
 
 class SpecHandlerError(Exception):
     """Base exception for spec handler errors."""
@@ -22,6 +41,8 @@ class SpecHandler:
     """Handler for reading and updating spec.yaml files."""
 
     @staticmethod
+    @traced()
+    @phase("handler I/O")
     def read_spec(spec_path: Path) -> dict:
         """Read and parse spec.yaml file.
 
@@ -29,7 +50,7 @@ class SpecHandler:
             spec_path: Path to spec.yaml file
 
         Returns:
-            Parsed spec data
+            Parsed spec data, including the `_cdd_revision` it was read at
 
         Raises:
             SpecHandlerError: If file doesn't exist or is malformed
@@ -38,31 +59,58 @@ class SpecHandler:
             raise SpecHandlerError(f"Spec file not found: {spec_path}")
 
         try:
+            # Read before the file (see current_revision)
+            revision = current_revision(spec_path)
             with open(spec_path, "r") as f:
-                data = yaml.safe_load(f)
+                text = f.read()
+            add_read(text)
+            with measure(YAML_PARSE):
+                data = yaml.safe_load(text)
 
             if not isinstance(data, dict):
                 raise SpecHandlerError("Spec file must contain a dictionary")
 
+            data[REVISION_FIELD] = revision
             return data
         except yaml.YAMLError as e:
             raise SpecHandlerError(f"Invalid YAML format: {e}")
 
     @staticmethod
+    @traced()
+    @phase("handler I/O")
     def write_spec(spec_path: Path, data: dict) -> None:
         """Write spec data to spec.yaml file.
 
+        The write holds the spec's lock and bumps its `_cdd_revision`. Data
+        read with read_spec() carries the revision it was read at, so
+        writing it back after another process wrote the file fails
+        instead of discarding that write.
+
         Args:
             spec_path: Path where spec.yaml will be written
-            data: Spec data to write
+            data: Spec data to write (its revision is updated)
+
+        Raises:
+            ConcurrencyError: If the lock cannot be taken in time
+            RevisionConflictError: If the file changed since data was read
         """
         # Ensure parent directory exists
         spec_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(spec_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        with locked(spec_path):
+            revision = claim_revision(spec_path, data)
+            with measure(YAML_DUMP):
+                text = yaml.safe_dump(
+                    without_revision(data),
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            atomic_write(spec_path, text)
+            store_revision(spec_path, revision)
+        add_write(text)
 
     @staticmethod
+    @traced()
     def update_status(
         spec_path: Path,
         new_status: TicketStatus,
@@ -77,34 +125,37 @@ class SpecHandler:
 
         Raises:
             SpecHandlerError: If spec file doesn't exist or has no ticket section
+            ConcurrencyError: If the spec's lock cannot be taken in time
         """
-        data = SpecHandler.read_spec(spec_path)
+        with locked(spec_path):
+            data = SpecHandler.read_spec(spec_path)
 
-        # Ensure ticket section exists
-        if "ticket" not in data:
-            raise SpecHandlerError("Spec file missing 'ticket' section")
+            # Ensure ticket section exists
+            if "ticket" not in data:
+                raise SpecHandlerError("Spec file missing 'ticket' section")
 
-        # Update status
-        data["ticket"]["status"] = new_status
+            # Update status
+            data["ticket"]["status"] = new_status
 
-        # Update the 'updated' timestamp if it exists
-        now = datetime.now(UTC).strftime("%Y-%m-%d")
-        if "updated" in data["ticket"]:
-            data["ticket"]["updated"] = now
+            # Update the 'updated' timestamp if it exists
+            now = datetime.now(UTC).strftime("%Y-%m-%d")
+            if "updated" in data["ticket"]:
+                data["ticket"]["updated"] = now
 
-        # Add specific timestamps based on status
-        if add_timestamp:
-            if new_status == "in_progress":
-                data["ticket"]["implementation_started"] = now
-            elif new_status == "completed":
-                data["ticket"]["implementation_completed"] = now
-            elif new_status == "archived":
-                data["ticket"]["archived_at"] = now
+            # Add specific timestamps based on status
+            if add_timestamp:
+                if new_status == "in_progress":
+                    data["ticket"]["implementation_started"] = now
+                elif new_status == "completed":
+                    data["ticket"]["implementation_completed"] = now
+                elif new_status == "archived":
+                    data["ticket"]["archived_at"] = now
 
-        # Write back
-        SpecHandler.write_spec(spec_path, data)
+            # Write back
+            SpecHandler.write_spec(spec_path, data)
 
     @staticmethod
+    @traced()
     def get_status(spec_path: Path) -> TicketStatus | None:
         """Get the current ticket status from spec.yaml.
 
@@ -0,0 +1,407 @@
+"""Ticket timelines reconstructed from git history.
+
+`cdd history` tells when each ticket was created, planned, started,
+implemented and archived. The whole history is read in one streaming
+pass over `git log --raw --no-renames -- specs/`; the spec.yaml and
+progress.yaml versions whose status matters are read through a single
+`git cat-file --batch` process, and each blob is parsed once.
+
+Timelines are events derived from state transitions per commit:
+
+- created / deleted: the ticket's first file appears / its last file
+  is removed
+- planned / started: plan.md / progress.yaml appears
+- archived / restored: the ticket appears in `specs/archive/` /
+  back in `specs/tickets/`
+- status: spec.yaml's ticket.status changes
+- implemented: progress.yaml's status becomes "completed"
+
+The timelines and the per-ticket state needed to continue them are
+cached in `.cdd/cache/history.json` with the last processed commit, so
+later runs only read new commits.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, TypedDict
+
+import yaml
+
+from .concurrency import atomic_write
+from .index import TICKET_LOCATIONS
+from .project import get_cache_dir
+from .search import SAFE_LOADER
+
+# Bump when event rules change to force a rebuild
+HISTORY_VERSION = 1
+
+CACHE_FILE = "history.json"
+
+COMMIT_MARKER = "\x1e"
+
+# Git's empty object id: the "before" or "after" side of an add/delete
+NULL_SHA = "0" * 40
+
+# Milestones shown per ticket in summaries
+MILESTONES = ["created", "planned", "started", "implemented", "archived"]
+
+
+class HistoryError(Exception):
+    """Raised when git history cannot be read."""
+
+    pass
+
+
+class TimelineEvent(TypedDict):
+    event: str
+    commit: str
+    time: int
+    detail: Optional[str]
+
+
+class _TicketState(TypedDict):
+    files: Dict[str, List[str]]
+    spec_status: Optional[str]
+    progress_status: Optional[str]
+    events: List[TimelineEvent]
+
+
+class BlobReader:
+    """Reads blobs through one long-running `git cat-file --batch`."""
+
+    def __init__(self, repo_dir: Path):
+        """Start the cat-file process.
+
+        Args:
+            repo_dir: Any directory inside the repository
+        """
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def read(self, sha: str) -> Optional[bytes]:
+        """Read a blob by object id (None if it is missing)."""
+        self._process.stdin.write(f"{sha}\n".encode())
+        self._process.stdin.flush()
+        header = self._process.stdout.readline().split()
+        if len(header) != 3:
+            return None
+        data = self._process.stdout.read(int(header[2]) + 1)
+        return data[:-1]
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        self._process.stdin.close()
+        self._process.wait()
+
+
+def _git_output(repo_dir: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=repo_dir, capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        raise HistoryError("git is not installed")
+    if result.returncode != 0:
+        raise HistoryError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout.strip()
+
+
+def iter_raw_log(
+    repo_dir: Path, revision: str
+) -> Iterator[Tuple[str, int, List[Tuple[str, str, str]]]]:
+    """Stream commits touching specs/, oldest first.
+
+    Args:
+        repo_dir: Project root (paths are relative to it)
+        revision: Revision or range to log
+
+    Yields:
+        (commit id, commit time, [(status, new blob id, path)])
+    """
+    process = subprocess.Popen(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "log",
+            "--reverse",
+            "--raw",
+            "--no-renames",
+            "--no-abbrev",
+            "--relative",
+            f"--format={COMMIT_MARKER}%H %ct",
+            revision,
+            "--",
+            "specs/",
+        ],
+        cwd=repo_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    commit: Optional[Tuple[str, int]] = None
+    changes: List[Tuple[str, str, str]] = []
+
+    for line in process.stdout:
+        if line.startswith(COMMIT_MARKER):
+            if commit:
+                yield commit[0], commit[1], changes
+            sha, _, timestamp = line[1:].strip().partition(" ")
+            commit, changes = (sha, int(timestamp or 0)), []
+        elif line.startswith(":"):
+            meta, _, path = line.rstrip("\n").partition("\t")
+            fields = meta.split()
+            changes.append((fields[4][0], fields[3], path))
+    if commit:
+        yield commit[0], commit[1], changes
+
+    stderr = process.stderr.read()
+    if process.wait() != 0:
+        raise HistoryError(stderr.strip() or "git log failed")
+
+
+def _split_ticket_path(path: str) -> Optional[Tuple[str, str, str]]:
+    """Split specs/<location>/<ticket>/<file> into its parts."""
+    for location, rel_dir in TICKET_LOCATIONS.items():
+        prefix = rel_dir + "/"
+        if path.startswith(prefix):
+            ticket, _, name = path[len(prefix) :].partition("/")
+            if ticket and name:
+                return location, ticket, name
+    return None
+
+
+class TicketHistory:
+    """Per-ticket timelines, extended incrementally from git."""
+
+    def __init__(self, project_root: Path):
+        """Create empty timelines.
+
+        Args:
+            project_root: Project root directory
+        """
+        self.project_root = Path(project_root)
+        self.head: Optional[str] = None
+        self.tickets: Dict[str, _TicketState] = {}
+        self._statuses: Dict[Tuple[str, str], Optional[str]] = {}
+
+    @property
+    def cache_path(self) -> Path:
+        return get_cache_dir(self.project_root) / CACHE_FILE
+
+    @classmethod
+    def load(cls, project_root: Path) -> "TicketHistory":
+        """Load cached timelines and extend them to HEAD.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Timelines as of HEAD
+
+        Raises:
+            HistoryError: If the project is not in a git repository
+        """
+        history = cls(project_root)
+        try:
+            data = json.loads(history.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") == HISTORY_VERSION:
+                history.head = data["head"]
+                history.tickets = data["tickets"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        head = _git_output(project_root, "rev-parse", "HEAD")
+        if head != history.head:
+            history.update(head)
+            history.save()
+        return history
+
+    def save(self) -> None:
+        """Write the timelines to the cache."""
+        atomic_write(
+            self.cache_path,
+            json.dumps(
+                {
+                    "version": HISTORY_VERSION,
+                    "head": self.head,
+                    "tickets": self.tickets,
+                }
+            ),
+        )
+
+    def update(self, head: str) -> int:
+        """Process commits between the last processed commit and head.
+
+        History is rebuilt from scratch when the last processed commit
+        is no longer an ancestor of head (rebase, reset).
+
+        Args:
+            head: Commit id to extend the timelines to
+
+        Returns:
+            Number of commits processed
+        """
+        revision = head
+        if self.head and self._is_ancestor(self.head, head):
+            revision = f"{self.head}..{head}"
+        else:
+            self.tickets = {}
+
+        processed = 0
+        blobs = BlobReader(self.project_root)
+        try:
+            for sha, time, changes in iter_raw_log(
+                self.project_root, revision
+            ):
+                self._apply_commit(sha, time, changes, blobs)
+                processed += 1
+        finally:
+            blobs.close()
+        self.head = head
+        return processed
+
+    def _is_ancestor(self, old: str, new: str) -> bool:
+        try:
+            _git_output(
+                self.project_root, "merge-base", "--is-ancestor", old, new
+            )
+        except HistoryError:
+            return False
+        return True
+
+    def _apply_commit(
+        self,
+        sha: str,
+        time: int,
+        changes: List[Tuple[str, str, str]],
+        blobs: BlobReader,
+    ) -> None:
+        touched: Dict[str, List[Tuple[str, str, str, str]]] = {}
+        for status, blob, path in changes:
+            parts = _split_ticket_path(path)
+            if parts:
+                location, ticket, name = parts
+                touched.setdefault(ticket, []).append(
+                    (status, blob, location, name)
+                )
+
+        for ticket, ticket_changes in touched.items():
+            state = self.tickets.setdefault(
+                ticket,
+                {
+                    "files": {location: [] for location in TICKET_LOCATIONS},
+                    "spec_status": None,
+                    "progress_status": None,
+                    "events": [],
+                },
+            )
+            before = {loc: set(names) for loc, names in state["files"].items()}
+            after = {loc: set(names) for loc, names in before.items()}
+            spec_blob = progress_blob = None
+
+            for status, blob, location, name in ticket_changes:
+                if status == "D":
+                    after[location].discard(name)
+                    continue
+                after[location].add(name)
+                if name == "spec.yaml":
+                    spec_blob = blob
+                elif name == "progress.yaml":
+                    progress_blob = blob
+
+            events = self._transitions(before, after)
+            if spec_blob and spec_blob != NULL_SHA:
+                spec_status = self._read_status(blobs, spec_blob, "spec")
+                if spec_status and spec_status != state["spec_status"]:
+                    events.append(("status", spec_status))
+                    state["spec_status"] = spec_status
+            if progress_blob and progress_blob != NULL_SHA:
+                progress_status = self._read_status(
+                    blobs, progress_blob, "progress"
+                )
+                if (
+                    progress_status == "completed"
+                    and state["progress_status"] != "completed"
+                ):
+                    events.append(("implemented", None))
+                state["progress_status"] = progress_status
+
+            state["files"] = {
+                location: sorted(names) for location, names in after.items()
+            }
+            state["events"].extend(
+                {"event": event, "commit": sha, "time": time, "detail": detail}
+                for event, detail in events
+            )
+
+    @staticmethod
+    def _transitions(
+        before: Dict[str, set], after: Dict[str, set]
+    ) -> List[Tuple[str, Optional[str]]]:
+        def _present(files: Dict[str, set], name: str) -> bool:
+            return any(name in names for names in files.values())
+
+        had_any = any(before.values())
+        has_any = any(after.values())
+        events: List[Tuple[str, Optional[str]]] = []
+
+        if has_any and not had_any:
+            events.append(("created", None))
+        elif had_any and not has_any:
+            events.append(("deleted", None))
+            return events
+
+        if had_any and after["archive"] and not before["archive"]:
+            events.append(("archived", None))
+        if before["archive"] and after["tickets"] and not before["tickets"]:
+            events.append(("restored", None))
+        if _present(after, "plan.md") and not _present(before, "plan.md"):
+            events.append(("planned", None))
+        if _present(after, "progress.yaml") and not _present(
+            before, "progress.yaml"
+        ):
+            events.append(("started", None))
+        return events
+
+    def _read_status(
+        self, blobs: BlobReader, blob: str, kind: str
+    ) -> Optional[str]:
+        key = (blob, kind)
+        if key not in self._statuses:
+            status = None
+            data = blobs.read(blob)
+            try:
+                content = yaml.load(data or b"", Loader=SAFE_LOADER)
+            except yaml.YAMLError:
+                content = None
+            if isinstance(content, dict):
+                if kind == "spec":
+                    ticket = content.get("ticket")
+                    if isinstance(ticket, dict):
+                        status = ticket.get("status")
+                else:
+                    status = content.get("status")
+            self._statuses[key] = status if isinstance(status, str) else None
+        return self._statuses[key]
+
+    def timeline(self, ticket: str) -> List[TimelineEvent]:
+        """Get a ticket's events, oldest first (empty if unknown)."""
+        state = self.tickets.get(ticket)
+        return list(state["events"]) if state else []
+
+    def milestones(self, ticket: str) -> Dict[str, Optional[TimelineEvent]]:
+        """Get the first occurrence of each milestone for a ticket."""
+        found: Dict[str, Optional[TimelineEvent]] = {
+            name: None for name in MILESTONES
+        }
+        for event in self.timeline(ticket):
+            if event["event"] in found and found[event["event"]] is None:
+                found[event["event"]] = event
+        return found
@@ -0,0 +1,408 @@
+"""Incremental index of a project's tickets and documentation.
+
+The index records, for every ticket folder under `specs/tickets/` and
+`specs/archive/`, the fields most views need (type, title, status,
+priority, plan/progress state) together with a stat signature of the
+files they came from. Refreshing the index stats each ticket's files
+and re-parses only the tickets whose signature changed, so listings
+stay cheap on large repositories. Documentation pages under `docs/`
+are indexed the same way.
+
+The index is persisted in `.cdd/cache/index.json`.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, TypedDict
+
+from .concurrency import atomic_write
+from .handlers.progress_handler import ProgressHandler, ProgressHandlerError
+from .handlers.spec_handler import SpecHandler, SpecHandlerError
+from .project import get_cache_dir
+
+# Bump when entry fields change to force a rebuild
+INDEX_VERSION = 2
+
+CACHE_FILE = "index.json"
+
+# Ticket locations relative to the project root
+TICKET_LOCATIONS = {
+    "tickets": "specs/tickets",
+    "archive": "specs/archive",
+}
+
+# Files whose changes affect a ticket's entry
+TICKET_FILES = ["spec.yaml", "plan.md", "progress.yaml"]
+
+DOCS_DIR = "docs"
+
+
+class TicketEntry(TypedDict):
+    name: str
+    location: str
+    path: str
+    type: Optional[str]
+    title: Optional[str]
+    status: Optional[str]
+    priority: Optional[str]
+    has_plan: bool
+    progress_status: Optional[str]
+    current_step: Optional[str]
+    steps_completed: int
+    steps_total: int
+    open_issues: List[str]
+    error: Optional[str]
+    signature: List[Optional[List[int]]]
+
+
+class DocEntry(TypedDict):
+    path: str
+    title: Optional[str]
+    signature: List[int]
+
+
+def _stat_signature(path: Path) -> Optional[List[int]]:
+    """Get (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def ticket_signature(ticket_dir: Path) -> List[Optional[List[int]]]:
+    """Get the stat signature of a ticket folder's files.
+
+    Args:
+        ticket_dir: Ticket folder
+
+    Returns:
+        One (mtime_ns, size) pair (or None) per file in TICKET_FILES
+    """
+    # Plain string joins: this runs for every ticket on every refresh
+    base = os.fspath(ticket_dir)
+    return [_stat_signature(os.path.join(base, name)) for name in TICKET_FILES]
+
+
+def read_ticket_entry(
+    ticket_dir: Path, location: str, project_root: Path
+) -> TicketEntry:
+    """Parse a ticket folder into an index entry.
+
+    Args:
+        ticket_dir: Ticket folder
+        location: "tickets" or "archive"
+        project_root: Project root (entry paths are relative to it)
+
+    Returns:
+        Ticket entry; parse problems are recorded in "error"
+    """
+    entry: TicketEntry = {
+        "name": ticket_dir.name,
+        "location": location,
+        "path": ticket_dir.relative_to(project_root).as_posix(),
+        "type": None,
+        "title": None,
+        "status": None,
+        "priority": None,
+        "has_plan": (ticket_dir / "plan.md").exists(),
+        "progress_status": None,
+        "current_step": None,
+        "steps_completed": 0,
+        "steps_total": 0,
+        "open_issues": [],
+        "error": None,
+        "signature": ticket_signature(ticket_dir),
+    }
+
+    try:
+        spec = SpecHandler.read_spec(ticket_dir / "spec.yaml")
+        ticket = spec.get("ticket")
+        if isinstance(ticket, dict):
+            entry["type"] = ticket.get("type")
+            entry["status"] = ticket.get("status")
+            priority = ticket.get("priority")
+            entry["priority"] = priority if isinstance(priority, str) else None
+        title = spec.get("title")
+        entry["title"] = str(title) if title is not None else None
+    except SpecHandlerError as e:
+        entry["error"] = str(e)
+
+    if entry["type"] is None:
+        entry["type"] = ticket_dir.name.split("-", 1)[0]
+
+    progress_path = ticket_dir / "progress.yaml"
+    if progress_path.exists():
+        try:
+            progress = ProgressHandler.read_progress(progress_path)
+            _read_progress_fields(entry, progress)
+        except (ProgressHandlerError, TypeError) as e:
+            entry["error"] = entry["error"] or str(e)
+
+    return entry
+
+
+def _read_progress_fields(entry: TicketEntry, progress: dict) -> None:
+    """Copy status, current step and open issues from progress data."""
+    status = progress.get("status")
+    entry["progress_status"] = status if isinstance(status, str) else None
+
+    steps = progress.get("steps")
+    steps = [s for s in steps if isinstance(s, dict)] if steps else []
+    entry["steps_total"] = len(steps)
+    entry["steps_completed"] = sum(
+        1 for step in steps if step.get("status") == "completed"
+    )
+    current = next(
+        (s for s in steps if s.get("status") == "in_progress"),
+        next((s for s in steps if s.get("status") == "pending"), None),
+    )
+    if current is not None and current.get("description"):
+        entry["current_step"] = str(current["description"])
+
+    issues = progress.get("issues")
+    entry["open_issues"] = [
+        str(issue.get("description", ""))
+        for issue in (issues or [])
+        if isinstance(issue, dict) and not issue.get("resolved_at")
+    ]
+
+
+def read_doc_title(doc_path: Path) -> Optional[str]:
+    """Get the first Markdown H1 of a document.
+
+    Args:
+        doc_path: Markdown file
+
+    Returns:
+        Heading text, or None if the file has no H1
+    """
+    try:
+        with open(doc_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("# "):
+                    return line[2:].strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return None
+
+
+class ProjectIndex:
+    """Persistent, incrementally refreshed index of tickets and docs."""
+
+    def __init__(self, project_root: Path):
+        """Create an empty index for a project.
+
+        Args:
+            project_root: Project root directory
+        """
+        self.project_root = Path(os.path.abspath(project_root))
+        self.tickets: Dict[str, TicketEntry] = {}
+        self.docs: Dict[str, DocEntry] = {}
+        self._dirty = False
+
+    @property
+    def cache_path(self) -> Path:
+        return get_cache_dir(self.project_root) / CACHE_FILE
+
+    @classmethod
+    def load(cls, project_root: Path, refresh: bool = True) -> "ProjectIndex":
+        """Load the persisted index.
+
+        Args:
+            project_root: Project root directory
+            refresh: Bring the index up to date with the filesystem
+
+        Returns:
+            Project index
+        """
+        index = cls(project_root)
+        try:
+            data = json.loads(index.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") == INDEX_VERSION:
+                index.tickets = data.get("tickets", {})
+                index.docs = data.get("docs", {})
+        except (OSError, ValueError):
+            pass
+
+        if refresh:
+            index.refresh()
+        return index
+
+    def save(self) -> None:
+        """Persist the index if it changed."""
+        if not self._dirty:
+            return
+        cache_path = self.cache_path
+        atomic_write(
+            cache_path,
+            json.dumps(
+                {
+                    "version": INDEX_VERSION,
+                    "tickets": self.tickets,
+                    "docs": self.docs,
+                }
+            ),
+        )
+        self._dirty = False
+
+    def refresh(self) -> List[str]:
+        """Re-parse tickets and docs whose files changed on disk.
+
+        Returns:
+            Relative paths of entries that were added, updated or removed
+        """
+        changed = []
+        seen = set()
+
+        for location, rel_dir in TICKET_LOCATIONS.items():
+            base = self.project_root / rel_dir
+            try:
+                entries = list(os.scandir(base))
+            except OSError:
+                continue
+            for dir_entry in entries:
+                if not dir_entry.is_dir() or dir_entry.name.startswith("."):
+                    continue
+                ticket_dir = Path(dir_entry.path)
+                signature = ticket_signature(ticket_dir)
+                if signature[0] is None:
+                    # Not a ticket without spec.yaml
+                    continue
+                key = f"{rel_dir}/{dir_entry.name}"
+                seen.add(key)
+                cached = self.tickets.get(key)
+                if cached and cached["signature"] == signature:
+                    continue
+                self.tickets[key] = read_ticket_entry(
+                    ticket_dir, location, self.project_root
+                )
+                changed.append(key)
+
+        for key in [k for k in self.tickets if k not in seen]:
+            del self.tickets[key]
+            changed.append(key)
+
+        changed.extend(self._refresh_docs())
+
+        if changed:
+            self._dirty = True
+        return changed
+
+    def _refresh_docs(self) -> List[str]:
+        changed = []
+        seen = set()
+        stack = [self.project_root / DOCS_DIR]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for dir_entry in entries:
+                if dir_entry.is_dir():
+                    stack.append(Path(dir_entry.path))
+                    continue
+                if not dir_entry.name.endswith(".md"):
+                    continue
+                doc_path = Path(dir_entry.path)
+                key = doc_path.relative_to(self.project_root).as_posix()
+                seen.add(key)
+                stat = dir_entry.stat()
+                signature = [stat.st_mtime_ns, stat.st_size]
+                cached = self.docs.get(key)
+                if cached and cached["signature"] == signature:
+                    continue
+                self.docs[key] = {
+                    "path": key,
+                    "title": read_doc_title(doc_path),
+                    "signature": signature,
+                }
+                changed.append(key)
+
+        for key in [k for k in self.docs if k not in seen]:
+            del self.docs[key]
+            changed.append(key)
+        return changed
+
+    def update_ticket(self, ticket_dir: Path) -> Optional[TicketEntry]:
+        """Re-read a single ticket folder.
+
+        Args:
+            ticket_dir: Ticket folder (absolute or project-relative)
+
+        Returns:
+            Updated entry, or None if the ticket no longer exists
+        """
+        ticket_dir = self._absolute(ticket_dir)
+        key = ticket_dir.relative_to(self.project_root).as_posix()
+        location = next(
+            (
+                name
+                for name, rel_dir in TICKET_LOCATIONS.items()
+                if key.startswith(f"{rel_dir}/")
+            ),
+            None,
+        )
+
+        self._dirty = True
+        if location is None or not (ticket_dir / "spec.yaml").exists():
+            self.tickets.pop(key, None)
+            return None
+
+        entry = read_ticket_entry(ticket_dir, location, self.project_root)
+        self.tickets[key] = entry
+        return entry
+
+    def update_doc(self, doc_path: Path) -> Optional[DocEntry]:
+        """Re-read a single documentation page.
+
+        Args:
+            doc_path: Markdown file (absolute or project-relative)
+
+        Returns:
+            Updated entry, or None if the page no longer exists
+        """
+        doc_path = self._absolute(doc_path)
+        key = doc_path.relative_to(self.project_root).as_posix()
+        signature = _stat_signature(doc_path)
+
+        self._dirty = True
+        if signature is None:
+            self.docs.pop(key, None)
+            return None
+
+        entry: DocEntry = {
+            "path": key,
+            "title": read_doc_title(doc_path),
+            "signature": signature,
+        }
+        self.docs[key] = entry
+        return entry
+
+    def list_tickets(
+        self, location: Optional[str] = None
+    ) -> List[TicketEntry]:
+        """List indexed tickets sorted by path.
+
+        Args:
+            location: "tickets" or "archive" (None for both)
+
+        Returns:
+            Ticket entries
+        """
+        return [
+            self.tickets[key]
+            for key in sorted(self.tickets)
+            if location is None or self.tickets[key]["location"] == location
+        ]
+
+    def ticket_names(self, location: str = "tickets") -> List[str]:
+        """Names of indexed tickets (e.g. for fuzzy suggestions)."""
+        return [entry["name"] for entry in self.list_tickets(location)]
+
+    def _absolute(self, path: Path) -> Path:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.project_root / path
+        return Path(os.path.abspath(path))
@@ -3,12 +3,18 @@
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
-from rich.console import Console
+from .output import LazyConsole
+from .profiling import phase
+from .project import forget_project_roots
+from .store import FrameworkStore, StoreError
+from .tracing import add_write, traced
 
-console = Console()
+console = LazyConsole()
 
 # Dangerous system paths that should never be initialized
 DANGEROUS_PATHS = [
@@ -23,6 +29,9 @@ DANGEROUS_PATHS = [
     "/boot",
 ]
 
+# Languages with packaged commands and templates
+SUPPORTED_LANGUAGES = ["en", "pt-br"]
+
 
 class InitializationError(Exception):
     """Raised when initialization cannot proceed."""
@@ -53,6 +62,7 @@ def is_dangerous_path(path: Path) -> bool:
     return False
 
 
+@phase("root discovery")
 def get_git_root(path: Path) -> Path | None:
     """Try to find git repository root.
 
@@ -146,6 +156,7 @@ def check_existing_structure(base_path: Path) -> Tuple[bool, List[str]]:
     return len(existing) > 0, existing
 
 
+@phase("handler I/O")
 def create_directory_structure(base_path: Path) -> List[str]:
     """Create CDD directory structure.
 
@@ -178,24 +189,105 @@ def create_directory_structure(base_path: Path) -> List[str]:
     return created
 
 
-def install_framework_commands(base_path: Path, language: str) -> List[str]:
+@lru_cache(maxsize=None)
+def read_packaged_files(
+    kind: str, language: str
+) -> Tuple[Tuple[str, bytes], ...]:
+    """Read packaged command or template files.
+
+    Results are cached so that initializing many projects in one process
+    reads the package data only once.
+
+    Args:
+        kind: Package directory ("commands" or "templates")
+        language: Language code ('en' or 'pt-br')
+
+    Returns:
+        Tuple of (file name, contents) pairs, sorted by name
+
+    Raises:
+        InitializationError: If no files exist for the language
+    """
+    source_dir = Path(__file__).parent / kind / language
+
+    if not source_dir.exists():
+        raise InitializationError(
+            f"{kind.title()} not found for language: {language}"
+        )
+
+    pattern = "*.md" if kind == "commands" else "*"
+    return tuple(
+        (source_file.name, source_file.read_bytes())
+        for source_file in sorted(source_dir.glob(pattern))
+        if source_file.is_file()
+    )
+
+
+def install_file(
+    data: bytes,
+    target_file: Path,
+    store: Optional[FrameworkStore] = None,
+    link_mode: str = "auto",
+) -> None:
+    """Install packaged file contents into a project.
+
+    Writes the file, or links it from the shared store when one is given.
+
+    Args:
+        data: Packaged file contents
+        target_file: Destination path inside the project
+        store: Shared content-addressed store (None to copy)
+        link_mode: Link mode used with the store (see store.LINK_MODES)
+    """
+    if store is None:
+        # Never write through a link into the shared store
+        if target_file.is_symlink() or target_file.exists():
+            target_file.unlink()
+        target_file.write_bytes(data)
+        add_write(data)
+        return
+
+    try:
+        digest = store.add_bytes(data)
+        store.install(digest, target_file, link_mode)
+    except StoreError as e:
+        raise InitializationError(str(e))
+
+
+@phase("handler I/O")
+def install_framework_commands(
+    base_path: Path,
+    language: str,
+    store: Optional[FrameworkStore] = None,
+    link_mode: str = "auto",
+    compact: bool = False,
+) -> List[str]:
     """Copy framework command files to .claude/commands/ in selected language.
 
     Args:
         base_path: Base directory for project
         language: Language code ('en' or 'pt-br')
+        store: Shared content-addressed store (None to copy)
+        link_mode: Link mode used with the store
+        compact: Install the compact builds (see cddoc.compact)
 
     Returns:
         List of installed command files
+
+    Raises:
+        InitializationError: If a compact build fails verification
     """
-    # Get source commands directory from package (same pattern as templates)
-    package_dir = Path(__file__).parent
-    source_commands = package_dir / "commands" / language
+    if compact:
+        from .compact import CompactError, compact_packaged_commands
 
-    if not source_commands.exists():
-        raise InitializationError(
-            f"Commands not found for language: {language}"
-        )
+        try:
+            command_files = compact_packaged_commands(language)
+        except CompactError as e:
+            raise InitializationError(str(e))
+    else:
+        from .fragments import assemble_packaged_commands
+
+        command_files = assemble_packaged_commands(language)
 
     # Target: .claude/commands/ (flat structure, no language subfolder)
     target_commands = base_path / ".claude" / "commands"
@@ -204,11 +296,9 @@ def install_framework_commands(base_path: Path, language: str) -> List[str]:
     installed = []
 
     # Copy all command files
-    for command_file in source_commands.glob("*.md"):
-        if command_file.is_file():
-            target_file = target_commands / command_file.name
-            shutil.copy2(command_file, target_file)
-            installed.append(f".claude/commands/{command_file.name}")
+    for name, data in command_files:
+        install_file(data, target_commands / name, store, link_mode)
+        installed.append(f".claude/commands/{name}")
 
     return installed
 
@@ -241,6 +331,7 @@ def prompt_language_selection() -> str:
             )
 
 
+@phase("handler I/O")
 def create_config_file(target_path: Path, language: str):
     """Create .cdd/config.yaml with language preference.
 
@@ -263,26 +354,28 @@ version: 1
 """
 
     config_file.write_text(config_content, encoding="utf-8")
+    add_write(config_content)
 
 
-def install_templates(base_path: Path, language: str) -> List[str]:
+@phase("handler I/O")
+def install_templates(
+    base_path: Path,
+    language: str,
+    store: Optional[FrameworkStore] = None,
+    link_mode: str = "auto",
+) -> List[str]:
     """Install templates in selected language.
 
     Args:
         base_path: Project root path
         language: Language code ('en' or 'pt-br')
+        store: Shared content-addressed store (None to copy)
+        link_mode: Link mode used with the store
 
     Returns:
         List of installed template filenames
     """
-    # Get source templates directory from package
-    package_dir = Path(__file__).parent
-    source_templates = package_dir / "templates" / language
-
-    if not source_templates.exists():
-        raise InitializationError(
-            f"Templates not found for language: {language}"
-        )
+    template_files = read_packaged_files("templates", language)
 
     # Target: .cdd/templates/ (flat structure, no language subfolder)
     target_templates = base_path / ".cdd" / "templates"
@@ -291,15 +384,14 @@ def install_templates(base_path: Path, language: str) -> List[str]:
     installed = []
 
     # Copy all template files
-    for template_file in source_templates.glob("*"):
-        if template_file.is_file():
-            target_file = target_templates / template_file.name
-            shutil.copy2(template_file, target_file)
-            installed.append(f".cdd/templates/{template_file.name}")
+    for name, data in template_files:
+        install_file(data, target_templates / name, store, link_mode)
+        installed.append(f".cdd/templates/{name}")
 
     return installed
 
 
+@phase("handler I/O")
 def generate_claude_md(base_path: Path, force: bool = False) -> bool:
     """Generate CLAUDE.md from constitution template.
 
@@ -322,14 +414,98 @@ def generate_claude_md(base_path: Path, force: bool = False) -> bool:
     )
 
     if template_path.exists():
-        shutil.copy2(template_path, claude_md_path)
+        # Contents only: the template may link to a read-only store
+        # object, and CLAUDE.md is meant to be edited
+        claude_md_path.unlink(missing_ok=True)
+        shutil.copyfile(template_path, claude_md_path)
         return True
 
     return False
 
 
+def validate_language(language: str) -> str:
+    """Validate a language code.
+
+    Args:
+        language: Language code to check
+
+    Returns:
+        The language code
+
+    Raises:
+        InitializationError: If the language is not supported
+    """
+    if language not in SUPPORTED_LANGUAGES:
+        raise InitializationError(
+            f"Unsupported language: {language}\n"
+            f"Supported values: {', '.join(SUPPORTED_LANGUAGES)}"
+        )
+    return language
+
+
+def install_structure(
+    target_path: Path,
+    language: str,
+    force: bool = False,
+    store: Optional[FrameworkStore] = None,
+    link_mode: str = "auto",
+    compact: bool = False,
+) -> dict:
+    """Create CDD structure in an already validated project root.
+
+    Performs no prompting and no console output, so it is safe to run
+    for several projects concurrently.
+
+    Args:
+        target_path: Resolved project root
+        language: Language code ('en' or 'pt-br')
+        force: Whether to overwrite existing files
+        store: Shared content-addressed store (None to copy)
+        link_mode: Link mode used with the store
+        compact: Install the compact builds of the command files
+
+    Returns:
+        Dictionary with initialization results
+    """
+    has_existing, _ = check_existing_structure(target_path)
+
+    # Create directory structure
+    created_dirs = create_directory_structure(target_path)
+    forget_project_roots()
+
+    # Create config file with language
+    create_config_file(target_path, language)
+
+    # Install commands and templates
+    installed_commands = install_framework_commands(
+        target_path, language, store, link_mode, compact
+    )
+    installed_templates = install_templates(
+        target_path, language, store, link_mode
+    )
+    claude_md_created = generate_claude_md(target_path, force)
+
+    return {
+        "path": target_path,
+        "created_dirs": created_dirs,
+        "installed_commands": installed_commands,
+        "installed_templates": installed_templates,
+        "claude_md_created": claude_md_created,
+        "existing_structure": has_existing,
+        "language": language,
+        "store_path": store.root if store else None,
+    }
+
+
+@traced()
 def initialize_project(
-    path: str, force: bool = False, minimal: bool = False
+    path: str,
+    force: bool = False,
+    minimal: bool = False,
+    shared_store: bool = False,
+    link_mode: str = "auto",
+    language: Optional[str] = None,
+    compact: bool = False,
 ) -> dict:
     """Initialize CDD structure in a project.
 
@@ -345,6 +521,12 @@ def initialize_project(
         path: Target directory path
         force: Whether to overwrite existing files
         minimal: Whether to create minimal structure only (reserved for future)
+        shared_store: Link framework files from the user-level
+            content-addressed store instead of copying them
+        link_mode: How files are linked from the store
+            (auto/reflink/hardlink/symlink/copy)
+        language: Language code; prompts interactively when None
+        compact: Install the compact builds of the command files
 
     Returns:
         Dictionary with initialization results
@@ -352,6 +534,9 @@ def initialize_project(
     Raises:
         InitializationError: If initialization fails
     """
+    if language is not None:
+        validate_language(language)
+
     target_path = Path(path)
 
     # Validate path
@@ -383,25 +568,154 @@ def initialize_project(
         )
 
     # Prompt for language selection
-    language = prompt_language_selection()
+    if language is None:
+        language = prompt_language_selection()
 
-    # Create directory structure
-    created_dirs = create_directory_structure(target_path)
+    store = FrameworkStore() if shared_store else None
+    return install_structure(
+        target_path, language, force, store, link_mode, compact
+    )
 
-    # Create config file with language
-    create_config_file(target_path, language)
 
-    # Install commands and templates
-    installed_commands = install_framework_commands(target_path, language)
-    installed_templates = install_templates(target_path, language)
-    claude_md_created = generate_claude_md(target_path, force)
+def expand_project_patterns(
+    patterns: Iterable[str], base_path: Optional[Path] = None
+) -> List[Path]:
+    """Expand project glob patterns into target directories.
 
-    return {
-        "path": target_path,
-        "created_dirs": created_dirs,
-        "installed_commands": installed_commands,
-        "installed_templates": installed_templates,
-        "claude_md_created": claude_md_created,
-        "existing_structure": has_existing,
-        "language": language,
-    }
+    Patterns containing glob characters match existing directories only;
+    plain paths are kept even if they don't exist yet (they are created
+    during initialization). Duplicates are dropped, order is preserved.
+
+    Args:
+        patterns: Glob patterns or paths (e.g. "packages/*")
+        base_path: Directory relative patterns are expanded from
+            (defaults to current directory)
+
+    Returns:
+        List of target directories
+    """
+    base = base_path or Path.cwd()
+    targets: List[Path] = []
+    seen = set()
+
+    for pattern in patterns:
+        pattern_path = Path(pattern).expanduser()
+        if not any(char in pattern for char in "*?["):
+            matches = [
+                pattern_path
+                if pattern_path.is_absolute()
+                else base / pattern_path
+            ]
+        elif pattern_path.is_absolute():
+            anchor = Path(pattern_path.anchor)
+            relative = str(pattern_path.relative_to(anchor))
+            matches = sorted(p for p in anchor.glob(relative) if p.is_dir())
+        else:
+            matches = sorted(p for p in base.glob(pattern) if p.is_dir())
+
+        for match in matches:
+            key = match.resolve()
+            if key not in seen:
+                seen.add(key)
+                targets.append(match)
+
+    return targets
+
+
+def read_repo_list(list_path: Path) -> List[str]:
+    """Read project paths from a repo-list file.
+
+    One path or glob pattern per line; blank lines and lines starting
+    with '#' are ignored. Relative entries are relative to the file.
+
+    Args:
+        list_path: Path to the list file
+
+    Returns:
+        List of path strings
+
+    Raises:
+        InitializationError: If the file cannot be read
+    """
+    try:
+        lines = Path(list_path).read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise InitializationError(f"Cannot read repo list {list_path}: {e}")
+
+    entries = []
+    for line in lines:
+        entry = line.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        if not Path(entry).expanduser().is_absolute():
+            entry = str(Path(list_path).parent / entry)
+        entries.append(entry)
+
+    return entries
+
+
+@traced()
+def initialize_projects(
+    paths: Iterable[Path],
+    language: str,
+    force: bool = False,
+    shared_store: bool = False,
+    link_mode: str = "auto",
+    max_workers: Optional[int] = None,
+    compact: bool = False,
+) -> List[dict]:
+    """Initialize several projects concurrently.
+
+    Unlike initialize_project(), each target is initialized in place
+    (no jump to the git root) so one monorepo can host many projects,
+    and no prompts are shown. Packaged files are read once and shared.
+
+    Args:
+        paths: Project directories to initialize
+        language: Language code ('en' or 'pt-br')
+        force: Whether to overwrite existing files
+        shared_store: Link framework files from the shared store
+        link_mode: How files are linked from the store
+        max_workers: Thread pool size (defaults to number of targets,
+            capped at 32)
+        compact: Install the compact builds of the command files
+
+    Returns:
+        One result dictionary per target, in input order. Failed targets
+        have "path" and "error" keys instead of installation results.
+
+    Raises:
+        InitializationError: If the language is unsupported or packaged
+            files are missing
+    """
+    validate_language(language)
+    targets = list(paths)
+    if not targets:
+        return []
+
+    # Warm the package cache once before fanning out
+    read_packaged_files("commands", language)
+    read_packaged_files("templates", language)
+    if compact:
+        from .compact import CompactError, compact_packaged_commands
+
+        try:
+            compact_packaged_commands(language)
+        except CompactError as e:
+            raise InitializationError(str(e))
+
+    store = FrameworkStore() if shared_store else None
+
+    def _init_one(target: Path) -> dict:
+        try:
+            target_path = validate_path(target)
+            target_path.mkdir(parents=True, exist_ok=True)
+            return install_structure(
+                target_path, language, force, store, link_mode, compact
+            )
+        except (InitializationError, OSError) as e:
+            return {"path": Path(target), "error": str(e)}
+
+    workers = max_workers or min(32, len(targets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_init_one, targets))
@@ -0,0 +1,836 @@
+"""Language server for spec.yaml, progress.yaml and plan.md buffers.
+
+`cdd lsp` speaks the Language Server Protocol over stdio, so editors
+report spec problems while the file is written instead of when an agent
+trips over them later. It provides:
+
+- Diagnostics: specs are checked against their ticket type's schema
+  (compiled from the ticket templates, as in `cdd validate`), progress
+  files against the progress schema, and plans for missing steps.
+- Completions for enum values (`ticket.status`, `priority`, ...) and
+  ticket names in `depends_on` lists.
+- Go-to-definition from a ticket name or ticket path to its spec.
+
+Keystrokes stay cheap on large files: a change only splices the edited
+range into the buffer, and completion/definition look at the lines
+around the cursor. Full YAML validation runs once typing pauses
+(DEBOUNCE_SECONDS), off the request loop, and is skipped when the
+content is unchanged.
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+from urllib.parse import unquote, urlparse
+
+from . import __version__
+from .api import Repository, RepositoryError
+from .plan import parse_plan
+from .project import find_project_root
+from .validation import (
+    TICKET_TYPES,
+    SchemaNode,
+    SpecSchema,
+    compile_spec_schemas,
+    content_key,
+    get_progress_schema,
+    load_ticket_templates,
+    validate_text,
+)
+
+# Quiet period after the last change before a buffer is validated
+DEBOUNCE_SECONDS = 0.3
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+# LSP constants
+SYNC_INCREMENTAL = 2
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+COMPLETION_VALUE = 12
+COMPLETION_REFERENCE = 18
+
+DocumentKind = Literal["spec", "progress", "plan"]
+
+# "key: value" (optionally as a list item), up to the cursor
+KEY_LINE = re.compile(r"^(\s*)(?:-\s+)?([\w.-]+):(?:\s+(\S*))?$")
+
+# A bare list item being typed, up to the cursor
+ITEM_LINE = re.compile(r"^(\s*)-\s*(\S*)$")
+
+# "key:" at the start of a (possibly list item) line
+KEY_START = re.compile(r"([\w.-]+):(?:\s|$)")
+
+# "key: |" or "key: >-" starting a multi-line string
+BLOCK_SCALAR = re.compile(r":\s+[|>][+-]?\s*$")
+
+# Characters that can make up a ticket name or path
+REFERENCE_CHARS = re.compile(r"[\w./-]")
+
+# An indented "type: <ticket type>" line
+TYPE_LINE = re.compile(r"^\s+type:\s*[\"']?(\w+)")
+
+# PyYAML error marks: the last one is where parsing failed
+YAML_MARK = re.compile(r"line (\d+), column (\d+)")
+
+ERROR_LINE = re.compile(r"^line (\d+): ")
+
+TICKET_DIRS = ("specs/tickets/", "specs/archive/")
+
+
+class LanguageServerError(Exception):
+    """Raised when the client sends a malformed message."""
+
+    pass
+
+
+class Document(TypedDict):
+    uri: str
+    path: Path
+    kind: DocumentKind
+    version: int
+    lines: List[str]
+    diagnosed: Optional[str]
+
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """Read one Content-Length framed JSON-RPC message.
+
+    Args:
+        stream: Binary input stream
+
+    Returns:
+        Decoded message, or None at end of input
+
+    Raises:
+        LanguageServerError: If the framing or JSON is invalid
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            length = int(value.strip())
+
+    if length is None:
+        raise LanguageServerError("Missing Content-Length header")
+    body = stream.read(length)
+    try:
+        return json.loads(body.decode("utf-8"))
+    except ValueError as e:
+        raise LanguageServerError(f"Invalid JSON message: {e}")
+
+
+def write_message(stream: BinaryIO, message: dict) -> None:
+    """Write one Content-Length framed JSON-RPC message.
+
+    Args:
+        stream: Binary output stream
+        message: Message to send
+    """
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+    stream.write(body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Path:
+    """Convert a file:// URI to a path."""
+    return Path(unquote(urlparse(uri).path))
+
+
+def document_kind(path: Path) -> Optional[DocumentKind]:
+    """Get what a buffer is checked as (None for unsupported files)."""
+    if path.name == "spec.yaml":
+        return "spec"
+    if path.name == "progress.yaml":
+        return "progress"
+    if path.name == "plan.md":
+        return "plan"
+    return None
+
+
+def utf16_to_index(line: str, character: int) -> int:
+    """Convert an LSP (UTF-16) column to a string index."""
+    if line.isascii():
+        return min(character, len(line))
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def index_to_utf16(line: str, index: int) -> int:
+    """Convert a string index to an LSP (UTF-16) column."""
+    prefix = line[:index]
+    if prefix.isascii():
+        return len(prefix)
+    return len(prefix.encode("utf-16-le")) // 2
+
+
+def apply_change(lines: List[str], change: dict) -> None:
+    """Apply a textDocument/didChange content change in place.
+
+    Only the edited lines are rebuilt, so a keystroke costs the same on
+    a ten-line spec and a ten-thousand-line one.
+
+    Args:
+        lines: Buffer lines (split on "\\n"), modified in place
+        change: Change event (ranged, or full text without a range)
+    """
+    if "range" not in change:
+        lines[:] = change["text"].split("\n")
+        return
+    start = change["range"]["start"]
+    end = change["range"]["end"]
+    last = len(lines) - 1
+    start_line = min(start["line"], last)
+    end_line = min(end["line"], last)
+    first_line = lines[start_line]
+    end_text = lines[end_line]
+    head = first_line[: utf16_to_index(first_line, start["character"])]
+    if start["line"] > last:
+        head = first_line
+    tail = end_text[utf16_to_index(end_text, end["character"]) :]
+    if end["line"] > last:
+        tail = ""
+    lines[start_line : end_line + 1] = (head + change["text"] + tail).split(
+        "\n"
+    )
+
+
+def key_lines(text: str) -> Dict[str, int]:
+    """Map dotted YAML key paths to the line they start on.
+
+    A line-based outline used to place diagnostics; list items get
+    indexed paths (`steps[2].status`) like validation errors do.
+
+    Args:
+        text: YAML content
+
+    Returns:
+        Mapping of path to zero-based line
+    """
+    lines: Dict[str, int] = {}
+    stack: List[Tuple[int, str, bool]] = []  # (indent, path, is_item)
+    counters: Dict[str, int] = {}
+    block_indent = None  # indent of the key owning a block scalar
+
+    for number, line in enumerate(text.splitlines()):
+        stripped = line.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(stripped)
+        if block_indent is not None:
+            if indent > block_indent:
+                continue
+            block_indent = None
+        is_item = stripped == "-" or stripped.startswith("- ")
+
+        # A list may sit at its parent key's indent ("key:\n- item")
+        while stack and (
+            stack[-1][0] > indent
+            or (stack[-1][0] == indent and not (is_item and not stack[-1][2]))
+        ):
+            stack.pop()
+        parent = stack[-1][1] if stack else ""
+
+        if is_item:
+            index = counters.get(parent, 0)
+            counters[parent] = index + 1
+            parent = f"{parent}[{index}]"
+            lines.setdefault(parent, number)
+            stack.append((indent, parent, True))
+            stripped = stripped[1:].lstrip(" ")
+            indent = len(line) - len(stripped)
+
+        match = KEY_START.match(stripped)
+        if match:
+            key = match.group(1)
+            path = f"{parent}.{key}" if parent else key
+            lines.setdefault(path, number)
+            stack.append((indent, path, False))
+            if BLOCK_SCALAR.search(stripped):
+                block_indent = indent
+    return lines
+
+
+def parent_keys(lines: List[str], number: int) -> List[str]:
+    """Get the keys enclosing a line, outermost first.
+
+    List items are transparent: keys inside `- ...` items resolve to
+    the key holding the list, matching how schemas nest sequences.
+
+    Args:
+        lines: Buffer lines
+        number: Zero-based line
+
+    Returns:
+        Keys of the mappings the line is nested in
+    """
+    line = lines[number]
+    indent = len(line) - len(line.lstrip(" "))
+    is_item = line.lstrip(" ").startswith("-")
+    keys: List[str] = []
+    for previous in reversed(lines[:number]):
+        stripped = previous.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        previous_indent = len(previous) - len(stripped)
+        is_key = KEY_START.match(stripped)
+        if previous_indent >= indent:
+            # A list may sit at its parent key's indent ("key:\n- item")
+            if not (
+                is_item
+                and previous_indent == indent
+                and is_key
+                and not stripped.startswith("-")
+            ):
+                continue
+        elif stripped.startswith("-"):
+            # Enclosing list item; keep looking for the list's key
+            indent, is_item = previous_indent, True
+            continue
+        if is_key is None:
+            continue
+        keys.append(is_key.group(1))
+        indent, is_item = previous_indent, False
+        if indent == 0:
+            break
+    keys.reverse()
+    return keys
+
+
+def schema_node(node: SchemaNode, keys: List[str]) -> Optional[SchemaNode]:
+    """Find the schema node for a key path (list items are skipped)."""
+    for key in keys:
+        while node.get("kind") == "sequence":
+            node = node["items"]
+        fields = node.get("fields")
+        if not fields or key not in fields:
+            return None
+        node = fields[key]
+    return node
+
+
+def guess_ticket_type(path: Path, lines: List[str]) -> Optional[str]:
+    """Get a spec's ticket type from its folder name or a `type:` line."""
+    for ticket_type in TICKET_TYPES:
+        if path.parent.name.startswith(f"{ticket_type}-"):
+            return ticket_type
+    for line in lines:
+        match = TYPE_LINE.match(line)
+        if match and match.group(1) in TICKET_TYPES:
+            return match.group(1)
+    return None
+
+
+def _line_range(lines: List[str], number: int) -> dict:
+    """Range covering a line's content (without indentation)."""
+    number = max(0, min(number, len(lines) - 1)) if lines else 0
+    line = lines[number] if lines else ""
+    start = len(line) - len(line.lstrip())
+    return {
+        "start": {"line": number, "character": index_to_utf16(line, start)},
+        "end": {"line": number, "character": index_to_utf16(line, len(line))},
+    }
+
+
+def _diagnostic(range_: dict, message: str, severity: int) -> dict:
+    return {
+        "range": range_,
+        "severity": severity,
+        "source": "cdd",
+        "message": message,
+    }
+
+
+def error_diagnostic(message: str, text: str, outline: Dict[str, int]) -> dict:
+    """Place a validation error message on the line it refers to.
+
+    Args:
+        message: Error from validate_text()
+        text: Buffer content
+        outline: key_lines() of the buffer
+
+    Returns:
+        LSP diagnostic
+    """
+    lines = text.splitlines()
+
+    if message.startswith("Invalid YAML format"):
+        marks = YAML_MARK.findall(message)
+        line, column = (int(n) - 1 for n in marks[-1]) if marks else (0, 0)
+        position = {"line": line, "character": column}
+        return _diagnostic(
+            {"start": position, "end": position},
+            " ".join(message.split()),
+            SEVERITY_ERROR,
+        )
+
+    match = ERROR_LINE.match(message)
+    if match:
+        # Unfilled placeholders: drafts are allowed, so only warn
+        return _diagnostic(
+            _line_range(lines, int(match.group(1)) - 1),
+            message[match.end() :],
+            SEVERITY_WARNING,
+        )
+
+    where, _, detail = message.partition(": ")
+    path = where
+    while path and path not in outline:
+        path = re.sub(r"(\[\d+\]|\.?[^.\[]+)$", "", path)
+    return _diagnostic(
+        _line_range(lines, outline.get(path, 0)),
+        f"{where}: {detail}" if where != "<root>" else detail,
+        SEVERITY_ERROR,
+    )
+
+
+class LanguageServer:
+    """LSP request handling for CDD buffers."""
+
+    def __init__(
+        self,
+        send: Callable[[dict], None],
+        debounce: float = DEBOUNCE_SECONDS,
+    ):
+        """Create a server.
+
+        Args:
+            send: Called with every outgoing message (thread-safe calls
+                are serialized by the server)
+            debounce: Seconds of quiet before a changed buffer is
+                validated (0 validates synchronously)
+        """
+        self._send = send
+        self.debounce = debounce
+        self.documents: Dict[str, Document] = {}
+        self.shutdown_requested = False
+        self.exited = False
+        self._lock = threading.RLock()
+        self._send_lock = threading.Lock()
+        self._timers: Dict[str, threading.Timer] = {}
+        self._schemas: Dict[Optional[Path], Dict[str, SpecSchema]] = {}
+        self._repositories: Dict[Path, Repository] = {}
+        self._handlers: Dict[str, Callable[[dict], Any]] = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/completion": self.completion,
+            "textDocument/definition": self.definition,
+        }
+        self._notifications: Dict[str, Callable[[dict], None]] = {
+            "exit": self.exit,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didSave": self.did_save,
+            "textDocument/didClose": self.did_close,
+        }
+
+    def send(self, message: dict) -> None:
+        with self._send_lock:
+            self._send(message)
+
+    def handle(self, message: dict) -> None:
+        """Dispatch one incoming message.
+
+        Args:
+            message: JSON-RPC request or notification
+        """
+        method = message.get("method", "")
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            handler = self._notifications.get(method)
+            if handler is not None:
+                handler(params)
+            return
+
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        handler = self._handlers.get(method)
+        if handler is None:
+            response["error"] = {
+                "code": METHOD_NOT_FOUND,
+                "message": f"Unsupported method: {method}",
+            }
+        else:
+            try:
+                response["result"] = handler(params)
+            except Exception as e:
+                response["error"] = {"code": INTERNAL_ERROR, "message": str(e)}
+        self.send(response)
+
+    def serve(self, stdin: BinaryIO, stdout: BinaryIO) -> int:
+        """Handle messages until the client exits.
+
+        Args:
+            stdin: Binary input stream
+            stdout: Binary output stream
+
+        Returns:
+            Process exit code (0 after a clean shutdown)
+        """
+        self._send = lambda message: write_message(stdout, message)
+        while not self.exited:
+            try:
+                message = read_message(stdin)
+            except LanguageServerError as e:
+                self.send(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": PARSE_ERROR, "message": str(e)},
+                    }
+                )
+                continue
+            if message is None:
+                break
+            self.handle(message)
+        self._cancel_timers()
+        return 0 if self.shutdown_requested else 1
+
+    # Lifecycle
+
+    def initialize(self, params: dict) -> dict:
+        return {
+            "capabilities": {
+                "positionEncoding": "utf-16",
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": SYNC_INCREMENTAL,
+                    "save": True,
+                },
+                "completionProvider": {"triggerCharacters": [":", " ", "-"]},
+                "definitionProvider": True,
+            },
+            "serverInfo": {"name": "cdd", "version": __version__},
+        }
+
+    def shutdown(self, params: dict) -> None:
+        self.shutdown_requested = True
+        self._cancel_timers()
+        return None
+
+    def exit(self, params: dict) -> None:
+        self.exited = True
+
+    # Document sync
+
+    def did_open(self, params: dict) -> None:
+        item = params["textDocument"]
+        path = uri_to_path(item["uri"])
+        kind = document_kind(path)
+        if kind is None:
+            return
+        with self._lock:
+            self.documents[item["uri"]] = {
+                "uri": item["uri"],
+                "path": path,
+                "kind": kind,
+                "version": item.get("version", 0),
+                "lines": item["text"].split("\n"),
+                "diagnosed": None,
+            }
+        self.publish_diagnostics(item["uri"])
+
+    def did_change(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        with self._lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            for change in params["contentChanges"]:
+                apply_change(document["lines"], change)
+            document["version"] = params["textDocument"].get(
+                "version", document["version"]
+            )
+        self._schedule(uri)
+
+    def did_save(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        with self._lock:
+            document = self.documents.get(uri)
+            if document is not None and "text" in params:
+                document["lines"] = params["text"].split("\n")
+        self.publish_diagnostics(uri)
+
+    def did_close(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        with self._lock:
+            timer = self._timers.pop(uri, None)
+            if timer is not None:
+                timer.cancel()
+            if self.documents.pop(uri, None) is None:
+                return
+        self.send(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "diagnostics": []},
+            }
+        )
+
+    # Diagnostics
+
+    def diagnose(self, document: Document) -> List[dict]:
+        """Compute diagnostics for a buffer.
+
+        Args:
+            document: Open document
+
+        Returns:
+            LSP diagnostics
+        """
+        text = "\n".join(document["lines"])
+        if document["kind"] == "plan":
+            if parse_plan(text)["steps"]:
+                return []
+            return [
+                _diagnostic(
+                    _line_range(text.splitlines(), 0),
+                    "No implementation steps found (expected "
+                    "'### Step N: ...' headings); /exec cannot track "
+                    "progress for this plan",
+                    SEVERITY_WARNING,
+                )
+            ]
+
+        errors = validate_text(
+            document["kind"],
+            text,
+            self.spec_schemas(document["path"]),
+            str(document["path"]),
+        )
+        if not errors:
+            return []
+        outline = key_lines(text)
+        return [error_diagnostic(error, text, outline) for error in errors]
+
+    def publish_diagnostics(self, uri: str) -> None:
+        """Validate a buffer and send its diagnostics if it changed."""
+        with self._lock:
+            self._timers.pop(uri, None)
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            snapshot: Document = {
+                **document,
+                "lines": list(document["lines"]),
+            }
+            key = content_key(snapshot["kind"], "\n".join(snapshot["lines"]))
+            if key == document["diagnosed"]:
+                return
+        diagnostics = self.diagnose(snapshot)
+        with self._lock:
+            if self.documents.get(uri) is not document:
+                return
+            document["diagnosed"] = key
+        self.send(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/publishDiagnostics",
+                "params": {
+                    "uri": uri,
+                    "version": snapshot["version"],
+                    "diagnostics": diagnostics,
+                },
+            }
+        )
+
+    def _schedule(self, uri: str) -> None:
+        if self.debounce <= 0:
+            self.publish_diagnostics(uri)
+            return
+        with self._lock:
+            previous = self._timers.get(uri)
+            if previous is not None:
+                previous.cancel()
+            timer = threading.Timer(
+                self.debounce, self.publish_diagnostics, [uri]
+            )
+            timer.daemon = True
+            self._timers[uri] = timer
+            timer.start()
+
+    def _cancel_timers(self) -> None:
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+
+    # Project state
+
+    def spec_schemas(self, path: Path) -> Dict[str, SpecSchema]:
+        """Get the compiled spec schemas for a file's project."""
+        root = find_project_root(path.parent)
+        with self._lock:
+            schemas = self._schemas.get(root)
+            if schemas is None:
+                schemas = compile_spec_schemas(load_ticket_templates(root))
+                self._schemas[root] = schemas
+            return schemas
+
+    def repository(self, path: Path) -> Optional[Repository]:
+        """Get the repository a file belongs to (None outside projects)."""
+        root = find_project_root(path.parent)
+        if root is None:
+            return None
+        with self._lock:
+            repository = self._repositories.get(root)
+            if repository is None:
+                try:
+                    repository = Repository(root)
+                except RepositoryError:
+                    return None
+                self._repositories[root] = repository
+            return repository
+
+    def ticket_names(
+        self, repository: Repository, location: str = "tickets"
+    ) -> List[str]:
+        """Get a project's ticket names from its refreshed ticket index."""
+        index = repository.index
+        if index is None:
+            return repository.ticket_names(location)
+        with self._lock:
+            index.refresh()
+            return index.ticket_names(location)
+
+    # Language features
+
+    def _cursor(self, params: dict) -> Optional[Tuple[Document, int, str]]:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return None
+        position = params["position"]
+        lines = document["lines"]
+        if position["line"] >= len(lines):
+            return None
+        line = lines[position["line"]]
+        return (
+            document,
+            position["line"],
+            line[: utf16_to_index(line, position["character"])],
+        )
+
+    def completion(self, params: dict) -> List[dict]:
+        """Complete enum values and ticket names at the cursor."""
+        cursor = self._cursor(params)
+        if cursor is None or cursor[0]["kind"] == "plan":
+            return []
+        document, number, before = cursor
+        lines = document["lines"]
+
+        match = KEY_LINE.match(before)
+        if match:
+            keys = parent_keys(lines, number) + [match.group(2)]
+        else:
+            match = ITEM_LINE.match(before)
+            if match is None:
+                return []
+            keys = parent_keys(lines, number)
+
+        if keys and keys[-1] == "depends_on":
+            repository = self.repository(document["path"])
+            if repository is None:
+                return []
+            current = document["path"].parent.name
+            return [
+                {"label": name, "kind": COMPLETION_REFERENCE}
+                for name in self.ticket_names(repository)
+                if name != current
+            ]
+
+        if document["kind"] == "progress":
+            root: Optional[SchemaNode] = get_progress_schema()
+        else:
+            schema = self.spec_schemas(document["path"]).get(
+                guess_ticket_type(document["path"], document["lines"]) or ""
+            )
+            root = schema["node"] if schema else None
+        node = schema_node(root, keys) if root else None
+        if node is None or node.get("kind") != "enum":
+            return []
+        return [
+            {"label": choice, "kind": COMPLETION_VALUE, "sortText": f"{i:02d}"}
+            for i, choice in enumerate(node["choices"])
+        ]
+
+    def definition(self, params: dict) -> Optional[dict]:
+        """Resolve a ticket name or ticket path to the ticket's spec."""
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return None
+        position = params["position"]
+        lines = document["lines"]
+        if position["line"] >= len(lines):
+            return None
+        line = lines[position["line"]]
+        index = utf16_to_index(line, position["character"])
+
+        start = index
+        while start > 0 and REFERENCE_CHARS.match(line[start - 1]):
+            start -= 1
+        end = index
+        while end < len(line) and REFERENCE_CHARS.match(line[end]):
+            end += 1
+        reference = line[start:end].strip("./")
+        if not reference:
+            return None
+
+        repository = self.repository(document["path"])
+        if repository is None:
+            return None
+        target = self._resolve_reference(repository, reference)
+        if target is None:
+            return None
+        position = {"line": 0, "character": 0}
+        return {
+            "uri": target.as_uri(),
+            "range": {"start": position, "end": position},
+        }
+
+    def _resolve_reference(
+        self, repository: Repository, reference: str
+    ) -> Optional[Path]:
+        for prefix in TICKET_DIRS:
+            if prefix in reference:
+                relative = reference[reference.index(prefix) :]
+                target = repository.root / relative
+                if target.is_file():
+                    return target
+                # A ticket folder, or a file the ticket doesn't have yet
+                ticket_dir = repository.root / "/".join(
+                    relative.split("/")[:3]
+                )
+                spec_path = ticket_dir / "spec.yaml"
+                return spec_path if spec_path.is_file() else None
+
+        for location in ("tickets", "archive"):
+            if reference in self.ticket_names(repository, location):
+                target = repository.resolve(reference, location=location)
+                return target if target.is_file() else None
+        return None
@@ -6,9 +6,13 @@ from datetime import datetime
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-console = Console()
+from .output import LazyConsole
+from .profiling import phase
+from .project import find_project_root
+from .tracing import add_read, add_write, traced
+
+console = LazyConsole()
 
 
 class TicketCreationError(Exception):
@@ -54,6 +58,7 @@ def normalize_ticket_name(name: str) -> str:
     return normalized
 
 
+@phase("root discovery")
 def get_git_root() -> Path:
     """Get git repository root directory.
 
@@ -85,6 +90,26 @@ def get_git_root() -> Path:
         )
 
 
+def get_project_root() -> Path:
+    """Get the root of the CDD project containing the current directory.
+
+    Uses the nearest ancestor with a `.cdd` directory (memoized, no
+    subprocess), falling back to the git repository root.
+
+    Returns:
+        Path to project root
+
+    Raises:
+        TicketCreationError: If no project is found and not in a git repo
+    """
+    project_root = find_project_root()
+    if project_root is not None:
+        return project_root
+
+    return get_git_root()
+
+
+@phase("handler I/O")
 def get_template_path(git_root: Path, ticket_type: str) -> Path:
     """Get path to ticket template file.
 
@@ -194,6 +219,7 @@ def prompt_new_name(ticket_type: str) -> str | None:
         return None
 
 
+@phase("handler I/O")
 def create_ticket_file(ticket_path: Path, template_path: Path) -> None:
     """Create ticket directory and spec.yaml file.
 
@@ -210,6 +236,7 @@ def create_ticket_file(ticket_path: Path, template_path: Path) -> None:
 
         # Read template
         template_content = template_path.read_text()
+        add_read(template_content)
 
         # Populate dates
         content = populate_template_dates(template_content)
@@ -217,6 +244,7 @@ def create_ticket_file(ticket_path: Path, template_path: Path) -> None:
         # Write spec.yaml
         spec_file = ticket_path / "spec.yaml"
         spec_file.write_text(content)
+        add_write(content)
 
     except Exception as e:
         raise TicketCreationError(f"Failed to create ticket: {e}")
@@ -240,6 +268,7 @@ def get_documentation_directory(git_root: Path, doc_type: str) -> Path:
         raise ValueError(f"Invalid documentation type: {doc_type}")
 
 
+@phase("handler I/O")
 def get_documentation_template_path(git_root: Path, doc_type: str) -> Path:
     """Get path to documentation template file.
 
@@ -266,6 +295,7 @@ def get_documentation_template_path(git_root: Path, doc_type: str) -> Path:
     return template_path
 
 
+@phase("handler I/O")
 def create_documentation_file(file_path: Path, template_path: Path) -> None:
     """Create documentation markdown file from template.
 
@@ -282,17 +312,20 @@ def create_documentation_file(file_path: Path, template_path: Path) -> None:
 
         # Read template
         template_content = template_path.read_text()
+        add_read(template_content)
 
         # Note: We don't populate dates for documentation (unlike tickets)
         # Documentation is living and continuously updated
 
         # Write markdown file
         file_path.write_text(template_content)
+        add_write(template_content)
 
     except Exception as e:
         raise TicketCreationError(f"Failed to create documentation: {e}")
 
 
+@traced()
 def create_new_ticket(ticket_type: str, name: str) -> dict:
     """Create a new ticket specification file.
 
@@ -315,24 +348,17 @@ def create_new_ticket(ticket_type: str, name: str) -> dict:
         TicketCreationError: If creation fails
     """
     # Normalize the name
-    normalized_name = normalize_ticket_name(name)
-
-    if not normalized_name:
-        raise TicketCreationError(
-            "Invalid ticket name\n"
-            "Name must contain at least one alphanumeric character.\n"
-            "Example: cdd new feature user-authentication"
-        )
+    normalized_name = require_ticket_name(name)
 
-    # Get git root
-    git_root = get_git_root()
+    # Get project root
+    project_root = get_project_root()
 
     # Get template
-    template_path = get_template_path(git_root, ticket_type)
+    template_path = get_template_path(project_root, ticket_type)
 
     # Construct ticket path
     folder_name = f"{ticket_type}-{normalized_name}"
-    ticket_path = git_root / "specs" / "tickets" / folder_name
+    ticket_path = project_root / "specs" / "tickets" / folder_name
 
     overwritten = False
 
@@ -363,7 +389,7 @@ def create_new_ticket(ticket_type: str, name: str) -> dict:
                 continue
 
             folder_name = f"{ticket_type}-{normalized_name}"
-            ticket_path = git_root / "specs" / "tickets" / folder_name
+            ticket_path = project_root / "specs" / "tickets" / folder_name
 
     # Create the ticket
     create_ticket_file(ticket_path, template_path)
@@ -376,6 +402,63 @@ def create_new_ticket(ticket_type: str, name: str) -> dict:
     }
 
 
+@traced()
+def create_ticket(
+    project_root: Path, ticket_type: str, name: str, overwrite: bool = False
+) -> dict:
+    """Create a ticket in a given project without prompting.
+
+    Library counterpart of create_new_ticket(): the project is explicit
+    (no working directory or git lookup) and an existing ticket is an
+    error unless overwrite is set.
+
+    Args:
+        project_root: Project root directory
+        ticket_type: Type of ticket (feature/bug/spike/enhancement)
+        name: Ticket name (will be normalized)
+        overwrite: Replace the spec of an existing ticket
+
+    Returns:
+        Dictionary with creation results (same keys as
+        create_new_ticket())
+
+    Raises:
+        TicketCreationError: If the name is invalid, the template is
+            missing or the ticket exists
+    """
+    normalized_name = require_ticket_name(name)
+    template_path = get_template_path(project_root, ticket_type)
+    ticket_path = (
+        project_root / "specs" / "tickets" / f"{ticket_type}-{normalized_name}"
+    )
+
+    exists = check_ticket_exists(ticket_path)
+    if exists and not overwrite:
+        raise TicketCreationError(f"Ticket already exists: {ticket_path}")
+
+    create_ticket_file(ticket_path, template_path)
+
+    return {
+        "ticket_path": ticket_path,
+        "normalized_name": normalized_name,
+        "ticket_type": ticket_type,
+        "overwritten": exists,
+    }
+
+
+def require_ticket_name(name: str) -> str:
+    """Normalize a ticket name, rejecting names with nothing left."""
+    normalized_name = normalize_ticket_name(name)
+    if not normalized_name:
+        raise TicketCreationError(
+            "Invalid ticket name\n"
+            "Name must contain at least one alphanumeric character.\n"
+            "Example: cdd new feature user-authentication"
+        )
+    return normalized_name
+
+
+@traced()
 def create_new_documentation(doc_type: str, name: str) -> dict:
     """Create a new documentation file.
 
@@ -408,14 +491,14 @@ def create_new_documentation(doc_type: str, name: str) -> dict:
             "Example: cdd new documentation guide getting-started"
         )
 
-    # Get git root
-    git_root = get_git_root()
+    # Get project root
+    project_root = get_project_root()
 
     # Get template
-    template_path = get_documentation_template_path(git_root, doc_type)
+    template_path = get_documentation_template_path(project_root, doc_type)
 
     # Get destination directory
-    doc_directory = get_documentation_directory(git_root, doc_type)
+    doc_directory = get_documentation_directory(project_root, doc_type)
 
     # Construct file path (clean name, no type prefix)
     file_path = doc_directory / f"{normalized_name}.md"
@@ -461,3 +544,52 @@ def create_new_documentation(doc_type: str, name: str) -> dict:
         "doc_type": doc_type,
         "overwritten": overwritten,
     }
+
+
+@traced()
+def create_documentation(
+    project_root: Path, doc_type: str, name: str, overwrite: bool = False
+) -> dict:
+    """Create a documentation file in a given project without prompting.
+
+    Non-interactive counterpart of create_new_documentation(), used by
+    machine-readable output modes.
+
+    Args:
+        project_root: Project root directory
+        doc_type: Type of documentation ("guide" or "feature")
+        name: Documentation name (will be normalized)
+        overwrite: Replace an existing file
+
+    Returns:
+        Dictionary with creation results (same keys as
+        create_new_documentation())
+
+    Raises:
+        TicketCreationError: If the name is invalid, the template is
+            missing or the file exists
+    """
+    normalized_name = normalize_ticket_name(name)
+    if not normalized_name:
+        raise TicketCreationError(
+            "Invalid documentation name\n"
+            "Name must contain at least one alphanumeric character.\n"
+            "Example: cdd new documentation guide getting-started"
+        )
+
+    template_path = get_documentation_template_path(project_root, doc_type)
+    doc_directory = get_documentation_directory(project_root, doc_type)
+    file_path = doc_directory / f"{normalized_name}.md"
+
+    exists = file_path.exists()
+    if exists and not overwrite:
+        raise TicketCreationError(f"Documentation already exists: {file_path}")
+
+    create_documentation_file(file_path, template_path)
+
+    return {
+        "file_path": file_path,
+        "normalized_name": normalized_name,
+        "doc_type": doc_type,
+        "overwritten": exists,
+    }
@@ -0,0 +1,175 @@
+"""Output modes for CLI results.
+
+By default commands render rich tables and panels. `cdd --mode MODE`
+switches to machine-readable output for scripts and pipelines:
+
+- json: the command's result as one JSON document on one line (an
+  array for listing commands)
+- ndjson: one JSON object per line, written as each record is ready
+- plain: one line per record, tab-separated values, no markup
+
+Machine modes never import rich for stdout: records are written with
+plain `sys.stdout.write`. Anything else a command prints (notices,
+errors) goes through the lazy console, which sends it to stderr so
+stdout carries nothing but records.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+OUTPUT_MODES = ["rich", "json", "ndjson", "plain"]
+
+_mode = "rich"
+
+
+def set_mode(mode: str) -> None:
+    """Select the output mode for this process.
+
+    Args:
+        mode: One of OUTPUT_MODES
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    global _mode
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode: {mode}")
+    _mode = mode
+
+
+def get_mode() -> str:
+    """Get the current output mode."""
+    return _mode
+
+
+def is_machine() -> bool:
+    """Whether results are emitted as records instead of rendered."""
+    return _mode != "rich"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def to_json(record: Any) -> str:
+    """Serialize a record to one line of JSON (paths become strings)."""
+    return json.dumps(
+        record,
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def _plain_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(_plain_value(item) for item in value)
+    if isinstance(value, dict):
+        return to_json(value)
+    return " ".join(str(value).split("\n")).replace("\t", " ")
+
+
+def to_plain(record: dict, fields: Optional[List[str]] = None) -> str:
+    """Format a record as one tab-separated line.
+
+    Args:
+        record: Record to format
+        fields: Keys to include, in order (default: every key)
+
+    Returns:
+        Values joined by tabs; lists are comma-separated
+    """
+    keys = fields if fields is not None else list(record)
+    return "\t".join(_plain_value(record.get(key)) for key in keys)
+
+
+def emit(record: dict, fields: Optional[List[str]] = None) -> None:
+    """Write a single result record to stdout.
+
+    Args:
+        record: Result of the command
+        fields: Keys written in plain mode (default: every key)
+    """
+    if _mode == "plain":
+        line = to_plain(record, fields)
+    else:
+        line = to_json(record)
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def emit_records(
+    records: Iterable[dict], fields: Optional[List[str]] = None
+) -> int:
+    """Write the records of a listing command to stdout.
+
+    ndjson and plain write each record as soon as it is produced; json
+    collects them into one array.
+
+    Args:
+        records: Records to write
+        fields: Keys written in plain mode (default: every key)
+
+    Returns:
+        Number of records written
+    """
+    if _mode == "json":
+        collected = list(records)
+        sys.stdout.write(to_json(collected) + "\n")
+        sys.stdout.flush()
+        return len(collected)
+
+    count = 0
+    for record in records:
+        if _mode == "plain":
+            line = to_plain(record, fields)
+        else:
+            line = to_json(record)
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+        count += 1
+    return count
+
+
+def escape(text: str) -> str:
+    """Escape rich markup (imports rich only when called)."""
+    from rich.markup import escape as rich_escape
+
+    return rich_escape(text)
+
+
+class LazyConsole:
+    """A rich Console created on first use.
+
+    Importing rich costs more than the small commands themselves, so
+    modules hold this proxy instead of a Console. In machine output
+    modes it prints to stderr, keeping stdout for records.
+    """
+
+    def __init__(self):
+        self._stdout = None
+        self._stderr = None
+
+    def _console(self):
+        from rich.console import Console
+
+        if is_machine():
+            if self._stderr is None:
+                self._stderr = Console(stderr=True)
+            return self._stderr
+        if self._stdout is None:
+            self._stdout = Console()
+        return self._stdout
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._console(), name)
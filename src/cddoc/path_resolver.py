@@ -4,6 +4,9 @@ import difflib
 from pathlib import Path
 from typing import List
 
+from .project import find_project_root, relative_to_cwd
+from .tracing import traced
+
 
 class PathResolutionError(Exception):
     """Raised when path cannot be resolved."""
@@ -19,6 +22,23 @@ class PathResolver:
     MAX_SUGGESTIONS = 3
 
     @staticmethod
+    def get_tickets_dir() -> Path:
+        """Get the tickets directory of the current project.
+
+        Scopes TICKETS_DIR to the nearest ancestor containing `.cdd`, so
+        shorthand works from any subdirectory of a monorepo project.
+        Falls back to TICKETS_DIR relative to the current directory.
+
+        Returns:
+            Tickets directory (relative when under the current directory)
+        """
+        root = find_project_root()
+        if root is None:
+            return PathResolver.TICKETS_DIR
+        return relative_to_cwd(root / PathResolver.TICKETS_DIR)
+
+    @staticmethod
+    @traced()
     def resolve(argument: str, target_file: str = "spec.yaml") -> Path:
         """Resolve argument to full file path.
 
@@ -52,10 +72,11 @@ class PathResolver:
             return Path(argument)
 
         # Ticket shorthand - resolve to specs/tickets/{name}/{target_file}
-        resolved_path = PathResolver.TICKETS_DIR / argument / target_file
+        tickets_dir = PathResolver.get_tickets_dir()
+        resolved_path = tickets_dir / argument / target_file
 
         # Check if ticket directory exists
-        ticket_dir = PathResolver.TICKETS_DIR / argument
+        ticket_dir = tickets_dir / argument
         if not ticket_dir.exists():
             # Ticket not found - provide helpful error with fuzzy matching
             similar_tickets = PathResolver.find_similar_tickets(argument)
@@ -67,11 +88,12 @@ class PathResolver:
         return resolved_path
 
     @staticmethod
+    @traced()
     def find_similar_tickets(ticket_name: str) -> List[str]:
         """Find similar ticket names using fuzzy matching.
 
-        Scans specs/tickets/ directory for similar ticket names using
-        difflib for similarity matching.
+        Scans the project's specs/tickets/ directory for similar ticket
+        names using difflib for similarity matching.
 
         Args:
             ticket_name: Ticket name to match against
@@ -83,15 +105,17 @@ class PathResolver:
             >>> PathResolver.find_similar_tickets("feat-auth")
             ['feature-auth', 'feature-authentication']
         """
+        tickets_dir = PathResolver.get_tickets_dir()
+
         # Check if tickets directory exists
-        if not PathResolver.TICKETS_DIR.exists():
+        if not tickets_dir.exists():
             return []
 
         # Get all ticket directory names
         try:
             all_tickets = [
                 d.name
-                for d in PathResolver.TICKETS_DIR.iterdir()
+                for d in tickets_dir.iterdir()
                 if d.is_dir() and not d.name.startswith(".")
             ]
         except (OSError, PermissionError):
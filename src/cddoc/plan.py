@@ -0,0 +1,427 @@
+"""Structured model of a ticket's plan.md.
+
+Plans follow the `*-plan-template.md` layouts (English or Portuguese).
+parse_plan() turns one into a PlanModel:
+
+- header fields (title, ticket type, estimated effort)
+- implementation steps, numbered in plan order, each with its outcome,
+  details, validation, estimate and the files it names. Both the
+  `### Step N: ...` layout and the enhancement template's phases of
+  numbered `1. **Title** (estimate)` items are understood.
+- files to create, modify, delete or only read for reference
+- acceptance criteria (Definition of Done and Success Criteria items)
+- the total estimate from the Effort Estimation table
+
+load_plan() caches models in `.cdd/cache/plans/`, one JSON file per
+plan content hash, so a plan is parsed once per revision no matter how
+many sessions, progress files or queue runs read it.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import List, Optional, Set, TypedDict
+
+from .concurrency import atomic_write
+from .project import find_project_root, get_cache_dir
+
+# Bump when the model changes to ignore cached models
+PLAN_VERSION = 2
+
+CACHE_DIR = "plans"
+
+MARKDOWN_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+
+# Backticked file paths, e.g. `src/app/models.py` or `docs/`
+PLAN_PATH = re.compile(r"`([\w.\-]+(?:/[\w.\-]+)*/?)`")
+
+# Bare file names such as `config.yaml`; code references such as
+# `json.dumps` or `helper.run` have the same shape, so only these
+# extensions count
+FILE_NAME = re.compile(r"^[\w\-]+\.(\w+)$")
+
+FILE_EXTENSIONS = set(
+    "c cfg cjs cpp cs css csv go h hpp html ini ipynb java js json jsx kt "
+    "lock md mjs php proto py pyi rb rs rst scss sh sql svelte swift toml "
+    "ts tsx txt vue xml yaml yml".split()
+)
+
+# `**Label:** value` lines
+FIELD = re.compile(r"^\*\*(.+?):\*\*\s*(.*)$")
+
+# `### Step 3: Add the parser` / `### Passo 3: ...`
+STEP_HEADING = re.compile(
+    r"^(?:step|passo)\s+(\d+)\s*[:.\-–—]\s*(.*)$", re.IGNORECASE
+)
+
+# `### Phase 2: Implementation` / `### Fase 2: ...`
+PHASE_HEADING = re.compile(
+    r"^(?:phase|fase)\s+\d+\s*[:.\-–—]\s*(.*)$", re.IGNORECASE
+)
+
+# `1. **Review Current Implementation** (2 hours)`
+NUMBERED_STEP = re.compile(r"^\d+\.\s+\*\*(.+?)\*\*\s*(?:\((.+?)\))?\s*$")
+
+LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+(.*)$")
+
+CHECKBOX = re.compile(r"^(?:\[[ xX]\]|✅|☐|✔️?)\s*")
+
+TABLE_ROW = re.compile(r"^\|(.+)\|\s*$")
+
+STEP_SECTIONS = re.compile(
+    r"implementation steps|investigation steps|passos de implementa"
+    r"|passos de investiga",
+    re.IGNORECASE,
+)
+FILE_SECTIONS = re.compile(
+    r"file structure|estrutura de arquivos|mudanças necessárias",
+    re.IGNORECASE,
+)
+CRITERIA_SECTIONS = re.compile(
+    r"definition of done|success criteria|definição de pronto"
+    r"|critérios de sucesso",
+    re.IGNORECASE,
+)
+ESTIMATE_SECTIONS = re.compile(
+    r"effort estimation|estimativa de esforço", re.IGNORECASE
+)
+
+# File Structure subsections, by the kind of change
+FILE_KINDS = {
+    "create": re.compile(r"new|create|novos|criar", re.IGNORECASE),
+    "delete": re.compile(r"delete|remove|excluir|remover", re.IGNORECASE),
+    "reference": re.compile(r"reference|referenc", re.IGNORECASE),
+    "modify": re.compile(r"modify|existing|modificar|existentes", re.I),
+}
+
+# Step fields, by the labels used in the templates
+OUTCOME_LABELS = {
+    "outcome",
+    "expected outcome",
+    "purpose",
+    "resultado",
+    "objetivo",
+    "change",
+}
+VALIDATION_LABELS = {
+    "validation",
+    "verification",
+    "evaluation",
+    "success criteria",
+    "validação",
+    "critérios de sucesso",
+}
+ESTIMATE_LABELS = {
+    "time",
+    "estimated time",
+    "time allocation",
+    "tempo",
+    "tempo estimado",
+}
+FILE_LABELS = {"file", "files", "arquivo", "arquivos"}
+EFFORT_LABELS = {"estimated effort", "esforço estimado"}
+TIMEBOX_LABELS = {"timebox", "caixa de tempo"}
+TYPE_LABELS = {"ticket type", "tipo de ticket"}
+
+
+class PlanError(Exception):
+    """Raised when a plan cannot be read."""
+
+    pass
+
+
+class PlanStep(TypedDict):
+    step_id: int
+    title: str
+    phase: Optional[str]
+    outcome: Optional[str]
+    details: List[str]
+    files: List[str]
+    validation: Optional[str]
+    estimate: Optional[str]
+
+
+class PlanFiles(TypedDict):
+    create: List[str]
+    modify: List[str]
+    delete: List[str]
+    reference: List[str]
+    mentioned: List[str]
+
+
+class PlanModel(TypedDict):
+    version: int
+    content_hash: str
+    title: Optional[str]
+    ticket_type: Optional[str]
+    estimated_effort: Optional[str]
+    total_estimate: Optional[str]
+    steps: List[PlanStep]
+    files: PlanFiles
+    acceptance_criteria: List[str]
+
+
+def content_hash(text: str) -> str:
+    """Get the cache key of a plan's content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def line_paths(line: str) -> List[str]:
+    """Get the backticked file paths in a line of Markdown."""
+    paths = []
+    for match in PLAN_PATH.finditer(line):
+        path = match.group(1).removeprefix("./")
+        name = FILE_NAME.match(path)
+        if "/" in path or (name and name.group(1).lower() in FILE_EXTENSIONS):
+            paths.append(path)
+    return paths
+
+
+def _new_step(step_id: int, title: str, phase: Optional[str]) -> PlanStep:
+    return {
+        "step_id": step_id,
+        "title": title,
+        "phase": phase,
+        "outcome": None,
+        "details": [],
+        "files": [],
+        "validation": None,
+        "estimate": None,
+    }
+
+
+def _add_unique(items: List[str], values: List[str]) -> None:
+    for value in values:
+        if value not in items:
+            items.append(value)
+
+
+def _strip_markup(text: str) -> str:
+    return text.replace("**", "").strip()
+
+
+def parse_plan(text: str) -> PlanModel:
+    """Parse plan.md content into a structured model.
+
+    Args:
+        text: plan.md content
+
+    Returns:
+        Plan model (parts the plan doesn't have are empty or None)
+    """
+    model: PlanModel = {
+        "version": PLAN_VERSION,
+        "content_hash": content_hash(text),
+        "title": None,
+        "ticket_type": None,
+        "estimated_effort": None,
+        "total_estimate": None,
+        "steps": [],
+        "files": {
+            "create": [],
+            "modify": [],
+            "delete": [],
+            "reference": [],
+            "mentioned": [],
+        },
+        "acceptance_criteria": [],
+    }
+
+    section = ""  # Current H2
+    subsection = ""  # Current H3
+    phase: Optional[str] = None
+    step: Optional[PlanStep] = None
+    in_fence = False
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        heading = MARKDOWN_HEADING.match(line)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            if level == 1:
+                model["title"] = title.split(":", 1)[-1].strip() or None
+            elif level == 2:
+                section, subsection, phase, step = title, "", None, None
+            elif level == 3:
+                subsection, step = title, None
+                if STEP_SECTIONS.search(section):
+                    step = _start_heading_step(model, title)
+                    if step is None:
+                        matched = PHASE_HEADING.match(title)
+                        phase = matched.group(1) if matched else title
+            continue
+
+        field = FIELD.match(stripped)
+        if field and model["title"] is not None and not section:
+            _read_header_field(model, field.group(1), field.group(2))
+            continue
+
+        if STEP_SECTIONS.search(section):
+            numbered = NUMBERED_STEP.match(stripped)
+            if numbered and phase is not None:
+                step = _new_step(
+                    len(model["steps"]) + 1, numbered.group(1), phase
+                )
+                step["estimate"] = numbered.group(2)
+                model["steps"].append(step)
+                continue
+            if step is not None:
+                _read_step_line(step, stripped)
+            _add_unique(model["files"]["mentioned"], line_paths(line))
+        elif FILE_SECTIONS.search(section):
+            kind = _file_kind(subsection)
+            _add_unique(model["files"][kind], line_paths(line))
+        elif CRITERIA_SECTIONS.search(section) or CRITERIA_SECTIONS.search(
+            subsection
+        ):
+            item = LIST_ITEM.match(line)
+            if item:
+                criterion = CHECKBOX.sub("", item.group(1)).strip()
+                if criterion:
+                    model["acceptance_criteria"].append(criterion)
+        elif ESTIMATE_SECTIONS.search(section):
+            _read_estimate_row(model, stripped)
+        elif not FILE_KINDS["reference"].search(subsection):
+            _add_unique(model["files"]["mentioned"], line_paths(line))
+
+    if model["total_estimate"] is None:
+        model["total_estimate"] = model["estimated_effort"]
+    return model
+
+
+def _start_heading_step(model: PlanModel, title: str) -> Optional[PlanStep]:
+    matched = STEP_HEADING.match(title)
+    if matched is None:
+        return None
+    step = _new_step(len(model["steps"]) + 1, matched.group(2).strip(), None)
+    model["steps"].append(step)
+    return step
+
+
+def _read_header_field(model: PlanModel, label: str, value: str) -> None:
+    label = label.lower()
+    value = value.strip() or None
+    if label in TYPE_LABELS:
+        model["ticket_type"] = value.lower() if value else None
+    elif label in EFFORT_LABELS:
+        model["estimated_effort"] = value
+    elif label in TIMEBOX_LABELS and model["estimated_effort"] is None:
+        # Spikes without an effort estimate are bounded by their timebox
+        model["estimated_effort"] = value
+
+
+def _read_step_line(step: PlanStep, line: str) -> None:
+    _add_unique(step["files"], line_paths(line))
+    field = FIELD.match(line)
+    if field is None:
+        # `- **Verification:** ...` inside numbered steps
+        item = LIST_ITEM.match(line)
+        field = FIELD.match(item.group(1)) if item else None
+        if field is None:
+            if item and item.group(1).strip():
+                step["details"].append(_strip_markup(item.group(1)))
+            return
+
+    label, value = field.group(1).lower(), field.group(2).strip()
+    if not value:
+        return
+    if label in OUTCOME_LABELS and step["outcome"] is None:
+        step["outcome"] = value
+    elif label in VALIDATION_LABELS:
+        step["validation"] = value
+    elif label in ESTIMATE_LABELS:
+        step["estimate"] = value
+    elif label in FILE_LABELS:
+        pass
+    else:
+        step["details"].append(f"{field.group(1)}: {value}")
+
+
+def _file_kind(subsection: str) -> str:
+    for kind, pattern in FILE_KINDS.items():
+        if pattern.search(subsection):
+            return kind
+    return "mentioned"
+
+
+def _read_estimate_row(model: PlanModel, line: str) -> None:
+    row = TABLE_ROW.match(line)
+    if row is None:
+        return
+    cells = [_strip_markup(cell) for cell in row.group(1).split("|")]
+    if len(cells) >= 2 and cells[0].lower() == "total" and cells[1]:
+        model["total_estimate"] = cells[1]
+
+
+def touched_files(model: PlanModel) -> List[str]:
+    """Get every file a plan will create, change or delete.
+
+    Args:
+        model: Parsed plan
+
+    Returns:
+        Sorted relative paths (directories end with "/"); files listed
+        only for reference are excluded
+    """
+    files: Set[str] = set()
+    for kind in ("create", "modify", "delete", "mentioned"):
+        files.update(model["files"][kind])
+    for step in model["steps"]:
+        files.update(step["files"])
+    return sorted(files)
+
+
+def _cache_path(plan_path: Path, digest: str) -> Optional[Path]:
+    root = find_project_root(plan_path.parent)
+    if root is None:
+        return None
+    cache_dir = get_cache_dir(root) / CACHE_DIR
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir / f"{digest}.json"
+
+
+def load_plan(plan_path: Path, use_cache: bool = True) -> PlanModel:
+    """Read a plan.md, using the cached model when its content is known.
+
+    Args:
+        plan_path: plan.md file
+        use_cache: Read and update the cache in `.cdd/cache/plans/`
+
+    Returns:
+        Plan model
+
+    Raises:
+        PlanError: If the plan cannot be read
+    """
+    plan_path = Path(plan_path)
+    try:
+        text = plan_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise PlanError(f"Cannot read plan {plan_path}: {e}")
+
+    digest = content_hash(text)
+    cache_path = (
+        _cache_path(plan_path.absolute(), digest) if use_cache else None
+    )
+    if cache_path is not None:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("version") == PLAN_VERSION:
+                return cached
+        except (OSError, ValueError):
+            pass
+
+    model = parse_plan(text)
+    if cache_path is not None:
+        try:
+            atomic_write(cache_path, json.dumps(model))
+        except OSError:
+            pass  # The cache is only a speedup
+    return model
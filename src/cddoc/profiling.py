@@ -0,0 +1,250 @@
+"""Per-phase timings and profiling for CDD commands.
+
+`cdd --timings COMMAND` prints where a command's time went, split into
+phases:
+
+- import: from the start of the `cddoc` import to the command starting
+  (interpreter startup is not included; use `python -X importtime` for
+  a per-module breakdown)
+- root discovery: finding the project or git root
+- config: loading `.cdd/config.yaml` and translations
+- handler I/O: reading and writing specs, progress files, tickets and
+  templates
+- render: printing to the terminal
+- command: everything else the command does
+
+Functions are attributed to a phase with the `@phase` decorator. Time is
+exclusive: a phase running inside another (root discovery while loading
+config) is only counted once, for the innermost phase.
+
+`cdd --profile FILE COMMAND` writes cProfile statistics (load them with
+`pstats` or `snakeviz`); `--profile-memory` also writes a tracemalloc
+snapshot next to them.
+
+Nothing is collected unless a flag is given: instrumented functions
+only check whether a timer is active, rendering is only wrapped while
+one is, and the profiling modules are imported on demand.
+"""
+
+import functools
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from . import IMPORT_STARTED
+
+if TYPE_CHECKING:
+    # rich is imported only when rendering, keeping imports cheap
+    from rich.console import Console
+
+PHASES = [
+    "import",
+    "root discovery",
+    "config",
+    "handler I/O",
+    "render",
+    "command",
+]
+
+# Phase of time not claimed by an instrumented function
+DEFAULT_PHASE = "command"
+
+# Entries of the cProfile summary printed after the command
+PROFILE_TOP = 15
+
+# Frames kept per tracemalloc allocation
+MEMORY_FRAMES = 10
+
+_active: Optional["PhaseTimer"] = None
+
+
+class PhaseTimer:
+    """Accumulates exclusive wall time per phase."""
+
+    def __init__(self):
+        """Create a timer; call start() to begin timing."""
+        self.totals: Dict[str, float] = {name: 0.0 for name in PHASES}
+        self.calls: Dict[str, int] = {name: 0 for name in PHASES}
+        self._stack: List[str] = []
+        self._last = 0.0
+        self._started = 0.0
+
+    def start(self) -> None:
+        """Record the import phase and start timing the command."""
+        now = time.perf_counter()
+        self.totals["import"] = now - IMPORT_STARTED
+        self.calls["import"] = 1
+        self._stack = [DEFAULT_PHASE]
+        self._started = self._last = now
+
+    def enter(self, name: str) -> None:
+        """Switch to a nested phase."""
+        now = time.perf_counter()
+        self.totals[self._stack[-1]] += now - self._last
+        self._stack.append(name)
+        self.calls[name] += 1
+        self._last = now
+
+    def exit(self) -> None:
+        """Return to the enclosing phase."""
+        now = time.perf_counter()
+        self.totals[self._stack.pop()] += now - self._last
+        self._last = now
+
+    def stop(self) -> float:
+        """Stop timing.
+
+        Returns:
+            Total time including the import phase, in seconds
+        """
+        while self._stack:
+            self.exit()
+        return self.totals["import"] + (self._last - self._started)
+
+
+def phase(name: str) -> Callable:
+    """Attribute a function's time to a phase while timings are on.
+
+    Args:
+        name: One of PHASES
+
+    Returns:
+        Decorator
+    """
+    if name not in PHASES:
+        raise ValueError(f"Unknown phase: {name}")
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = _active
+            if timer is None:
+                return func(*args, **kwargs)
+            timer.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.exit()
+
+        return wrapper
+
+    return decorator
+
+
+def start_timings() -> PhaseTimer:
+    """Start timing phases, including terminal rendering.
+
+    Returns:
+        The active timer
+    """
+    from rich.console import Console
+
+    global _active
+    _active = PhaseTimer()
+    _active.start()
+    # Rendering is wrapped only while timing, so it costs nothing
+    # otherwise
+    Console.print = phase("render")(Console.print)
+    return _active
+
+
+def stop_timings() -> Optional[Tuple[PhaseTimer, float]]:
+    """Stop timing phases.
+
+    Returns:
+        Tuple of (timer, total seconds), or None if timings were off
+    """
+    from rich.console import Console
+
+    global _active
+    timer, _active = _active, None
+    if timer is None:
+        return None
+    Console.print = Console.print.__wrapped__
+    return timer, timer.stop()
+
+
+def print_timings(timer: PhaseTimer, total: float, console: "Console") -> None:
+    """Print the per-phase breakdown.
+
+    Args:
+        timer: Stopped timer
+        total: Total seconds returned by stop_timings()
+        console: Console to print to (usually stderr)
+    """
+    from rich.table import Table
+
+    table = Table(title="Timings")
+    table.add_column("Phase")
+    table.add_column("Time", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Calls", justify="right")
+    for name in PHASES:
+        seconds = timer.totals[name]
+        table.add_row(
+            name,
+            f"{seconds * 1000:.1f} ms",
+            f"{100 * seconds / total:.0f}%" if total else "-",
+            str(timer.calls[name]) if name != DEFAULT_PHASE else "",
+        )
+    table.add_section()
+    table.add_row("total", f"{total * 1000:.1f} ms", "100%", "")
+    console.print(table)
+
+
+class Profiler:
+    """cProfile (and optionally tracemalloc) around a command."""
+
+    def __init__(self, output: Path, memory: bool = False):
+        """Create a profiler.
+
+        Args:
+            output: pstats output file
+            memory: Also trace allocations and write a snapshot to
+                `<output>.tracemalloc`
+        """
+        import cProfile
+
+        self.output = Path(output)
+        self.memory = memory
+        self._profile = cProfile.Profile()
+
+    @property
+    def memory_output(self) -> Path:
+        return self.output.with_name(self.output.name + ".tracemalloc")
+
+    def start(self) -> None:
+        """Start profiling."""
+        if self.memory:
+            import tracemalloc
+
+            tracemalloc.start(MEMORY_FRAMES)
+        self._profile.enable()
+
+    def stop(self, console: "Console") -> None:
+        """Stop profiling, write the results and print a summary.
+
+        Args:
+            console: Console for the summary (usually stderr)
+        """
+        import pstats
+        import tracemalloc
+
+        self._profile.disable()
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(self.output)
+
+        stats = pstats.Stats(self._profile, stream=console.file)
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+        console.print(f"Profile written to {self.output}")
+
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            snapshot.dump(str(self.memory_output))
+            console.print(
+                f"Memory: {current / 1024:.0f} KiB allocated, "
+                f"{peak / 1024:.0f} KiB peak; snapshot written to "
+                f"{self.memory_output}"
+            )
@@ -0,0 +1,111 @@
+"""Project root discovery for CDD commands.
+
+A CDD project is the nearest ancestor directory containing a `.cdd`
+directory. Monorepos can host one project per team, and every command
+scopes its paths (tickets, docs, templates, config) to that project.
+
+Lookups are memoized in a root map shared by the whole process, so
+repeated resolution from the same directory (or any directory visited
+on the way up) costs one dictionary lookup and a single stat.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+from .profiling import phase
+
+# Directory marking a CDD project root
+PROJECT_MARKER = ".cdd"
+
+# Maps every directory visited during discovery to its project root.
+# Misses are not cached so a later `cdd init` is picked up immediately.
+_ROOT_MAP: Dict[Path, Path] = {}
+
+
+def _is_project_root(directory: Path) -> bool:
+    """Check whether a directory contains the project marker."""
+    return (directory / PROJECT_MARKER).is_dir()
+
+
+@phase("root discovery")
+def find_project_root(start: Optional[Path] = None) -> Optional[Path]:
+    """Find the nearest ancestor directory containing `.cdd`.
+
+    Args:
+        start: Directory to start from (defaults to current directory)
+
+    Returns:
+        Resolved project root, or None if no ancestor is a CDD project
+
+    Examples:
+        >>> find_project_root(Path("services/billing/src"))
+        PosixPath('/repo/services/billing')
+    """
+    directory = (Path(start) if start else Path.cwd()).resolve()
+
+    cached = _ROOT_MAP.get(directory)
+    if cached is not None:
+        # A cached root is only trusted while its marker still exists
+        if _is_project_root(cached):
+            return cached
+        forget_project_roots()
+
+    visited = []
+    for candidate in (directory, *directory.parents):
+        root = _ROOT_MAP.get(candidate)
+        if root is None and _is_project_root(candidate):
+            root = candidate
+        if root is not None:
+            for visited_dir in visited:
+                _ROOT_MAP[visited_dir] = root
+            _ROOT_MAP[candidate] = root
+            return root
+        visited.append(candidate)
+
+    return None
+
+
+def forget_project_roots() -> None:
+    """Clear the root map.
+
+    Called after a project is initialized so that directories cached as
+    belonging to an outer project are rediscovered.
+    """
+    _ROOT_MAP.clear()
+
+
+def relative_to_cwd(path: Path) -> Path:
+    """Express a project path relative to the current directory if inside it.
+
+    Keeps output short and stable when commands run from the project
+    root, while still pointing at the right project from elsewhere.
+
+    Args:
+        path: Absolute path
+
+    Returns:
+        Path relative to the current directory, or path unchanged
+    """
+    try:
+        return path.relative_to(Path.cwd().resolve())
+    except ValueError:
+        return path
+
+
+def get_cache_dir(project_root: Path) -> Path:
+    """Get the project's cache directory, creating it if needed.
+
+    Derived data (validation results, indexes) lives in `.cdd/cache/`,
+    which ignores itself so caches are never committed.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Path to `.cdd/cache/`
+    """
+    cache_dir = project_root / PROJECT_MARKER / "cache"
+    if not cache_dir.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+    return cache_dir
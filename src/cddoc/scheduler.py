@@ -0,0 +1,556 @@
+"""Multi-ticket execution queue.
+
+`cdd run-queue` drains the backlog of planned tickets by running an
+executor command (by default the autonomous `/exec-auto` workflow) for
+each of them in a bounded pool of worker processes:
+
+- Tickets whose spec status is `planned` and that have a plan.md are
+  queued, ordered by `ticket.priority` (critical, high, medium, low)
+  and by `ticket.depends_on`: a ticket starts only after every ticket
+  it depends on has completed. Dependencies on tickets that are
+  neither completed nor queued block the ticket.
+- Tickets whose plans name the same files (see plan.touched_files())
+  never run at the same time, so parallel executors don't edit the
+  same code.
+- When an executor exits, the ticket's result is read from the status
+  in its progress.yaml.
+
+Defaults can be set in `.cdd/config.yaml`:
+
+    run_queue:
+      executor: my-agent --ticket {ticket}
+      workers: 4
+      timeout: 3600
+"""
+
+import os
+import shlex
+import subprocess
+import time
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    TypedDict,
+)
+
+import yaml
+
+from .handlers.progress_handler import ProgressHandler, ProgressHandlerError
+from .handlers.spec_handler import SpecHandler, SpecHandlerError
+from .index import ProjectIndex, TicketEntry
+from .plan import PlanError, load_plan, parse_plan, touched_files
+from .project import PROJECT_MARKER, get_cache_dir
+
+# Executor command; placeholders are replaced per ticket
+DEFAULT_EXECUTOR = 'claude -p "/exec-auto {ticket}"'
+
+EXECUTOR_PLACEHOLDERS = ["ticket", "ticket_dir", "spec", "plan"]
+
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Statuses of tickets that dependents may build on
+DONE_STATUSES = {"completed", "archived"}
+
+# Seconds between checks of running executors
+POLL_INTERVAL = 0.1
+
+LOGS_DIR = "run-queue"
+
+RunStatus = Literal["completed", "incomplete", "failed", "blocked"]
+
+
+class SchedulerError(Exception):
+    """Raised when the queue cannot be built or run."""
+
+    pass
+
+
+class QueuedTicket(TypedDict):
+    name: str
+    path: Path
+    priority: Optional[str]
+    depends_on: List[str]
+    files: List[str]
+
+
+class TicketRun(TypedDict):
+    name: str
+    status: RunStatus
+    returncode: Optional[int]
+    duration: float
+    log_path: Optional[Path]
+    reason: Optional[str]
+
+
+class QueueSettings(TypedDict):
+    executor: str
+    workers: int
+    timeout: Optional[float]
+
+
+class _Running(TypedDict):
+    ticket: QueuedTicket
+    process: subprocess.Popen
+    started: float
+    log_path: Path
+
+
+def load_settings(project_root: Path) -> QueueSettings:
+    """Get the queue settings from .cdd/config.yaml.
+
+    Args:
+        project_root: Project root
+
+    Returns:
+        Settings, with defaults for anything not configured
+    """
+    settings: QueueSettings = {
+        "executor": DEFAULT_EXECUTOR,
+        "workers": os.cpu_count() or 1,
+        "timeout": None,
+    }
+    try:
+        with open(
+            project_root / PROJECT_MARKER / "config.yaml", encoding="utf-8"
+        ) as f:
+            config = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        return settings
+
+    configured = config.get("run_queue")
+    if not isinstance(configured, dict):
+        return settings
+    if isinstance(configured.get("executor"), str):
+        settings["executor"] = configured["executor"]
+    workers = configured.get("workers")
+    if isinstance(workers, int) and workers > 0:
+        settings["workers"] = workers
+    timeout = configured.get("timeout")
+    if isinstance(timeout, (int, float)) and timeout > 0:
+        settings["timeout"] = float(timeout)
+    return settings
+
+
+def plan_files(plan_text: str) -> List[str]:
+    """Get the files a plan says it will create, change or delete.
+
+    Args:
+        plan_text: plan.md content
+
+    Returns:
+        Sorted relative paths (directories end with "/")
+    """
+    return touched_files(parse_plan(plan_text))
+
+
+def files_overlap(first: List[str], second: List[str]) -> bool:
+    """Check whether two file lists share a file or a directory."""
+    for a in first:
+        for b in second:
+            if a == b:
+                return True
+            if a.endswith("/") and b.startswith(a):
+                return True
+            if b.endswith("/") and a.startswith(b):
+                return True
+    return False
+
+
+def _depends_on(spec: dict) -> List[str]:
+    ticket = spec.get("ticket")
+    if not isinstance(ticket, dict):
+        return []
+    depends_on = ticket.get("depends_on") or []
+    if isinstance(depends_on, str):
+        depends_on = [depends_on]
+    if not isinstance(depends_on, list):
+        return []
+    return [str(name).strip() for name in depends_on if str(name).strip()]
+
+
+def _priority_rank(ticket: QueuedTicket) -> int:
+    return PRIORITY_ORDER.get(
+        (ticket["priority"] or "").lower(), len(PRIORITY_ORDER)
+    )
+
+
+def select_tickets(
+    project_root: Path, names: Optional[List[str]] = None
+) -> List[QueuedTicket]:
+    """Find tickets ready for execution.
+
+    Args:
+        project_root: Project root
+        names: Only consider these tickets (None for all planned ones)
+
+    Returns:
+        Planned tickets with a plan, in priority order
+
+    Raises:
+        SchedulerError: If a named ticket doesn't exist or isn't planned
+    """
+    index = ProjectIndex.load(project_root)
+    index.save()
+    entries = {e["name"]: e for e in index.list_tickets("tickets")}
+
+    if names:
+        for name in names:
+            entry = entries.get(name)
+            if entry is None:
+                raise SchedulerError(f"Ticket not found: {name}")
+            if entry["status"] != "planned" or not entry["has_plan"]:
+                raise SchedulerError(
+                    f"Ticket {name} is not planned (status: "
+                    f"{entry['status'] or 'unknown'}, plan: "
+                    f"{'yes' if entry['has_plan'] else 'no'})"
+                )
+        candidates = [entries[name] for name in names]
+    else:
+        candidates = [
+            entry
+            for entry in entries.values()
+            if entry["status"] == "planned" and entry["has_plan"]
+        ]
+
+    queue = [_queued_ticket(project_root, entry) for entry in candidates]
+    queue.sort(key=lambda t: (_priority_rank(t), t["name"]))
+    return queue
+
+
+def _queued_ticket(project_root: Path, entry: TicketEntry) -> QueuedTicket:
+    ticket_dir = project_root / entry["path"]
+    try:
+        spec = SpecHandler.read_spec(ticket_dir / "spec.yaml")
+    except SpecHandlerError:
+        spec = {}
+    try:
+        files = touched_files(load_plan(ticket_dir / "plan.md"))
+    except PlanError:
+        files = []
+    return {
+        "name": entry["name"],
+        "path": ticket_dir,
+        "priority": entry["priority"],
+        "depends_on": _depends_on(spec),
+        "files": files,
+    }
+
+
+def done_tickets(project_root: Path) -> Set[str]:
+    """Names of tickets that are completed or archived."""
+    index = ProjectIndex.load(project_root)
+    return {
+        entry["name"]
+        for entry in index.list_tickets()
+        if entry["location"] == "archive" or entry["status"] in DONE_STATUSES
+    }
+
+
+def order_queue(queue: List[QueuedTicket]) -> List[QueuedTicket]:
+    """Order tickets so each comes after the queued tickets it needs.
+
+    Among tickets whose dependencies are met, higher priority goes first.
+
+    Args:
+        queue: Tickets in priority order
+
+    Returns:
+        Tickets in execution order (tickets in a dependency cycle last)
+    """
+    queued = {t["name"] for t in queue}
+    ordered: List[QueuedTicket] = []
+    placed: Set[str] = set()
+    remaining = list(queue)
+    while remaining:
+        for ticket in remaining:
+            if all(
+                dep in placed or dep not in queued
+                for dep in ticket["depends_on"]
+            ):
+                break
+        else:
+            # Only cycles are left
+            return ordered + remaining
+        ordered.append(ticket)
+        placed.add(ticket["name"])
+        remaining.remove(ticket)
+    return ordered
+
+
+def executor_command(template: str, ticket: QueuedTicket) -> List[str]:
+    """Build the executor command line for a ticket.
+
+    Args:
+        template: Command with {ticket}, {ticket_dir}, {spec} and
+            {plan} placeholders
+        ticket: Ticket to run
+
+    Returns:
+        Command arguments
+
+    Raises:
+        SchedulerError: If the template is malformed
+    """
+    values = {
+        "ticket": ticket["name"],
+        "ticket_dir": str(ticket["path"]),
+        "spec": str(ticket["path"] / "spec.yaml"),
+        "plan": str(ticket["path"] / "plan.md"),
+    }
+    try:
+        return [arg.format(**values) for arg in shlex.split(template)]
+    except (ValueError, KeyError, IndexError) as e:
+        raise SchedulerError(
+            f"Invalid executor command {template!r}: {e} (placeholders: "
+            + ", ".join("{" + name + "}" for name in EXECUTOR_PLACEHOLDERS)
+            + ")"
+        )
+
+
+def progress_status(ticket_dir: Path) -> Optional[str]:
+    """Get the status recorded in a ticket's progress.yaml, if any."""
+    try:
+        progress = ProgressHandler.read_progress(ticket_dir / "progress.yaml")
+    except (ProgressHandlerError, TypeError):
+        return None
+    status = progress.get("status")
+    return status if isinstance(status, str) else None
+
+
+class RunQueue:
+    """Runs queued tickets through the executor in a worker pool."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        tickets: List[QueuedTicket],
+        executor: str = DEFAULT_EXECUTOR,
+        workers: int = 1,
+        timeout: Optional[float] = None,
+        on_event: Optional[Callable[[str, str, Optional[TicketRun]], None]] = (
+            None
+        ),
+    ):
+        """Prepare a run.
+
+        Args:
+            project_root: Project root
+            tickets: Tickets to run, in priority order
+            executor: Executor command template
+            workers: Maximum number of executors running at once
+            timeout: Seconds before an executor is killed (None: no limit)
+            on_event: Called with ("started" | "finished", ticket name,
+                result) as tickets start and finish
+
+        Raises:
+            SchedulerError: If workers is not positive
+        """
+        if workers < 1:
+            raise SchedulerError("Number of workers must be at least 1")
+        self.project_root = project_root
+        self.queue = order_queue(tickets)
+        self.executor = executor
+        self.workers = workers
+        self.timeout = timeout
+        self.on_event = on_event
+        self.results: Dict[str, TicketRun] = {}
+
+    @property
+    def logs_dir(self) -> Path:
+        return get_cache_dir(self.project_root) / LOGS_DIR
+
+    def run(self) -> List[TicketRun]:
+        """Run every queued ticket.
+
+        Returns:
+            One result per ticket, in the order they finished
+        """
+        for ticket in self.queue:
+            executor_command(self.executor, ticket)
+
+        done = done_tickets(self.project_root)
+        queued = {t["name"] for t in self.queue}
+        pending = list(self.queue)
+        running: Dict[str, _Running] = {}
+        self.logs_dir.mkdir(exist_ok=True)
+
+        for ticket in list(pending):
+            if self._in_cycle(ticket["name"], queued):
+                pending.remove(ticket)
+                self._record(
+                    ticket["name"], "blocked", reason="dependency cycle"
+                )
+
+        try:
+            while pending or running:
+                self._block_unrunnable(pending, done, queued)
+                for ticket in list(pending):
+                    if len(running) >= self.workers:
+                        break
+                    if not self._can_start(ticket, done, running):
+                        continue
+                    pending.remove(ticket)
+                    running[ticket["name"]] = self._start(ticket)
+
+                finished = self._reap(running)
+                for name in finished:
+                    if self.results[name]["status"] == "completed":
+                        done.add(name)
+                if not finished and running:
+                    time.sleep(POLL_INTERVAL)
+        finally:
+            for job in running.values():
+                job["process"].kill()
+                job["process"].wait()
+
+        return list(self.results.values())
+
+    def _block_unrunnable(
+        self, pending: List[QueuedTicket], done: Set[str], queued: Set[str]
+    ) -> None:
+        """Drop tickets whose dependencies can no longer complete."""
+        changed = True
+        while changed:
+            changed = False
+            for ticket in list(pending):
+                reason = self._blocked_reason(ticket, done, queued)
+                if reason is None:
+                    continue
+                pending.remove(ticket)
+                self._record(ticket["name"], "blocked", reason=reason)
+                changed = True
+
+    def _blocked_reason(
+        self,
+        ticket: QueuedTicket,
+        done: Set[str],
+        queued: Set[str],
+    ) -> Optional[str]:
+        for dep in ticket["depends_on"]:
+            if dep in done:
+                continue
+            if dep not in queued:
+                return f"depends on {dep}, which is not completed"
+            result = self.results.get(dep)
+            if result is not None:
+                return f"depends on {dep} ({result['status']})"
+        return None
+
+    def _in_cycle(self, name: str, queued: Set[str]) -> bool:
+        deps = {t["name"]: t["depends_on"] for t in self.queue}
+        stack = [d for d in deps.get(name, []) if d in queued]
+        seen: Set[str] = set()
+        while stack:
+            current = stack.pop()
+            if current == name:
+                return True
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.extend(d for d in deps.get(current, []) if d in queued)
+        return False
+
+    def _can_start(
+        self,
+        ticket: QueuedTicket,
+        done: Set[str],
+        running: Dict[str, _Running],
+    ) -> bool:
+        if any(dep not in done for dep in ticket["depends_on"]):
+            return False
+        return not any(
+            files_overlap(ticket["files"], job["ticket"]["files"])
+            for job in running.values()
+        )
+
+    def _start(self, ticket: QueuedTicket) -> _Running:
+        log_path = self.logs_dir / f"{ticket['name']}.log"
+        env = dict(os.environ)
+        env["CDD_TICKET"] = ticket["name"]
+        env["CDD_TICKET_DIR"] = str(ticket["path"])
+        with open(log_path, "wb") as log:
+            try:
+                process = subprocess.Popen(
+                    executor_command(self.executor, ticket),
+                    cwd=self.project_root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    env=env,
+                )
+            except OSError as e:
+                raise SchedulerError(f"Cannot start executor: {e}")
+        if self.on_event:
+            self.on_event("started", ticket["name"], None)
+        return {
+            "ticket": ticket,
+            "process": process,
+            "started": time.monotonic(),
+            "log_path": log_path,
+        }
+
+    def _reap(self, running: Dict[str, _Running]) -> List[str]:
+        finished = []
+        for name, job in list(running.items()):
+            returncode = job["process"].poll()
+            elapsed = time.monotonic() - job["started"]
+            timed_out = False
+            if returncode is None:
+                if self.timeout is None or elapsed < self.timeout:
+                    continue
+                job["process"].kill()
+                returncode = job["process"].wait()
+                timed_out = True
+
+            del running[name]
+            finished.append(name)
+            status: RunStatus
+            reason = None
+            if timed_out:
+                status = "failed"
+                reason = f"timed out after {self.timeout:g}s"
+            elif returncode != 0:
+                status = "failed"
+                reason = f"executor exited with code {returncode}"
+            else:
+                progress = progress_status(job["ticket"]["path"])
+                if progress == "completed":
+                    status = "completed"
+                else:
+                    status = "incomplete"
+                    reason = f"progress.yaml status: {progress or 'missing'}"
+            self._record(
+                name,
+                status,
+                returncode=returncode,
+                duration=elapsed,
+                log_path=job["log_path"],
+                reason=reason,
+            )
+        return finished
+
+    def _record(
+        self,
+        name: str,
+        status: RunStatus,
+        returncode: Optional[int] = None,
+        duration: float = 0.0,
+        log_path: Optional[Path] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        result: TicketRun = {
+            "name": name,
+            "status": status,
+            "returncode": returncode,
+            "duration": duration,
+            "log_path": log_path,
+            "reason": reason,
+        }
+        self.results[name] = result
+        if self.on_event:
+            self.on_event("finished", name, result)
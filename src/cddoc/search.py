@@ -0,0 +1,550 @@
+"""Full-text search over ticket specs, plans and documentation.
+
+`cdd search` ranks documents with BM25F: each document is split into
+fields (title, acceptance criteria, headings, body) and a term's
+frequency is weighted by its field's boost before BM25 saturation and
+length normalization are applied.
+
+The inverted index lives in a SQLite database at
+`.cdd/cache/search.db` (postings clustered by term, so a query reads
+only the postings of its terms). Refreshing stats every candidate file
+and re-tokenizes only files whose content hash changed. Large files are
+read through memory-mapped I/O.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import re
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
+
+import yaml
+
+from .index import DOCS_DIR, TICKET_LOCATIONS
+from .project import get_cache_dir
+
+# Bump when tokenization or field extraction changes to force a rebuild
+SEARCH_VERSION = 1
+
+DB_FILE = "search.db"
+
+# Ticket files that are indexed
+TICKET_DOCUMENTS = ["spec.yaml", "plan.md"]
+
+# Relative importance of each field
+FIELD_BOOSTS = {
+    "title": 3.0,
+    "acceptance_criteria": 2.0,
+    "headings": 2.0,
+    "body": 1.0,
+}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Files at least this large are read through mmap
+MMAP_THRESHOLD = 64 * 1024
+
+SNIPPET_WIDTH = 160
+
+# libyaml's loader when available: specs dominate indexing time
+SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.*)$")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the "
+    "this to was were will with".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    title TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+"""
+
+
+class SearchError(Exception):
+    """Raised when the search index cannot be built or queried."""
+
+    pass
+
+
+class SearchHit(TypedDict):
+    path: str
+    kind: str
+    title: Optional[str]
+    score: float
+    snippet: str
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms.
+
+    Args:
+        text: Any text
+
+    Returns:
+        Terms in order, without stopwords and single characters
+    """
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def read_document(path: Path) -> Tuple[str, str]:
+    """Read a file and hash its content.
+
+    Files of MMAP_THRESHOLD bytes or more are mapped instead of read
+    into an intermediate buffer.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Tuple of (text, sha256 hex digest)
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest = hashlib.sha256(mapped).hexdigest()
+                text = mapped[:].decode("utf-8", errors="replace")
+            return text, digest
+        data = f.read()
+    return (
+        data.decode("utf-8", errors="replace"),
+        hashlib.sha256(data).hexdigest(),
+    )
+
+
+def document_kind(rel_path: str) -> str:
+    """Classify an indexed path as "spec", "plan" or "doc"."""
+    if rel_path.endswith("/spec.yaml"):
+        return "spec"
+    if rel_path.startswith("specs/"):
+        return "plan"
+    return "doc"
+
+
+def _flatten(value) -> Iterable[str]:
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _flatten(item)
+    elif value is not None:
+        yield str(value)
+
+
+def extract_fields(rel_path: str, text: str) -> Dict[str, str]:
+    """Split a document into boosted fields.
+
+    Specs contribute their title (plus the ticket folder name) and
+    acceptance criteria; Markdown files their first H1 and other
+    headings. Everything else is body text.
+
+    Args:
+        rel_path: Project-relative path
+        text: File content
+
+    Returns:
+        Mapping of field name (see FIELD_BOOSTS) to text
+    """
+    if document_kind(rel_path) == "spec":
+        ticket_name = rel_path.split("/")[-2].replace("-", " ")
+        try:
+            spec = yaml.load(text, Loader=SAFE_LOADER)
+        except yaml.YAMLError:
+            spec = None
+        if not isinstance(spec, dict):
+            return {"title": ticket_name, "body": text}
+
+        spec = dict(spec)
+        title = spec.pop("title", None)
+        acceptance = spec.pop("acceptance_criteria", None)
+        return {
+            "title": f"{title or ''} {ticket_name}",
+            "acceptance_criteria": " ".join(_flatten(acceptance)),
+            "body": " ".join(_flatten(spec)),
+        }
+
+    title = None
+    headings = []
+    body = []
+    for line in text.splitlines():
+        match = HEADING_PATTERN.match(line)
+        if match and title is None and line.startswith("# "):
+            title = match.group(1)
+        elif match:
+            headings.append(match.group(1))
+        else:
+            body.append(line)
+    return {
+        "title": title or "",
+        "headings": "\n".join(headings),
+        "body": "\n".join(body),
+    }
+
+
+def document_title(rel_path: str, fields: Dict[str, str]) -> Optional[str]:
+    """Display title for a search hit."""
+    if document_kind(rel_path) == "spec":
+        # Drop the ticket folder name appended for matching
+        ticket_name = rel_path.split("/")[-2].replace("-", " ")
+        title = fields["title"].removesuffix(ticket_name).strip()
+        return title or None
+    return fields["title"] or None
+
+
+def weigh_terms(fields: Dict[str, str]) -> Tuple[Dict[str, float], int]:
+    """Compute boosted term frequencies for a document.
+
+    Args:
+        fields: Output of extract_fields()
+
+    Returns:
+        Tuple of (term -> weighted frequency, document length in terms)
+    """
+    weights: Dict[str, float] = {}
+    length = 0
+    for field, text in fields.items():
+        boost = FIELD_BOOSTS[field]
+        counts = Counter(tokenize(text))
+        length += sum(counts.values())
+        for term, count in counts.items():
+            weights[term] = weights.get(term, 0.0) + boost * count
+    return weights, length
+
+
+def discover_documents(project_root: Path) -> Dict[str, os.stat_result]:
+    """List indexable files.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Mapping of project-relative path to stat result
+    """
+    found: Dict[str, os.stat_result] = {}
+    root = os.fspath(project_root)
+
+    for rel_dir in TICKET_LOCATIONS.values():
+        try:
+            tickets = list(os.scandir(os.path.join(root, rel_dir)))
+        except OSError:
+            continue
+        for ticket in tickets:
+            if not ticket.is_dir() or ticket.name.startswith("."):
+                continue
+            for name in TICKET_DOCUMENTS:
+                try:
+                    stat = os.stat(os.path.join(ticket.path, name))
+                except OSError:
+                    continue
+                found[f"{rel_dir}/{ticket.name}/{name}"] = stat
+
+    stack = [DOCS_DIR]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(os.path.join(root, current)))
+        except OSError:
+            continue
+        for entry in entries:
+            rel_path = f"{current}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(rel_path)
+            elif entry.name.endswith(".md"):
+                found[rel_path] = entry.stat()
+
+    return found
+
+
+def make_snippet(text: str, terms: List[str], width: int = SNIPPET_WIDTH):
+    """Pick the passage of a document that best matches the query.
+
+    Args:
+        text: Document text
+        terms: Query terms
+        width: Maximum snippet length in characters
+
+    Returns:
+        Single-line snippet
+    """
+    lowered = text.lower()
+    positions = []
+    for term in terms:
+        for match in re.finditer(rf"\b{re.escape(term)}\b", lowered):
+            positions.append(match.start())
+            if len(positions) > 200:
+                break
+
+    start = 0
+    if positions:
+        best = -1
+        for position in positions:
+            window = lowered[max(0, position - width // 4) :][:width]
+            matched = sum(1 for term in terms if term in window)
+            if matched > best:
+                best, start = matched, max(0, position - width // 4)
+
+    snippet = " ".join(text[start : start + width * 2].split())[:width]
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + width < len(text) else ""
+    return f"{prefix}{snippet}{suffix}"
+
+
+def _fingerprint() -> str:
+    boosts = ",".join(f"{k}={v}" for k, v in sorted(FIELD_BOOSTS.items()))
+    return f"{SEARCH_VERSION}:{boosts}"
+
+
+class SearchIndex:
+    """Persistent BM25F inverted index for a project."""
+
+    def __init__(self, project_root: Path, db_path: Optional[Path] = None):
+        """Open (creating if needed) the project's search index.
+
+        Args:
+            project_root: Project root directory
+            db_path: Database file (defaults to .cdd/cache/search.db)
+
+        Raises:
+            SearchError: If the database cannot be opened
+        """
+        self.project_root = Path(os.path.abspath(project_root))
+        self.db_path = db_path or get_cache_dir(self.project_root) / DB_FILE
+        try:
+            self.db = sqlite3.connect(self.db_path)
+            self.db.executescript(SCHEMA)
+            row = self.db.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != _fingerprint():
+                self._reset()
+        except sqlite3.Error as e:
+            raise SearchError(f"Cannot open search index: {e}")
+
+    def _reset(self) -> None:
+        with self.db:
+            self.db.execute("DELETE FROM postings")
+            self.db.execute("DELETE FROM docs")
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)",
+                (_fingerprint(),),
+            )
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with the project files.
+
+        Returns:
+            Counts of "added", "updated" and "removed" documents
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        found = discover_documents(self.project_root)
+        known = {
+            path: (doc_id, mtime_ns, size, digest)
+            for doc_id, path, mtime_ns, size, digest in self.db.execute(
+                "SELECT id, path, mtime_ns, size, sha256 FROM docs"
+            )
+        }
+
+        with self.db:
+            for rel_path, stat in found.items():
+                previous = known.get(rel_path)
+                if previous and previous[1:3] == (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ):
+                    continue
+                action = self._index_file(rel_path, previous)
+                if action:
+                    counts[action] += 1
+
+            for rel_path, (doc_id, *_) in known.items():
+                if rel_path not in found:
+                    self._remove(doc_id)
+                    counts["removed"] += 1
+
+        return counts
+
+    def update_paths(self, rel_paths: Iterable[str]) -> None:
+        """Re-index specific files (e.g. from `cdd watch`).
+
+        Args:
+            rel_paths: Project-relative paths; missing files are removed
+                from the index and unindexable paths are ignored
+        """
+        with self.db:
+            for rel_path in rel_paths:
+                if not self._is_indexable(rel_path):
+                    continue
+                row = self.db.execute(
+                    "SELECT id, mtime_ns, size, sha256 FROM docs "
+                    "WHERE path = ?",
+                    (rel_path,),
+                ).fetchone()
+                if (self.project_root / rel_path).is_file():
+                    self._index_file(rel_path, row)
+                elif row is not None:
+                    self._remove(row[0])
+
+    @staticmethod
+    def _is_indexable(rel_path: str) -> bool:
+        parts = rel_path.split("/")
+        if parts[0] == DOCS_DIR:
+            return rel_path.endswith(".md")
+        return (
+            len(parts) == 4
+            and "/".join(parts[:2]) in TICKET_LOCATIONS.values()
+            and parts[3] in TICKET_DOCUMENTS
+        )
+
+    def _index_file(self, rel_path: str, previous) -> Optional[str]:
+        path = self.project_root / rel_path
+        try:
+            stat = os.stat(path)
+            text, digest = read_document(path)
+        except OSError:
+            return None
+
+        if previous is not None and previous[3] == digest:
+            # Touched but unchanged: only refresh the stat signature
+            self.db.execute(
+                "UPDATE docs SET mtime_ns = ?, size = ? WHERE id = ?",
+                (stat.st_mtime_ns, stat.st_size, previous[0]),
+            )
+            return None
+
+        fields = extract_fields(rel_path, text)
+        weights, length = weigh_terms(fields)
+        if previous is not None:
+            self._remove(previous[0])
+
+        cursor = self.db.execute(
+            "INSERT INTO docs (path, kind, title, mtime_ns, size, sha256, "
+            "length) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                rel_path,
+                document_kind(rel_path),
+                document_title(rel_path, fields),
+                stat.st_mtime_ns,
+                stat.st_size,
+                digest,
+                length,
+            ),
+        )
+        doc_id = cursor.lastrowid
+        self.db.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?)",
+            ((term, doc_id, weight) for term, weight in weights.items()),
+        )
+        return "updated" if previous is not None else "added"
+
+    def _remove(self, doc_id: int) -> None:
+        self.db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def search(
+        self, query: str, limit: int = 10, kind: Optional[str] = None
+    ) -> List[SearchHit]:
+        """Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+            kind: Restrict to "spec", "plan" or "doc"
+
+        Returns:
+            Hits ordered by descending score, with snippets
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        total_docs, total_length = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs"
+        ).fetchone()
+        if not total_docs:
+            return []
+        average_length = max(total_length / total_docs, 1.0)
+
+        # IDF per term from posting counts (a range count on the
+        # clustered primary key)
+        idfs = []
+        for term in terms:
+            (df,) = self.db.execute(
+                "SELECT COUNT(*) FROM postings WHERE term = ?", (term,)
+            ).fetchone()
+            if df:
+                idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+                idfs.append((term, idf))
+        if not idfs:
+            return []
+
+        # Score and rank inside SQLite so only the top hits reach Python
+        values = ", ".join("(?, ?)" for _ in idfs)
+        params: List = [value for pair in idfs for value in pair]
+        params += [BM25_K1 + 1, BM25_K1, 1 - BM25_B, BM25_B / average_length]
+        kind_filter = ""
+        if kind is not None:
+            kind_filter = "WHERE d.kind = ?"
+            params.append(kind)
+        params.append(limit)
+
+        rows = self.db.execute(
+            f"WITH q(term, idf) AS (VALUES {values}), "
+            "k(k1p1, k1, b0, b1) AS (SELECT ?, ?, ?, ?) "
+            "SELECT d.path, d.kind, d.title, SUM(q.idf * p.weight * k.k1p1 "
+            "/ (p.weight + k.k1 * (k.b0 + k.b1 * d.length))) AS score "
+            "FROM q JOIN postings p ON p.term = q.term "
+            "JOIN docs d ON d.id = p.doc_id CROSS JOIN k "
+            f"{kind_filter} GROUP BY d.id ORDER BY score DESC, d.path "
+            "LIMIT ?",
+            params,
+        ).fetchall()
+
+        hits: List[SearchHit] = []
+        for path, doc_kind, title, score in rows:
+            try:
+                text, _ = read_document(self.project_root / path)
+            except OSError:
+                text = ""
+            hits.append(
+                {
+                    "path": path,
+                    "kind": doc_kind,
+                    "title": title,
+                    "score": round(score, 4),
+                    "snippet": make_snippet(text, terms),
+                }
+            )
+        return hits
+
+    def close(self) -> None:
+        self.db.close()
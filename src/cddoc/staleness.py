@@ -0,0 +1,370 @@
+"""Detection of documentation pages that lag behind their sources.
+
+`cdd docs stale` maps each feature page under `docs/features/` to the
+source files and directories it mentions (inline code, links and bare
+paths that name tracked files), then compares git history: every line
+changed in those sources by commits made after the page's own last
+commit counts against the page.
+
+History comes from a single `git log --numstat` pass, summarized per
+file and cached in `.cdd/cache/stale.json` keyed by HEAD. When HEAD
+moves forward only the new commits are read.
+"""
+
+import bisect
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, TypedDict
+
+from .concurrency import atomic_write
+from .project import get_cache_dir
+
+# Bump when the cached history layout changes
+HISTORY_VERSION = 1
+
+CACHE_FILE = "stale.json"
+
+DEFAULT_DOCS_DIR = "docs/features"
+
+# Mentions under these directories are documentation, not sources
+NON_SOURCE_DIRS = ("docs/", "specs/", ".cdd/", ".claude/")
+
+COMMIT_MARKER = "\x1e"
+
+PATH_CANDIDATE = re.compile(r"[\w@+-][\w@+./-]*")
+
+
+class StalenessError(Exception):
+    """Raised when git history cannot be read."""
+
+    pass
+
+
+class StaleDoc(TypedDict):
+    path: str
+    sources: List[str]
+    last_commit: Optional[str]
+    last_updated: Optional[int]
+    commits: int
+    lines_changed: int
+    changed_files: List[str]
+
+
+class _Commit(TypedDict):
+    sha: str
+    time: int
+
+
+def _git(project_root: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            errors="replace",
+        )
+    except FileNotFoundError:
+        raise StalenessError("git is not installed")
+    if result.returncode != 0:
+        raise StalenessError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+
+def parse_numstat_log(
+    output: str, first_seq: int
+) -> Tuple[List[_Commit], Dict[str, List[List[int]]]]:
+    """Parse `git log --numstat` output, newest commit first.
+
+    Args:
+        output: Output of git log with the COMMIT_MARKER format
+        first_seq: Sequence number for the oldest commit in the output
+
+    Returns:
+        Tuple of (commits oldest first, per-file [seq, lines] entries)
+    """
+    chunks = [chunk for chunk in output.split(COMMIT_MARKER) if chunk]
+    commits: List[_Commit] = []
+    files: Dict[str, List[List[int]]] = {}
+
+    for offset, chunk in enumerate(reversed(chunks)):
+        seq = first_seq + offset
+        header, _, body = chunk.partition("\n")
+        sha, _, timestamp = header.partition(" ")
+        commits.append({"sha": sha, "time": int(timestamp or 0)})
+        for line in body.splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, path = parts
+            lines = (int(added) if added.isdigit() else 0) + (
+                int(deleted) if deleted.isdigit() else 0
+            )
+            files.setdefault(path, []).append([seq, lines])
+    return commits, files
+
+
+class FileHistory:
+    """Per-file change history of a repository, cached by HEAD."""
+
+    def __init__(self, project_root: Path):
+        """Create an empty history.
+
+        Args:
+            project_root: Project root (may be a git subdirectory; paths
+                are relative to it)
+        """
+        self.project_root = Path(project_root)
+        self.head: Optional[str] = None
+        self.commits: List[_Commit] = []
+        self.files: Dict[str, List[List[int]]] = {}
+        self._names: Optional[List[str]] = None
+
+    @property
+    def cache_path(self) -> Path:
+        return get_cache_dir(self.project_root) / CACHE_FILE
+
+    @classmethod
+    def load(cls, project_root: Path) -> "FileHistory":
+        """Load the cached history and bring it up to date with HEAD.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            History as of HEAD
+
+        Raises:
+            StalenessError: If the project is not in a git repository
+        """
+        history = cls(project_root)
+        try:
+            data = json.loads(history.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") == HISTORY_VERSION:
+                history.head = data["head"]
+                history.commits = data["commits"]
+                history.files = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        head = _git(project_root, "rev-parse", "HEAD").strip()
+        if head != history.head:
+            history._update(head)
+            history.save()
+        return history
+
+    def save(self) -> None:
+        """Write the history to the cache."""
+        atomic_write(
+            self.cache_path,
+            json.dumps(
+                {
+                    "version": HISTORY_VERSION,
+                    "head": self.head,
+                    "commits": self.commits,
+                    "files": self.files,
+                }
+            ),
+        )
+
+    def _update(self, head: str) -> None:
+        revision = head
+        if self.head and self._is_ancestor(self.head, head):
+            revision = f"{self.head}..{head}"
+        else:
+            self.commits, self.files = [], {}
+
+        output = _git(
+            self.project_root,
+            "log",
+            "--numstat",
+            "--no-renames",
+            "--relative",
+            f"--format={COMMIT_MARKER}%H %ct",
+            revision,
+        )
+        commits, files = parse_numstat_log(output, len(self.commits))
+        self.commits.extend(commits)
+        for path, entries in files.items():
+            self.files.setdefault(path, []).extend(entries)
+        self.head = head
+        self._names = None
+
+    def _is_ancestor(self, old: str, new: str) -> bool:
+        try:
+            _git(self.project_root, "merge-base", "--is-ancestor", old, new)
+        except StalenessError:
+            return False
+        return True
+
+    def last_change(self, path: str) -> Optional[int]:
+        """Sequence number of the last commit touching a file."""
+        entries = self.files.get(path)
+        return max(seq for seq, _ in entries) if entries else None
+
+    def changes_since(
+        self, paths: List[str], seq: int
+    ) -> Tuple[Set[int], int, List[str]]:
+        """Summarize changes to files or directories after a commit.
+
+        Args:
+            paths: Files or directories (project-relative)
+            seq: Sequence number of the reference commit
+
+        Returns:
+            Tuple of (commit sequence numbers, lines changed, changed
+            files)
+        """
+        if self._names is None:
+            self._names = sorted(self.files)
+        names = self._names
+        commits: Set[int] = set()
+        lines = 0
+        changed: Set[str] = set()
+
+        for source in paths:
+            if source in self.files:
+                matched = [source]
+            else:
+                prefix = source.rstrip("/") + "/"
+                start = bisect.bisect_left(names, prefix)
+                end = bisect.bisect_left(names, prefix[:-1] + "0", start)
+                matched = names[start:end]
+            for name in matched:
+                for entry_seq, entry_lines in self.files[name]:
+                    if entry_seq > seq:
+                        commits.add(entry_seq)
+                        lines += entry_lines
+                        changed.add(name)
+        return commits, lines, sorted(changed)
+
+
+def tracked_paths(project_root: Path) -> Tuple[Set[str], Set[str]]:
+    """List tracked files and the directories containing them.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Tuple of (files, directories), project-relative
+    """
+    files = set(_git(project_root, "ls-files", "-z").split("\0")) - {""}
+    dirs = set()
+    for path in files:
+        parent = os.path.dirname(path)
+        while parent and parent not in dirs:
+            dirs.add(parent)
+            parent = os.path.dirname(parent)
+    return files, dirs
+
+
+def referenced_sources(
+    text: str,
+    doc_path: str,
+    files: Set[str],
+    dirs: Set[str],
+    basenames: Dict[str, Optional[str]],
+) -> List[str]:
+    """Find the tracked source paths a page mentions.
+
+    Candidates are path-like words resolved against the project root,
+    then against the page's directory; a bare file name counts when
+    exactly one tracked file has it. Directories count only when
+    written as a path (`src/api/`), not as a bare word ("tests").
+
+    Args:
+        text: Page content
+        doc_path: Project-relative path of the page
+        files: Tracked files
+        dirs: Directories containing tracked files
+        basenames: File name -> tracked path (None when ambiguous)
+
+    Returns:
+        Sorted source files and directories
+    """
+    found = set()
+    base = os.path.dirname(doc_path)
+    for word in set(PATH_CANDIDATE.findall(text)):
+        word = word.removeprefix("./").rstrip("./")
+        if not word or word.startswith("/"):
+            continue
+        for candidate in (
+            word,
+            os.path.normpath(os.path.join(base, word)),
+            basenames.get(word) if "/" not in word else None,
+        ):
+            if not candidate:
+                continue
+            if candidate in files or ("/" in word and candidate in dirs):
+                if not (candidate + "/").startswith(NON_SOURCE_DIRS):
+                    found.add(candidate)
+                break
+    return sorted(found)
+
+
+def find_stale_docs(
+    project_root: Path,
+    docs_dir: str = DEFAULT_DOCS_DIR,
+    include_current: bool = False,
+) -> List[StaleDoc]:
+    """Rank documentation pages by how much their sources changed.
+
+    Args:
+        project_root: Project root directory
+        docs_dir: Project-relative directory of the pages to check
+        include_current: Also return pages with no source changes
+
+    Returns:
+        Pages, most lines changed first
+
+    Raises:
+        StalenessError: If the project is not in a git repository
+    """
+    history = FileHistory.load(project_root)
+    files, dirs = tracked_paths(project_root)
+    basenames: Dict[str, Optional[str]] = {}
+    for path in files:
+        name = os.path.basename(path)
+        basenames[name] = None if name in basenames else path
+
+    results: List[StaleDoc] = []
+    for doc_path in sorted(files):
+        if not (
+            doc_path.startswith(docs_dir.rstrip("/") + "/")
+            and doc_path.endswith(".md")
+        ):
+            continue
+        try:
+            text = (project_root / doc_path).read_text(encoding="utf-8")
+        except OSError:
+            continue
+
+        sources = referenced_sources(text, doc_path, files, dirs, basenames)
+        seq = history.last_change(doc_path)
+        if seq is None:
+            # Not committed yet: nothing to compare against
+            commits, lines, changed = set(), 0, []
+        else:
+            commits, lines, changed = history.changes_since(sources, seq)
+
+        if lines or commits or include_current:
+            commit = history.commits[seq] if seq is not None else None
+            results.append(
+                {
+                    "path": doc_path,
+                    "sources": sources,
+                    "last_commit": commit["sha"] if commit else None,
+                    "last_updated": commit["time"] if commit else None,
+                    "commits": len(commits),
+                    "lines_changed": lines,
+                    "changed_files": changed,
+                }
+            )
+
+    results.sort(
+        key=lambda doc: (-doc["lines_changed"], -doc["commits"], doc["path"])
+    )
+    return results
@@ -0,0 +1,276 @@
+"""Content-addressed store for shared framework files.
+
+Framework commands and templates are identical across every project
+initialized with the same package version. The store keeps one copy of
+each file under a user-level cache directory, addressed by its SHA-256
+digest, and installs it into projects with reflinks, hardlinks or
+symlinks so that many checkouts on one disk share the same blocks.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Environment variable overriding the store location
+STORE_ENV_VAR = "CDD_STORE_DIR"
+
+# Supported link modes, "auto" tries them in the order listed after it
+LINK_MODES = ["auto", "reflink", "hardlink", "symlink", "copy"]
+
+# ioctl request number for FICLONE (Linux, btrfs/xfs/overlayfs)
+FICLONE = 0x40049409
+
+
+class StoreError(Exception):
+    """Raised when the shared store cannot be read or written."""
+
+    pass
+
+
+def default_store_dir() -> Path:
+    """Get the user-level store directory.
+
+    Honours $CDD_STORE_DIR, then $XDG_CACHE_HOME, then ~/.cache.
+
+    Returns:
+        Path to the store root directory
+    """
+    override = os.environ.get(STORE_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "cdd" / "store"
+
+
+def hash_bytes(data: bytes) -> str:
+    """Compute the content address of a blob.
+
+    Args:
+        data: File contents
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Clone source into target sharing extents (copy-on-write).
+
+    Raises:
+        OSError: If the filesystem or platform does not support reflinks
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("Reflinks are not supported on this platform")
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            target.unlink()
+            raise
+
+
+def _copy(source: Path, target: Path) -> None:
+    """Copy source into target, in-kernel when possible."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        shutil.copyfile(source, target)
+        return
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # Cross-filesystem on old kernels - fall back to userspace
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst)
+
+
+class FrameworkStore:
+    """User-level content-addressed store for framework files."""
+
+    def __init__(self, root: Optional[Path] = None):
+        """Create a store handle.
+
+        Args:
+            root: Store directory (defaults to default_store_dir())
+        """
+        self.root = Path(root) if root else default_store_dir()
+
+    def object_path(self, digest: str) -> Path:
+        """Get the on-disk location of an object.
+
+        Args:
+            digest: SHA-256 hex digest
+
+        Returns:
+            Path to the object file
+        """
+        return self.root / "objects" / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        """Check whether an intact object exists in the store.
+
+        Args:
+            digest: SHA-256 hex digest
+
+        Returns:
+            True if the object exists and matches its digest
+        """
+        try:
+            self.read(digest)
+            return True
+        except StoreError:
+            return False
+
+    def add_bytes(self, data: bytes) -> str:
+        """Add a blob to the store.
+
+        Existing objects are verified and rewritten if corrupted, so
+        re-adding known content doubles as a repair.
+
+        Args:
+            data: File contents
+
+        Returns:
+            Digest of the stored object
+
+        Raises:
+            StoreError: If the object cannot be written
+        """
+        digest = hash_bytes(data)
+        if self.has(digest):
+            return digest
+
+        object_path = self.object_path(digest)
+        tmp_path = None
+        try:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per call: threads of one process may add the same
+            # object at once
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{object_path.name}.",
+                suffix=".tmp",
+                dir=object_path.parent,
+            )
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Objects are immutable; hardlinked installs share the inode
+            tmp_path.chmod(0o444)
+            if object_path.exists():
+                object_path.chmod(0o644)
+            os.replace(tmp_path, object_path)
+        except OSError as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            # Another writer may have stored the same content meanwhile
+            if self.has(digest):
+                return digest
+            raise StoreError(f"Failed to write store object {digest}: {e}")
+
+        return digest
+
+    def add_file(self, path: Path) -> str:
+        """Add a file's contents to the store.
+
+        Args:
+            path: File to ingest
+
+        Returns:
+            Digest of the stored object
+        """
+        return self.add_bytes(Path(path).read_bytes())
+
+    def read(self, digest: str) -> bytes:
+        """Read an object, verifying its integrity.
+
+        Args:
+            digest: SHA-256 hex digest
+
+        Returns:
+            Object contents
+
+        Raises:
+            StoreError: If the object is missing or corrupted
+        """
+        object_path = self.object_path(digest)
+        try:
+            data = object_path.read_bytes()
+        except OSError:
+            raise StoreError(f"Store object not found: {digest}")
+
+        if hash_bytes(data) != digest:
+            raise StoreError(f"Store object corrupted: {digest}")
+
+        return data
+
+    def install(self, digest: str, target: Path, mode: str = "auto") -> str:
+        """Materialize an object at target.
+
+        Any existing file at target is replaced.
+
+        Args:
+            digest: SHA-256 hex digest of a stored object
+            target: Destination file path
+            mode: One of LINK_MODES
+
+        Returns:
+            Link method actually used ("reflink", "hardlink", "symlink"
+            or "copy")
+
+        Raises:
+            StoreError: If the object is invalid or every method fails
+        """
+        if mode not in LINK_MODES:
+            raise StoreError(
+                f"Invalid link mode: {mode}\n"
+                f"Supported modes: {', '.join(LINK_MODES)}"
+            )
+
+        # Integrity check before anything points at the object
+        self.read(digest)
+
+        source = self.object_path(digest)
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        methods = LINK_MODES[1:] if mode == "auto" else [mode]
+        errors = []
+        for method in methods:
+            if target.exists() or target.is_symlink():
+                target.unlink()
+            try:
+                if method == "reflink":
+                    _reflink(source, target)
+                    target.chmod(0o644)
+                elif method == "hardlink":
+                    os.link(source, target)
+                elif method == "symlink":
+                    target.symlink_to(source)
+                else:
+                    _copy(source, target)
+                    target.chmod(0o644)
+                return method
+            except OSError as e:
+                errors.append(f"{method}: {e}")
+
+        raise StoreError(
+            f"Failed to install {target} from store\n" + "\n".join(errors)
+        )
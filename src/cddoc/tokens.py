@@ -0,0 +1,510 @@
+"""Offline token estimation and prompt-size profiling.
+
+Token counts are estimates: no model tokenizer is required. Estimators
+are pluggable; the built-in ones are:
+
+- "chars": characters / 4, a good average for English prose and Markdown
+- "words": counts words and punctuation, closer for code-heavy text
+- "tiktoken": exact BPE counts when the optional `tiktoken` package is
+  installed
+
+Any `module:function` taking a string and returning an int can also be
+used, and `register_estimator()` adds named ones.
+
+`cdd tokens` uses these to report how much context each command file,
+template and ticket artifact costs, broken down by Markdown heading (or
+top-level YAML key), against per-group budgets and against the previous
+release.
+"""
+
+import importlib
+import re
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypedDict
+
+import yaml
+
+from .index import TICKET_LOCATIONS
+from .project import PROJECT_MARKER
+
+# Average characters per token for English prose and Markdown
+CHARS_PER_TOKEN = 4
+
+DEFAULT_ESTIMATOR = "chars"
+
+TOKEN_GROUPS = ["commands", "templates", "tickets"]
+
+# Per-file budgets in tokens, overridable in .cdd/config.yaml:
+#   token_budgets:
+#     commands: 15000
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "commands": 12000,
+    "templates": 3000,
+    "tickets": 8000,
+}
+
+# Ticket files whose size is profiled
+TICKET_ARTIFACTS = ["spec.yaml", "plan.md", "progress.yaml"]
+
+PROFILED_SUFFIXES = (".md", ".yaml", ".yml")
+
+WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+FENCE_PATTERN = re.compile(r"^(```|~~~)")
+MARKDOWN_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+YAML_TOP_LEVEL_KEY = re.compile(r"^([\w\-\"']+)\s*:")
+
+Estimator = Callable[[str], int]
+
+
+class TokenEstimatorError(Exception):
+    """Raised when a token estimator cannot be loaded."""
+
+    pass
+
+
+class SectionTokens(TypedDict):
+    heading: str
+    level: int
+    line: int
+    tokens: int
+
+
+class FileTokens(TypedDict):
+    path: str
+    group: str
+    tokens: int
+    budget: Optional[int]
+    previous: Optional[int]
+    sections: List[SectionTokens]
+
+
+class TokensReport(TypedDict):
+    estimator: str
+    against: Optional[str]
+    files: List[FileTokens]
+    total: int
+    previous_total: Optional[int]
+
+
+def chars_estimator(text: str) -> int:
+    """Estimate tokens as characters / CHARS_PER_TOKEN."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def words_estimator(text: str) -> int:
+    """Estimate tokens from words and punctuation.
+
+    Each punctuation mark counts as a token and each word as one token
+    per started CHARS_PER_TOKEN * 2 characters, which tracks BPE
+    tokenizers more closely than raw length on code and YAML.
+    """
+    step = CHARS_PER_TOKEN * 2
+    return sum(
+        (len(piece) + step - 1) // step for piece in WORD_PATTERN.findall(text)
+    )
+
+
+def _tiktoken_estimator(text: str) -> int:
+    try:
+        import tiktoken
+    except ImportError:
+        raise TokenEstimatorError(
+            "The tiktoken estimator requires: pip install tiktoken"
+        )
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+_ESTIMATORS: Dict[str, Estimator] = {
+    "chars": chars_estimator,
+    "words": words_estimator,
+    "tiktoken": _tiktoken_estimator,
+}
+
+
+def register_estimator(name: str, estimator: Estimator) -> None:
+    """Make an estimator available by name.
+
+    Args:
+        name: Name used with `--estimator`
+        estimator: Function returning the token count of a string
+    """
+    _ESTIMATORS[name] = estimator
+
+
+def available_estimators() -> List[str]:
+    """Names of registered estimators."""
+    return sorted(_ESTIMATORS)
+
+
+def get_estimator(name: Optional[str] = None) -> Estimator:
+    """Look up an estimator.
+
+    Args:
+        name: Registered name or "module:function" (None for default)
+
+    Returns:
+        Estimator function
+
+    Raises:
+        TokenEstimatorError: If the estimator doesn't exist
+    """
+    name = name or DEFAULT_ESTIMATOR
+    if name in _ESTIMATORS:
+        return _ESTIMATORS[name]
+
+    module_name, _, attribute = name.partition(":")
+    if not attribute:
+        raise TokenEstimatorError(
+            f"Unknown estimator: {name} "
+            f"(available: {', '.join(available_estimators())}, "
+            "or module:function)"
+        )
+    try:
+        estimator = getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as e:
+        raise TokenEstimatorError(f"Cannot load estimator {name}: {e}")
+    if not callable(estimator):
+        raise TokenEstimatorError(f"Estimator {name} is not callable")
+    return estimator
+
+
+def estimate_tokens(text: str, estimator: Optional[str] = None) -> int:
+    """Estimate how many tokens a text occupies in a prompt.
+
+    Args:
+        text: Text to measure
+        estimator: Estimator name (defaults to DEFAULT_ESTIMATOR)
+
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    return get_estimator(estimator)(text)
+
+
+def split_sections(text: str, path: str) -> List[Tuple[str, int, int, str]]:
+    """Split a file into sections for a per-section breakdown.
+
+    Markdown is split at headings (ignoring fenced code blocks), YAML at
+    top-level keys. Text before the first boundary is a level-0
+    "(preamble)" section.
+
+    Args:
+        text: File content
+        path: File name (selects Markdown or YAML splitting)
+
+    Returns:
+        List of (heading, level, 1-based line, section text)
+    """
+    is_yaml = path.endswith((".yaml", ".yml"))
+    sections: List[Tuple[str, int, int, List[str]]] = [
+        ("(preamble)", 0, 1, [])
+    ]
+    in_fence = False
+
+    for number, line in enumerate(text.splitlines(keepends=True), start=1):
+        heading = None
+        if is_yaml:
+            match = YAML_TOP_LEVEL_KEY.match(line)
+            if match:
+                heading = (match.group(1).strip("\"'"), 1)
+        elif FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = MARKDOWN_HEADING.match(line)
+            if match:
+                heading = (match.group(2), len(match.group(1)))
+
+        if heading:
+            sections.append((heading[0], heading[1], number, []))
+        sections[-1][3].append(line)
+
+    return [
+        (heading, level, line, "".join(lines))
+        for heading, level, line, lines in sections
+        if lines
+    ]
+
+
+def section_breakdown(
+    text: str, path: str, estimator: Estimator
+) -> List[SectionTokens]:
+    """Estimate tokens per section of a file.
+
+    Args:
+        text: File content
+        path: File name
+        estimator: Estimator function
+
+    Returns:
+        Sections in file order
+    """
+    return [
+        {"heading": heading, "level": level, "line": line, "tokens": count}
+        for heading, level, line, body in split_sections(text, path)
+        if (count := estimator(body)) or level
+    ]
+
+
+def group_for(path: Path, project_root: Optional[Path] = None) -> str:
+    """Classify a profiled file as commands, templates or tickets.
+
+    Only the part of the path inside the project (or inside this
+    package, for the packaged command files) is looked at, so folders
+    named like a group above the project don't change the result.
+
+    Args:
+        path: Profiled file
+        project_root: Project the file belongs to
+
+    Returns:
+        Group name ("other" if none applies)
+    """
+    parts = path.parts
+    bases = [Path(__file__).parent]
+    if project_root is not None:
+        bases.insert(0, project_root)
+    for base in bases:
+        try:
+            parts = path.absolute().relative_to(base.absolute()).parts
+        except ValueError:
+            continue
+        break
+    if "commands" in parts:
+        return "commands"
+    if "templates" in parts:
+        return "templates"
+    if "specs" in parts:
+        return "tickets"
+    return "other"
+
+
+def discover_token_targets(
+    project_root: Path, language: str = "en"
+) -> List[Path]:
+    """List the files `cdd tokens` profiles by default.
+
+    Installed command files (`.claude/commands/`, or the packaged ones
+    for the configured language when none are installed), installed
+    templates and every active ticket's artifacts.
+
+    Args:
+        project_root: Project root directory
+        language: Language of the packaged command fallback
+
+    Returns:
+        File paths
+    """
+    commands_dir = project_root / ".claude" / "commands"
+    if not commands_dir.is_dir():
+        commands_dir = Path(__file__).parent / "commands" / language
+
+    targets = sorted(commands_dir.glob("*.md"))
+    targets += sorted(
+        path
+        for path in (project_root / PROJECT_MARKER / "templates").glob("*")
+        if path.suffix in PROFILED_SUFFIXES
+    )
+    tickets_dir = project_root / TICKET_LOCATIONS["tickets"]
+    for ticket in sorted(tickets_dir.glob("*")):
+        targets += [
+            ticket / name
+            for name in TICKET_ARTIFACTS
+            if (ticket / name).is_file()
+        ]
+    return targets
+
+
+def expand_token_targets(paths: List[Path]) -> List[Path]:
+    """Expand directories into the Markdown and YAML files they contain."""
+    targets = []
+    for path in paths:
+        if path.is_dir():
+            targets += sorted(
+                child
+                for child in path.rglob("*")
+                if child.suffix in PROFILED_SUFFIXES and child.is_file()
+            )
+        else:
+            targets.append(path)
+    return targets
+
+
+def load_budgets(project_root: Optional[Path]) -> Dict[str, int]:
+    """Get per-group token budgets.
+
+    Args:
+        project_root: Project root (reads `token_budgets` from
+            .cdd/config.yaml when present)
+
+    Returns:
+        Budget per group
+    """
+    budgets = dict(DEFAULT_BUDGETS)
+    if project_root is None:
+        return budgets
+    try:
+        with open(
+            project_root / PROJECT_MARKER / "config.yaml", encoding="utf-8"
+        ) as f:
+            config = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        return budgets
+
+    configured = config.get("token_budgets")
+    if isinstance(configured, dict):
+        for group, value in configured.items():
+            if isinstance(value, int) and value > 0:
+                budgets[str(group)] = value
+    return budgets
+
+
+def latest_release(repo_dir: Path) -> Optional[str]:
+    """Get the most recent tag reachable from HEAD, if any."""
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--tags", "--abbrev=0"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return None
+    tag = result.stdout.strip()
+    return tag if result.returncode == 0 and tag else None
+
+
+def read_at_revision(
+    repo_dir: Path, revision: str, paths: List[Path]
+) -> Dict[Path, Optional[str]]:
+    """Read several files as of a git revision in one git call.
+
+    Args:
+        repo_dir: Any directory inside the repository
+        revision: Tag, branch or commit
+        paths: Files (absolute or relative to the current directory)
+
+    Returns:
+        Content per path (None where the file didn't exist, or outside
+        the repository)
+    """
+    contents: Dict[Path, Optional[str]] = {path: None for path in paths}
+    try:
+        top = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return contents
+    if top.returncode != 0:
+        return contents
+    git_root = Path(top.stdout.strip()).resolve()
+
+    specs = []
+    for path in paths:
+        try:
+            rel_path = path.resolve().relative_to(git_root).as_posix()
+        except ValueError:
+            continue
+        specs.append((path, f"{revision}:{rel_path}"))
+    if not specs:
+        return contents
+
+    result = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        cwd=git_root,
+        input="".join(f"{spec}\n" for _, spec in specs).encode(),
+        capture_output=True,
+    )
+    output = result.stdout
+    offset = 0
+    for path, _ in specs:
+        end = output.find(b"\n", offset)
+        if end < 0:
+            break
+        header = output[offset:end].split()
+        offset = end + 1
+        if len(header) != 3 or header[1] != b"blob":
+            continue
+        size = int(header[2])
+        contents[path] = output[offset : offset + size].decode(
+            "utf-8", errors="replace"
+        )
+        offset += size + 1
+    return contents
+
+
+def profile_tokens(
+    paths: List[Path],
+    estimator: Optional[str] = None,
+    budgets: Optional[Dict[str, int]] = None,
+    against: Optional[str] = None,
+    repo_dir: Optional[Path] = None,
+    project_root: Optional[Path] = None,
+) -> TokensReport:
+    """Estimate token counts for files.
+
+    Args:
+        paths: Files to profile
+        estimator: Estimator name (defaults to DEFAULT_ESTIMATOR)
+        budgets: Per-group budgets (defaults to DEFAULT_BUDGETS)
+        against: Git revision to compare with (None for no comparison)
+        repo_dir: Directory used to run git (defaults to cwd)
+        project_root: Project the files belong to, used to group them
+            (the root passed to discover_token_targets())
+
+    Returns:
+        Report with one entry per readable file
+
+    Raises:
+        TokenEstimatorError: If the estimator cannot be loaded
+    """
+    estimate = get_estimator(estimator)
+    budgets = DEFAULT_BUDGETS if budgets is None else budgets
+    previous = (
+        read_at_revision(repo_dir or Path.cwd(), against, paths)
+        if against
+        else {}
+    )
+
+    files: List[FileTokens] = []
+    for path in paths:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        group = group_for(path, project_root)
+        old_text = previous.get(path)
+        files.append(
+            {
+                "path": str(path),
+                "group": group,
+                "tokens": estimate(text),
+                "budget": budgets.get(group),
+                "previous": (
+                    estimate(old_text) if old_text is not None else None
+                ),
+                "sections": section_breakdown(text, path.name, estimate),
+            }
+        )
+
+    compared = [f["previous"] for f in files if f["previous"] is not None]
+    return {
+        "estimator": estimator or DEFAULT_ESTIMATOR,
+        "against": against,
+        "files": files,
+        "total": sum(f["tokens"] for f in files),
+        "previous_total": sum(compared) if against else None,
+    }
+
+
+def over_budget(report: TokensReport) -> List[FileTokens]:
+    """Files whose estimate exceeds their group's budget."""
+    return [
+        f
+        for f in report["files"]
+        if f["budget"] is not None and f["tokens"] > f["budget"]
+    ]
@@ -0,0 +1,350 @@
+"""In-process tracing spans for CDD operations.
+
+Public handler and workflow operations (spec, progress and archive
+handlers, path resolution, ticket creation, init) run inside spans that
+record:
+
+- wall time (start and end timestamps)
+- bytes read and written by the operation
+- time spent parsing and dumping YAML
+- filesystem calls (opens, directory listings, mkdir, rename, remove,
+  moves), counted from Python audit events
+
+Counters of a span include those of its child spans. Finished spans are
+appended to a JSONL file, one span per line, using OpenTelemetry field
+names (`trace_id`, `span_id`, `parent_span_id`, `start_time_unix_nano`,
+`end_time_unix_nano`, `attributes`, `status`, `resource`), so the file
+can be loaded by OTLP tooling or queried directly with jq.
+
+Tracing is enabled with `cdd --trace FILE` or the CDD_TRACE_FILE
+environment variable (handy for long agent sessions), or by calling
+enable() when using cddoc as a library. When it is off, instrumented
+functions only check a flag and no audit hook is installed.
+"""
+
+import functools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from . import __version__
+
+# Counter attributes
+READ_BYTES = "cdd.io.read_bytes"
+WRITE_BYTES = "cdd.io.write_bytes"
+YAML_PARSE = "cdd.yaml.parse_ns"
+YAML_DUMP = "cdd.yaml.dump_ns"
+FS_CALLS = "cdd.fs.calls"
+
+COUNTERS = [READ_BYTES, WRITE_BYTES, YAML_PARSE, YAML_DUMP, FS_CALLS]
+
+# Audit events counted as filesystem calls
+FS_EVENTS = frozenset(
+    [
+        "open",
+        "os.listdir",
+        "os.scandir",
+        "os.mkdir",
+        "os.rename",
+        "os.remove",
+        "os.rmdir",
+        "os.link",
+        "os.symlink",
+        "os.truncate",
+        "os.chmod",
+        "os.utime",
+        "shutil.copyfile",
+        "shutil.move",
+        "shutil.rmtree",
+    ]
+)
+
+_output: Optional[Path] = None
+_local = threading.local()
+_lock = threading.Lock()
+_pending: List[Dict[str, Any]] = []
+_hook_installed = False
+
+
+class Span:
+    """A timed operation with counters and attributes."""
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any],
+    ):
+        """Start a span.
+
+        Args:
+            name: Operation name
+            parent: Enclosing span in the same thread (None for a root)
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else _new_id(128)
+        self.span_id = _new_id(64)
+        self.attributes = attributes
+        self.counters: Dict[str, int] = {name: 0 for name in COUNTERS}
+        self.error: Optional[BaseException] = None
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+
+    def end(self) -> None:
+        """Finish the span and queue it for export."""
+        duration = time.perf_counter_ns() - self._start_perf
+        if self.parent:
+            for name, value in self.counters.items():
+                self.parent.counters[name] += value
+
+        attributes = dict(self.attributes)
+        attributes.update(self.counters)
+        attributes["thread.id"] = threading.get_ident()
+        status: Dict[str, Any] = {"code": "STATUS_CODE_OK"}
+        if self.error is not None:
+            status = {
+                "code": "STATUS_CODE_ERROR",
+                "message": str(self.error),
+            }
+            attributes["exception.type"] = type(self.error).__name__
+
+        with _lock:
+            _pending.append(
+                {
+                    "name": self.name,
+                    "trace_id": self.trace_id,
+                    "span_id": self.span_id,
+                    "parent_span_id": (
+                        self.parent.span_id if self.parent else None
+                    ),
+                    "kind": "SPAN_KIND_INTERNAL",
+                    "start_time_unix_nano": self.start_ns,
+                    "end_time_unix_nano": self.start_ns + duration,
+                    "attributes": attributes,
+                    "status": status,
+                    "resource": {
+                        "service.name": "cdd",
+                        "service.version": __version__,
+                        "process.pid": os.getpid(),
+                    },
+                }
+            )
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _stack() -> List[Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _current() -> Optional[Span]:
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def _audit(event: str, args: tuple) -> None:
+    if _output is not None and event in FS_EVENTS:
+        current = _current()
+        if current is not None:
+            current.counters[FS_CALLS] += 1
+
+
+def enable(output: Union[str, Path]) -> None:
+    """Start recording spans.
+
+    Args:
+        output: JSONL file spans are appended to
+    """
+    global _output, _hook_installed
+    _output = Path(output)
+    if not _hook_installed:
+        # Audit hooks cannot be removed; _audit checks _output instead
+        sys.addaudithook(_audit)
+        _hook_installed = True
+
+
+def disable() -> None:
+    """Stop recording spans and write any that are still queued."""
+    global _output
+    flush()
+    _output = None
+
+
+def is_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _output is not None
+
+
+def flush() -> None:
+    """Append queued spans to the output file."""
+    global _pending
+    with _lock:
+        spans, _pending = _pending, []
+    if not spans or _output is None:
+        return
+    _output.parent.mkdir(parents=True, exist_ok=True)
+    lines = "".join(json.dumps(span) + "\n" for span in spans)
+    # One append per flush keeps concurrent processes' lines intact
+    with open(_output, "a", encoding="utf-8") as f:
+        f.write(lines)
+
+
+def start_span(name: str, **attributes: Any) -> Optional[Span]:
+    """Start a span as a child of the thread's current span.
+
+    Args:
+        name: Operation name
+        **attributes: Span attributes
+
+    Returns:
+        The span, or None when tracing is off
+    """
+    if _output is None:
+        return None
+    stack = _stack()
+    started = Span(name, stack[-1] if stack else None, attributes)
+    stack.append(started)
+    return started
+
+
+def end_span(
+    started: Optional[Span], error: Optional[BaseException] = None
+) -> None:
+    """End a span returned by start_span().
+
+    Root spans flush the queue to the output file.
+
+    Args:
+        started: Span to end (None is ignored)
+        error: Exception the operation failed with
+    """
+    if started is None:
+        return
+    stack = _stack()
+    if started in stack:
+        del stack[stack.index(started) :]
+    started.error = error
+    started.end()
+    if started.parent is None:
+        flush()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Run a block inside a span.
+
+    Args:
+        name: Operation name
+        **attributes: Span attributes
+
+    Yields:
+        The span, or None when tracing is off
+    """
+    started = start_span(name, **attributes)
+    try:
+        yield started
+    except BaseException as e:
+        end_span(started, e)
+        raise
+    else:
+        end_span(started)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Run a function inside a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        code = {
+            "code.function": func.__name__,
+            "code.namespace": func.__module__,
+        }
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _output is None:
+                return func(*args, **kwargs)
+            started = start_span(span_name, **code)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                end_span(started, e)
+                raise
+            end_span(started)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def add(counter: str, value: int) -> None:
+    """Add to a counter of the current span (no-op when off)."""
+    if _output is not None:
+        current = _current()
+        if current is not None:
+            current.counters[counter] += value
+
+
+def add_read(data: Union[str, bytes]) -> None:
+    """Count data read by the current operation."""
+    if _output is not None:
+        add(READ_BYTES, len(_as_bytes(data)))
+
+
+def add_write(data: Union[str, bytes]) -> None:
+    """Count data written by the current operation."""
+    if _output is not None:
+        add(WRITE_BYTES, len(_as_bytes(data)))
+
+
+def _as_bytes(data: Union[str, bytes]) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+@contextmanager
+def _measure(counter: str) -> Iterator[None]:
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        add(counter, time.perf_counter_ns() - start)
+
+
+@contextmanager
+def _unmeasured() -> Iterator[None]:
+    yield
+
+
+def measure(counter: str):
+    """Time a block into a nanosecond counter of the current span.
+
+    Args:
+        counter: Counter name (e.g. YAML_PARSE)
+
+    Returns:
+        Context manager
+    """
+    if _output is None:
+        return _unmeasured()
+    return _measure(counter)
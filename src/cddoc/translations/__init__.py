@@ -2,7 +2,10 @@
 
 from typing import Any
 
+from ..profiling import phase
 
+
+@phase("config")
 def get_translations(language: str) -> Any:
     """Get translation messages for specified language.
 
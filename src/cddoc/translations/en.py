@@ -36,8 +36,16 @@ class Messages:
     init_status_created = "✅ Created"
     init_status_installed = "✅ Installed"
     init_status_exists = "⚠️  Already exists"
+    init_status_linked = "🔗 Shared store"
     init_all_exists = "ℹ️  All directories and files already exist"
 
+    # Multi-project initialization summary
+    init_multi_summary_title = "Multi-Project Initialization Summary"
+    init_multi_table_project = "Project"
+    init_multi_table_created = "Dirs created"
+    init_multi_table_installed = "Files installed"
+    init_multi_totals = "✅ {succeeded} initialized, ❌ {failed} failed"
+
     # Next steps
     next_steps_title = "✅ CDD Framework Initialized"
     next_steps_content = """[bold]Your CDD Framework is Ready![/bold]
@@ -34,8 +34,16 @@ class Messages:
     init_status_created = "✅ Criado"
     init_status_installed = "✅ Instalado"
     init_status_exists = "⚠️  Já existe"
+    init_status_linked = "🔗 Store compartilhado"
     init_all_exists = "ℹ️  Todos os diretórios e arquivos já existem"
 
+    # Multi-project initialization summary
+    init_multi_summary_title = "Resumo da Inicialização de Projetos"
+    init_multi_table_project = "Projeto"
+    init_multi_table_created = "Diretórios criados"
+    init_multi_table_installed = "Arquivos instalados"
+    init_multi_totals = "✅ {succeeded} inicializados, ❌ {failed} com falha"
+
     # Next steps
     next_steps_title = "✅ Framework CDD Inicializado"
     next_steps_content = """[bold]Seu Framework CDD Está Pronto![/bold]
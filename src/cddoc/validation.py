@@ -0,0 +1,662 @@
+"""Schema validation for ticket specs and progress files.
+
+Spec schemas are compiled per ticket type from the ticket templates
+(`*-ticket-template.yaml`): every key becomes a known field, bracketed
+choices such as `[high/medium/low]` become enums, and every bracketed
+placeholder becomes a pattern that must not survive into a real spec.
+The progress schema is compiled from the `ProgressData` TypedDicts.
+
+Files are validated in a process pool and results are cached in
+`.cdd/cache/validation.json`, keyed by content hash.
+"""
+
+import hashlib
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+import yaml
+
+from .concurrency import atomic_write
+from .handlers.progress_handler import ProgressData
+from .handlers.spec_handler import TicketStatus
+from .project import get_cache_dir
+
+# Bump when validation rules change to invalidate cached results
+SCHEMA_VERSION = 1
+
+TICKET_TYPES = ["feature", "bug", "spike", "enhancement"]
+
+# Dotted paths every spec must define, whatever its type
+REQUIRED_SPEC_FIELDS = ["title", "ticket", "ticket.type"]
+
+# Below this many uncached files, a process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+CACHE_FILE = "validation.json"
+
+# Any bracketed template text, e.g. "[Descriptive feature title]"
+PLACEHOLDER_PATTERN = re.compile(r"\[[^\[\]\n]+\]")
+
+# Bracketed choices, e.g. "[high/medium/low]"
+ENUM_PATTERN = re.compile(r"^\[([\w-]+(?:/[\w-]+)+)\]$")
+
+# Unquoted bracketed values YAML would read as flow sequences
+FLOW_PLACEHOLDER_LINE = re.compile(r"^(\s*(?:-\s+|[\w-]+:\s+))(\[.*\])\s*$")
+
+ValidationKind = Literal["spec", "progress"]
+
+
+class SchemaNode(TypedDict, total=False):
+    """Compiled schema node.
+
+    kind is one of "mapping", "sequence", "text", "integer", "enum"
+    or "any".
+    """
+
+    kind: str
+    fields: Dict[str, "SchemaNode"]
+    required: List[str]
+    items: "SchemaNode"
+    choices: List[str]
+    nullable: bool
+
+
+class SpecSchema(TypedDict):
+    node: SchemaNode
+    placeholders: List[str]
+
+
+class ValidationResult(TypedDict):
+    path: str
+    kind: str
+    errors: List[str]
+    cached: bool
+
+
+class ValidationError(Exception):
+    """Raised when validation cannot be performed."""
+
+    pass
+
+
+def _quote_placeholders(template_text: str) -> str:
+    """Quote bracketed template values so YAML keeps them as strings."""
+    lines = []
+    for line in template_text.splitlines():
+        match = FLOW_PLACEHOLDER_LINE.match(line)
+        if match:
+            line = match.group(1) + json.dumps(match.group(2))
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _compile_template_node(value: Any) -> SchemaNode:
+    """Compile a parsed template value into a schema node."""
+    if isinstance(value, dict):
+        return {
+            "kind": "mapping",
+            "fields": {
+                str(key): _compile_template_node(child)
+                for key, child in value.items()
+            },
+            "required": [],
+            "nullable": True,
+        }
+    if isinstance(value, list):
+        items = _compile_template_node(value[0]) if value else {"kind": "any"}
+        return {"kind": "sequence", "items": items, "nullable": True}
+    if isinstance(value, str):
+        match = ENUM_PATTERN.match(value.strip())
+        if match:
+            return {
+                "kind": "enum",
+                "choices": match.group(1).split("/"),
+                "nullable": True,
+            }
+        return {"kind": "text", "nullable": True}
+    return {"kind": "any"}
+
+
+def _extract_placeholders(template_text: str) -> List[str]:
+    """Collect bracketed placeholders from non-comment template lines."""
+    placeholders = set()
+    for line in template_text.splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        placeholders.update(PLACEHOLDER_PATTERN.findall(line))
+    # Longest first so the alternation prefers the most specific match
+    return sorted(placeholders, key=lambda p: (-len(p), p))
+
+
+def compile_spec_schema(ticket_type: str, template_text: str) -> SpecSchema:
+    """Compile a ticket template into a spec schema.
+
+    Args:
+        ticket_type: Ticket type the template describes
+        template_text: Raw `*-ticket-template.yaml` content
+
+    Returns:
+        Compiled schema with the placeholders to reject
+
+    Raises:
+        ValidationError: If the template is not a YAML mapping
+    """
+    try:
+        parsed = yaml.safe_load(_quote_placeholders(template_text))
+    except yaml.YAMLError as e:
+        raise ValidationError(f"Invalid template for {ticket_type}: {e}")
+
+    if not isinstance(parsed, dict):
+        raise ValidationError(f"Invalid template for {ticket_type}")
+
+    node = _compile_template_node(parsed)
+    ticket = node["fields"].setdefault("ticket", _compile_template_node({}))
+    ticket["fields"]["type"] = {"kind": "enum", "choices": [ticket_type]}
+    ticket["fields"]["status"] = {
+        "kind": "enum",
+        "choices": list(get_args(TicketStatus)),
+        "nullable": True,
+    }
+
+    for dotted in REQUIRED_SPEC_FIELDS:
+        *parents, leaf = dotted.split(".")
+        target = node
+        for parent in parents:
+            target = target["fields"][parent]
+        target["required"].append(leaf)
+        target["fields"].setdefault(leaf, {"kind": "any"})["nullable"] = False
+
+    return {"node": node, "placeholders": _extract_placeholders(template_text)}
+
+
+def compile_typed_dict(type_hint: Any) -> SchemaNode:
+    """Compile a TypedDict (or nested type hint) into a schema node.
+
+    Args:
+        type_hint: TypedDict class or typing construct
+
+    Returns:
+        Compiled schema node
+    """
+    if hasattr(type_hint, "__required_keys__"):
+        hints = get_type_hints(type_hint)
+        return {
+            "kind": "mapping",
+            "fields": {
+                key: compile_typed_dict(hint) for key, hint in hints.items()
+            },
+            "required": sorted(type_hint.__required_keys__),
+        }
+
+    origin = get_origin(type_hint)
+    args = get_args(type_hint)
+
+    if origin is list:
+        return {"kind": "sequence", "items": compile_typed_dict(args[0])}
+    if origin is Literal:
+        return {"kind": "enum", "choices": [str(arg) for arg in args]}
+    if origin is Union:
+        non_null = [arg for arg in args if arg is not type(None)]
+        node = compile_typed_dict(non_null[0]) if non_null else {}
+        node["nullable"] = len(non_null) < len(args)
+        return node
+    if type_hint is str:
+        return {"kind": "text"}
+    if type_hint is int:
+        return {"kind": "integer"}
+    return {"kind": "any"}
+
+
+@lru_cache(maxsize=None)
+def get_progress_schema() -> SchemaNode:
+    """Get the compiled progress.yaml schema."""
+    return compile_typed_dict(ProgressData)
+
+
+def _format_path(path: str, key: Union[str, int]) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else str(key)
+
+
+def _normalize_choice(value: Any) -> str:
+    # YAML 1.1 reads bare yes/no as booleans
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    return str(value).strip().lower()
+
+
+def _describe(value: Any) -> str:
+    """Short description of an offending value for error messages."""
+    if isinstance(value, dict):
+        return "a mapping"
+    if isinstance(value, list):
+        return "a list"
+    return repr(value)
+
+
+def _check_node(
+    value: Any, node: SchemaNode, path: str, errors: List[str]
+) -> None:
+    """Recursively check a value against a schema node."""
+    kind = node.get("kind", "any")
+    where = path or "<root>"
+
+    if value is None:
+        if not node.get("nullable", False) and kind != "any":
+            errors.append(f"{where}: value is required")
+        return
+
+    if kind == "mapping":
+        if not isinstance(value, dict):
+            errors.append(f"{where}: expected a mapping")
+            return
+        for key in node.get("required", []):
+            if key not in value:
+                errors.append(
+                    f"{_format_path(path, key)}: missing required field"
+                )
+        fields = node.get("fields", {})
+        for key, child in value.items():
+            if key in fields:
+                _check_node(
+                    child, fields[key], _format_path(path, key), errors
+                )
+    elif kind == "sequence":
+        if isinstance(value, dict) and all(
+            isinstance(group, list) for group in value.values()
+        ):
+            # Grouped lists (e.g. acceptance criteria by area)
+            for key, group in value.items():
+                _check_node(group, node, _format_path(path, key), errors)
+            return
+        if not isinstance(value, list):
+            errors.append(f"{where}: expected a list")
+            return
+        for index, item in enumerate(value):
+            _check_node(item, node["items"], _format_path(path, index), errors)
+    elif kind == "enum":
+        choices = node["choices"]
+        if _normalize_choice(value) not in choices:
+            errors.append(
+                f"{where}: expected one of {', '.join(choices)} "
+                f"(got {_describe(value)})"
+            )
+    elif kind == "text":
+        if not isinstance(value, (str, int, float, date)):
+            errors.append(f"{where}: expected text")
+    elif kind == "integer":
+        if isinstance(value, bool) or not isinstance(value, int):
+            errors.append(f"{where}: expected an integer")
+
+
+def _find_placeholders(text: str, placeholders: List[str]) -> List[str]:
+    """Report template placeholders left in a file, with line numbers."""
+    if not placeholders:
+        return []
+
+    pattern = _placeholder_regex(tuple(placeholders))
+    errors = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith("#"):
+            continue
+        for match in pattern.finditer(line):
+            errors.append(
+                f"line {line_number}: unfilled template placeholder "
+                f"{match.group(0)!r}"
+            )
+    return errors
+
+
+@lru_cache(maxsize=None)
+def _placeholder_regex(placeholders: tuple) -> "re.Pattern":
+    return re.compile("|".join(re.escape(p) for p in placeholders))
+
+
+def _guess_ticket_type(data: Any, path_hint: str) -> Optional[str]:
+    """Get ticket type from spec data, falling back to the folder name."""
+    if isinstance(data, dict) and isinstance(data.get("ticket"), dict):
+        ticket_type = data["ticket"].get("type")
+        if ticket_type in TICKET_TYPES:
+            return ticket_type
+
+    folder = Path(path_hint).parent.name
+    for ticket_type in TICKET_TYPES:
+        if folder.startswith(f"{ticket_type}-"):
+            return ticket_type
+    return None
+
+
+def validate_text(
+    kind: ValidationKind,
+    text: str,
+    spec_schemas: Dict[str, SpecSchema],
+    path_hint: str = "",
+) -> List[str]:
+    """Validate file content.
+
+    Args:
+        kind: "spec" or "progress"
+        text: Raw YAML content
+        spec_schemas: Compiled spec schemas by ticket type
+        path_hint: Original path, used to infer the ticket type
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        return [f"Invalid YAML format: {e}"]
+
+    errors: List[str] = []
+
+    if kind == "progress":
+        _check_node(data, get_progress_schema(), "", errors)
+        return errors
+
+    ticket_type = _guess_ticket_type(data, path_hint)
+    if ticket_type in spec_schemas:
+        schema = spec_schemas[ticket_type]
+        errors.extend(_find_placeholders(text, schema["placeholders"]))
+        _check_node(data, schema["node"], "", errors)
+        return errors
+
+    placeholders = sorted(
+        {p for s in spec_schemas.values() for p in s["placeholders"]},
+        key=lambda p: (-len(p), p),
+    )
+    errors.extend(_find_placeholders(text, placeholders))
+    if not isinstance(data, dict):
+        errors.append("<root>: expected a mapping")
+    elif not isinstance(data.get("ticket"), dict):
+        errors.append("ticket: missing required field")
+    else:
+        errors.append(
+            f"ticket.type: expected one of {', '.join(TICKET_TYPES)} "
+            f"(got {data['ticket'].get('type')!r})"
+        )
+    return errors
+
+
+def load_ticket_templates(
+    project_root: Optional[Path] = None,
+) -> Dict[str, str]:
+    """Load ticket template text for every ticket type.
+
+    Project templates in `.cdd/templates/` take precedence (they are in
+    the project's language); packaged English templates fill the gaps.
+
+    Args:
+        project_root: Project root (None to use packaged templates only)
+
+    Returns:
+        Mapping of ticket type to template text
+    """
+    packaged = Path(__file__).parent / "templates" / "en"
+    templates = {}
+    for ticket_type in TICKET_TYPES:
+        name = f"{ticket_type}-ticket-template.yaml"
+        candidates = [packaged / name]
+        if project_root is not None:
+            candidates.insert(0, project_root / ".cdd" / "templates" / name)
+        for candidate in candidates:
+            if candidate.is_file():
+                templates[ticket_type] = candidate.read_text(encoding="utf-8")
+                break
+    return templates
+
+
+def compile_spec_schemas(templates: Dict[str, str]) -> Dict[str, SpecSchema]:
+    """Compile spec schemas for every template.
+
+    Args:
+        templates: Mapping of ticket type to template text
+
+    Returns:
+        Mapping of ticket type to compiled schema
+    """
+    return {
+        ticket_type: compile_spec_schema(ticket_type, text)
+        for ticket_type, text in templates.items()
+    }
+
+
+def schema_fingerprint(templates: Dict[str, str]) -> str:
+    """Hash the inputs that determine validation results.
+
+    Args:
+        templates: Mapping of ticket type to template text
+
+    Returns:
+        Hex digest identifying the current schema set
+    """
+    digest = hashlib.sha256(f"v{SCHEMA_VERSION}".encode())
+    for ticket_type in sorted(templates):
+        digest.update(ticket_type.encode())
+        digest.update(templates[ticket_type].encode())
+    return digest.hexdigest()
+
+
+def detect_kind(path: Path) -> ValidationKind:
+    """Infer what a file should be validated as.
+
+    Args:
+        path: File path
+
+    Returns:
+        "progress" for progress.yaml files, "spec" otherwise
+    """
+    return "progress" if Path(path).name == "progress.yaml" else "spec"
+
+
+def discover_validation_targets(project_root: Path) -> List[Path]:
+    """Find every spec, progress file and example spec in a project.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Sorted list of files to validate
+    """
+    targets = []
+    for base in ("specs/tickets", "specs/archive"):
+        for name in ("spec.yaml", "progress.yaml"):
+            targets.extend((project_root / base).glob(f"*/{name}"))
+    targets.extend((project_root / "docs" / "examples").glob("*.yaml"))
+    return sorted(targets)
+
+
+def content_key(kind: str, text: str) -> str:
+    """Cache key for a file's validation result."""
+    return hashlib.sha256(f"{kind}\0{text}".encode()).hexdigest()
+
+
+class ValidationCache:
+    """Validation results keyed by content hash, persisted as JSON."""
+
+    def __init__(self, cache_path: Optional[Path], fingerprint: str):
+        """Load cached results.
+
+        Args:
+            cache_path: JSON file (None for an in-memory cache)
+            fingerprint: Current schema fingerprint; results recorded
+                under a different fingerprint are discarded
+        """
+        self.cache_path = cache_path
+        self.fingerprint = fingerprint
+        self.results: Dict[str, List[str]] = {}
+        self._dirty = False
+
+        if cache_path is None or not cache_path.exists():
+            return
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("fingerprint") == fingerprint:
+            self.results = data.get("results", {})
+
+    def get(self, key: str) -> Optional[List[str]]:
+        return self.results.get(key)
+
+    def put(self, key: str, errors: List[str]) -> None:
+        self.results[key] = errors
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed."""
+        if self.cache_path is None or not self._dirty:
+            return
+        atomic_write(
+            self.cache_path,
+            json.dumps(
+                {"fingerprint": self.fingerprint, "results": self.results}
+            ),
+        )
+        self._dirty = False
+
+
+# Per-process schemas, set once by the pool initializer
+_worker_schemas: Dict[str, SpecSchema] = {}
+
+
+def _init_worker(templates: Dict[str, str]) -> None:
+    global _worker_schemas
+    _worker_schemas = compile_spec_schemas(templates)
+
+
+def _validate_in_worker(kind: ValidationKind, text: str, path: str):
+    return validate_text(kind, text, _worker_schemas, path)
+
+
+def validate_files(
+    paths: Iterable[Path],
+    project_root: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    fail_fast: bool = False,
+) -> List[ValidationResult]:
+    """Validate many spec and progress files.
+
+    Cached results are reused for unchanged content; the rest are
+    validated in a process pool (inline for small batches).
+
+    Args:
+        paths: Files to validate
+        project_root: Project root, used for templates and the cache
+        max_workers: Process pool size (defaults to CPU count)
+        use_cache: Whether to read and write the results cache
+        fail_fast: Stop after the first invalid file
+
+    Returns:
+        Results in input order (truncated after the first failure when
+        fail_fast is set)
+    """
+    templates = load_ticket_templates(project_root)
+    fingerprint = schema_fingerprint(templates)
+    cache_path = (
+        get_cache_dir(project_root) / CACHE_FILE
+        if use_cache and project_root is not None
+        else None
+    )
+    cache = ValidationCache(cache_path, fingerprint)
+
+    results: List[Optional[ValidationResult]] = []
+    pending = []
+    for index, path in enumerate(paths):
+        kind = detect_kind(path)
+        try:
+            text = Path(path).read_text(encoding="utf-8")
+        except OSError as e:
+            results.append(
+                {
+                    "path": str(path),
+                    "kind": kind,
+                    "errors": [f"Cannot read file: {e}"],
+                    "cached": False,
+                }
+            )
+            continue
+
+        key = content_key(kind, text)
+        cached = cache.get(key)
+        if cached is not None:
+            results.append(
+                {
+                    "path": str(path),
+                    "kind": kind,
+                    "errors": cached,
+                    "cached": True,
+                }
+            )
+        else:
+            results.append(None)
+            pending.append((index, kind, text, key, str(path)))
+
+    def _record(index, kind, key, path, errors) -> bool:
+        cache.put(key, errors)
+        results[index] = {
+            "path": path,
+            "kind": kind,
+            "errors": errors,
+            "cached": False,
+        }
+        return fail_fast and bool(errors)
+
+    if fail_fast and any(r and r["errors"] for r in results):
+        pending = []
+
+    if max_workers == 1 or len(pending) < PARALLEL_THRESHOLD:
+        schemas = compile_spec_schemas(templates)
+        for index, kind, text, key, path in pending:
+            errors = validate_text(kind, text, schemas, path)
+            if _record(index, kind, key, path, errors):
+                break
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(templates,),
+        ) as executor:
+            futures = {
+                executor.submit(_validate_in_worker, kind, text, path): (
+                    index,
+                    kind,
+                    key,
+                    path,
+                )
+                for index, kind, text, key, path in pending
+            }
+            for future in as_completed(futures):
+                index, kind, key, path = futures[future]
+                if _record(index, kind, key, path, future.result()):
+                    for other in futures:
+                        other.cancel()
+                    break
+
+    cache.save()
+
+    if fail_fast:
+        for position, result in enumerate(results):
+            if result is not None and result["errors"]:
+                return [r for r in results[: position + 1] if r is not None]
+
+    return [result for result in results if result is not None]
@@ -0,0 +1,510 @@
+"""Filesystem watch mode that keeps derived project state up to date.
+
+`cdd watch` follows changes to ticket files (`spec.yaml`,
+`progress.yaml`, `plan.md`) and documentation pages, and pushes only
+the changed files through the spec/progress handlers to update the
+project index, the validation cache and (once built) the search index
+in place.
+
+On Linux the watcher uses inotify (through ctypes, no dependencies);
+elsewhere, or when inotify is unavailable, it polls with `os.scandir`
+snapshots of the watched trees.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Literal, Optional, Tuple, TypedDict
+
+from .docgraph import CACHE_FILE as DOCGRAPH_FILE
+from .docgraph import DocGraph
+from .index import ProjectIndex
+from .project import get_cache_dir
+from .search import DB_FILE as SEARCH_DB_FILE
+from .search import SearchIndex
+from .validation import (
+    CACHE_FILE,
+    ValidationCache,
+    compile_spec_schemas,
+    content_key,
+    detect_kind,
+    load_ticket_templates,
+    schema_fingerprint,
+    validate_text,
+)
+
+# Top-level directories that hold watched files
+WATCHED_DIRS = ["specs", "docs"]
+
+# Files inside a ticket folder that derived state depends on
+TICKET_FILE_NAMES = {"spec.yaml", "progress.yaml", "plan.md"}
+
+# Time to keep collecting events after the first one (editors save in
+# several steps)
+SETTLE_SECONDS = 0.05
+
+# inotify constants (linux/inotify.h)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class Change(TypedDict):
+    path: str
+    action: Literal["added", "modified", "deleted"]
+
+
+class WatchError(Exception):
+    """Raised when a watch backend cannot be started."""
+
+    pass
+
+
+def is_watched(rel_path: str) -> bool:
+    """Check whether a project-relative path feeds derived state.
+
+    Args:
+        rel_path: POSIX path relative to the project root
+
+    Returns:
+        True for ticket files (specs/<location>/<ticket>/<file>) and
+        Markdown files under docs/
+    """
+    parts = rel_path.split("/")
+    if parts[0] == "specs":
+        return len(parts) == 4 and parts[3] in TICKET_FILE_NAMES
+    if parts[0] == "docs":
+        return rel_path.endswith(".md")
+    return False
+
+
+def scan_tree(project_root: Path, rel_dir: str) -> Snapshot:
+    """Snapshot watched files below a directory.
+
+    Args:
+        project_root: Project root directory
+        rel_dir: Directory relative to the project root
+
+    Returns:
+        Mapping of relative path to (mtime_ns, size)
+    """
+    snapshot: Snapshot = {}
+    stack = [rel_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(project_root / current))
+        except OSError:
+            continue
+        for entry in entries:
+            rel_path = f"{current}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(rel_path)
+            elif is_watched(rel_path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> List[Change]:
+    """Compare two snapshots.
+
+    Args:
+        old: Previous snapshot
+        new: Current snapshot
+
+    Returns:
+        Changes sorted by path
+    """
+    changes: List[Change] = []
+    for path, signature in new.items():
+        if path not in old:
+            changes.append({"path": path, "action": "added"})
+        elif old[path] != signature:
+            changes.append({"path": path, "action": "modified"})
+    for path in old:
+        if path not in new:
+            changes.append({"path": path, "action": "deleted"})
+    return sorted(changes, key=lambda change: change["path"])
+
+
+class PollingBackend:
+    """Watch backend that rescans the watched trees on an interval."""
+
+    name = "polling"
+
+    def __init__(self, project_root: Path, interval: float = 1.0):
+        self.project_root = project_root
+        self.interval = interval
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[List[str]]:
+        """Wait one interval.
+
+        Returns:
+            None, meaning "rescan everything"
+        """
+        delay = (
+            self.interval if timeout is None else min(timeout, self.interval)
+        )
+        time.sleep(delay)
+        return None
+
+    def watch_tree(self, rel_dir: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyBackend:
+    """Watch backend using Linux inotify through ctypes."""
+
+    name = "inotify"
+
+    def __init__(self, project_root: Path):
+        """Start watching the project.
+
+        Raises:
+            WatchError: If inotify is not available
+        """
+        if not sys.platform.startswith("linux"):
+            raise WatchError("inotify is only available on Linux")
+
+        libc_name = ctypes.util.find_library("c")
+        try:
+            self._libc = ctypes.CDLL(libc_name, use_errno=True)
+            self._libc.inotify_init1
+        except (OSError, AttributeError) as e:
+            raise WatchError(f"inotify is not available: {e}")
+
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise WatchError(
+                f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}"
+            )
+
+        self.project_root = project_root
+        self._watches: Dict[int, str] = {}
+
+        # The root is watched (non-recursively) for specs/ or docs/
+        # being created later
+        self._add_watch("")
+        for rel_dir in WATCHED_DIRS:
+            self.watch_tree(rel_dir)
+
+    def _add_watch(self, rel_dir: str) -> None:
+        path = self.project_root / rel_dir if rel_dir else self.project_root
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(str(path)), WATCH_MASK
+        )
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise WatchError(f"Cannot watch {path}: {os.strerror(error)}")
+        self._watches[wd] = rel_dir
+
+    def watch_tree(self, rel_dir: str) -> None:
+        """Add watches for a directory and all its subdirectories."""
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            if not (self.project_root / current).is_dir():
+                continue
+            self._add_watch(current)
+            try:
+                entries = list(os.scandir(self.project_root / current))
+            except OSError:
+                continue
+            stack.extend(
+                f"{current}/{entry.name}"
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            )
+
+    def _read_events(self) -> Optional[List[str]]:
+        dirty: List[str] = []
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return dirty
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(
+                    buffer[offset : offset + length].rstrip(b"\0")
+                )
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                parent = self._watches.get(wd)
+                if parent is None or not name:
+                    continue
+                if parent == "" and name not in WATCHED_DIRS:
+                    continue
+                dirty.append(f"{parent}/{name}" if parent else name)
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[List[str]]:
+        """Wait for filesystem events.
+
+        Args:
+            timeout: Seconds to wait (None blocks until an event)
+
+        Returns:
+            Relative paths (files or directories) to recheck, or None if
+            events were lost and everything must be rescanned
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        dirty: List[str] = []
+        while ready:
+            events = self._read_events()
+            if events is None:
+                return None
+            dirty.extend(events)
+            ready, _, _ = select.select([self.fd], [], [], SETTLE_SECONDS)
+        return dirty
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_backend(
+    project_root: Path, polling: bool = False, interval: float = 1.0
+):
+    """Create the best available watch backend.
+
+    Args:
+        project_root: Project root directory
+        polling: Force the polling backend
+        interval: Polling interval in seconds
+
+    Returns:
+        InotifyBackend when available, PollingBackend otherwise
+    """
+    if not polling:
+        try:
+            return InotifyBackend(project_root)
+        except WatchError:
+            pass
+    return PollingBackend(project_root, interval)
+
+
+class Watcher:
+    """Turns backend notifications into file-level changes."""
+
+    def __init__(self, project_root: Path, backend=None):
+        """Snapshot the watched trees.
+
+        Args:
+            project_root: Project root directory
+            backend: Watch backend (defaults to create_backend())
+        """
+        self.project_root = Path(project_root)
+        self.backend = backend or create_backend(self.project_root)
+        self.snapshot: Snapshot = {}
+        for rel_dir in WATCHED_DIRS:
+            self.snapshot.update(scan_tree(self.project_root, rel_dir))
+
+    def poll(self, timeout: Optional[float] = None) -> List[Change]:
+        """Wait for and return the next batch of changes.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Changes since the previous call (may be empty on timeout)
+        """
+        dirty = self.backend.wait(timeout)
+        if dirty is None:
+            dirty = list(WATCHED_DIRS)
+        return self.rescan(dirty)
+
+    def rescan(self, rel_paths: List[str]) -> List[Change]:
+        """Recheck specific files or directory trees.
+
+        Args:
+            rel_paths: Project-relative files or directories
+
+        Returns:
+            Changes found
+        """
+        changes: List[Change] = []
+        for rel_path in _collapse(rel_paths):
+            if (self.project_root / rel_path).is_dir() or any(
+                key.startswith(f"{rel_path}/") for key in self.snapshot
+            ):
+                prefix = f"{rel_path}/"
+                old = {
+                    key: value
+                    for key, value in self.snapshot.items()
+                    if key.startswith(prefix)
+                }
+                # Watch before scanning so files created in between are
+                # reported by the next event rather than lost
+                self.backend.watch_tree(rel_path)
+                new = scan_tree(self.project_root, rel_path)
+            elif is_watched(rel_path):
+                old = {}
+                if rel_path in self.snapshot:
+                    old[rel_path] = self.snapshot[rel_path]
+                new = {}
+                try:
+                    stat = (self.project_root / rel_path).stat()
+                    new[rel_path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    pass
+            else:
+                continue
+
+            for key in old:
+                self.snapshot.pop(key, None)
+            self.snapshot.update(new)
+            changes.extend(diff_snapshots(old, new))
+
+        return changes
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+def _collapse(rel_paths: List[str]) -> List[str]:
+    """Deduplicate paths, dropping those inside another listed path."""
+    unique = sorted(set(rel_paths))
+    collapsed: List[str] = []
+    for path in unique:
+        if collapsed and path.startswith(f"{collapsed[-1]}/"):
+            continue
+        collapsed.append(path)
+    return collapsed
+
+
+class WatchSession:
+    """Applies file changes to the project index and validation cache."""
+
+    def __init__(self, project_root: Path):
+        """Load derived state for a project.
+
+        Args:
+            project_root: Project root directory
+        """
+        self.project_root = Path(project_root)
+        self.index = ProjectIndex.load(self.project_root)
+        templates = load_ticket_templates(self.project_root)
+        self.schemas = compile_spec_schemas(templates)
+        self.validation = ValidationCache(
+            get_cache_dir(self.project_root) / CACHE_FILE,
+            schema_fingerprint(templates),
+        )
+        # Extra consumers called with every batch of changes
+        self.listeners: List[Callable[[List[Change]], None]] = []
+
+        # Keep the search index current too, once it has been built
+        if (get_cache_dir(self.project_root) / SEARCH_DB_FILE).exists():
+            search_index = SearchIndex(self.project_root)
+            self.listeners.append(
+                lambda changes: search_index.update_paths(
+                    change["path"] for change in changes
+                )
+            )
+
+        # ...and the documentation link graph
+        if (get_cache_dir(self.project_root) / DOCGRAPH_FILE).exists():
+            graph = DocGraph.load(self.project_root)
+            self.listeners.append(
+                lambda changes: self._update_graph(graph, changes)
+            )
+        self.index.save()
+
+    def apply(self, changes: List[Change]) -> List[str]:
+        """Push changed files through the handlers.
+
+        Args:
+            changes: File changes from a Watcher
+
+        Returns:
+            One human-readable report line per change
+        """
+        report = []
+        for change in changes:
+            report.append(self._apply_one(change))
+
+        self.index.save()
+        self.validation.save()
+        for listener in self.listeners:
+            listener(changes)
+        return report
+
+    @staticmethod
+    def _update_graph(graph: DocGraph, changes: List[Change]) -> None:
+        graph.update_paths(change["path"] for change in changes)
+        graph.save()
+
+    def _apply_one(self, change: Change) -> str:
+        rel_path = change["path"]
+        action = change["action"]
+        absolute = self.project_root / rel_path
+
+        if rel_path.startswith("docs/"):
+            entry = self.index.update_doc(absolute)
+            title = entry["title"] if entry else None
+            return f"{action}: {rel_path}" + (f" ({title})" if title else "")
+
+        entry = self.index.update_ticket(absolute.parent)
+        detail = []
+        if entry is not None:
+            detail.append(f"status {entry['status'] or '-'}")
+
+        if action != "deleted" and absolute.name != "plan.md":
+            try:
+                text = absolute.read_text(encoding="utf-8")
+            except OSError:
+                text = None
+            if text is not None:
+                kind = detect_kind(absolute)
+                errors = validate_text(kind, text, self.schemas, rel_path)
+                self.validation.put(content_key(kind, text), errors)
+                detail.append(
+                    f"{len(errors)} validation error(s)" if errors else "valid"
+                )
+
+        suffix = f" ({', '.join(detail)})" if detail else ""
+        return f"{action}: {rel_path}{suffix}"
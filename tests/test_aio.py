@@ -0,0 +1,166 @@
+"""Tests for the asyncio handler API."""
+
+import asyncio
+import threading
+
+import pytest
+import yaml
+
+from cddoc import aio
+from cddoc.concurrency import REVISION_FIELD
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.handlers.spec_handler import SpecHandlerError
+from cddoc.new_ticket import TicketCreationError
+from cddoc.project import forget_project_roots
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd" / "templates").mkdir(parents=True)
+    (
+        tmp_path / ".cdd" / "templates" / "feature-ticket-template.yaml"
+    ).write_text(
+        "title: '[Feature name]'\nticket:\n  type: feature\n  status: draft\n"
+    )
+    forget_project_roots()
+    yield tmp_path
+    forget_project_roots()
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    aio.configure(max_workers=4)
+    yield
+    aio.shutdown()
+
+
+def _write_spec(directory, title):
+    directory.mkdir(parents=True)
+    path = directory / "spec.yaml"
+    path.write_text(
+        yaml.safe_dump({"title": title, "ticket": {"status": "draft"}})
+    )
+    return path
+
+
+def test_read_specs_concurrently(tmp_path):
+    paths = [_write_spec(tmp_path / f"t{i}", f"Ticket {i}") for i in range(5)]
+
+    specs = asyncio.run(aio.SpecHandler.read_specs(paths))
+
+    assert [s["title"] for s in specs] == [f"Ticket {i}" for i in range(5)]
+
+
+def test_read_specs_return_exceptions(tmp_path):
+    good = _write_spec(tmp_path / "good", "Good")
+
+    results = asyncio.run(
+        aio.SpecHandler.read_specs(
+            [good, tmp_path / "missing.yaml"], return_exceptions=True
+        )
+    )
+
+    assert results[0]["title"] == "Good"
+    assert isinstance(results[1], SpecHandlerError)
+    with pytest.raises(SpecHandlerError):
+        asyncio.run(aio.SpecHandler.read_specs([tmp_path / "missing.yaml"]))
+
+
+def test_update_status_and_get_status(tmp_path):
+    path = _write_spec(tmp_path / "t", "Ticket")
+
+    async def scenario():
+        await aio.SpecHandler.update_status(path, "planned")
+        return await aio.SpecHandler.get_status(path)
+
+    assert asyncio.run(scenario()) == "planned"
+
+
+def test_update_progress(tmp_path):
+    path = tmp_path / "progress.yaml"
+    asyncio.run(
+        aio.ProgressHandler.write_progress(
+            path,
+            ProgressHandler.initialize_progress(
+                tmp_path / "plan.md", tmp_path / "spec.yaml"
+            ),
+        )
+    )
+
+    async def scenario():
+        await asyncio.gather(
+            *(
+                aio.ProgressHandler.update_progress(
+                    path, lambda data, i=i: data["issues"].append(i)
+                )
+                for i in range(8)
+            )
+        )
+        return await aio.ProgressHandler.read_progress(path)
+
+    data = asyncio.run(scenario())
+
+    assert sorted(data["issues"]) == list(range(8))
+    assert data[REVISION_FIELD] == 9
+
+
+def test_archive_and_restore(tmp_path):
+    ticket = tmp_path / "specs" / "tickets" / "feature-x"
+    _write_spec(ticket, "X")
+    archive = tmp_path / "specs" / "archive"
+
+    async def scenario():
+        archived = await aio.ArchiveHandler.archive_ticket(ticket, archive)
+        listed = await aio.ArchiveHandler.list_archived_tickets(archive)
+        restored = await aio.ArchiveHandler.restore_ticket(
+            archived, ticket.parent
+        )
+        return archived, listed, restored
+
+    archived, listed, restored = asyncio.run(scenario())
+
+    assert listed == [archived]
+    assert restored == ticket
+    assert (ticket / "spec.yaml").exists()
+
+
+def test_create_ticket(project):
+    result = asyncio.run(aio.create_ticket(project, "feature", "CSV Export"))
+
+    assert result["normalized_name"] == "csv-export"
+    assert result["ticket_path"].joinpath("spec.yaml").exists()
+    with pytest.raises(TicketCreationError, match="already exists"):
+        asyncio.run(aio.create_ticket(project, "feature", "csv export"))
+
+
+def test_cancel_queued_operation(tmp_path):
+    """Test cancelling a queued call keeps it from ever running."""
+    aio.configure(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+    ran = []
+
+    def blocker():
+        started.set()
+        release.wait(5)
+
+    async def scenario():
+        first = asyncio.create_task(aio.run_blocking(blocker))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        queued = asyncio.create_task(aio.run_blocking(ran.append, 1))
+        await asyncio.sleep(0)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await first
+        await aio.run_blocking(lambda: None)
+
+    asyncio.run(scenario())
+
+    assert ran == []
+
+
+def test_configure_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        aio.configure(max_workers=0)
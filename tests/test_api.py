@@ -0,0 +1,183 @@
+"""Tests for the Repository library API."""
+
+import pytest
+
+from cddoc.api import Repository, RepositoryError
+from cddoc.handlers.archive_handler import ArchiveHandlerError
+from cddoc.handlers.spec_handler import SpecHandler
+from cddoc.new_ticket import TicketCreationError
+from cddoc.path_resolver import PathResolutionError
+
+TEMPLATE = (
+    "title: '[Feature name]'\n"
+    "ticket:\n"
+    "  type: feature\n"
+    "  status: draft\n"
+    "  created: [auto-generated]\n"
+)
+
+
+def _make_project(path, language="en"):
+    (path / ".cdd" / "templates").mkdir(parents=True)
+    (path / ".cdd" / "templates" / "feature-ticket-template.yaml").write_text(
+        TEMPLATE
+    )
+    (path / ".cdd" / "config.yaml").write_text(f"language: {language}\n")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return Repository(_make_project(tmp_path))
+
+
+def test_rejects_non_project(tmp_path):
+    with pytest.raises(RepositoryError, match="Not a CDD project"):
+        Repository(tmp_path)
+
+
+def test_create_and_read_ticket(repo):
+    result = repo.create_ticket("feature", "CSV Export")
+
+    assert (
+        result["ticket_path"] == repo.root / "specs/tickets/feature-csv-export"
+    )
+    assert result["overwritten"] is False
+    spec = repo.read_spec("feature-csv-export")
+    assert spec["ticket"]["status"] == "draft"
+    assert "[auto-generated]" not in str(spec["ticket"]["created"])
+    assert repo.ticket_names() == ["feature-csv-export"]
+
+    with pytest.raises(TicketCreationError, match="already exists"):
+        repo.create_ticket("feature", "csv export")
+    assert repo.create_ticket("feature", "csv export", overwrite=True)[
+        "overwritten"
+    ]
+
+
+def test_missing_template(repo):
+    with pytest.raises(TicketCreationError, match="Template not found"):
+        repo.create_ticket("spike", "research")
+
+
+def test_spec_cache_tracks_external_writes(repo):
+    repo.create_ticket("feature", "export")
+    first = repo.read_spec("feature-export")
+    first["title"] = "Changed locally"
+
+    assert repo.read_spec("feature-export")["title"] == "[Feature name]"
+
+    spec_path = repo.resolve("feature-export")
+    data = SpecHandler.read_spec(spec_path)
+    data["title"] = "Changed on disk"
+    SpecHandler.write_spec(spec_path, data)
+
+    assert repo.read_spec("feature-export")["title"] == "Changed on disk"
+
+
+@pytest.mark.parametrize(
+    "name", ["../../../outside", "..", ".", "", "a/b", "a\\b", "../specs"]
+)
+def test_ticket_names_cannot_leave_the_project(repo, name):
+    (repo.root / "specs" / "tickets").mkdir(parents=True)
+
+    for operation in (
+        lambda: repo.resolve(name),
+        lambda: repo.write_spec(name, {}),
+        lambda: repo.write_progress(name, {}),
+        lambda: repo.archive_ticket(name),
+        lambda: repo.restore_ticket(name),
+    ):
+        with pytest.raises(PathResolutionError):
+            operation()
+    assert not (repo.root.parent / "outside").exists()
+
+
+def test_resolve_keeps_files_inside_the_ticket(repo):
+    repo.create_ticket("feature", "export")
+
+    with pytest.raises(PathResolutionError, match="Invalid ticket file"):
+        repo.resolve("feature-export", "../../../../spec.yaml")
+    assert repo.resolve("feature-export", "notes/a.md") == (
+        repo.root / "specs/tickets/feature-export/notes/a.md"
+    )
+
+
+def test_status_and_progress(repo):
+    repo.create_ticket("feature", "export")
+    repo.update_status("feature-export", "planned")
+
+    assert repo.get_status("feature-export") == "planned"
+
+    (repo.resolve("feature-export", "plan.md")).write_text(
+        "# Plan\n\n## Implementation Steps\n\n### Step 1: Do it\n"
+    )
+    seeded = repo.seed_progress("feature-export")
+    assert [s["description"] for s in seeded["steps"]] == ["Do it"]
+
+    updated = repo.update_progress(
+        "feature-export", lambda data: data["issues"].append("slow")
+    )
+    assert updated["issues"] == ["slow"]
+    assert repo.read_progress("feature-export")["issues"] == ["slow"]
+
+
+def test_list_tickets_with_and_without_index(tmp_path):
+    root = _make_project(tmp_path)
+    with Repository(root) as repo:
+        repo.create_ticket("feature", "export")
+        repo.update_status("feature-export", "planned")
+        entries = repo.list_tickets()
+
+    assert [(e["name"], e["status"]) for e in entries] == [
+        ("feature-export", "planned")
+    ]
+    assert (root / ".cdd/cache/index.json").exists()
+
+    plain = Repository(root, use_index=False)
+    assert plain.index is None
+    assert [e["status"] for e in plain.list_tickets("tickets")] == ["planned"]
+
+
+def test_archive_and_restore(repo):
+    repo.create_ticket("feature", "export")
+    repo.list_tickets()
+
+    archived = repo.archive_ticket("feature-export")
+
+    assert archived == repo.root / "specs/archive/feature-export"
+    assert repo.ticket_names() == []
+    assert repo.ticket_names("archive") == ["feature-export"]
+    assert [e["location"] for e in repo.index.list_tickets()] == ["archive"]
+
+    restored = repo.restore_ticket("feature-export")
+
+    assert restored == repo.root / "specs/tickets/feature-export"
+    assert [e["location"] for e in repo.index.list_tickets()] == ["tickets"]
+    repo.archive_ticket("feature-export")
+    repo.create_ticket("feature", "export")
+    with pytest.raises(ArchiveHandlerError, match="already exists"):
+        repo.archive_ticket("feature-export")
+
+
+def test_unknown_ticket_suggests_names(repo):
+    repo.create_ticket("feature", "export")
+
+    with pytest.raises(PathResolutionError, match="feature-export"):
+        repo.read_spec("feature-exprot")
+    with pytest.raises(RepositoryError, match="Unknown ticket location"):
+        repo.ticket_names("trash")
+
+
+def test_many_repositories(tmp_path):
+    first = Repository(_make_project(tmp_path / "a", "en"))
+    second = Repository(_make_project(tmp_path / "b", "pt-br"))
+
+    first.create_ticket("feature", "export")
+
+    assert first.language == "en"
+    assert second.language == "pt-br"
+    assert second.ticket_names() == []
+
+    (second.config_path).write_text("language: en\n")
+    assert second.language == "en"
@@ -0,0 +1,197 @@
+"""Tests for the JSON-lines batch protocol."""
+
+import json
+import subprocess
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from cddoc import batch
+from cddoc.api import Repository
+from cddoc.batch import BatchRunner, parse_request, request_keys, run_batch
+from cddoc.cli import main
+from cddoc.output import set_mode
+from cddoc.project import forget_project_roots
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    monkeypatch.chdir(tmp_path)
+    forget_project_roots()
+    result = CliRunner().invoke(main, ["init", "--language", "en"])
+    assert result.exit_code == 0, result.output
+    yield tmp_path
+    set_mode("rich")
+    forget_project_roots()
+
+
+def request(id, op, **args):
+    return json.dumps({"id": id, "op": op, "args": args})
+
+
+def run(root, lines, jobs=1):
+    responses = []
+    failed = run_batch(Repository(root), lines, responses.append, jobs)
+    return failed, [json.loads(line) for line in responses]
+
+
+def test_agent_sequence_with_per_request_errors(project):
+    lines = [
+        request(1, "create_ticket", type="feature", name="User Auth"),
+        request(2, "resolve", ticket="feature-user-auth", file="plan.md"),
+        request(
+            3, "update_status", ticket="feature-user-auth", status="planned"
+        ),
+        request(4, "get_status", ticket="feature-usr-auth"),
+        "{not json",
+        "",
+        json.dumps({"id": "x", "op": "explode"}),
+        request(5, "update_status", ticket="feature-user-auth", status="?"),
+        request(6, "archive", ticket="feature-user-auth"),
+        request(
+            7, "get_status", ticket="feature-user-auth", location="archive"
+        ),
+    ]
+    failed, responses = run(project, lines)
+
+    assert [r["id"] for r in responses] == [1, 2, 3, 4, None, "x", 5, 6, 7]
+    assert failed == 4
+    assert responses[1]["result"].endswith("feature-user-auth/plan.md")
+    assert responses[3]["error"]["type"] == "PathResolutionError"
+    assert "feature-user-auth" in responses[3]["error"]["message"]
+    assert responses[4]["error"]["type"] == "BatchError"
+    assert "Unknown operation" in responses[5]["error"]["message"]
+    assert "must be one of" in responses[6]["error"]["message"]
+    assert responses[8] == {"id": 7, "ok": True, "result": "planned"}
+    assert (project / "specs/archive/feature-user-auth").is_dir()
+
+
+def test_ticket_names_cannot_escape_the_project(project):
+    lines = [
+        request(1, "write_spec", ticket="../../../outside", data={}),
+        request(2, "resolve", ticket="feature-x/../../..", file="spec.yaml"),
+    ]
+    failed, responses = run(project, lines)
+
+    assert failed == 2
+    assert {r["error"]["type"] for r in responses} == {"PathResolutionError"}
+    assert not (project.parent.parent / "outside").exists()
+
+
+def test_progress_operations(project):
+    ticket = project / "specs/tickets/feature-export"
+    lines = [
+        request(1, "create_ticket", type="feature", name="export"),
+        request(2, "read_progress", ticket="feature-export"),
+    ]
+    _, responses = run(project, lines)
+    assert responses[1]["error"]["type"] == "ProgressHandlerError"
+
+    (ticket / "plan.md").write_text(
+        "# Plan\n\n## Implementation Steps\n\n"
+        "### Step 1: Write the exporter\n\n### Step 2: Add the button\n"
+    )
+    lines = [
+        request(1, "seed_progress", ticket="feature-export"),
+        request(
+            2,
+            "update_progress",
+            ticket="feature-export",
+            set={"status": "blocked"},
+            steps={"2": {"status": "completed"}},
+        ),
+    ]
+    failed, responses = run(project, lines)
+    assert failed == 0
+    progress = responses[1]["result"]
+    assert progress["status"] == "blocked"
+    assert [step["status"] for step in progress["steps"]] == [
+        "pending",
+        "completed",
+    ]
+
+
+def test_request_keys():
+    assert request_keys(parse_request(request(1, "list_tickets"))) is None
+    create = parse_request(
+        request(1, "create_ticket", type="bug", name="Login Crash")
+    )
+    assert request_keys(create) == {"bug-login-crash"}
+    status = parse_request(request(1, "get_status", ticket="bug-login-crash"))
+    assert request_keys(status) == {"bug-login-crash"}
+
+
+@pytest.fixture
+def slow_op(monkeypatch):
+    """Operation sleeping `seconds`, then logging its `n`."""
+    log = []
+    lock = threading.Lock()
+
+    def sleep(repo, args):
+        time.sleep(args.get("seconds", 0.2))
+        with lock:
+            log.append(args.get("n"))
+        return args.get("n")
+
+    monkeypatch.setitem(batch.OPERATIONS, "sleep", sleep)
+    return log
+
+
+def test_jobs_run_independent_tickets_concurrently(project, slow_op):
+    lines = [request(n, "sleep", ticket=f"t{n}", n=n) for n in range(4)]
+    started = time.monotonic()
+    failed, responses = run(project, lines, jobs=4)
+    elapsed = time.monotonic() - started
+
+    assert failed == 0
+    assert [r["result"] for r in responses] == [0, 1, 2, 3]
+    assert elapsed < 0.6
+
+
+def test_jobs_keep_same_ticket_and_barriers_in_order(project, slow_op):
+    lines = [
+        request(0, "sleep", ticket="a", n=0, seconds=0.2),
+        request(1, "sleep", ticket="b", n=1, seconds=0.05),
+        request(2, "sleep", ticket="a", n=2, seconds=0),
+        request(3, "list_tickets"),
+        request(4, "sleep", ticket="c", n=4, seconds=0),
+    ]
+    failed, responses = run(project, lines, jobs=4)
+
+    assert failed == 0
+    assert [r["id"] for r in responses] == [0, 1, 2, 3, 4]
+    assert slow_op.index(0) < slow_op.index(2)
+    assert slow_op.index(1) < slow_op.index(2)
+    assert slow_op[-1] == 4
+
+
+def test_responses_stream_before_input_ends(project):
+    written = []
+    runner = BatchRunner(Repository(project), written.append)
+    runner.submit(request(1, "get_status", ticket="missing"))
+    assert len(written) == 1
+    assert runner.close() == 1
+
+
+def test_cli_batch_stdin(project):
+    lines = "\n".join(
+        [
+            request(1, "create_ticket", type="spike", name="cache"),
+            request(2, "get_status", ticket="spike-cache"),
+        ]
+    )
+    result = CliRunner().invoke(main, ["batch", "--stdin", "-j", "2"], lines)
+    assert result.exit_code == 0, result.output
+    responses = [json.loads(line) for line in result.output.splitlines()]
+    assert [r["id"] for r in responses] == [1, 2]
+
+    failing = CliRunner().invoke(
+        main, ["batch", "--stdin"], request(1, "read_spec", ticket="nope")
+    )
+    assert failing.exit_code == 1
+
+    usage = CliRunner().invoke(main, ["batch"])
+    assert usage.exit_code == 2
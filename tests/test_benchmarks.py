@@ -0,0 +1,172 @@
+"""Tests for the benchmark suite's fixtures, statistics and runner."""
+
+import json
+from typing import get_args
+
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.fixtures import LARGE_TICKET, generate_project, get_fixture
+from benchmarks.runner import (
+    RESULTS_VERSION,
+    load_results,
+    run_case,
+    save_results,
+)
+from benchmarks.stats import compare_results, mann_whitney_u, summarize
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.handlers.spec_handler import SpecHandler, TicketStatus
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    return get_fixture(
+        20, tmp_path_factory.mktemp("fixtures"), progress_steps=30
+    )
+
+
+def test_generate_project_layout(tmp_path):
+    root = generate_project(tmp_path / "p", 10, progress_steps=12, seed=3)
+
+    tickets = sorted(p.name for p in (root / "specs" / "tickets").iterdir())
+    assert len(tickets) == 11
+    assert LARGE_TICKET in tickets
+    assert len(list((root / "specs" / "archive").iterdir())) == 1
+    assert (root / ".cdd" / "templates").is_dir()
+
+    progress = ProgressHandler.read_progress(
+        root / "specs" / "tickets" / LARGE_TICKET / "progress.yaml"
+    )
+    assert len(progress["steps"]) == 12
+    for name in tickets:
+        spec = SpecHandler.read_spec(
+            root / "specs" / "tickets" / name / "spec.yaml"
+        )
+        assert spec["ticket"]["type"] == name.split("-", 1)[0]
+        assert spec["ticket"]["status"] in get_args(TicketStatus)
+
+
+def test_generate_project_is_deterministic(tmp_path):
+    first = generate_project(tmp_path / "a", 5, progress_steps=3, seed=1)
+    second = generate_project(tmp_path / "b", 5, progress_steps=3, seed=1)
+
+    def _files(root):
+        return {
+            str(p.relative_to(root)): p.read_bytes()
+            for p in (root / "specs").rglob("*")
+            if p.is_file()
+        }
+
+    assert _files(first) == _files(second)
+
+
+def test_get_fixture_reuses_generated_project(tmp_path):
+    root = get_fixture(3, tmp_path, progress_steps=2)
+    (root / "sentinel").touch()
+
+    assert get_fixture(3, tmp_path, progress_steps=2) == root
+    assert (root / "sentinel").exists()
+
+
+def test_mann_whitney_identical_samples():
+    _, p_value = mann_whitney_u([1.0] * 10, [1.0] * 10)
+
+    assert p_value == 1.0
+
+
+def test_mann_whitney_detects_shift():
+    old = [1.0 + i * 0.01 for i in range(20)]
+    new = [1.5 + i * 0.01 for i in range(20)]
+
+    u, p_value = mann_whitney_u(old, new)
+
+    assert u == 0
+    assert p_value < 0.001
+
+
+def test_mann_whitney_overlapping_samples():
+    old = [1.0, 1.2, 1.1, 1.3, 1.05, 1.25, 1.15, 1.22, 1.08, 1.18]
+    new = [1.12, 1.02, 1.28, 1.1, 1.21, 1.06, 1.16, 1.3, 1.01, 1.19]
+
+    _, p_value = mann_whitney_u(old, new)
+
+    assert p_value > 0.5
+
+
+def test_summarize():
+    summary = summarize([3.0, 1.0, 2.0])
+
+    assert summary["median"] == 2.0
+    assert summary["mean"] == 2.0
+    assert summary["min"] == 1.0
+    assert summary["stdev"] == pytest.approx(1.0)
+
+
+def test_compare_results_verdicts():
+    base = [1.0 + i * 0.001 for i in range(15)]
+    old = {
+        "slower": summarize(base),
+        "faster": summarize(base),
+        "noise": summarize(base),
+        "removed": summarize(base),
+    }
+    new = {
+        "slower": summarize([x * 1.5 for x in base]),
+        "faster": summarize([x * 0.5 for x in base]),
+        "noise": summarize([x * 1.01 for x in base]),
+        "added": summarize(base),
+    }
+
+    verdicts = {
+        c["name"]: c["verdict"] for c in compare_results(old, new, 0.01, 0.05)
+    }
+
+    assert verdicts == {
+        "faster": "improvement",
+        "noise": "unchanged",
+        "slower": "regression",
+    }
+
+
+@pytest.mark.parametrize(
+    "name", [name for name in CASES if not name.startswith("cli.")]
+)
+def test_case_runs_and_restores_fixture(project, name):
+    def _snapshot():
+        return {
+            str(p.relative_to(project)): p.read_bytes()
+            for p in (project / "specs").rglob("*")
+            if p.is_file()
+        }
+
+    before = _snapshot()
+
+    samples = run_case(CASES[name], project, repeat=2, min_sample=0)
+
+    assert len(samples) == 2
+    assert all(sample > 0 for sample in samples)
+    assert _snapshot() == before
+
+
+def test_results_round_trip(tmp_path):
+    results = {
+        "version": RESULTS_VERSION,
+        "commit": "abc",
+        "python": "3.11.0",
+        "platform": "linux-x86_64",
+        "timestamp": "2025-01-01T00:00:00+00:00",
+        "results": {"case[10]": summarize([1.0, 2.0])},
+    }
+    path = tmp_path / "results" / "abc.json"
+
+    save_results(results, path)
+
+    assert load_results(path) == results
+
+
+def test_load_results_rejects_other_versions(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({"version": RESULTS_VERSION + 1}))
+
+    with pytest.raises(ValueError):
+        load_results(path)
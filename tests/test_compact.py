@@ -0,0 +1,126 @@
+"""Tests for compact module."""
+
+import pytest
+from cddoc.compact import (
+    BANNER_MARKER,
+    COMPACT_BANNER,
+    compact_command,
+    compact_packaged_commands,
+    main,
+    split_blocks,
+    verify_compact,
+)
+from cddoc.fragments import assemble_packaged_commands
+from cddoc.init import (
+    SUPPORTED_LANGUAGES,
+    initialize_projects,
+    install_framework_commands,
+)
+
+BANNER = """<!--
+═══════════════════════════
+CDD FRAMEWORK COMMAND - DO NOT MODIFY
+
+Command: /test
+═══════════════════════════
+-->
+
+"""
+
+REMINDER = (
+    "Always read the spec before writing code, and never skip the "
+    "acceptance criteria when verifying the result."
+)
+
+
+def test_compact_replaces_banner():
+    """The long banner becomes a one-line marker."""
+    compact = compact_command(BANNER + "# Title\n\nBody\n")
+
+    assert compact.startswith(COMPACT_BANNER)
+    assert "Command: /test" not in compact
+    assert BANNER_MARKER in compact
+
+
+def test_compact_normalizes_whitespace_and_rules():
+    """Trailing spaces, blank-line runs and rules are removed."""
+    text = "# Title   \n\n\n\nFirst line  \n\n---\n\n## Next\n"
+
+    compact = compact_command(text)
+
+    assert compact == COMPACT_BANNER + "\n\n# Title\n\nFirst line\n\n## Next\n"
+
+
+def test_compact_keeps_code_fences_verbatim():
+    """Blank lines and spacing inside fenced code are untouched."""
+    text = "# Title\n\n```yaml\nkey: value  \n\n\nother: 1\n```\n"
+
+    compact = compact_command(text)
+
+    assert "```yaml\nkey: value  \n\n\nother: 1\n```" in compact
+    assert split_blocks(text)[1].startswith("```yaml")
+
+
+def test_compact_drops_repeated_blocks():
+    """Long blocks repeated later in a file are kept once."""
+    text = f"# A\n\n{REMINDER}\n\n# B\n\n{REMINDER}\n\nShort\n\nShort\n"
+
+    compact = compact_command(text)
+
+    assert compact.count(REMINDER) == 1
+    assert compact.count("Short") == 2
+    assert compact.count("# ") == 2
+
+
+def test_verify_compact_detects_losses():
+    """Missing headings and blocks are reported."""
+    original = "# Title\n\n## Step 1\n\nDo the thing\n"
+
+    assert verify_compact(original, compact_command(original)) == []
+
+    problems = verify_compact(original, COMPACT_BANNER + "\n\n# Title\n")
+    assert "headings differ from the source" in problems
+    assert "missing block: Do the thing" in problems
+
+    problems = verify_compact(original, original)
+    assert "framework marker missing" in problems
+
+
+@pytest.mark.parametrize("language", SUPPORTED_LANGUAGES)
+def test_packaged_commands_compact_losslessly(language):
+    """Every packaged command has a smaller, verified compact build."""
+    originals = dict(assemble_packaged_commands(language))
+
+    for name, data in compact_packaged_commands(language):
+        original = originals[name].decode("utf-8")
+        compact = data.decode("utf-8")
+        assert verify_compact(original, compact) == []
+        assert len(compact) < len(original)
+
+
+def test_main_reports_every_command(capsys):
+    """The build check passes and lists every language and command."""
+    assert main() == 0
+
+    output = capsys.readouterr().out
+    assert "en/socrates.md" in output
+    assert "pt-br/plan.md" in output
+    assert "LOSSY" not in output
+
+
+def test_install_compact_commands(tmp_path):
+    """init --compact installs the compact builds."""
+    installed = install_framework_commands(tmp_path, "en", compact=True)
+
+    assert len(installed) == 4
+    content = (tmp_path / ".claude" / "commands" / "socrates.md").read_text()
+    assert content.startswith(COMPACT_BANNER)
+
+
+def test_initialize_projects_compact(tmp_path):
+    """Multi-project init passes the compact option through."""
+    results = initialize_projects([tmp_path / "a"], "en", compact=True)
+
+    assert "error" not in results[0]
+    plan = tmp_path / "a" / ".claude" / "commands" / "plan.md"
+    assert plan.read_text().startswith(COMPACT_BANNER)
@@ -0,0 +1,237 @@
+"""Tests for cross-process locking and revision checks."""
+
+import json
+import multiprocessing
+import os
+import socket
+import time
+
+import pytest
+import yaml
+
+from cddoc import concurrency
+from cddoc.concurrency import (
+    REVISION_FIELD,
+    ConcurrencyError,
+    RevisionConflictError,
+    current_revision,
+    is_stale,
+    lock_path_for,
+    locked,
+)
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.handlers.spec_handler import SpecHandler
+from cddoc.project import forget_project_roots
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    forget_project_roots()
+    yield tmp_path
+    forget_project_roots()
+
+
+@pytest.fixture
+def spec_path(project):
+    path = project / "specs" / "tickets" / "feature-x" / "spec.yaml"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        yaml.safe_dump({"title": "X", "ticket": {"status": "draft"}})
+    )
+    return path
+
+
+@pytest.fixture
+def progress_path(project):
+    path = project / "specs" / "tickets" / "feature-x" / "progress.yaml"
+    data = ProgressHandler.initialize_progress(
+        path.with_name("plan.md"), path.with_name("spec.yaml")
+    )
+    ProgressHandler.write_progress(path, data)
+    return path
+
+
+def _hold_lock(path, ready, release):
+    with locked(path):
+        ready.set()
+        release.wait(10)
+
+
+def _dead_pid():
+    process = multiprocessing.get_context("fork").Process(target=int)
+    process.start()
+    process.join()
+    return process.pid
+
+
+def _append_issues(path, count):
+    forget_project_roots()
+    for i in range(count):
+        ProgressHandler.update_progress(
+            path,
+            lambda data: data["issues"].append(
+                {
+                    "timestamp": str(i),
+                    "type": "runtime_error",
+                    "description": f"{os.getpid()}-{i}",
+                    "resolution": None,
+                    "resolved_at": None,
+                }
+            ),
+        )
+
+
+def test_lock_files_live_in_project_cache(spec_path, project):
+    lock_path = lock_path_for(spec_path)
+
+    assert lock_path.parent == project / ".cdd" / "cache" / "locks"
+    assert lock_path.name.startswith("spec.yaml-")
+    assert lock_path_for(spec_path.with_name("progress.yaml")) != lock_path
+
+
+def test_lock_outside_project_is_hidden_sibling(tmp_path):
+    target = tmp_path / "loose.yaml"
+    assert lock_path_for(target) == tmp_path / ".loose.yaml.lock"
+
+
+def test_lock_is_reentrant_and_records_holder(spec_path):
+    with locked(spec_path) as lock_path:
+        with locked(spec_path):
+            pass
+        holder = json.loads(lock_path.read_text())
+        assert holder["pid"] == os.getpid()
+        assert holder["host"] == socket.gethostname()
+
+
+def test_lock_times_out_while_another_process_holds_it(spec_path):
+    ctx = multiprocessing.get_context("fork")
+    ready, release = ctx.Event(), ctx.Event()
+    holder = ctx.Process(target=_hold_lock, args=(spec_path, ready, release))
+    holder.start()
+    try:
+        assert ready.wait(10)
+        started = time.monotonic()
+        with pytest.raises(ConcurrencyError, match=f"pid {holder.pid}"):
+            with locked(spec_path, timeout=0.2):
+                pass
+        assert time.monotonic() - started >= 0.2
+    finally:
+        release.set()
+        holder.join(10)
+
+    with locked(spec_path, timeout=1):
+        pass
+
+
+def test_fallback_lock_breaks_stale_lock(spec_path, monkeypatch):
+    monkeypatch.setattr(concurrency, "fcntl", None)
+    lock_path = lock_path_for(spec_path)
+    dead = _dead_pid()
+    lock_path.write_text(
+        json.dumps(
+            {
+                "pid": dead,
+                "host": socket.gethostname(),
+                "acquired_at": time.time(),
+            }
+        )
+    )
+    assert is_stale(lock_path)
+
+    with locked(spec_path, timeout=0.5):
+        assert json.loads(lock_path.read_text())["pid"] == os.getpid()
+    assert not lock_path.exists()
+
+
+def test_fallback_lock_times_out_on_live_holder(spec_path, monkeypatch):
+    monkeypatch.setattr(concurrency, "fcntl", None)
+    lock_path = lock_path_for(spec_path)
+    lock_path.write_text(
+        json.dumps(
+            {
+                "pid": os.getppid(),
+                "host": socket.gethostname(),
+                "acquired_at": time.time(),
+            }
+        )
+    )
+
+    with pytest.raises(ConcurrencyError, match="Timed out"):
+        with locked(spec_path, timeout=0.1):
+            pass
+    with locked(spec_path, timeout=0.5, stale_after=0):
+        pass
+
+
+def test_writes_increment_revision(spec_path):
+    assert current_revision(spec_path) == 0
+
+    SpecHandler.update_status(spec_path, "planned")
+    SpecHandler.update_status(spec_path, "in_progress")
+
+    data = SpecHandler.read_spec(spec_path)
+    assert data[REVISION_FIELD] == 2
+    assert data["ticket"]["status"] == "in_progress"
+
+
+def test_revision_is_kept_out_of_ticket_files(spec_path, progress_path):
+    SpecHandler.update_status(spec_path, "planned")
+    ProgressHandler.update_progress(progress_path, lambda data: None)
+
+    assert REVISION_FIELD not in yaml.safe_load(spec_path.read_text())
+    assert REVISION_FIELD not in yaml.safe_load(progress_path.read_text())
+    assert concurrency.revision_path_for(spec_path).parent == (
+        lock_path_for(spec_path).parent
+    )
+    assert SpecHandler.read_spec(spec_path)[REVISION_FIELD] == 1
+
+
+def test_own_revision_field_survives_round_trip(spec_path):
+    spec_path.write_text("title: X\nticket:\n  status: draft\nrevision: 7\n")
+
+    data = SpecHandler.read_spec(spec_path)
+    assert data["revision"] == 7
+    SpecHandler.write_spec(spec_path, data)
+    SpecHandler.update_status(spec_path, "planned")
+
+    assert yaml.safe_load(spec_path.read_text())["revision"] == 7
+    assert SpecHandler.read_spec(spec_path)["revision"] == 7
+
+
+def test_stale_write_is_rejected(spec_path):
+    stale = SpecHandler.read_spec(spec_path)
+    SpecHandler.update_status(spec_path, "planned")
+
+    stale["title"] = "Overwritten"
+    with pytest.raises(RevisionConflictError, match="revision 0, now 1"):
+        SpecHandler.write_spec(spec_path, stale)
+
+    assert SpecHandler.read_spec(spec_path)["title"] == "X"
+
+
+def test_sequential_writes_of_same_data_succeed(progress_path):
+    data = ProgressHandler.read_progress(progress_path)
+
+    ProgressHandler.write_progress(progress_path, data)
+    ProgressHandler.write_progress(progress_path, data)
+
+    assert current_revision(progress_path) == 3
+    assert ProgressHandler.read_progress(progress_path)[REVISION_FIELD] == 3
+
+
+def test_concurrent_updates_lose_nothing(progress_path):
+    ctx = multiprocessing.get_context("fork")
+    workers = [
+        ctx.Process(target=_append_issues, args=(progress_path, 10))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    data = ProgressHandler.read_progress(progress_path)
+    assert len(data["issues"]) == 40
+    assert data[REVISION_FIELD] == 41
@@ -0,0 +1,141 @@
+"""Tests for token-budgeted context packs."""
+
+import pytest
+import yaml
+
+from cddoc.context import (
+    ContextError,
+    build_context,
+    collect_inputs,
+    fit_to_budget,
+    truncate_markdown,
+)
+from cddoc.tokens import estimate_tokens
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd" / "templates").mkdir(parents=True)
+    (tmp_path / "CLAUDE.md").write_text("# Project\n\nPython 3.11, click.\n")
+    (tmp_path / ".cdd" / "templates" / "bug-plan-template.md").write_text(
+        "# Bug Plan\n\n## Root cause\n"
+    )
+    (tmp_path / ".cdd" / "templates" / "feature-plan-template.md").write_text(
+        "# Feature Plan\n"
+    )
+    ticket = tmp_path / "specs" / "tickets" / "bug-export-crash"
+    ticket.mkdir(parents=True)
+    (ticket / "spec.yaml").write_text(
+        yaml.safe_dump(
+            {"title": "Export crashes on empty CSV", "ticket": {"type": "bug"}}
+        )
+    )
+    (ticket / "plan.md").write_text("# Plan\n\n1. Guard empty rows\n")
+    docs = tmp_path / "docs" / "features"
+    docs.mkdir(parents=True)
+    (docs / "export.md").write_text("# CSV Export\n\nExport writes CSV.\n")
+    (docs / "auth.md").write_text("# Auth\n\nLogin flow.\n")
+    return tmp_path
+
+
+def _ticket(project):
+    return project / "specs" / "tickets" / "bug-export-crash"
+
+
+def test_plan_pack_sections(project):
+    """Test /plan packs use the type's template and related docs."""
+    pack = build_context(_ticket(project), "plan", project_root=project)
+
+    assert [(s["name"], s["path"]) for s in pack["sections"]] == [
+        ("constitution", "CLAUDE.md"),
+        ("template", ".cdd/templates/bug-plan-template.md"),
+        ("docs", "docs/features/export.md"),
+        ("spec", "specs/tickets/bug-export-crash/spec.yaml"),
+    ]
+    assert "Feature Plan" not in pack["text"]
+    assert pack["text"].startswith('<file section="constitution"')
+
+
+def test_exec_pack_sections(project):
+    """Test /exec packs include the plan and seeded progress."""
+    pack = build_context(_ticket(project), "exec", project_root=project)
+
+    names = [s["name"] for s in pack["sections"]]
+    assert names == ["constitution", "docs", "spec", "plan", "progress"]
+    assert (_ticket(project) / "progress.yaml").exists()
+
+
+def test_stable_prefix_across_tickets(project):
+    """Test tickets of a type share the pack prefix up to their spec."""
+    other = project / "specs" / "tickets" / "bug-export-timeout"
+    other.mkdir()
+    (other / "spec.yaml").write_text(
+        "title: Export times out on CSV\nticket:\n  type: bug\n"
+    )
+
+    first = build_context(_ticket(project), project_root=project)["text"]
+    second = build_context(other, project_root=project)["text"]
+
+    prefix = first.split('<file section="spec"')[0]
+    assert second.startswith(prefix)
+
+
+def test_cached_until_inputs_change(project):
+    """Test packs are reused until an input's content changes."""
+    first = build_context(_ticket(project), project_root=project)
+    second = build_context(_ticket(project), project_root=project)
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["text"] == first["text"]
+
+    (project / "CLAUDE.md").write_text("# Project\n\nPython 3.12.\n")
+    third = build_context(_ticket(project), project_root=project)
+
+    assert third["cached"] is False
+    assert "3.12" in third["text"]
+
+
+def test_budget_trims_low_priority_sections(project):
+    """Test docs are trimmed before the spec when over budget."""
+    long_doc = "# CSV Export\n\nIntro.\n" + "".join(
+        f"## Part {i}\n\n" + "csv export " * 200 + "\n" for i in range(20)
+    )
+    (project / "docs" / "features" / "export.md").write_text(long_doc)
+
+    pack = build_context(
+        _ticket(project), budget=1000, project_root=project, use_cache=False
+    )
+
+    sections = {s["name"]: s for s in pack["sections"]}
+    assert sections["docs"]["truncated"] is True
+    assert sections["spec"]["truncated"] is False
+    assert pack["tokens"] <= 1000
+    assert "## Part 19" not in pack["text"]
+
+
+def test_spec_always_included(project):
+    """Test the spec is kept whole even when it exceeds the budget."""
+    inputs = collect_inputs(_ticket(project), "plan", project)
+
+    fitted = fit_to_budget(inputs, budget=1)
+
+    assert [item["name"] for item in fitted] == ["spec"]
+
+
+def test_truncate_at_headings():
+    """Test truncation keeps whole Markdown sections."""
+    text = "# A\n" + "x" * 100 + "\n# B\n" + "y" * 400 + "\n"
+
+    trimmed = truncate_markdown(text, 60)
+
+    assert trimmed.startswith("# A\n")
+    assert "# B" not in trimmed
+    assert trimmed.endswith("truncated to fit the context budget ...]\n")
+    assert estimate_tokens(trimmed) <= 60
+
+
+def test_missing_spec(project):
+    """Test tickets without spec.yaml are rejected."""
+    with pytest.raises(ContextError):
+        build_context(project / "specs" / "tickets", project_root=project)
@@ -0,0 +1,131 @@
+"""Tests for the static ticket dashboard."""
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from cddoc.dashboard import board_status, build_dashboard
+from cddoc.handlers.progress_handler import ProgressHandler
+
+
+def _write_spec(ticket_dir, **ticket):
+    ticket_dir.mkdir(parents=True, exist_ok=True)
+    ticket.setdefault("type", "feature")
+    (ticket_dir / "spec.yaml").write_text(
+        yaml.safe_dump({"title": ticket_dir.name.title(), "ticket": ticket})
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    tickets = tmp_path / "specs" / "tickets"
+    _write_spec(tickets / "feature-login", status="draft", priority="high")
+    _write_spec(tickets / "bug-crash", type="bug")
+
+    progress = ProgressHandler.initialize_progress(
+        Path("plan.md"), Path("spec.yaml")
+    )
+    progress["steps"] = [
+        {"step_id": 1, "description": "Write model", "status": "completed"},
+        {"step_id": 2, "description": "Add endpoint", "status": "pending"},
+    ]
+    progress["issues"] = [
+        {"description": "Flaky test <db>", "resolved_at": None},
+        {"description": "Fixed", "resolved_at": "2025-01-01T00:00:00Z"},
+    ]
+    ProgressHandler.write_progress(
+        tickets / "bug-crash" / "progress.yaml", progress
+    )
+    (tickets / "bug-crash" / "plan.md").write_text("# Plan\n")
+    _write_spec(tmp_path / "specs" / "archive" / "feature-old")
+    return tmp_path
+
+
+def test_html_board(project):
+    """Test the board groups tickets and shows progress and issues."""
+    result = build_dashboard(project)
+
+    board = result["board_path"].read_text()
+    assert result["tickets"] == 3
+    assert result["board_path"] == (
+        project / ".cdd" / "cache" / "dashboard" / "index.html"
+    )
+    assert "draft (1)" in board
+    assert "in progress (1)" in board
+    assert "archived (1)" in board
+    assert "1/2 steps" in board
+    assert "Add endpoint" in board
+    assert "1 open issue(s)" in board
+
+    page = (result["output_dir"] / "tickets" / "bug-crash.html").read_text()
+    assert "Flaky test &lt;db&gt;" in page
+    assert "Fixed" not in page
+    assert "../../../../specs/tickets/bug-crash/plan.md" in page
+
+
+def test_only_changed_tickets_rerendered(project):
+    """Test unchanged tickets are served from the output cache."""
+    assert build_dashboard(project)["rendered"] == 3
+    assert build_dashboard(project)["rendered"] == 0
+
+    spec = project / "specs" / "tickets" / "feature-login" / "spec.yaml"
+    _write_spec(spec.parent, status="planned")
+    stat = spec.stat()
+    os.utime(spec, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    result = build_dashboard(project)
+
+    assert result["rendered"] == 1
+    assert "planned (1)" in result["board_path"].read_text()
+
+
+def test_removed_ticket_page_deleted(project):
+    """Test pages of deleted tickets are removed."""
+    result = build_dashboard(project)
+    page = result["output_dir"] / "archive" / "feature-old.html"
+    assert page.exists()
+
+    (project / "specs" / "archive" / "feature-old" / "spec.yaml").unlink()
+    result = build_dashboard(project)
+
+    assert result["removed"] == 1
+    assert not page.exists()
+
+
+def test_deleted_output_rebuilt(project):
+    """Test a deleted output directory is fully regenerated."""
+    build_dashboard(project, output_dir=project / "site")
+    (project / "site" / "index.html").unlink()
+
+    assert (
+        build_dashboard(project, output_dir=project / "site")["rendered"] == 3
+    )
+
+
+def test_markdown_board(project):
+    """Test Markdown output uses tables per status."""
+    result = build_dashboard(project, fmt="markdown")
+
+    board = result["board_path"].read_text()
+    assert result["board_path"].name == "index.md"
+    assert "## Draft (1)" in board
+    assert "| [feature-login](tickets/feature-login.md) |" in board
+
+
+def test_board_status_inference():
+    """Test status falls back to progress and plan state."""
+    entry = {
+        "location": "tickets",
+        "status": None,
+        "progress_status": None,
+        "has_plan": True,
+    }
+
+    assert board_status(entry) == "planned"
+    assert board_status({**entry, "progress_status": "blocked"}) == (
+        "in_progress"
+    )
+    assert board_status({**entry, "location": "archive"}) == "archived"
@@ -0,0 +1,169 @@
+"""Tests for the documentation link graph."""
+
+import os
+
+import pytest
+
+from cddoc.docgraph import DocGraph, parse_links, slugify
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    ticket = tmp_path / "specs" / "tickets" / "feature-login"
+    ticket.mkdir(parents=True)
+    (ticket / "spec.yaml").write_text("title: Login\n")
+    (ticket / "plan.md").write_text(
+        "# Plan\n\nFollow [auth docs](../../../docs/features/auth.md#tokens)."
+        "\n"
+    )
+    features = tmp_path / "docs" / "features"
+    features.mkdir(parents=True)
+    (features / "auth.md").write_text(
+        "# Auth\n\n## Tokens\n\nSee [login](login.md) and "
+        "[guide](../guides/setup.md#install).\n"
+        "Built in specs/tickets/feature-login/.\n"
+    )
+    (features / "login.md").write_text(
+        "# Login\n\nBack to [auth](auth.md#missing).\n"
+    )
+    (features / "lonely.md").write_text("# Lonely\n")
+    return tmp_path
+
+
+def _write(path, text):
+    """Write a file and make sure its stat signature changes."""
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_slugify():
+    """Test GitHub-style heading anchors."""
+    assert slugify("Step 2: Load Context!") == "step-2-load-context"
+    assert slugify("The `cdd init` Command") == "the-cdd-init-command"
+
+
+def test_parse_links():
+    """Test link, definition and ticket reference extraction."""
+    text = (
+        "# Title\n\n"
+        "[a](other.md) [b](https://example.com) [c](#title)\n"
+        "`[code](ignored.md)` and specs/tickets/bug-x/spec.yaml\n"
+        "```\n[fenced](ignored.md)\n```\n"
+        "[ref]: /docs/ref.md\n"
+        "## Title\n"
+    )
+
+    links, anchors = parse_links(text, "docs/guides/page.md")
+
+    assert [(link["target"], link["kind"]) for link in links] == [
+        ("docs/guides/other.md", "link"),
+        ("docs/guides/page.md", "link"),
+        ("specs/tickets/bug-x", "ticket"),
+        ("docs/ref.md", "link"),
+    ]
+    assert links[1]["anchor"] == "title"
+    assert anchors == ["title", "title-1"]
+
+
+def test_broken_links(project):
+    """Test missing files and anchors are reported, ticket refs are not."""
+    graph = DocGraph.load(project)
+
+    assert graph.broken_links() == [
+        {
+            "source": "docs/features/auth.md",
+            "line": 5,
+            "target": "docs/guides/setup.md#install",
+            "reason": "missing file",
+        },
+        {
+            "source": "docs/features/login.md",
+            "line": 3,
+            "target": "docs/features/auth.md#missing",
+            "reason": "missing anchor",
+        },
+    ]
+
+
+def test_links_outside_the_project(tmp_path):
+    """Test links leaving the project are checked on disk."""
+    root = tmp_path / "project"
+    (root / ".cdd").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "docs" / "index.md").write_text(
+        "[shared](../../shared/README.md) [gone](../../shared/GONE.md)\n"
+    )
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "README.md").write_text("# Shared\n")
+
+    graph = DocGraph.load(root)
+
+    assert [link["target"] for link in graph.broken_links()] == [
+        "../shared/GONE.md"
+    ]
+
+
+def test_orphans_and_most_referenced(project):
+    """Test inbound links from docs and plans are counted."""
+    graph = DocGraph.load(project)
+
+    assert graph.orphans() == ["docs/features/lonely.md"]
+    assert graph.most_referenced(2) == [
+        ("docs/features/auth.md", 2),
+        ("docs/features/login.md", 1),
+    ]
+    assert ("specs/tickets/feature-login", 1) in graph.most_referenced()
+
+
+def test_ticket_references_follow_ticket_existence(project):
+    """Test mentions of tickets count only while the ticket exists."""
+    graph = DocGraph.load(project)
+    ticket = project / "specs" / "tickets" / "feature-login"
+    for name in os.listdir(ticket):
+        os.remove(ticket / name)
+    ticket.rmdir()
+
+    graph.refresh()
+
+    targets = [target for target, _ in graph.most_referenced()]
+    assert "specs/tickets/feature-login" not in targets
+
+
+def test_refresh_is_incremental(project):
+    """Test only changed files are re-parsed and the cache is reused."""
+    DocGraph.load(project).save()
+
+    graph = DocGraph.load(project)
+    assert graph.refresh() == []
+    assert not graph._dirty
+
+    _write(project / "docs" / "features" / "lonely.md", "[x](login.md)\n")
+    (project / "docs" / "features" / "login.md").unlink()
+
+    assert sorted(graph.refresh()) == [
+        "docs/features/login.md",
+        "docs/features/lonely.md",
+    ]
+    assert any(
+        link["target"] == "docs/features/login.md"
+        and link["reason"] == "missing file"
+        for link in graph.broken_links()
+    )
+
+
+def test_update_paths(project):
+    """Test targeted updates add, re-parse and remove files."""
+    graph = DocGraph.load(project)
+    (project / "docs" / "new.md").write_text("[auth](features/auth.md)\n")
+    (project / "docs" / "features" / "lonely.md").unlink()
+
+    graph.update_paths(
+        ["docs/new.md", "docs/features/lonely.md", "src/ignored.py"]
+    )
+
+    assert "docs/new.md" in graph.files
+    assert "docs/features/lonely.md" not in graph.files
+    assert "src/ignored.py" not in graph.files
+    assert graph.orphans() == ["docs/new.md"]
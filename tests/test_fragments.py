@@ -0,0 +1,125 @@
+"""Tests for fragments module."""
+
+import pytest
+from cddoc.fragments import (
+    FragmentError,
+    assemble_command,
+    assemble_packaged_commands,
+    fragment_types,
+    parse_fragments,
+)
+from cddoc.init import SUPPORTED_LANGUAGES, read_packaged_files
+
+COMMAND = """# Planner
+
+Shared intro.
+
+<!-- cdd:types feature enhancement -->
+## Feature guidance
+Build it.
+<!-- cdd:end -->
+
+<!-- cdd:types bug -->
+## Bug guidance
+Fix it.
+<!-- cdd:end -->
+
+---
+
+<!-- cdd:types spike -->
+## Spike example
+Research it.
+<!-- cdd:end -->
+
+---
+
+## Shared outro
+"""
+
+
+def test_parse_fragments():
+    """Shared and typed fragments are returned in file order."""
+    fragments = parse_fragments(COMMAND)
+
+    assert [f["types"] for f in fragments] == [
+        [],
+        ["feature", "enhancement"],
+        [],
+        ["bug"],
+        [],
+        ["spike"],
+        [],
+    ]
+    assert fragment_types(COMMAND) == [
+        "bug",
+        "enhancement",
+        "feature",
+        "spike",
+    ]
+
+
+def test_assemble_for_one_type():
+    """Only the shared text and the type's fragments are kept."""
+    text = assemble_command(COMMAND, "bug")
+
+    assert "Fix it." in text
+    assert "Build it." not in text
+    assert "Research it." not in text
+    assert "cdd:" not in text
+    assert "\n\n\n" not in text
+    assert text.count("---") == 1
+    assert text.endswith("## Shared outro\n")
+
+
+def test_assemble_shared_fragment_for_several_types():
+    """A fragment listing several types is kept for each of them."""
+    assert "Build it." in assemble_command(COMMAND, "enhancement")
+    assert "Build it." in assemble_command(COMMAND, "feature")
+
+
+def test_assemble_without_type_keeps_everything():
+    """Without a type every fragment is kept and markers are removed."""
+    text = assemble_command(COMMAND)
+
+    for body in ["Build it.", "Fix it.", "Research it.", "Shared intro."]:
+        assert body in text
+    assert "cdd:" not in text
+    assert assemble_command("# Plain\n\n\n\nText\n") == "# Plain\n\n\n\nText\n"
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("<!-- cdd:types bug -->\n<!-- cdd:types spike -->\n", "Nested"),
+        ("text\n<!-- cdd:end -->\n", "Unmatched"),
+        ("<!-- cdd:types bug -->\ntext\n", "Unclosed"),
+    ],
+)
+def test_malformed_markers(text, message):
+    """Nested, unmatched and unclosed markers are rejected."""
+    with pytest.raises(FragmentError, match=message):
+        parse_fragments(text)
+
+
+@pytest.mark.parametrize("language", SUPPORTED_LANGUAGES)
+def test_packaged_commands_shrink_per_type(language):
+    """Typed prompts are smaller and carry only their own guidance."""
+    full = dict(assemble_packaged_commands(language))
+    bug = dict(assemble_packaged_commands(language, "bug"))
+    raw = dict(read_packaged_files("commands", language))
+
+    for name in ["plan.md", "socrates.md"]:
+        assert fragment_types(raw[name].decode()) == [
+            "bug",
+            "enhancement",
+            "feature",
+            "spike",
+        ]
+        assert len(bug[name]) < len(full[name])
+        assert b"cdd:types" not in full[name]
+
+    assert b"#### For Bug Plans:" in bug["plan.md"]
+    assert b"#### For Feature Plans:" not in bug["plan.md"]
+    assert b"## Example Session Flow" not in bug["socrates.md"]
+    assert len(bug["socrates.md"]) < 0.8 * len(full["socrates.md"])
+    assert bug["exec.md"] == full["exec.md"]
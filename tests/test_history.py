@@ -0,0 +1,171 @@
+"""Tests for git-based ticket timelines."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+import yaml
+
+from cddoc.history import (
+    CACHE_FILE,
+    BlobReader,
+    HistoryError,
+    TicketHistory,
+    iter_raw_log,
+)
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _commit(cwd, message):
+    _git(cwd, "add", "-A")
+    _git(cwd, "commit", "-qm", message)
+
+
+def _write_spec(ticket_dir, status):
+    ticket_dir.mkdir(parents=True, exist_ok=True)
+    (ticket_dir / "spec.yaml").write_text(
+        yaml.safe_dump(
+            {"title": "Login", "ticket": {"type": "feature", "status": status}}
+        )
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    (tmp_path / "README.md").write_text("# Project\n")
+    _git(tmp_path, "init", "-q")
+    _commit(tmp_path, "initial")
+    return tmp_path
+
+
+def _events(history, ticket):
+    return [(e["event"], e["detail"]) for e in history.timeline(ticket)]
+
+
+def test_ticket_lifecycle(project):
+    """Test each milestone is recorded from the commit that caused it."""
+    ticket = project / "specs" / "tickets" / "feature-login"
+    _write_spec(ticket, "draft")
+    _commit(project, "create")
+    _write_spec(ticket, "planned")
+    (ticket / "plan.md").write_text("# Plan\n")
+    _commit(project, "plan")
+    (ticket / "progress.yaml").write_text("status: in_progress\n")
+    _commit(project, "start")
+    (ticket / "progress.yaml").write_text("status: completed\n")
+    _commit(project, "done")
+    archive = project / "specs" / "archive"
+    archive.mkdir(parents=True)
+    shutil.move(ticket, archive / "feature-login")
+    _commit(project, "archive")
+
+    history = TicketHistory.load(project)
+
+    assert _events(history, "feature-login") == [
+        ("created", None),
+        ("status", "draft"),
+        ("planned", None),
+        ("status", "planned"),
+        ("started", None),
+        ("implemented", None),
+        ("archived", None),
+    ]
+    milestones = history.milestones("feature-login")
+    assert milestones["archived"]["commit"] == _git(
+        project, "rev-parse", "HEAD"
+    )
+    assert history.timeline("unknown") == []
+
+
+def test_deleted_and_restored(project):
+    """Test deletions and moves back out of the archive."""
+    archived = project / "specs" / "archive" / "bug-crash"
+    _write_spec(archived, "completed")
+    _commit(project, "archived bug")
+    tickets = project / "specs" / "tickets"
+    tickets.mkdir(parents=True)
+    shutil.move(archived, tickets / "bug-crash")
+    _commit(project, "restore")
+    shutil.rmtree(tickets / "bug-crash")
+    _commit(project, "delete")
+
+    history = TicketHistory.load(project)
+
+    assert [event for event, _ in _events(history, "bug-crash")] == [
+        "created",
+        "status",
+        "restored",
+        "deleted",
+    ]
+
+
+def test_incremental_update(project, monkeypatch):
+    """Test later runs only read commits after the cached head."""
+    ticket = project / "specs" / "tickets" / "feature-login"
+    _write_spec(ticket, "draft")
+    _commit(project, "create")
+    first = TicketHistory.load(project)
+    cache = json.loads((project / ".cdd" / "cache" / CACHE_FILE).read_text())
+    assert cache["head"] == first.head
+
+    (ticket / "plan.md").write_text("# Plan\n")
+    _commit(project, "plan")
+    revisions = []
+    original = iter_raw_log
+
+    def _recording(repo_dir, revision):
+        revisions.append(revision)
+        return original(repo_dir, revision)
+
+    monkeypatch.setattr("cddoc.history.iter_raw_log", _recording)
+    second = TicketHistory.load(project)
+
+    assert revisions == [f"{first.head}..{second.head}"]
+    assert _events(second, "feature-login")[-1] == ("planned", None)
+
+    TicketHistory.load(project)
+    assert len(revisions) == 1
+
+
+def test_rewritten_history_is_rebuilt(project):
+    """Test a head that is not a descendant triggers a full rebuild."""
+    ticket = project / "specs" / "tickets" / "feature-login"
+    _write_spec(ticket, "draft")
+    _commit(project, "create")
+    TicketHistory.load(project)
+
+    _git(project, "reset", "-q", "--hard", "HEAD~1")
+    history = TicketHistory.load(project)
+
+    assert history.tickets == {}
+
+
+def test_blob_reader(project):
+    """Test blobs are read through one cat-file process."""
+    blob = _git(project, "rev-parse", "HEAD:README.md")
+    reader = BlobReader(project)
+    try:
+        assert reader.read(blob) == b"# Project\n"
+        assert reader.read("0" * 40) is None
+        assert reader.read(blob) == b"# Project\n"
+    finally:
+        reader.close()
+
+
+def test_not_a_git_repository(tmp_path):
+    """Test a clear error outside git."""
+    (tmp_path / ".cdd").mkdir()
+
+    with pytest.raises(HistoryError):
+        TicketHistory.load(tmp_path)
@@ -0,0 +1,111 @@
+"""Tests for the incremental project index."""
+
+import os
+
+import pytest
+import yaml
+from cddoc.index import ProjectIndex
+
+
+def _write_spec(ticket_dir, status="draft", title="Login"):
+    ticket_dir.mkdir(parents=True, exist_ok=True)
+    (ticket_dir / "spec.yaml").write_text(
+        yaml.safe_dump(
+            {
+                "title": title,
+                "ticket": {
+                    "type": "feature",
+                    "status": status,
+                    "priority": "high",
+                },
+            }
+        )
+    )
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    _write_spec(tmp_path / "specs" / "tickets" / "feature-login")
+    _write_spec(tmp_path / "specs" / "archive" / "feature-old", "completed")
+    (tmp_path / "specs" / "tickets" / "notes").mkdir()
+    docs = tmp_path / "docs" / "guides"
+    docs.mkdir(parents=True)
+    (docs / "setup.md").write_text("Intro\n# Setup Guide\n")
+    return tmp_path
+
+
+def test_builds_entries(project):
+    """Test tickets, archive and docs are indexed."""
+    index = ProjectIndex.load(project)
+
+    login = index.tickets["specs/tickets/feature-login"]
+    assert login["title"] == "Login"
+    assert login["status"] == "draft"
+    assert login["location"] == "tickets"
+    assert login["has_plan"] is False
+    assert index.ticket_names() == ["feature-login"]
+    assert index.ticket_names("archive") == ["feature-old"]
+    assert index.docs["docs/guides/setup.md"]["title"] == "Setup Guide"
+
+
+def test_persisted_and_reused(project):
+    """Test a reloaded index only re-parses changed tickets."""
+    ProjectIndex.load(project).save()
+    assert (project / ".cdd" / "cache" / "index.json").exists()
+
+    assert ProjectIndex.load(project, refresh=False).refresh() == []
+
+    spec = project / "specs" / "tickets" / "feature-login" / "spec.yaml"
+    _write_spec(spec.parent, status="planned")
+    _bump_mtime(spec)
+    index = ProjectIndex.load(project, refresh=False)
+
+    assert index.refresh() == ["specs/tickets/feature-login"]
+    assert index.tickets["specs/tickets/feature-login"]["status"] == "planned"
+
+
+def test_removed_entries(project):
+    """Test deleted tickets and docs drop out on refresh."""
+    index = ProjectIndex.load(project)
+    (project / "specs" / "archive" / "feature-old" / "spec.yaml").unlink()
+    (project / "docs" / "guides" / "setup.md").unlink()
+
+    changed = index.refresh()
+
+    assert set(changed) == {
+        "specs/archive/feature-old",
+        "docs/guides/setup.md",
+    }
+    assert index.list_tickets("archive") == []
+
+
+def test_invalid_spec_recorded(project):
+    """Test parse errors are stored instead of raised."""
+    ticket = project / "specs" / "tickets" / "bug-crash"
+    ticket.mkdir()
+    (ticket / "spec.yaml").write_text("title: [unclosed")
+
+    entry = ProjectIndex.load(project).tickets["specs/tickets/bug-crash"]
+
+    assert entry["error"]
+    assert entry["type"] == "bug"
+
+
+def test_update_single_ticket(project):
+    """Test a single ticket can be refreshed in place."""
+    index = ProjectIndex.load(project)
+    ticket = project / "specs" / "tickets" / "feature-login"
+    (ticket / "plan.md").write_text("# Plan\n")
+
+    entry = index.update_ticket("specs/tickets/feature-login")
+
+    assert entry["has_plan"] is True
+    (ticket / "spec.yaml").unlink()
+    assert index.update_ticket(ticket) is None
+    assert "specs/tickets/feature-login" not in index.tickets
@@ -8,12 +8,16 @@ from cddoc.init import (
     check_existing_structure,
     create_config_file,
     create_directory_structure,
+    expand_project_patterns,
     generate_claude_md,
     initialize_project,
+    initialize_projects,
     install_framework_commands,
     install_templates,
     is_dangerous_path,
     prompt_language_selection,
+    read_packaged_files,
+    read_repo_list,
     validate_path,
 )
 
@@ -587,3 +591,88 @@ def test_config_yaml_utf8_encoding(tmp_path):
 
     # No encoding errors should occur
     assert isinstance(content, str)
+
+
+def test_initialize_project_with_language_skips_prompt(tmp_path, monkeypatch):
+    """Test passing language avoids the interactive prompt."""
+
+    def fail_prompt():
+        raise AssertionError("prompt should not be called")
+
+    monkeypatch.setattr("cddoc.init.prompt_language_selection", fail_prompt)
+    result = initialize_project(str(tmp_path), language="pt-br")
+
+    assert result["language"] == "pt-br"
+    assert "language: pt-br" in (tmp_path / ".cdd" / "config.yaml").read_text()
+
+
+def test_initialize_project_invalid_language(tmp_path):
+    """Test unsupported languages are rejected."""
+    with pytest.raises(InitializationError, match="Unsupported language"):
+        initialize_project(str(tmp_path), language="fr")
+
+
+def test_expand_project_patterns(tmp_path):
+    """Test glob patterns expand to directories, literals are kept."""
+    (tmp_path / "packages" / "api").mkdir(parents=True)
+    (tmp_path / "packages" / "web").mkdir()
+    (tmp_path / "packages" / "README.md").write_text("x")
+
+    targets = expand_project_patterns(
+        ["packages/*", "packages/api", "new-service"], base_path=tmp_path
+    )
+
+    assert targets == [
+        tmp_path / "packages" / "api",
+        tmp_path / "packages" / "web",
+        tmp_path / "new-service",
+    ]
+
+
+def test_read_repo_list(tmp_path):
+    """Test repo lists skip comments and resolve relative entries."""
+    list_file = tmp_path / "repos.txt"
+    list_file.write_text("# services\nsvc-a\n\n/abs/svc-b\n")
+
+    assert read_repo_list(list_file) == [
+        str(tmp_path / "svc-a"),
+        "/abs/svc-b",
+    ]
+
+
+def test_initialize_projects_in_place(tmp_path):
+    """Test many projects are initialized without git root jumps."""
+    targets = [tmp_path / "packages" / name for name in ("a", "b", "c")]
+
+    results = initialize_projects(targets, "en", max_workers=2)
+
+    assert [r["path"] for r in results] == targets
+    for target in targets:
+        assert (target / ".claude" / "commands" / "plan.md").exists()
+        assert (target / ".cdd" / "config.yaml").exists()
+        assert (target / "CLAUDE.md").exists()
+
+
+def test_initialize_projects_reports_errors(tmp_path):
+    """Test a failing target does not abort the batch."""
+    results = initialize_projects([Path("/usr"), tmp_path / "ok"], "en")
+
+    assert "error" in results[0]
+    assert "system directory" in results[0]["error"]
+    assert "error" not in results[1]
+
+
+def test_initialize_projects_reads_package_once(tmp_path, monkeypatch):
+    """Test packaged files are read once for the whole batch."""
+    read_packaged_files.cache_clear()
+    calls = []
+    original = Path.read_bytes
+
+    def counting_read_bytes(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    initialize_projects([tmp_path / "a", tmp_path / "b"], "en")
+
+    assert len(calls) == len(set(calls))
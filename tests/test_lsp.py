@@ -0,0 +1,340 @@
+"""Tests for the spec/plan language server."""
+
+import io
+import time
+
+import pytest
+import yaml
+
+from cddoc.lsp import (
+    METHOD_NOT_FOUND,
+    SEVERITY_ERROR,
+    SEVERITY_WARNING,
+    LanguageServer,
+    apply_change,
+    key_lines,
+    read_message,
+    write_message,
+)
+from cddoc.project import forget_project_roots
+
+SPEC = """title: Export CSV
+ticket:
+  type: feature
+  status: drafted
+  priority: high
+  depends_on:
+    - feature-auth
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    for name in ("feature-export", "feature-auth", "bug-crash"):
+        ticket = tmp_path / "specs" / "tickets" / name
+        ticket.mkdir(parents=True)
+        (ticket / "spec.yaml").write_text(
+            yaml.safe_dump({"title": name, "ticket": {"type": "feature"}})
+        )
+    forget_project_roots()
+    yield tmp_path
+    forget_project_roots()
+
+
+@pytest.fixture
+def server():
+    sent = []
+    server = LanguageServer(sent.append, debounce=0)
+    server.sent = sent
+    return server
+
+
+def _uri(project, name="feature-export", file_name="spec.yaml"):
+    return (project / "specs" / "tickets" / name / file_name).as_uri()
+
+
+def _open(server, uri, text):
+    server.handle(
+        {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didOpen",
+            "params": {
+                "textDocument": {
+                    "uri": uri,
+                    "languageId": "yaml",
+                    "version": 1,
+                    "text": text,
+                }
+            },
+        }
+    )
+
+
+def _diagnostics(server):
+    published = [
+        m
+        for m in server.sent
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+    return published[-1]["params"]["diagnostics"]
+
+
+def _request(server, method, uri, line, character):
+    server.handle(
+        {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": method,
+            "params": {
+                "textDocument": {"uri": uri},
+                "position": {"line": line, "character": character},
+            },
+        }
+    )
+    return server.sent[-1]["result"]
+
+
+def test_message_framing_roundtrip():
+    stream = io.BytesIO()
+    write_message(stream, {"jsonrpc": "2.0", "method": "exit", "x": "é"})
+    stream.seek(0)
+
+    assert read_message(stream) == {
+        "jsonrpc": "2.0",
+        "method": "exit",
+        "x": "é",
+    }
+    assert read_message(stream) is None
+
+
+def test_apply_incremental_change_utf16():
+    lines = "title: 😀 ok\nticket:\n".split("\n")
+    change = {
+        "range": {
+            "start": {"line": 0, "character": 10},
+            "end": {"line": 0, "character": 12},
+        },
+        "text": "fine",
+    }
+
+    apply_change(lines, change)
+
+    assert lines == ["title: 😀 fine", "ticket:", ""]
+
+    apply_change(
+        lines,
+        {
+            "range": {
+                "start": {"line": 0, "character": 7},
+                "end": {"line": 1, "character": 6},
+            },
+            "text": "x\nnew",
+        },
+    )
+
+    assert lines == ["title: x", "new:", ""]
+
+
+def test_key_lines_indexes_list_items():
+    text = (
+        "steps:\n"
+        "  - id: 1\n"
+        "    status: done\n"
+        "  - id: 2\n"
+        "    status: bad\n"
+        "notes: |\n"
+        "  - not: a key\n"
+    )
+
+    outline = key_lines(text)
+
+    assert outline["steps[1].status"] == 4
+    assert outline["notes"] == 5
+    assert "notes[0]" not in outline
+
+
+def test_spec_diagnostics_point_at_field(project, server):
+    uri = _uri(project)
+    _open(server, uri, SPEC)
+
+    (diagnostic,) = _diagnostics(server)
+    assert diagnostic["severity"] == SEVERITY_ERROR
+    assert diagnostic["message"].startswith("ticket.status: expected one of")
+    assert diagnostic["range"]["start"] == {"line": 3, "character": 2}
+
+    server.handle(
+        {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didChange",
+            "params": {
+                "textDocument": {"uri": uri, "version": 2},
+                "contentChanges": [
+                    {
+                        "range": {
+                            "start": {"line": 3, "character": 10},
+                            "end": {"line": 3, "character": 17},
+                        },
+                        "text": "draft",
+                    }
+                ],
+            },
+        }
+    )
+
+    assert _diagnostics(server) == []
+    assert server.documents[uri]["lines"][3] == "  status: draft"
+
+
+def test_yaml_error_and_placeholder_positions(project, server):
+    _open(server, _uri(project), "title: [Feature name\nticket: {\n")
+    (diagnostic,) = _diagnostics(server)
+    assert diagnostic["message"].startswith("Invalid YAML format")
+    assert diagnostic["range"]["start"]["line"] >= 1
+
+    _open(
+        server,
+        _uri(project, "feature-auth"),
+        "title: '[Descriptive feature title]'\nticket:\n  type: feature\n",
+    )
+    (diagnostic,) = _diagnostics(server)
+    assert diagnostic["severity"] == SEVERITY_WARNING
+    assert diagnostic["range"]["start"]["line"] == 0
+
+
+def test_plan_without_steps_warns(project, server):
+    _open(server, _uri(project, file_name="plan.md"), "# Plan\n\nTBD\n")
+    (diagnostic,) = _diagnostics(server)
+    assert "No implementation steps" in diagnostic["message"]
+
+    _open(
+        server,
+        _uri(project, file_name="plan.md"),
+        "# Plan\n\n## Implementation Steps\n\n### Step 1: Do it\n",
+    )
+    assert _diagnostics(server) == []
+
+
+def test_completions(project, server):
+    uri = _uri(project)
+    _open(server, uri, SPEC)
+
+    statuses = _request(server, "textDocument/completion", uri, 3, 10)
+    priorities = _request(server, "textDocument/completion", uri, 4, 12)
+    references = _request(server, "textDocument/completion", uri, 6, 6)
+
+    assert "in_progress" in [item["label"] for item in statuses]
+    assert [item["label"] for item in priorities] == ["high", "medium", "low"]
+    assert [item["label"] for item in references] == [
+        "bug-crash",
+        "feature-auth",
+    ]
+    assert _request(server, "textDocument/completion", uri, 0, 7) == []
+
+
+def test_reference_completions_follow_the_ticket_index(project, server):
+    uri = _uri(project)
+    _open(server, uri, SPEC)
+    tickets = project / "specs" / "tickets"
+    (tickets / "scratch").mkdir()
+    (tickets / "bug-new").mkdir()
+    (tickets / "bug-new" / "spec.yaml").write_text("title: New\n")
+
+    references = _request(server, "textDocument/completion", uri, 6, 6)
+
+    assert [item["label"] for item in references] == [
+        "bug-crash",
+        "bug-new",
+        "feature-auth",
+    ]
+
+
+def test_definition_resolves_ticket_references(project, server):
+    uri = _uri(project)
+    _open(server, uri, SPEC)
+
+    location = _request(server, "textDocument/definition", uri, 6, 10)
+
+    assert location["uri"] == _uri(project, "feature-auth")
+
+    plan_uri = _uri(project, file_name="plan.md")
+    _open(server, plan_uri, "See `specs/tickets/bug-crash/plan.md`.\n")
+    assert _request(server, "textDocument/definition", plan_uri, 0, 20) == {
+        "uri": _uri(project, "bug-crash"),
+        "range": {
+            "start": {"line": 0, "character": 0},
+            "end": {"line": 0, "character": 0},
+        },
+    }
+    assert _request(server, "textDocument/definition", uri, 0, 2) is None
+
+
+def test_keystrokes_are_cheap_on_large_specs(project):
+    """Test edits only touch the buffer; validation waits for a pause."""
+    server = LanguageServer(lambda message: None, debounce=60)
+    uri = _uri(project)
+    big = SPEC + "".join(
+        f"note_{i}:\n  - item {i}\n  - other {i}\n" for i in range(5000)
+    )
+    _open(server, uri, big)
+
+    started = time.perf_counter()
+    for i in range(100):
+        server.handle(
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri, "version": i + 2},
+                    "contentChanges": [
+                        {
+                            "range": {
+                                "start": {"line": 12000, "character": 0},
+                                "end": {"line": 12000, "character": 0},
+                            },
+                            "text": "x",
+                        }
+                    ],
+                },
+            }
+        )
+        server.handle(
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "textDocument/completion",
+                "params": {
+                    "textDocument": {"uri": uri},
+                    "position": {"line": 3, "character": 10},
+                },
+            }
+        )
+    per_keystroke = (time.perf_counter() - started) / 100
+    server.shutdown({})
+
+    assert per_keystroke < 0.01
+
+
+def test_serve_lifecycle(project):
+    requests = io.BytesIO()
+    for message in (
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+        {"jsonrpc": "2.0", "id": 2, "method": "workspace/symbol"},
+        {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+        {"jsonrpc": "2.0", "method": "exit"},
+    ):
+        write_message(requests, message)
+    requests.seek(0)
+    responses = io.BytesIO()
+
+    code = LanguageServer(lambda message: None).serve(requests, responses)
+
+    responses.seek(0)
+    initialize = read_message(responses)
+    unsupported = read_message(responses)
+    shutdown = read_message(responses)
+    assert code == 0
+    assert initialize["result"]["capabilities"]["definitionProvider"]
+    assert unsupported["error"]["code"] == METHOD_NOT_FOUND
+    assert shutdown == {"jsonrpc": "2.0", "id": 3, "result": None}
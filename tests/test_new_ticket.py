@@ -389,3 +389,33 @@ class TestIntegrationScenarios:
         for input_name, expected_normalized in test_cases:
             result = create_new_ticket("feature", input_name)
             assert result["normalized_name"] == expected_normalized
+
+
+class TestProjectScoping:
+    """Test ticket creation scopes to the nearest .cdd project."""
+
+    def test_creates_ticket_in_nearest_project(self, tmp_path, monkeypatch):
+        """Test tickets land in the team project, not the git root."""
+        import subprocess
+
+        from cddoc.project import forget_project_roots
+
+        subprocess.run(
+            ["git", "init"], cwd=tmp_path, check=True, capture_output=True
+        )
+        team = tmp_path / "services" / "billing"
+        templates_dir = team / ".cdd" / "templates"
+        templates_dir.mkdir(parents=True)
+        (templates_dir / "bug-ticket-template.yaml").write_text(
+            "created: [auto-generated]"
+        )
+        (team / "src").mkdir()
+        monkeypatch.chdir(team / "src")
+        forget_project_roots()
+
+        result = create_new_ticket("bug", "Rounding Error")
+
+        assert result["ticket_path"] == (
+            team.resolve() / "specs" / "tickets" / "bug-rounding-error"
+        )
+        assert (result["ticket_path"] / "spec.yaml").exists()
@@ -0,0 +1,128 @@
+"""Tests for machine-readable output modes."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import cddoc
+from cddoc import output
+from cddoc.cli import main
+from cddoc.project import forget_project_roots
+
+
+@pytest.fixture(autouse=True)
+def reset_mode():
+    yield
+    output.set_mode("rich")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    monkeypatch.chdir(tmp_path)
+    forget_project_roots()
+    result = CliRunner().invoke(
+        main, ["--mode", "json", "init", "--language", "en"]
+    )
+    assert result.exit_code == 0, result.output
+    output.set_mode("rich")
+    yield tmp_path
+    forget_project_roots()
+
+
+def test_to_plain_joins_fields_with_tabs():
+    record = {"path": "a\tb", "errors": ["x", "y"], "cached": True}
+    assert output.to_plain(record) == "a b\tx,y\ttrue"
+    assert output.to_plain(record, ["cached", "missing"]) == "true\t"
+
+
+def test_emit_records_streams_or_collects(capsys):
+    records = [{"a": 1}, {"a": 2}]
+
+    output.set_mode("ndjson")
+    assert output.emit_records(iter(records)) == 2
+    assert capsys.readouterr().out == '{"a":1}\n{"a":2}\n'
+
+    output.set_mode("json")
+    output.emit_records(iter(records))
+    assert json.loads(capsys.readouterr().out) == records
+
+    with pytest.raises(ValueError):
+        output.set_mode("yaml")
+
+
+def test_new_ticket_json_is_one_line(project):
+    result = CliRunner().invoke(
+        main, ["--mode", "json", "new", "feature", "Export CSV"]
+    )
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["normalized_name"] == "export-csv"
+    assert (project / "specs/tickets/feature-export-csv/spec.yaml").exists()
+
+    again = CliRunner().invoke(
+        main, ["--mode", "json", "new", "feature", "Export CSV"]
+    )
+    assert again.exit_code == 1
+    assert "already exists" in again.output
+
+
+def test_validate_ndjson_and_plain(project):
+    runner = CliRunner()
+    runner.invoke(main, ["--mode", "json", "new", "bug", "crash"])
+
+    result = runner.invoke(main, ["--mode", "ndjson", "validate"])
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [r["kind"] for r in records] == ["spec"]
+    assert records[0]["errors"]
+    assert result.exit_code == 1
+
+    plain = runner.invoke(main, ["--mode", "plain", "validate"])
+    fields = plain.output.splitlines()[0].split("\t")
+    assert fields[0].endswith("bug-crash/spec.yaml")
+    assert fields[1] == "spec"
+
+
+def test_mode_does_not_clash_with_command_output_options(project):
+    result = CliRunner().invoke(
+        main, ["--mode", "json", "dashboard", "--output", "board"]
+    )
+    assert result.exit_code == 0, result.output
+    json.loads(result.output)
+    assert (project / "board").is_dir()
+
+
+def test_unsupported_command_rejects_machine_output(project):
+    result = CliRunner().invoke(main, ["--mode", "json", "watch"])
+    assert result.exit_code == 2
+    assert "not supported" in result.output
+
+
+def test_machine_output_does_not_import_rich(project):
+    script = (
+        "import sys\n"
+        "from cddoc.cli import main\n"
+        "try:\n"
+        "    main(['--mode', 'json', 'new', 'spike', 'probe'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.stderr.write(str(any(m.startswith('rich')"
+        " for m in sys.modules)))\n"
+    )
+    src = str(Path(cddoc.__file__).parent.parent)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=project,
+        env={**os.environ, "PYTHONPATH": src},
+        capture_output=True,
+        text=True,
+    )
+    assert json.loads(result.stdout)["ticket_type"] == "spike"
+    assert result.stderr == "False"
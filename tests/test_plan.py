@@ -0,0 +1,305 @@
+"""Tests for the structured plan.md model."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.plan import (
+    PlanError,
+    content_hash,
+    load_plan,
+    parse_plan,
+    touched_files,
+)
+from cddoc.project import forget_project_roots
+
+FEATURE_PLAN = """# Implementation Plan: CSV Export
+
+**Generated:** 2025-01-10
+**Spec:** `specs/tickets/feature-export/spec.yaml`
+**Ticket Type:** Feature
+**Estimated Effort:** 6 hours
+
+---
+
+## File Structure
+
+### New Files to Create
+
+1. **`src/app/export.py`**
+   - Purpose: CSV writer
+
+### Existing Files to Modify
+
+1. **`src/app/cli.py`**
+   - Changes: add `export` command
+
+### Files to Reference for Patterns
+
+1. **`src/app/report.py`**
+
+---
+
+## Implementation Steps
+
+### Step 1: Create the exporter
+**Outcome:** `src/app/export.py` writes rows
+
+**Details:**
+- Add `write_csv()`
+- Handle empty input
+
+**Code Example:**
+```python
+path = "`src/ignored.py`"
+```
+
+**Validation:** `tests/test_export.py` passes
+
+---
+
+### Step 2: Wire the command
+**Outcome:** `cdd export` works
+
+**Details:**
+- Register the command in `src/app/cli.py`
+
+**Validation:** Manual run
+
+---
+
+## Effort Estimation
+
+| Activity       | Estimated Time | Assumptions |
+|----------------|----------------|-------------|
+| Implementation | 4 hours        | None        |
+| **Total**      | **5 hours**    | **1 day**   |
+
+---
+
+## Definition of Done
+
+- ✅ All implementation steps completed
+- ✅ Exports open in spreadsheets
+"""
+
+ENHANCEMENT_PLAN = """# Enhancement Plan: Faster Index
+
+**Ticket Type:** Enhancement
+**Estimated Effort:** 3 hours
+
+## Implementation Steps
+
+### Phase 1: Preparation
+**Estimated Time:** 1 hour
+
+1. **Profile refresh** (30 minutes)
+   - Run the benchmark suite
+   - **Success Criteria:** Hot spots identified
+
+### Phase 2: Implementation
+**Estimated Time:** 2 hours
+
+1. **Cache stat results** (2 hours)
+   - **Actions:** Reuse signatures in `src/cddoc/index.py`
+   - **Verification:** Benchmarks improve
+
+## Definition of Done
+
+- [ ] Refresh is twice as fast
+"""
+
+PT_BR_PLAN = """# Plano de Correção: Exportação falha
+
+**Tipo de Ticket:** Bug
+
+## Passos de Implementação
+
+### Passo 1: Corrigir o parser
+**Resultado:** `src/app/parser.py` aceita linhas vazias
+
+**Validação:** Testes passam
+
+## Definição de Pronto
+
+- ✅ Bug corrigido
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    forget_project_roots()
+    yield tmp_path
+    forget_project_roots()
+
+
+def test_parse_header_steps_and_estimates():
+    model = parse_plan(FEATURE_PLAN)
+
+    assert model["title"] == "CSV Export"
+    assert model["ticket_type"] == "feature"
+    assert model["estimated_effort"] == "6 hours"
+    assert model["total_estimate"] == "5 hours"
+    assert model["content_hash"] == content_hash(FEATURE_PLAN)
+
+    first, second = model["steps"]
+    assert first["step_id"] == 1
+    assert first["title"] == "Create the exporter"
+    assert first["outcome"] == "`src/app/export.py` writes rows"
+    assert first["details"] == ["Add `write_csv()`", "Handle empty input"]
+    assert first["validation"] == "`tests/test_export.py` passes"
+    assert first["files"] == ["src/app/export.py", "tests/test_export.py"]
+    assert second["files"] == ["src/app/cli.py"]
+
+
+def test_parse_files_and_acceptance_criteria():
+    model = parse_plan(FEATURE_PLAN)
+
+    assert model["files"]["create"] == ["src/app/export.py"]
+    assert model["files"]["modify"] == ["src/app/cli.py"]
+    assert model["files"]["reference"] == ["src/app/report.py"]
+    assert model["acceptance_criteria"] == [
+        "All implementation steps completed",
+        "Exports open in spreadsheets",
+    ]
+    assert touched_files(model) == [
+        "src/app/cli.py",
+        "src/app/export.py",
+        "tests/test_export.py",
+    ]
+
+
+def test_parse_enhancement_phases():
+    model = parse_plan(ENHANCEMENT_PLAN)
+
+    assert [
+        (s["step_id"], s["title"], s["phase"]) for s in model["steps"]
+    ] == [
+        (1, "Profile refresh", "Preparation"),
+        (2, "Cache stat results", "Implementation"),
+    ]
+    profile, cache = model["steps"]
+    assert profile["estimate"] == "30 minutes"
+    assert profile["validation"] == "Hot spots identified"
+    assert cache["validation"] == "Benchmarks improve"
+    assert cache["files"] == ["src/cddoc/index.py"]
+    assert model["acceptance_criteria"] == ["Refresh is twice as fast"]
+    assert model["total_estimate"] == "3 hours"
+
+
+def test_parse_portuguese_plan():
+    model = parse_plan(PT_BR_PLAN)
+
+    assert model["ticket_type"] == "bug"
+    (step,) = model["steps"]
+    assert step["title"] == "Corrigir o parser"
+    assert step["validation"] == "Testes passam"
+    assert step["files"] == ["src/app/parser.py"]
+    assert model["acceptance_criteria"] == ["Bug corrigido"]
+
+
+def test_load_plan_caches_by_content_hash(project):
+    plan_path = project / "specs" / "tickets" / "feature-export" / "plan.md"
+    plan_path.parent.mkdir(parents=True)
+    plan_path.write_text(FEATURE_PLAN)
+
+    model = load_plan(plan_path)
+
+    cache_path = (
+        project / ".cdd/cache/plans" / f"{content_hash(FEATURE_PLAN)}.json"
+    )
+    assert json.loads(cache_path.read_text()) == model
+
+    cached = json.loads(cache_path.read_text())
+    cached["title"] = "From cache"
+    cache_path.write_text(json.dumps(cached))
+    assert load_plan(plan_path)["title"] == "From cache"
+    assert load_plan(plan_path, use_cache=False)["title"] == "CSV Export"
+
+    plan_path.write_text(FEATURE_PLAN.replace("CSV Export", "TSV Export"))
+    assert load_plan(plan_path)["title"] == "TSV Export"
+
+
+def test_load_plan_from_many_threads(project):
+    """Test threads caching the same new plan don't collide."""
+    ticket = project / "specs" / "tickets" / "feature-export"
+    ticket.mkdir(parents=True)
+    for attempt in range(20):
+        plan_path = ticket / "plan.md"
+        plan_path.write_text(FEATURE_PLAN.replace("CSV", f"CSV {attempt}"))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            titles = set(
+                pool.map(lambda _: load_plan(plan_path)["title"], range(16))
+            )
+
+        assert titles == {f"CSV {attempt} Export"}
+    assert not list((project / ".cdd/cache/plans").glob("*.tmp"))
+
+
+def test_load_plan_ignores_failed_cache_write(project):
+    plan_path = project / "specs" / "tickets" / "feature-export" / "plan.md"
+    plan_path.parent.mkdir(parents=True)
+    plan_path.write_text(FEATURE_PLAN)
+    cache_path = (
+        project / ".cdd/cache/plans" / f"{content_hash(FEATURE_PLAN)}.json"
+    )
+    cache_path.mkdir(parents=True)
+
+    assert load_plan(plan_path)["title"] == "CSV Export"
+
+
+def test_load_plan_missing_file(tmp_path):
+    with pytest.raises(PlanError, match="Cannot read plan"):
+        load_plan(tmp_path / "plan.md")
+
+
+def test_initialize_progress_seeds_steps_from_plan(project):
+    ticket = project / "specs" / "tickets" / "feature-export"
+    ticket.mkdir(parents=True)
+    (ticket / "plan.md").write_text(FEATURE_PLAN)
+    (ticket / "spec.yaml").write_text(
+        "title: Export\nacceptance_criteria:\n  - Users can export CSV\n"
+    )
+
+    data = ProgressHandler.initialize_progress(
+        ticket / "plan.md", ticket / "spec.yaml"
+    )
+
+    assert data["plan_hash"] == content_hash(FEATURE_PLAN)
+    assert [s["description"] for s in data["steps"]] == [
+        "Create the exporter",
+        "Wire the command",
+    ]
+    assert data["steps"][0]["status"] == "pending"
+    assert data["steps"][0]["planned_files"] == [
+        "src/app/export.py",
+        "tests/test_export.py",
+    ]
+    assert data["acceptance_criteria"] == [
+        {
+            "criterion": "Users can export CSV",
+            "status": "pending",
+            "validated_at": None,
+        }
+    ]
+
+
+def test_seed_progress_writes_once(project):
+    ticket = project / "specs" / "tickets" / "feature-export"
+    ticket.mkdir(parents=True)
+    (ticket / "plan.md").write_text(FEATURE_PLAN)
+
+    data = ProgressHandler.seed_progress(ticket)
+
+    assert data is not None
+    saved = ProgressHandler.read_progress(ticket / "progress.yaml")
+    assert len(saved["steps"]) == 2
+    assert [c["criterion"] for c in saved["acceptance_criteria"]] == [
+        "All implementation steps completed",
+        "Exports open in spreadsheets",
+    ]
+    assert ProgressHandler.seed_progress(ticket) is None
+    assert ProgressHandler.seed_progress(project / "missing") is None
@@ -0,0 +1,127 @@
+"""Tests for per-phase timings and command profiling."""
+
+import io
+import pstats
+
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from cddoc import profiling
+from cddoc.cli import main
+from cddoc.init import install_templates
+from cddoc.profiling import (
+    PhaseTimer,
+    phase,
+    start_timings,
+    stop_timings,
+)
+from cddoc.project import forget_project_roots
+
+
+@pytest.fixture(autouse=True)
+def _no_active_timer():
+    yield
+    stop_timings()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".cdd").mkdir()
+    install_templates(tmp_path, "en")
+    monkeypatch.chdir(tmp_path)
+    forget_project_roots()
+    yield tmp_path
+    forget_project_roots()
+
+
+def test_phase_is_transparent_when_off():
+    @phase("config")
+    def load(value):
+        return value * 2
+
+    assert profiling._active is None
+    assert load(21) == 42
+    assert load.__name__ == "load"
+
+
+def test_phase_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        phase("network")
+
+
+def test_timer_counts_nested_phases_exclusively(monkeypatch):
+    clock = iter([10.0, 11.0, 13.0, 16.0, 20.0, 21.0])
+    monkeypatch.setattr(profiling, "IMPORT_STARTED", 9.5)
+    monkeypatch.setattr(profiling.time, "perf_counter", lambda: next(clock))
+    timer = PhaseTimer()
+
+    timer.start()  # 10
+    timer.enter("config")  # 11: command += 1
+    timer.enter("root discovery")  # 13: config += 2
+    timer.exit()  # 16: root discovery += 3
+    timer.exit()  # 20: config += 4
+    total = timer.stop()  # 21: command += 1
+
+    assert timer.totals["import"] == 0.5
+    assert timer.totals["command"] == 2.0
+    assert timer.totals["config"] == 6.0
+    assert timer.totals["root discovery"] == 3.0
+    assert timer.calls["config"] == 1
+    assert total == 11.5
+
+
+def test_timings_wrap_rendering_only_while_active():
+    original = Console.print
+    timer = start_timings()
+
+    assert Console.print is not original
+    Console(file=io.StringIO()).print("hello")
+    assert timer.calls["render"] == 1
+
+    result = stop_timings()
+    assert result is not None
+    assert Console.print is original
+    assert stop_timings() is None
+
+
+def test_cli_timings_print_breakdown(project):
+    original = Console.print
+
+    result = CliRunner().invoke(
+        main, ["--timings", "new", "feature", "fast-path"]
+    )
+
+    assert result.exit_code == 0
+    assert (project / "specs/tickets/feature-fast-path/spec.yaml").exists()
+    for name in profiling.PHASES:
+        assert name in result.output
+    assert Console.print is original
+    assert profiling._active is None
+
+
+def test_cli_profile_writes_stats_and_snapshot(project):
+    output = project / "out" / "new.prof"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "--profile",
+            str(output),
+            "--profile-memory",
+            "new",
+            "bug",
+            "slow-path",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert pstats.Stats(str(output)).total_calls > 0
+    assert (project / "out" / "new.prof.tracemalloc").exists()
+
+
+def test_cli_profile_memory_requires_profile(project):
+    result = CliRunner().invoke(main, ["--profile-memory", "new", "bug", "x"])
+
+    assert result.exit_code == 2
+    assert "--profile-memory requires --profile" in result.output
@@ -0,0 +1,108 @@
+"""Tests for project root discovery."""
+
+from pathlib import Path
+
+import pytest
+from cddoc import project
+from cddoc.path_resolver import PathResolver
+from cddoc.project import (
+    find_project_root,
+    forget_project_roots,
+    relative_to_cwd,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_root_map():
+    """Isolate the process-wide root map between tests."""
+    forget_project_roots()
+    yield
+    forget_project_roots()
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """Monorepo with a top-level project and a nested team project."""
+    (tmp_path / ".cdd").mkdir()
+    team = tmp_path / "services" / "billing"
+    (team / ".cdd").mkdir(parents=True)
+    (team / "src" / "api").mkdir(parents=True)
+    (tmp_path / "libs" / "shared").mkdir(parents=True)
+    return tmp_path
+
+
+def test_find_nearest_project_root(monorepo):
+    """Test the nearest ancestor with .cdd wins."""
+    team = monorepo / "services" / "billing"
+
+    assert find_project_root(team / "src" / "api") == team.resolve()
+    assert find_project_root(monorepo / "libs" / "shared") == (
+        monorepo.resolve()
+    )
+
+
+def test_find_project_root_none(tmp_path):
+    """Test None is returned outside any project."""
+    assert find_project_root(tmp_path) is None
+
+
+def test_find_project_root_defaults_to_cwd(monorepo, monkeypatch):
+    """Test discovery starts from the current directory."""
+    monkeypatch.chdir(monorepo / "services" / "billing" / "src")
+
+    assert find_project_root() == (monorepo / "services" / "billing").resolve()
+
+
+def test_root_map_caches_visited_directories(monorepo, monkeypatch):
+    """Test repeated lookups are answered from the root map."""
+    team = (monorepo / "services" / "billing").resolve()
+    find_project_root(team / "src" / "api")
+
+    assert project._ROOT_MAP[team / "src" / "api"] == team
+    assert project._ROOT_MAP[team / "src"] == team
+
+    calls = []
+    original = project._is_project_root
+
+    def counting(directory):
+        calls.append(directory)
+        return original(directory)
+
+    monkeypatch.setattr(project, "_is_project_root", counting)
+    assert find_project_root(team / "src") == team
+    # Only the cached root's marker is re-checked
+    assert calls == [team]
+
+
+def test_removed_marker_invalidates_cache(monorepo):
+    """Test a deleted .cdd directory is not served from cache."""
+    team = monorepo / "services" / "billing"
+    find_project_root(team / "src")
+
+    (team / ".cdd").rmdir()
+
+    assert find_project_root(team / "src") == monorepo.resolve()
+
+
+def test_relative_to_cwd(tmp_path, monkeypatch):
+    """Test paths under the cwd are shortened, others kept."""
+    monkeypatch.chdir(tmp_path)
+
+    assert relative_to_cwd(tmp_path.resolve() / "specs") == Path("specs")
+    assert relative_to_cwd(Path("/elsewhere")) == Path("/elsewhere")
+
+
+def test_path_resolver_scopes_to_project(monorepo, monkeypatch):
+    """Test shorthand resolves inside the nearest project."""
+    team = (monorepo / "services" / "billing").resolve()
+    (team / "specs" / "tickets" / "feature-invoices").mkdir(parents=True)
+    monkeypatch.chdir(team / "src" / "api")
+
+    result = PathResolver.resolve("feature-invoices", "spec.yaml")
+
+    assert result == (
+        team / "specs" / "tickets" / "feature-invoices" / "spec.yaml"
+    )
+    assert PathResolver.find_similar_tickets("feature-invoice") == [
+        "feature-invoices"
+    ]
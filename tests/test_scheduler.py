@@ -0,0 +1,333 @@
+"""Tests for the multi-ticket run queue."""
+
+import shlex
+import sys
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from cddoc.cli import main
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.project import forget_project_roots
+from cddoc.scheduler import (
+    RunQueue,
+    SchedulerError,
+    executor_command,
+    files_overlap,
+    load_settings,
+    order_queue,
+    plan_files,
+    select_tickets,
+)
+
+# Records start/end times, then marks progress.yaml as the ticket's
+# FAKE_RESULT file says (default: completed)
+EXECUTOR_SCRIPT = """
+import os, sys, time
+from pathlib import Path
+
+import yaml
+
+ticket_dir = Path(os.environ["CDD_TICKET_DIR"])
+events = Path(sys.argv[1])
+with open(events, "a") as f:
+    f.write(f"start {os.environ['CDD_TICKET']} {time.time()}\\n")
+time.sleep(0.3)
+result = ticket_dir / "FAKE_RESULT"
+outcome = result.read_text().strip() if result.exists() else "completed"
+if outcome == "crash":
+    sys.exit(3)
+progress = {
+    "plan_path": "plan.md",
+    "spec_path": "spec.yaml",
+    "started_at": "x",
+    "updated_at": "x",
+    "status": outcome,
+    "steps": [],
+    "acceptance_criteria": [],
+}
+(ticket_dir / "progress.yaml").write_text(yaml.safe_dump(progress))
+with open(events, "a") as f:
+    f.write(f"end {os.environ['CDD_TICKET']} {time.time()}\\n")
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".cdd").mkdir()
+    monkeypatch.chdir(tmp_path)
+    forget_project_roots()
+    yield tmp_path
+    forget_project_roots()
+
+
+@pytest.fixture
+def executor(tmp_path):
+    script = tmp_path / "fake_executor.py"
+    script.write_text(EXECUTOR_SCRIPT)
+    events = tmp_path / "events.log"
+    command = (
+        f"{shlex.quote(sys.executable)} {shlex.quote(str(script))} "
+        f"{shlex.quote(str(events))}"
+    )
+    return command, events
+
+
+def make_ticket(
+    root,
+    name,
+    status="planned",
+    priority="medium",
+    depends_on=None,
+    files=(),
+    location="tickets",
+):
+    ticket_dir = root / "specs" / location / name
+    ticket_dir.mkdir(parents=True)
+    ticket = {"type": name.split("-")[0], "status": status}
+    if priority:
+        ticket["priority"] = priority
+    if depends_on:
+        ticket["depends_on"] = depends_on
+    (ticket_dir / "spec.yaml").write_text(
+        yaml.safe_dump({"title": name, "ticket": ticket})
+    )
+    plan = "# Plan\n\n## File Structure\n\n"
+    plan += "".join(f"1. **`{path}`**\n" for path in files)
+    (ticket_dir / "plan.md").write_text(plan)
+    return ticket_dir
+
+
+def read_events(events):
+    spans = {}
+    for line in events.read_text().splitlines():
+        kind, name, at = line.split()
+        spans.setdefault(name, {})[kind] = float(at)
+    return spans
+
+
+def test_plan_files_skip_reference_sections_and_code():
+    plan = """# Plan
+
+## File Structure
+
+### New Files to Create
+
+1. **`src/app/models.py`**
+   - Uses `ProgressHandler.read_progress` and `config.yaml`
+
+### Files to Reference for Patterns
+
+1. **`src/app/legacy.py`**
+
+## Implementation Steps
+
+```python
+open("`src/ignored.py`")
+```
+
+Touch `./docs/` and `[path/to/file.py]`.
+"""
+    assert plan_files(plan) == ["config.yaml", "docs/", "src/app/models.py"]
+
+
+def test_plan_files_ignore_dotted_code_references():
+    plan = """# Plan
+
+## Implementation Steps
+
+### Step 1: Wire it up
+
+Call `helper.run`, `os.path` and `json.dumps` from `runner.py`; keep
+`settings.TOML` and `app/helper.run` as they are.
+"""
+    assert plan_files(plan) == ["app/helper.run", "runner.py", "settings.TOML"]
+
+
+def test_files_overlap_matches_files_and_directories():
+    assert files_overlap(["src/a.py"], ["src/b.py", "src/a.py"])
+    assert files_overlap(["docs/"], ["docs/guide.md"])
+    assert not files_overlap(["src/a.py"], ["src/a.pyc", "tests/a.py"])
+
+
+def test_select_orders_planned_tickets_by_priority(project):
+    make_ticket(project, "feature-low", priority="low")
+    make_ticket(project, "bug-critical", priority="critical")
+    make_ticket(project, "feature-draft", status="draft")
+    make_ticket(project, "feature-high", priority="high")
+    (make_ticket(project, "spike-noplan") / "plan.md").unlink()
+
+    queue = select_tickets(project)
+
+    assert [t["name"] for t in queue] == [
+        "bug-critical",
+        "feature-high",
+        "feature-low",
+    ]
+
+
+def test_select_rejects_unplanned_named_ticket(project):
+    make_ticket(project, "feature-draft", status="draft")
+
+    with pytest.raises(SchedulerError, match="not planned"):
+        select_tickets(project, ["feature-draft"])
+    with pytest.raises(SchedulerError, match="not found"):
+        select_tickets(project, ["feature-missing"])
+
+
+def test_order_puts_dependencies_first(project):
+    make_ticket(project, "feature-api", priority="low")
+    make_ticket(
+        project, "feature-ui", priority="high", depends_on=["feature-api"]
+    )
+    make_ticket(project, "bug-fix", priority="medium")
+
+    ordered = order_queue(select_tickets(project))
+
+    assert [t["name"] for t in ordered] == [
+        "bug-fix",
+        "feature-api",
+        "feature-ui",
+    ]
+
+
+def test_executor_command_substitutes_placeholders(project):
+    ticket_dir = make_ticket(project, "feature-x")
+    (ticket,) = select_tickets(project)
+
+    assert executor_command("run --plan {plan} '{ticket} now'", ticket) == [
+        "run",
+        "--plan",
+        str(ticket_dir / "plan.md"),
+        "feature-x now",
+    ]
+    with pytest.raises(SchedulerError, match="placeholders"):
+        executor_command("run {unknown}", ticket)
+
+
+def test_settings_come_from_config(project):
+    (project / ".cdd" / "config.yaml").write_text(
+        yaml.safe_dump(
+            {"run_queue": {"executor": "agent {ticket}", "workers": 3}}
+        )
+    )
+
+    settings = load_settings(project)
+
+    assert settings["executor"] == "agent {ticket}"
+    assert settings["workers"] == 3
+    assert settings["timeout"] is None
+
+
+def test_run_parallelizes_disjoint_and_serializes_overlapping(
+    project, executor
+):
+    command, events = executor
+    make_ticket(project, "feature-a", files=["src/shared.py"])
+    make_ticket(project, "feature-b", files=["src/shared.py", "src/b.py"])
+    make_ticket(project, "feature-c", files=["src/c.py"])
+
+    results = RunQueue(
+        project, select_tickets(project), executor=command, workers=3
+    ).run()
+
+    assert {r["name"]: r["status"] for r in results} == {
+        "feature-a": "completed",
+        "feature-b": "completed",
+        "feature-c": "completed",
+    }
+    spans = read_events(events)
+    assert spans["feature-b"]["start"] >= spans["feature-a"]["end"]
+    assert spans["feature-c"]["start"] < spans["feature-a"]["end"]
+    assert (project / ".cdd/cache/run-queue/feature-a.log").exists()
+    status = ProgressHandler.read_progress(
+        project / "specs/tickets/feature-c/progress.yaml"
+    )["status"]
+    assert status == "completed"
+
+
+def test_failed_dependency_blocks_dependents(project, executor):
+    command, events = executor
+    api = make_ticket(project, "feature-api")
+    (api / "FAKE_RESULT").write_text("crash")
+    make_ticket(project, "feature-ui", depends_on=["feature-api"])
+    make_ticket(project, "feature-docs", depends_on=["feature-ui"])
+    make_ticket(project, "feature-other", depends_on=["feature-elsewhere"])
+    make_ticket(
+        project, "feature-done", status="completed", location="archive"
+    )
+    make_ticket(project, "feature-next", depends_on=["feature-done"])
+
+    results = {
+        r["name"]: r
+        for r in RunQueue(
+            project, select_tickets(project), executor=command, workers=2
+        ).run()
+    }
+
+    assert results["feature-api"]["status"] == "failed"
+    assert results["feature-api"]["returncode"] == 3
+    assert results["feature-ui"]["status"] == "blocked"
+    assert "feature-api" in results["feature-ui"]["reason"]
+    assert results["feature-docs"]["status"] == "blocked"
+    assert results["feature-other"]["status"] == "blocked"
+    assert results["feature-next"]["status"] == "completed"
+    assert set(read_events(events)) == {"feature-api", "feature-next"}
+
+
+def test_dependency_cycles_are_blocked(project, executor):
+    command, _ = executor
+    make_ticket(project, "feature-a", depends_on=["feature-b"])
+    make_ticket(project, "feature-b", depends_on=["feature-a"])
+
+    results = RunQueue(
+        project, select_tickets(project), executor=command
+    ).run()
+
+    assert {r["status"] for r in results} == {"blocked"}
+    assert all(r["reason"] == "dependency cycle" for r in results)
+
+
+def test_unfinished_progress_and_timeouts(project, executor):
+    command, _ = executor
+    stuck = make_ticket(project, "feature-stuck")
+    (stuck / "FAKE_RESULT").write_text("blocked")
+    make_ticket(project, "feature-slow")
+
+    results = {
+        r["name"]: r
+        for r in RunQueue(
+            project, select_tickets(project, ["feature-stuck"]), command
+        ).run()
+    }
+    assert results["feature-stuck"]["status"] == "incomplete"
+    assert "blocked" in results["feature-stuck"]["reason"]
+
+    (slow,) = RunQueue(
+        project,
+        select_tickets(project, ["feature-slow"]),
+        command,
+        timeout=0.1,
+    ).run()
+    assert slow["status"] == "failed"
+    assert "timed out" in slow["reason"]
+
+
+def test_cli_dry_run_and_run(project, executor):
+    command, _ = executor
+    make_ticket(project, "feature-one", priority="high")
+    failing = make_ticket(project, "bug-two")
+    (failing / "FAKE_RESULT").write_text("crash")
+
+    dry = CliRunner().invoke(main, ["run-queue", "--dry-run"])
+    assert dry.exit_code == 0
+    assert dry.output.index("feature-one") < dry.output.index("bug-two")
+    assert not (project / ".cdd/cache/run-queue").exists()
+
+    result = CliRunner().invoke(
+        main, ["run-queue", "-j", "2", "--executor", command]
+    )
+    assert result.exit_code == 1
+    assert "1 completed" in result.output
+    assert "1 failed" in result.output
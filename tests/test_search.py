@@ -0,0 +1,205 @@
+"""Tests for BM25 full-text search."""
+
+import os
+
+import pytest
+import yaml
+
+from cddoc import search as search_module
+from cddoc.search import (
+    SearchIndex,
+    extract_fields,
+    make_snippet,
+    read_document,
+    tokenize,
+)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    tickets = tmp_path / "specs" / "tickets"
+    _write(
+        tickets / "feature-rate-limit" / "spec.yaml",
+        yaml.safe_dump(
+            {
+                "title": "API rate limiting",
+                "acceptance_criteria": ["Requests over quota get 429"],
+                "ticket": {"type": "feature"},
+            }
+        ),
+    )
+    _write(
+        tickets / "feature-rate-limit" / "plan.md",
+        "# Plan\n\n## Token bucket\n\nStore counters in Redis.\n",
+    )
+    _write(
+        tickets / "bug-login" / "spec.yaml",
+        yaml.safe_dump(
+            {
+                "title": "Login fails",
+                "description": "Too many requests return 500",
+                "ticket": {"type": "bug"},
+            }
+        ),
+    )
+    _write(
+        tmp_path / "specs" / "archive" / "feature-old" / "spec.yaml",
+        "title: Old quota system\nticket:\n  type: feature\n",
+    )
+    _write(
+        tmp_path / "docs" / "guides" / "limits.md",
+        "# Limits Guide\n\nHow rate limits protect the API.\n",
+    )
+    (tmp_path / "docs" / "notes.txt").write_text("rate limiting")
+    return tmp_path
+
+
+@pytest.fixture
+def index(project):
+    search_index = SearchIndex(project)
+    search_index.refresh()
+    yield search_index
+    search_index.close()
+
+
+def test_tokenize():
+    """Test terms are lowercased and stopwords dropped."""
+    assert tokenize("The Rate-Limit of a API_v2") == [
+        "rate",
+        "limit",
+        "api_v2",
+    ]
+
+
+def test_extract_spec_fields():
+    """Test spec title and acceptance criteria are separate fields."""
+    fields = extract_fields(
+        "specs/tickets/feature-x/spec.yaml",
+        "title: Export\nacceptance_criteria:\n  - CSV works\nnotes: fast\n",
+    )
+
+    assert fields["title"] == "Export feature x"
+    assert fields["acceptance_criteria"] == "CSV works"
+    assert fields["body"] == "fast"
+
+
+def test_extract_markdown_fields():
+    """Test the first H1 is the title and other headings are boosted."""
+    fields = extract_fields("docs/a.md", "# Title\n## Setup\ntext\n")
+
+    assert fields == {"title": "Title", "headings": "Setup", "body": "text"}
+
+
+def test_indexes_specs_plans_and_docs(project, index):
+    """Test every indexable file is added once."""
+    assert index.refresh() == {"added": 0, "updated": 0, "removed": 0}
+    paths = {row[0] for row in index.db.execute("SELECT path FROM docs")}
+
+    assert paths == {
+        "specs/tickets/feature-rate-limit/spec.yaml",
+        "specs/tickets/feature-rate-limit/plan.md",
+        "specs/tickets/bug-login/spec.yaml",
+        "specs/archive/feature-old/spec.yaml",
+        "docs/guides/limits.md",
+    }
+
+
+def test_title_boost_ranks_first(index):
+    """Test a title match outranks a body match."""
+    hits = index.search("rate limiting")
+
+    assert hits[0]["path"] == "specs/tickets/feature-rate-limit/spec.yaml"
+    assert hits[0]["title"] == "API rate limiting"
+    assert hits[0]["kind"] == "spec"
+    assert [h["score"] for h in hits] == sorted(
+        (h["score"] for h in hits), reverse=True
+    )
+
+
+def test_filters_and_limits(index):
+    """Test kind filtering and result limits."""
+    assert [h["path"] for h in index.search("rate", kind="doc")] == [
+        "docs/guides/limits.md"
+    ]
+    assert len(index.search("rate", limit=1)) == 1
+    assert index.search("nonexistent") == []
+    assert index.search("the") == []
+
+
+def test_incremental_update_by_hash(project, index):
+    """Test only changed content is re-indexed."""
+    plan = project / "specs" / "tickets" / "feature-rate-limit" / "plan.md"
+    _bump_mtime(plan)
+    assert index.refresh() == {"added": 0, "updated": 0, "removed": 0}
+
+    _write(plan, "# Plan\n\nUse a sliding window.\n")
+    _bump_mtime(plan)
+    (project / "docs" / "guides" / "limits.md").unlink()
+
+    assert index.refresh() == {"added": 0, "updated": 1, "removed": 1}
+    assert index.search("redis") == []
+    assert index.search("sliding")[0]["kind"] == "plan"
+
+
+def test_update_paths(project, index):
+    """Test targeted updates used by watch mode."""
+    doc = project / "docs" / "guides" / "quota.md"
+    _write(doc, "# Quota\n\nDaily quotas.\n")
+
+    index.update_paths(["docs/guides/quota.md", "src/app.py"])
+
+    assert index.search("daily")[0]["path"] == "docs/guides/quota.md"
+    doc.unlink()
+    index.update_paths(["docs/guides/quota.md"])
+    assert index.search("daily") == []
+
+
+def test_index_persisted(project, index):
+    """Test a reopened index needs no re-indexing."""
+    reopened = SearchIndex(project)
+
+    assert reopened.refresh() == {"added": 0, "updated": 0, "removed": 0}
+    assert reopened.search("quota")
+    reopened.close()
+
+
+def test_rebuild_on_boost_change(project, index, monkeypatch):
+    """Test changing field boosts discards the index."""
+    monkeypatch.setitem(search_module.FIELD_BOOSTS, "title", 5.0)
+
+    reopened = SearchIndex(project)
+
+    assert reopened.refresh()["added"] == 5
+    reopened.close()
+
+
+def test_mmap_read(tmp_path, monkeypatch):
+    """Test large files are read through mmap with the same result."""
+    path = tmp_path / "big.md"
+    path.write_text("word " * 100)
+
+    small = read_document(path)
+    monkeypatch.setattr(search_module, "MMAP_THRESHOLD", 1)
+
+    assert read_document(path) == small
+
+
+def test_snippet_centers_on_terms():
+    """Test snippets show the passage containing the query terms."""
+    text = "intro " * 100 + "the redis token bucket stores counters"
+
+    snippet = make_snippet(text, ["redis", "bucket"], width=60)
+
+    assert snippet.startswith("…")
+    assert "redis token bucket" in snippet
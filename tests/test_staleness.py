@@ -0,0 +1,148 @@
+"""Tests for documentation staleness detection."""
+
+import json
+import subprocess
+
+import pytest
+
+from cddoc.staleness import (
+    CACHE_FILE,
+    FileHistory,
+    StalenessError,
+    find_stale_docs,
+    parse_numstat_log,
+    referenced_sources,
+)
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _commit(cwd, message):
+    _git(cwd, "add", "-A")
+    _git(cwd, "commit", "-qm", message)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    (tmp_path / "src" / "api").mkdir(parents=True)
+    (tmp_path / "src" / "api" / "routes.py").write_text("a = 1\n")
+    (tmp_path / "src" / "api-old").mkdir()
+    (tmp_path / "src" / "api-old" / "legacy.py").write_text("x = 1\n")
+    (tmp_path / "src" / "auth.py").write_text("b = 1\n")
+    features = tmp_path / "docs" / "features"
+    features.mkdir(parents=True)
+    (features / "api.md").write_text("# API\n\nRoutes live in `src/api/`.\n")
+    (features / "auth.md").write_text("# Auth\n\nSee auth.py for tests.\n")
+    _git(tmp_path, "init", "-q")
+    _commit(tmp_path, "initial")
+    return tmp_path
+
+
+def test_parse_numstat_log():
+    """Test commits are numbered oldest first with per-file lines."""
+    output = (
+        "\x1eb2 200\n\n3\t1\tsrc/a.py\n-\t-\tlogo.png\n"
+        "\x1ea1 100\n\n5\t0\tsrc/a.py\n"
+    )
+
+    commits, files = parse_numstat_log(output, 10)
+
+    assert commits == [{"sha": "a1", "time": 100}, {"sha": "b2", "time": 200}]
+    assert files == {"src/a.py": [[10, 5], [11, 4]], "logo.png": [[11, 0]]}
+
+
+def test_referenced_sources():
+    """Test paths, relative links and unique file names are resolved."""
+    files = {
+        "src/api/routes.py",
+        "src/util.py",
+        "lib/util.py",
+        "src/auth.py",
+        "docs/other.md",
+    }
+    dirs = {"src", "src/api", "lib", "docs"}
+    basenames = {
+        "routes.py": "src/api/routes.py",
+        "util.py": None,
+        "auth.py": "src/auth.py",
+        "other.md": "docs/other.md",
+    }
+    text = (
+        "Code in `src/api/`, [auth](../src/auth.py), util.py, routes.py.\n"
+        "The src folder and [docs](other.md) are not sources.\n"
+    )
+
+    sources = referenced_sources(text, "docs/page.md", files, dirs, basenames)
+
+    assert sources == ["src/api", "src/api/routes.py", "src/auth.py"]
+
+
+def test_stale_docs_ranked_by_source_changes(project):
+    """Test only changes after a page's last commit count."""
+    (project / "src" / "api" / "routes.py").write_text("a = 2\nb = 3\n")
+    (project / "src" / "api-old" / "legacy.py").write_text("x = 2\n")
+    _commit(project, "change routes")
+    (project / "src" / "auth.py").write_text("b = 2\n")
+    _commit(project, "change auth")
+    (project / "docs" / "features" / "auth.md").write_text(
+        "# Auth\n\nUpdated for auth.py.\n"
+    )
+    _commit(project, "update auth docs")
+
+    results = find_stale_docs(project, include_current=True)
+
+    assert [doc["path"] for doc in results] == [
+        "docs/features/api.md",
+        "docs/features/auth.md",
+    ]
+    api = results[0]
+    assert api["sources"] == ["src/api"]
+    assert api["commits"] == 1
+    assert api["lines_changed"] == 3
+    assert api["changed_files"] == ["src/api/routes.py"]
+    assert results[1]["lines_changed"] == 0
+    assert find_stale_docs(project) == [api]
+
+
+def test_history_cached_by_head(project, monkeypatch):
+    """Test the history is reused for HEAD and extended incrementally."""
+    first = FileHistory.load(project)
+    cache = json.loads((project / ".cdd" / "cache" / CACHE_FILE).read_text())
+    assert cache["head"] == first.head
+
+    (project / "src" / "auth.py").write_text("b = 2\nc = 3\n")
+    _commit(project, "change auth")
+    calls = []
+    original = subprocess.run
+
+    def _recording_run(args, **kwargs):
+        calls.append(args)
+        return original(args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", _recording_run)
+    second = FileHistory.load(project)
+
+    log = [args for args in calls if "log" in args][0]
+    assert log[-1] == f"{first.head}..{second.head}"
+    assert len(second.commits) == 2
+    assert second.files["src/auth.py"] == [[0, 1], [1, 3]]
+
+    calls.clear()
+    FileHistory.load(project)
+    assert not [args for args in calls if "log" in args]
+
+
+def test_not_a_git_repository(tmp_path):
+    """Test a clear error outside git."""
+    (tmp_path / ".cdd").mkdir()
+
+    with pytest.raises(StalenessError):
+        find_stale_docs(tmp_path)
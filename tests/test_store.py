@@ -0,0 +1,206 @@
+"""Tests for shared content-addressed store."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cddoc.init import initialize_project
+from cddoc.store import (
+    FrameworkStore,
+    StoreError,
+    default_store_dir,
+    hash_bytes,
+)
+
+
+def test_default_store_dir_env_override(tmp_path, monkeypatch):
+    """Test $CDD_STORE_DIR takes precedence."""
+    monkeypatch.setenv("CDD_STORE_DIR", str(tmp_path / "store"))
+    assert default_store_dir() == tmp_path / "store"
+
+
+def test_default_store_dir_xdg_cache(tmp_path, monkeypatch):
+    """Test $XDG_CACHE_HOME is used when no override is set."""
+    monkeypatch.delenv("CDD_STORE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_store_dir() == tmp_path / "cdd" / "store"
+
+
+def test_add_bytes_is_content_addressed(tmp_path):
+    """Test identical content maps to a single object."""
+    store = FrameworkStore(tmp_path)
+
+    digest1 = store.add_bytes(b"hello")
+    digest2 = store.add_bytes(b"hello")
+
+    assert digest1 == digest2 == hash_bytes(b"hello")
+    assert store.object_path(digest1).read_bytes() == b"hello"
+    assert store.read(digest1) == b"hello"
+
+
+def test_add_bytes_from_many_threads(tmp_path):
+    """Test threads adding the same new object don't collide."""
+    for attempt in range(20):
+        store = FrameworkStore(tmp_path / str(attempt))
+        data = b"shared command " + str(attempt).encode()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            digests = list(
+                pool.map(lambda _: store.add_bytes(data), range(32))
+            )
+
+        assert set(digests) == {hash_bytes(data)}
+        assert store.read(digests[0]) == data
+        objects_dir = store.object_path(digests[0]).parent
+        assert not list(objects_dir.glob("*.tmp"))
+
+
+def test_read_detects_corruption(tmp_path):
+    """Test read verifies object integrity."""
+    store = FrameworkStore(tmp_path)
+    digest = store.add_bytes(b"original")
+    object_path = store.object_path(digest)
+    object_path.chmod(0o644)
+    object_path.write_bytes(b"tampered")
+
+    with pytest.raises(StoreError, match="corrupted"):
+        store.read(digest)
+    assert store.has(digest) is False
+
+
+def test_add_bytes_repairs_corrupted_object(tmp_path):
+    """Test re-adding known content rewrites a corrupted object."""
+    store = FrameworkStore(tmp_path)
+    digest = store.add_bytes(b"original")
+    object_path = store.object_path(digest)
+    object_path.chmod(0o644)
+    object_path.write_bytes(b"tampered")
+
+    store.add_bytes(b"original")
+
+    assert store.read(digest) == b"original"
+
+
+def test_read_missing_object(tmp_path):
+    """Test reading an unknown digest fails."""
+    store = FrameworkStore(tmp_path)
+
+    with pytest.raises(StoreError, match="not found"):
+        store.read(hash_bytes(b"missing"))
+
+
+@pytest.mark.parametrize("mode", ["hardlink", "symlink", "copy"])
+def test_install_modes(tmp_path, mode):
+    """Test each explicit link mode materializes the content."""
+    store = FrameworkStore(tmp_path / "store")
+    digest = store.add_bytes(b"command")
+    target = tmp_path / "project" / "cmd.md"
+
+    method = store.install(digest, target, mode)
+
+    assert method == mode
+    assert target.read_bytes() == b"command"
+
+
+def test_install_hardlink_shares_inode(tmp_path):
+    """Test hardlinked installs share the object's inode."""
+    store = FrameworkStore(tmp_path / "store")
+    digest = store.add_bytes(b"command")
+    target = tmp_path / "cmd.md"
+
+    store.install(digest, target, "hardlink")
+
+    assert os.stat(target).st_ino == os.stat(store.object_path(digest)).st_ino
+
+
+def test_install_auto_falls_back(tmp_path):
+    """Test auto mode picks a working method."""
+    store = FrameworkStore(tmp_path / "store")
+    digest = store.add_bytes(b"command")
+    target = tmp_path / "cmd.md"
+
+    method = store.install(digest, target)
+
+    assert method in ("reflink", "hardlink", "symlink", "copy")
+    assert target.read_bytes() == b"command"
+
+
+def test_install_replaces_existing_file(tmp_path):
+    """Test install overwrites an existing target."""
+    store = FrameworkStore(tmp_path / "store")
+    digest = store.add_bytes(b"new")
+    target = tmp_path / "cmd.md"
+    target.write_bytes(b"old")
+
+    store.install(digest, target, "copy")
+
+    assert target.read_bytes() == b"new"
+
+
+def test_install_invalid_mode(tmp_path):
+    """Test unknown link modes are rejected."""
+    store = FrameworkStore(tmp_path)
+    digest = store.add_bytes(b"x")
+
+    with pytest.raises(StoreError, match="Invalid link mode"):
+        store.install(digest, tmp_path / "out", "teleport")
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def test_shared_store_symlinks_keep_claude_md_writable(tmp_path, monkeypatch):
+    """Test CLAUDE.md doesn't inherit the read-only mode of store objects."""
+    monkeypatch.setattr("cddoc.init.prompt_language_selection", lambda: "en")
+    monkeypatch.setenv("CDD_STORE_DIR", str(tmp_path / "store"))
+    project = tmp_path / "project"
+
+    initialize_project(str(project), shared_store=True, link_mode="symlink")
+
+    claude_md = project / "CLAUDE.md"
+    assert not claude_md.is_symlink()
+    assert os.stat(claude_md).st_mode & 0o200
+
+
+def test_initialize_project_shared_store(tmp_path, monkeypatch):
+    """Test init links framework files from the shared store."""
+    monkeypatch.setattr("cddoc.init.prompt_language_selection", lambda: "en")
+    monkeypatch.setenv("CDD_STORE_DIR", str(tmp_path / "store"))
+    project = tmp_path / "project"
+
+    result = initialize_project(
+        str(project), shared_store=True, link_mode="hardlink"
+    )
+
+    socrates = project / ".claude" / "commands" / "socrates.md"
+    store = FrameworkStore(tmp_path / "store")
+    digest = hash_bytes(socrates.read_bytes())
+    assert result["store_path"] == tmp_path / "store"
+    assert (
+        os.stat(socrates).st_ino == os.stat(store.object_path(digest)).st_ino
+    )
+
+    # CLAUDE.md must be an independent, editable copy
+    claude_md = project / "CLAUDE.md"
+    assert claude_md.exists()
+    assert os.stat(claude_md).st_nlink == 1
+    assert os.stat(claude_md).st_mode & 0o777 == 0o666 & ~_umask()
+
+
+def test_reinitialize_without_store_does_not_touch_objects(
+    tmp_path, monkeypatch
+):
+    """Test copying over linked files never writes into the store."""
+    monkeypatch.setattr("cddoc.init.prompt_language_selection", lambda: "en")
+    monkeypatch.setenv("CDD_STORE_DIR", str(tmp_path / "store"))
+    project = tmp_path / "project"
+    initialize_project(str(project), shared_store=True, link_mode="symlink")
+
+    initialize_project(str(project), force=True)
+
+    socrates = project / ".claude" / "commands" / "socrates.md"
+    assert not socrates.is_symlink()
+    store = FrameworkStore(tmp_path / "store")
+    assert store.has(hash_bytes(socrates.read_bytes()))
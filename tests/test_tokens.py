@@ -0,0 +1,181 @@
+"""Tests for token estimation and prompt-size profiling."""
+
+import subprocess
+
+import pytest
+
+from cddoc.tokens import (
+    TokenEstimatorError,
+    chars_estimator,
+    discover_token_targets,
+    estimate_tokens,
+    get_estimator,
+    group_for,
+    load_budgets,
+    over_budget,
+    profile_tokens,
+    read_at_revision,
+    register_estimator,
+    section_breakdown,
+    split_sections,
+    words_estimator,
+)
+
+
+def test_builtin_estimators():
+    """Test the chars and words estimators."""
+    assert chars_estimator("") == 0
+    assert chars_estimator("abcde") == 2
+    assert words_estimator("Hello, world!") == 4
+    assert estimate_tokens("abcdefgh") == 2
+
+
+def test_plugin_estimators():
+    """Test registered and module:function estimators."""
+    register_estimator("test-lines", lambda text: text.count("\n"))
+
+    assert estimate_tokens("a\nb\n", "test-lines") == 2
+    assert get_estimator("builtins:len")("abc") == 3
+    with pytest.raises(TokenEstimatorError):
+        get_estimator("nope")
+    with pytest.raises(TokenEstimatorError):
+        get_estimator("no_such_module:func")
+
+
+def test_markdown_sections_skip_code_fences():
+    """Test headings inside fenced code blocks are not boundaries."""
+    text = "intro\n# Title\ntext\n```\n# not a heading\n```\n## Sub\nmore\n"
+
+    sections = split_sections(text, "doc.md")
+
+    assert [(h, level, line) for h, level, line, _ in sections] == [
+        ("(preamble)", 0, 1),
+        ("Title", 1, 2),
+        ("Sub", 2, 7),
+    ]
+
+
+def test_yaml_sections_by_top_level_key():
+    """Test YAML files break down by top-level key."""
+    text = "# comment\ntitle: x\nticket:\n  type: bug\n"
+
+    breakdown = section_breakdown(text, "spec.yaml", chars_estimator)
+
+    assert [s["heading"] for s in breakdown] == [
+        "(preamble)",
+        "title",
+        "ticket",
+    ]
+    assert sum(s["tokens"] for s in breakdown) >= chars_estimator(text) - 2
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd" / "templates").mkdir(parents=True)
+    (tmp_path / ".cdd" / "templates" / "bug-plan-template.md").write_text(
+        "# Bug\n"
+    )
+    commands = tmp_path / ".claude" / "commands"
+    commands.mkdir(parents=True)
+    (commands / "plan.md").write_text("# Plan\n" + "x" * 400)
+    ticket = tmp_path / "specs" / "tickets" / "bug-x"
+    ticket.mkdir(parents=True)
+    (ticket / "spec.yaml").write_text("title: x\n")
+    (ticket / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_discover_targets(project):
+    """Test commands, templates and ticket artifacts are profiled."""
+    targets = discover_token_targets(project)
+
+    assert [t.relative_to(project).as_posix() for t in targets] == [
+        ".claude/commands/plan.md",
+        ".cdd/templates/bug-plan-template.md",
+        "specs/tickets/bug-x/spec.yaml",
+    ]
+    assert [group_for(t, project) for t in targets] == [
+        "commands",
+        "templates",
+        "tickets",
+    ]
+
+
+def test_groups_ignore_folders_above_the_project(tmp_path):
+    """Test a project nested under a `commands` folder is grouped right."""
+    root = tmp_path / "commands" / "templates" / "specs" / "app"
+    (root / "docs").mkdir(parents=True)
+    (root / "docs" / "guide.md").write_text("# Guide\n")
+    (root / ".cdd" / "templates").mkdir(parents=True)
+    (root / ".cdd" / "templates" / "bug-template.yaml").write_text("x: 1\n")
+    targets = [
+        root / "docs" / "guide.md",
+        root / ".cdd" / "templates" / "bug-template.yaml",
+    ]
+
+    report = profile_tokens(targets, project_root=root)
+
+    assert [f["group"] for f in report["files"]] == ["other", "templates"]
+    assert group_for(targets[0]) == "commands"
+    assert group_for(targets[0], root) == "other"
+
+
+def test_packaged_commands_fallback(tmp_path):
+    """Test packaged command files are used when none are installed."""
+    targets = discover_token_targets(tmp_path, "en")
+
+    assert "socrates.md" in {t.name for t in targets}
+    assert {group_for(t, tmp_path) for t in targets} == {"commands"}
+
+
+def test_budgets(project):
+    """Test budgets from config and over-budget detection."""
+    (project / ".cdd" / "config.yaml").write_text(
+        "language: en\ntoken_budgets:\n  commands: 50\n"
+    )
+    budgets = load_budgets(project)
+
+    report = profile_tokens(
+        discover_token_targets(project), budgets=budgets, project_root=project
+    )
+
+    assert budgets["commands"] == 50
+    assert budgets["templates"] == 3000
+    assert [f["group"] for f in over_budget(report)] == ["commands"]
+    assert report["total"] == sum(f["tokens"] for f in report["files"])
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_diff_against_release(project):
+    """Test token changes are reported against a git revision."""
+    _git(project, "init", "-q")
+    _git(project, "add", ".")
+    _git(project, "commit", "-qm", "release")
+    _git(project, "tag", "v1")
+    plan = project / ".claude" / "commands" / "plan.md"
+    plan.write_text(plan.read_text() + "y" * 400)
+    new_file = project / "specs" / "tickets" / "bug-x" / "plan.md"
+    new_file.write_text("# New\n")
+
+    report = profile_tokens([plan, new_file], against="v1", repo_dir=project)
+
+    assert report["files"][0]["tokens"] - report["files"][0]["previous"] == (
+        100
+    )
+    assert report["files"][1]["previous"] is None
+
+
+def test_read_at_revision_outside_repo(tmp_path):
+    """Test files outside a repository have no previous content."""
+    path = tmp_path / "a.md"
+    path.write_text("x")
+
+    assert read_at_revision(tmp_path, "HEAD", [path]) == {path: None}
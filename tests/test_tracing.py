@@ -0,0 +1,149 @@
+"""Tests for tracing spans and I/O counters."""
+
+import json
+
+import pytest
+import yaml
+
+from cddoc import tracing
+from cddoc.handlers.archive_handler import ArchiveHandler
+from cddoc.handlers.spec_handler import SpecHandler, SpecHandlerError
+from cddoc.tracing import (
+    FS_CALLS,
+    READ_BYTES,
+    WRITE_BYTES,
+    YAML_DUMP,
+    YAML_PARSE,
+    span,
+    traced,
+)
+
+
+@pytest.fixture(autouse=True)
+def _tracing_off():
+    yield
+    tracing.disable()
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "trace" / "spans.jsonl"
+    tracing.enable(path)
+    return path
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    path = tmp_path / "specs" / "tickets" / "feature-x" / "spec.yaml"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        yaml.safe_dump({"title": "X", "ticket": {"status": "draft"}})
+    )
+    return path
+
+
+def _spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_disabled_tracing_records_nothing(tmp_path, spec_path):
+    assert not tracing.is_enabled()
+
+    SpecHandler.update_status(spec_path, "planned")
+
+    with span("block") as started:
+        assert started is None
+    with tracing.measure(YAML_PARSE):
+        pass
+    assert not list(tmp_path.rglob("*.jsonl"))
+
+
+def test_nested_spans_share_trace_and_link_parents(trace_file):
+    @traced()
+    def inner():
+        tracing.add(READ_BYTES, 10)
+
+    with span("outer", custom="value"):
+        inner()
+        inner()
+
+    spans = _spans(trace_file)
+    assert [s["name"] for s in spans] == [
+        "test_nested_spans_share_trace_and_link_parents.<locals>.inner",
+        "test_nested_spans_share_trace_and_link_parents.<locals>.inner",
+        "outer",
+    ]
+    outer = spans[-1]
+    assert outer["parent_span_id"] is None
+    assert outer["attributes"]["custom"] == "value"
+    assert outer["attributes"][READ_BYTES] == 20
+    for child in spans[:2]:
+        assert child["trace_id"] == outer["trace_id"]
+        assert child["parent_span_id"] == outer["span_id"]
+        assert child["attributes"]["code.function"] == "inner"
+        assert child["attributes"][READ_BYTES] == 10
+    assert len(outer["trace_id"]) == 32
+    assert len(outer["span_id"]) == 16
+    assert outer["end_time_unix_nano"] >= outer["start_time_unix_nano"]
+    assert outer["status"] == {"code": "STATUS_CODE_OK"}
+    assert outer["resource"]["service.name"] == "cdd"
+
+
+def test_spans_are_flushed_when_the_root_ends(trace_file):
+    with span("root"):
+        with span("child"):
+            pass
+        assert not trace_file.exists()
+
+    assert len(_spans(trace_file)) == 2
+
+
+def test_update_status_records_io_and_yaml(trace_file, spec_path):
+    SpecHandler.update_status(spec_path, "planned")
+
+    spans = {s["name"]: s for s in _spans(trace_file)}
+    update = spans["SpecHandler.update_status"]
+    read = spans["SpecHandler.read_spec"]
+    write = spans["SpecHandler.write_spec"]
+
+    assert read["parent_span_id"] == update["span_id"]
+    assert write["parent_span_id"] == update["span_id"]
+    assert read["attributes"][READ_BYTES] > 0
+    assert read["attributes"][YAML_PARSE] > 0
+    assert read["attributes"][FS_CALLS] >= 1
+    assert write["attributes"][WRITE_BYTES] == len(spec_path.read_bytes())
+    assert write["attributes"][YAML_DUMP] > 0
+    assert update["attributes"][FS_CALLS] >= 2
+    assert update["attributes"][READ_BYTES] == read["attributes"][READ_BYTES]
+
+
+def test_filesystem_calls_are_counted(trace_file, tmp_path):
+    ticket = tmp_path / "specs" / "tickets" / "bug-y"
+    ticket.mkdir(parents=True)
+
+    ArchiveHandler.archive_ticket(ticket, tmp_path / "specs" / "archive")
+
+    (archived,) = _spans(trace_file)
+    assert archived["name"] == "ArchiveHandler.archive_ticket"
+    assert archived["attributes"][FS_CALLS] >= 2
+
+
+def test_failed_operation_sets_error_status(trace_file, tmp_path):
+    with pytest.raises(SpecHandlerError):
+        SpecHandler.read_spec(tmp_path / "missing.yaml")
+
+    (failed,) = _spans(trace_file)
+    assert failed["status"]["code"] == "STATUS_CODE_ERROR"
+    assert "missing.yaml" in failed["status"]["message"]
+    assert failed["attributes"]["exception.type"] == "SpecHandlerError"
+
+
+def test_spans_append_across_sessions(trace_file):
+    with span("first"):
+        pass
+    tracing.disable()
+    tracing.enable(trace_file)
+    with span("second"):
+        pass
+
+    assert [s["name"] for s in _spans(trace_file)] == ["first", "second"]
@@ -0,0 +1,306 @@
+"""Tests for spec and progress schema validation."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+from cddoc.handlers.progress_handler import ProgressHandler
+from cddoc.validation import (
+    ValidationCache,
+    compile_spec_schema,
+    compile_spec_schemas,
+    compile_typed_dict,
+    detect_kind,
+    discover_validation_targets,
+    get_progress_schema,
+    load_ticket_templates,
+    schema_fingerprint,
+    validate_files,
+    validate_text,
+)
+
+
+@pytest.fixture(scope="module")
+def schemas():
+    """Spec schemas compiled from the packaged templates."""
+    return compile_spec_schemas(load_ticket_templates())
+
+
+def _feature_spec(**ticket_overrides):
+    ticket = {"type": "feature", "priority": "high", "status": "draft"}
+    ticket.update(ticket_overrides)
+    return yaml.safe_dump(
+        {
+            "title": "User authentication",
+            "acceptance_criteria": ["Users can log in"],
+            "ticket": ticket,
+        }
+    )
+
+
+class TestSpecSchemaCompilation:
+    """Test schemas derived from ticket templates."""
+
+    def test_enum_from_bracketed_choices(self):
+        """Test [a/b/c] placeholders compile to enums."""
+        schema = compile_spec_schema(
+            "bug", "title: x\nticket:\n  priority: [critical/high/low]\n"
+        )
+
+        priority = schema["node"]["fields"]["ticket"]["fields"]["priority"]
+        assert priority["kind"] == "enum"
+        assert priority["choices"] == ["critical", "high", "low"]
+
+    def test_type_and_status_enums(self):
+        """Test ticket.type is pinned and ticket.status uses TicketStatus."""
+        schema = compile_spec_schema("spike", "title: x\nticket: {}\n")
+
+        fields = schema["node"]["fields"]["ticket"]["fields"]
+        assert fields["type"]["choices"] == ["spike"]
+        assert "planned" in fields["status"]["choices"]
+
+    def test_placeholders_collected_from_template(self):
+        """Test placeholders exclude template comments."""
+        schema = compile_spec_schema(
+            "feature",
+            '# [comment]\ntitle: "[Descriptive feature title]"\n'
+            "ticket:\n  type: feature\n",
+        )
+
+        assert schema["placeholders"] == ["[Descriptive feature title]"]
+
+    def test_all_packaged_templates_compile(self, schemas):
+        """Test every ticket type has a schema."""
+        assert set(schemas) == {"feature", "bug", "spike", "enhancement"}
+
+
+class TestValidateSpec:
+    """Test spec validation."""
+
+    def test_valid_spec(self, schemas):
+        """Test a filled-in spec passes."""
+        assert validate_text("spec", _feature_spec(), schemas) == []
+
+    def test_unfilled_placeholder(self, schemas):
+        """Test template placeholders are reported with line numbers."""
+        text = (
+            'title: "[Descriptive feature title]"\nticket:\n  type: feature\n'
+        )
+
+        errors = validate_text("spec", text, schemas)
+
+        assert any(
+            "line 1" in e and "[Descriptive feature title]" in e
+            for e in errors
+        )
+
+    def test_invalid_enum(self, schemas):
+        """Test invalid enum values are reported."""
+        errors = validate_text(
+            "spec", _feature_spec(priority="urgent"), schemas
+        )
+
+        assert errors == [
+            "ticket.priority: expected one of high, medium, low "
+            "(got 'urgent')"
+        ]
+
+    def test_invalid_status(self, schemas):
+        """Test status must be a TicketStatus value."""
+        errors = validate_text("spec", _feature_spec(status="done"), schemas)
+
+        assert len(errors) == 1
+        assert errors[0].startswith("ticket.status")
+
+    def test_yaml_booleans_match_yes_no_enums(self, schemas):
+        """Test bare yes/no (parsed as booleans) satisfy yes/no enums."""
+        text = (
+            "title: Faster search\n"
+            "impact_assessment:\n  breaking_changes: no\n"
+            "ticket:\n  type: enhancement\n"
+        )
+
+        assert validate_text("spec", text, schemas) == []
+
+    def test_missing_title(self, schemas):
+        """Test required fields are enforced."""
+        text = "ticket:\n  type: bug\n"
+
+        assert validate_text("spec", text, schemas) == [
+            "title: missing required field"
+        ]
+
+    def test_unknown_type(self, schemas):
+        """Test specs with an unknown type are rejected."""
+        errors = validate_text(
+            "spec", "title: x\nticket:\n  type: epic\n", schemas
+        )
+
+        assert any("ticket.type" in e for e in errors)
+
+    def test_type_inferred_from_folder(self, schemas):
+        """Test folder prefix selects the schema when type is missing."""
+        text = "title: x\nticket:\n  priority: high\n"
+
+        errors = validate_text(
+            "spec", text, schemas, "specs/tickets/bug-x/spec.yaml"
+        )
+
+        assert errors == ["ticket.type: missing required field"]
+
+    def test_grouped_list(self, schemas):
+        """Test lists grouped under headings are accepted."""
+        text = (
+            "title: x\nacceptance_criteria:\n  login:\n    - works\n"
+            "ticket:\n  type: feature\n"
+        )
+
+        assert validate_text("spec", text, schemas) == []
+
+    def test_invalid_yaml(self, schemas):
+        """Test malformed YAML is reported."""
+        errors = validate_text("spec", "title: [unclosed", schemas)
+
+        assert errors[0].startswith("Invalid YAML format")
+
+    def test_packaged_examples_are_valid(self, schemas):
+        """Test docs/examples specs pass validation."""
+        examples = Path(__file__).parent.parent / "docs" / "examples"
+        for example in examples.glob("*.yaml"):
+            assert validate_text("spec", example.read_text(), schemas) == []
+
+
+class TestValidateProgress:
+    """Test progress validation against the ProgressData TypedDicts."""
+
+    def test_initialized_progress_is_valid(self, tmp_path):
+        """Test progress created by ProgressHandler passes."""
+        data = ProgressHandler.initialize_progress(
+            Path("plan.md"), Path("spec.yaml")
+        )
+        data["steps"] = [
+            {
+                "step_id": 1,
+                "description": "Do it",
+                "status": "pending",
+                "started_at": None,
+                "completed_at": None,
+                "files_touched": [],
+            }
+        ]
+
+        assert validate_text("progress", yaml.safe_dump(data), {}) == []
+
+    def test_invalid_step(self):
+        """Test nested TypedDict fields are checked."""
+        data = ProgressHandler.initialize_progress(
+            Path("plan.md"), Path("spec.yaml")
+        )
+        data["steps"] = [{"step_id": "one", "status": "skipped"}]
+
+        errors = validate_text("progress", yaml.safe_dump(data), {})
+
+        assert "steps[0].step_id: expected an integer" in errors
+        assert "steps[0].description: missing required field" in errors
+        assert any(e.startswith("steps[0].status") for e in errors)
+
+    def test_compile_typed_dict_optional(self):
+        """Test Optional fields compile as nullable."""
+        node = get_progress_schema()["fields"]["steps"]["items"]
+
+        assert node["fields"]["started_at"]["nullable"] is True
+        assert compile_typed_dict(str) == {"kind": "text"}
+
+
+class TestValidateFiles:
+    """Test batch validation, discovery and caching."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / ".cdd").mkdir()
+        ticket = tmp_path / "specs" / "tickets" / "feature-login"
+        ticket.mkdir(parents=True)
+        (ticket / "spec.yaml").write_text(_feature_spec())
+        bad = tmp_path / "specs" / "tickets" / "bug-crash"
+        bad.mkdir()
+        (bad / "spec.yaml").write_text("ticket:\n  type: bug\n")
+        examples = tmp_path / "docs" / "examples"
+        examples.mkdir(parents=True)
+        (examples / "example.yaml").write_text(_feature_spec())
+        return tmp_path
+
+    def test_discover_targets(self, project):
+        """Test specs, progress files and examples are discovered."""
+        targets = discover_validation_targets(project)
+
+        assert [p.relative_to(project).as_posix() for p in targets] == [
+            "docs/examples/example.yaml",
+            "specs/tickets/bug-crash/spec.yaml",
+            "specs/tickets/feature-login/spec.yaml",
+        ]
+
+    def test_detect_kind(self):
+        """Test progress.yaml files use the progress schema."""
+        assert detect_kind(Path("a/progress.yaml")) == "progress"
+        assert detect_kind(Path("a/spec.yaml")) == "spec"
+
+    def test_results_are_cached(self, project):
+        """Test unchanged files are served from the cache."""
+        targets = discover_validation_targets(project)
+
+        first = validate_files(targets, project_root=project)
+        second = validate_files(targets, project_root=project)
+
+        assert [r["cached"] for r in first] == [False, False, False]
+        assert [r["cached"] for r in second] == [True, True, True]
+        assert [r["errors"] for r in first] == [r["errors"] for r in second]
+        assert (project / ".cdd" / "cache" / "validation.json").exists()
+
+    def test_changed_file_is_revalidated(self, project):
+        """Test content changes invalidate the cached result."""
+        targets = discover_validation_targets(project)
+        validate_files(targets, project_root=project)
+        targets[1].write_text(_feature_spec(type="bug"))
+
+        results = validate_files(targets, project_root=project)
+
+        assert results[1]["cached"] is False
+        assert results[1]["errors"] == []
+
+    def test_fail_fast(self, project):
+        """Test validation stops at the first invalid file."""
+        targets = discover_validation_targets(project)
+
+        results = validate_files(
+            targets, project_root=project, use_cache=False, fail_fast=True
+        )
+
+        assert len(results) == 2
+        assert results[-1]["errors"]
+
+    def test_process_pool(self, project, monkeypatch):
+        """Test large batches run in the process pool."""
+        monkeypatch.setattr("cddoc.validation.PARALLEL_THRESHOLD", 1)
+        targets = discover_validation_targets(project)
+
+        results = validate_files(
+            targets, project_root=project, max_workers=2, use_cache=False
+        )
+
+        assert [bool(r["errors"]) for r in results] == [False, True, False]
+
+    def test_cache_discarded_on_schema_change(self, tmp_path):
+        """Test results recorded under another fingerprint are ignored."""
+        cache_path = tmp_path / "validation.json"
+        cache = ValidationCache(cache_path, "old")
+        cache.put("key", [])
+        cache.save()
+
+        assert ValidationCache(cache_path, "old").get("key") == []
+        assert ValidationCache(cache_path, "new").get("key") is None
+
+    def test_fingerprint_tracks_templates(self):
+        """Test template edits change the schema fingerprint."""
+        assert schema_fingerprint({"bug": "a"}) != schema_fingerprint(
+            {"bug": "b"}
+        )
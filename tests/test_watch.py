@@ -0,0 +1,186 @@
+"""Tests for filesystem watch mode."""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from cddoc.docgraph import DocGraph
+from cddoc.search import SearchIndex
+from cddoc.watch import (
+    InotifyBackend,
+    PollingBackend,
+    Watcher,
+    WatchError,
+    WatchSession,
+    diff_snapshots,
+    is_watched,
+    scan_tree,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".cdd").mkdir()
+    ticket = tmp_path / "specs" / "tickets" / "feature-login"
+    ticket.mkdir(parents=True)
+    (ticket / "spec.yaml").write_text(
+        yaml.safe_dump(
+            {
+                "title": "Login",
+                "ticket": {"type": "feature", "status": "draft"},
+            }
+        )
+    )
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.md").write_text("# Docs\n")
+    return tmp_path
+
+
+def _touch(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_is_watched():
+    """Test only ticket files and docs pages are watched."""
+    assert is_watched("specs/tickets/feature-x/spec.yaml")
+    assert is_watched("specs/archive/bug-y/plan.md")
+    assert is_watched("docs/guides/setup.md")
+    assert not is_watched("specs/tickets/feature-x/notes.txt")
+    assert not is_watched("specs/tickets/spec.yaml")
+    assert not is_watched("src/app.py")
+
+
+def test_scan_and_diff(project):
+    """Test snapshots detect added, modified and deleted files."""
+    before = scan_tree(project, "specs")
+    spec = project / "specs" / "tickets" / "feature-login" / "spec.yaml"
+    _touch(spec, "title: Changed\n")
+    (spec.parent / "plan.md").write_text("# Plan\n")
+    (project / "specs" / "tickets" / "feature-login" / "x.txt").write_text("")
+
+    changes = diff_snapshots(before, scan_tree(project, "specs"))
+
+    assert changes == [
+        {"path": "specs/tickets/feature-login/plan.md", "action": "added"},
+        {
+            "path": "specs/tickets/feature-login/spec.yaml",
+            "action": "modified",
+        },
+    ]
+    assert diff_snapshots({"docs/a.md": (1, 1)}, {}) == [
+        {"path": "docs/a.md", "action": "deleted"}
+    ]
+
+
+def test_polling_watcher(project):
+    """Test the polling backend reports file-level changes."""
+    watcher = Watcher(project, PollingBackend(project, interval=0.1))
+    ticket = project / "specs" / "tickets" / "bug-crash"
+    ticket.mkdir()
+    (ticket / "spec.yaml").write_text("title: Crash\n")
+    (project / "docs" / "index.md").unlink()
+
+    changes = watcher.poll()
+
+    assert changes == [
+        {"path": "docs/index.md", "action": "deleted"},
+        {"path": "specs/tickets/bug-crash/spec.yaml", "action": "added"},
+    ]
+    assert watcher.poll() == []
+
+
+def test_inotify_watcher(project):
+    """Test the inotify backend picks up writes in new directories."""
+    try:
+        backend = InotifyBackend(project)
+    except WatchError:
+        pytest.skip("inotify not available")
+    watcher = Watcher(project, backend)
+    try:
+        ticket = project / "specs" / "tickets" / "bug-crash"
+        ticket.mkdir()
+        assert watcher.poll(timeout=2) == []
+
+        (ticket / "spec.yaml").write_text("title: Crash\n")
+        deadline = time.monotonic() + 2
+        changes = []
+        while not changes and time.monotonic() < deadline:
+            changes = watcher.poll(timeout=0.5)
+
+        assert changes == [
+            {"path": "specs/tickets/bug-crash/spec.yaml", "action": "added"}
+        ]
+    finally:
+        watcher.close()
+
+
+def test_session_updates_index_and_validation(project):
+    """Test changes are pushed into the index and validation cache."""
+    session = WatchSession(project)
+    spec = project / "specs" / "tickets" / "feature-login" / "spec.yaml"
+    _touch(
+        spec,
+        yaml.safe_dump(
+            {"title": "Login", "ticket": {"type": "feature", "status": "done"}}
+        ),
+    )
+    received = []
+    session.listeners.append(received.append)
+
+    report = session.apply(
+        [
+            {
+                "path": "specs/tickets/feature-login/spec.yaml",
+                "action": "modified",
+            }
+        ]
+    )
+
+    assert report == [
+        "modified: specs/tickets/feature-login/spec.yaml "
+        "(status done, 1 validation error(s))"
+    ]
+    entry = session.index.tickets["specs/tickets/feature-login"]
+    assert entry["status"] == "done"
+    assert received and received[0][0]["action"] == "modified"
+    assert (project / ".cdd" / "cache" / "validation.json").exists()
+
+
+def test_session_handles_deleted_doc(project):
+    """Test deleted docs are removed from the index."""
+    session = WatchSession(project)
+    (project / "docs" / "index.md").unlink()
+
+    report = session.apply([{"path": "docs/index.md", "action": "deleted"}])
+
+    assert report == ["deleted: docs/index.md"]
+    assert "docs/index.md" not in session.index.docs
+
+
+def test_session_updates_built_search_index(project):
+    """Test an existing search index follows changes."""
+    search_index = SearchIndex(project)
+    search_index.refresh()
+    session = WatchSession(project)
+    (project / "docs" / "quota.md").write_text("# Quota\n\nDaily quotas.\n")
+
+    session.apply([{"path": "docs/quota.md", "action": "added"}])
+
+    assert search_index.search("daily")[0]["path"] == "docs/quota.md"
+    search_index.close()
+
+
+def test_session_updates_built_doc_graph(project):
+    """Test an existing documentation graph follows changes."""
+    DocGraph.load(project).save()
+    session = WatchSession(project)
+    (project / "docs" / "quota.md").write_text("[Gone](missing.md)\n")
+
+    session.apply([{"path": "docs/quota.md", "action": "added"}])
+
+    graph = DocGraph.load(project, refresh=False)
+    assert graph.broken_links()[0]["source"] == "docs/quota.md"